@@ -184,6 +184,14 @@ if HAS_FASTAPI:
         version="1.0.0"
     )
     
+    @app.on_event("shutdown")
+    async def flush_execution_history():
+        """Write buffered execution updates and job states before the process exits."""
+        from src.services.execution_monitor import shutdown_execution_monitor
+        await shutdown_execution_monitor()
+        if state_manager:
+            await state_manager.flush_to_disk()
+    
     # Mount static files directory
     static_path = Path(__file__).parent.parent / "static"
     static_path.mkdir(parents=True, exist_ok=True)
@@ -422,6 +430,11 @@ CANONICAL_COMMAND_MAPPINGS = {
                 'default': False,
                 'description': 'Generate detailed audit trail'
             },
+            '--profile': {
+                'type': 'boolean',
+                'default': False,
+                'description': 'Save a per-stage performance profile (time, memory, LLM calls, tokens); topic-based analysis only'
+            },
             '--verbose': {
                 'type': 'boolean',
                 'default': False,
@@ -2979,6 +2992,19 @@ if HAS_FASTAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
+    @app.get("/api/executions/{run_id}/profile")
+    async def get_execution_profile(run_id: str):
+        """Get the per-stage performance profile of a --profile run."""
+        try:
+            from src.services.execution_monitor import get_execution_monitor
+            stages = await get_execution_monitor().get_run_profile(run_id)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        
+        if not stages:
+            raise HTTPException(status_code=404, detail=f"No profile recorded for run {run_id}")
+        return {"run_id": run_id, "stages": stages}
+    
     @app.post("/api/notify-completion")
     async def notify_completion(
         request: Request,
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import AsyncIterator, Awaitable, Callable, Generic, Iterator, List, Optional, TypeVar
+import asyncio
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Awaitable, Callable, Generic, Iterator, List, Optional, TypeVar, Union
 
 from .http_response import BaseHttpResponse
 
@@ -59,6 +60,23 @@ class AsyncPager(Generic[T]):
     has_next: bool
     items: Optional[List[T]]
     response: Optional[BaseHttpResponse]
+    # Number of pages iter_pages() may request ahead of the consumer (0 = fetch on demand)
+    prefetch: int = 0
+
+    def with_prefetch(self, prefetch: int) -> AsyncPager[T]:
+        """
+        Return this pager with look-ahead page fetching enabled.
+
+        While the caller processes page N, pages N+1..N+prefetch are requested in the
+        background. Cursor pagination stays serial (each request needs the previous
+        page's cursor); prefetching only overlaps those requests with the caller's work.
+        Requests go through get_next(), so they keep the client's retry and Retry-After
+        handling. At most `prefetch` pages are fetched or in flight beyond the one the
+        caller holds, so a slow consumer pauses the fetching.
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        return replace(self, prefetch=prefetch)
 
     async def __aiter__(self) -> AsyncIterator[T]:
         async for page in self.iter_pages():
@@ -67,6 +85,11 @@ class AsyncPager(Generic[T]):
                     yield item
 
     async def iter_pages(self) -> AsyncIterator[AsyncPager[T]]:
+        if self.prefetch > 0:
+            async for prefetched in self._iter_pages_prefetched():
+                yield prefetched
+            return
+
         page: Optional[AsyncPager[T]] = self
         while page is not None:
             yield page
@@ -80,3 +103,39 @@ class AsyncPager(Generic[T]):
 
     async def next_page(self) -> Optional[AsyncPager[T]]:
         return await self.get_next() if self.get_next is not None else None
+
+    async def _iter_pages_prefetched(self) -> AsyncIterator[AsyncPager[T]]:
+        # Fetched pages not yet handed to the consumer, then None (end) or the fetch error
+        pages: asyncio.Queue[Union[AsyncPager[T], BaseException, None]] = asyncio.Queue()
+        # One permit per page that may be fetched or in flight ahead of the consumer
+        permits = asyncio.Semaphore(self.prefetch)
+
+        async def fetch_ahead() -> None:
+            page: Optional[AsyncPager[T]] = self
+            try:
+                while page is not None and page.has_next and page.get_next is not None:
+                    await permits.acquire()
+                    page = await page.get_next()
+                    if page is None or page.items is None or len(page.items) == 0:
+                        break
+                    pages.put_nowait(page)
+            except Exception as exc:
+                pages.put_nowait(exc)
+                return
+            pages.put_nowait(None)
+
+        fetcher = asyncio.ensure_future(fetch_ahead())
+        try:
+            yield self
+            while True:
+                next_page = await pages.get()
+                if next_page is None:
+                    return
+                if isinstance(next_page, BaseException):
+                    raise next_page
+                permits.release()
+                yield next_page
+        finally:
+            if not fetcher.done():
+                fetcher.cancel()
+                await asyncio.gather(fetcher, return_exceptions=True)
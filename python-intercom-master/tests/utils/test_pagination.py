@@ -0,0 +1,102 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from intercom.core.pagination import AsyncPager
+
+
+class PageSource:
+    """Serves numbered pages through get_next callbacks and records fetch activity."""
+
+    def __init__(self, page_count: int, fail_on: Optional[int] = None, delay: float = 0.01) -> None:
+        self.page_count = page_count
+        self.fail_on = fail_on
+        self.delay = delay
+        self.started: List[int] = []
+        self.consumed = 0
+        self.max_ahead = 0
+
+    async def fetch(self, number: int) -> AsyncPager[int]:
+        self.started.append(number)
+        self.max_ahead = max(self.max_ahead, number - self.consumed)
+        await asyncio.sleep(self.delay)
+        if number == self.fail_on:
+            raise RuntimeError(f"page {number} failed")
+        return self.page(number)
+
+    def page(self, number: int) -> AsyncPager[int]:
+        has_next = number < self.page_count
+        return AsyncPager(
+            get_next=(lambda: self.fetch(number + 1)) if has_next else None,
+            has_next=has_next,
+            items=[number * 10, number * 10 + 1],
+            response=None,
+        )
+
+
+async def consume(pager: AsyncPager[int], source: PageSource, work: float = 0.02) -> List[int]:
+    items: List[int] = []
+    async for page in pager.iter_pages():
+        source.consumed += 1
+        await asyncio.sleep(work)
+        items.extend(page.items or [])
+    return items
+
+
+def test_prefetch_yields_same_pages_as_serial_iteration() -> None:
+    serial = PageSource(6)
+    prefetched = PageSource(6)
+
+    expected = asyncio.run(consume(serial.page(1), serial))
+    actual = asyncio.run(consume(prefetched.page(1).with_prefetch(2), prefetched))
+
+    assert actual == expected == [n for page in range(1, 7) for n in (page * 10, page * 10 + 1)]
+    assert prefetched.started == list(range(2, 7))
+
+
+def test_prefetch_overlaps_fetching_with_consumer_but_respects_depth() -> None:
+    serial = PageSource(5)
+    prefetched = PageSource(5)
+
+    asyncio.run(consume(serial.page(1), serial))
+    asyncio.run(consume(prefetched.page(1).with_prefetch(2), prefetched))
+
+    # Without prefetch the next page is only requested after the current one is done
+    assert serial.max_ahead == 1
+    assert prefetched.max_ahead == 2
+
+
+def test_prefetch_raises_fetch_error_after_earlier_pages() -> None:
+    source = PageSource(5, fail_on=3)
+    seen: List[int] = []
+
+    async def run() -> None:
+        async for page in source.page(1).with_prefetch(3).iter_pages():
+            seen.extend(page.items or [])
+
+    with pytest.raises(RuntimeError, match="page 3 failed"):
+        asyncio.run(run())
+    assert seen == [10, 11, 20, 21]
+
+
+def test_prefetch_stops_fetching_when_consumer_stops() -> None:
+    source = PageSource(50)
+
+    async def run() -> None:
+        pages = source.page(1).with_prefetch(2).iter_pages()
+        async for page in pages:
+            if page.items and page.items[0] == 20:
+                break
+        await pages.aclose()  # type: ignore[attr-defined]
+        fetched = len(source.started)
+        await asyncio.sleep(0.05)
+        assert len(source.started) == fetched
+
+    asyncio.run(run())
+    assert len(source.started) <= 4
+
+
+def test_with_prefetch_rejects_negative_depth() -> None:
+    with pytest.raises(ValueError):
+        PageSource(1).page(1).with_prefetch(-1)
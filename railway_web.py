@@ -467,19 +467,22 @@ if HAS_FASTAPI:
             raise HTTPException(status_code=500, detail="Services not available")
         
         try:
-            current = duckdb_storage.get_analysis_snapshot(current_id)
-            prior = duckdb_storage.get_analysis_snapshot(prior_id)
+            # Precomputed comparison (single indexed lookup, snapshot payloads are not loaded)
+            comparison = await historical_service.get_comparison_async(current_id, prior_id)
             
-            if not current or not prior:
+            if not comparison:
                 raise HTTPException(status_code=404, detail="One or both snapshots not found")
             
-            # Calculate comparison
-            comparison = historical_service.calculate_comparison(current, prior)
-            
             # Build HTML for comparison view
+            volume_changes = sorted(
+                (comparison.get('volume_changes') or {}).items(),
+                key=lambda item: abs(item[1].get('change', 0)),
+                reverse=True
+            )
             volume_changes_html = '<br>'.join([
-                f"{topic}: {change:+.1f}% ({abs_change:+d} conversations)"
-                for topic, change, abs_change in comparison.get('volume_changes', [])
+                f"{topic}: {change.get('pct', 0) * 100:+.1f}% ({change.get('change', 0):+d} conversations)"
+                for topic, change in volume_changes
+                if change.get('change')
             ])
             
             html = f"""
@@ -502,11 +505,11 @@ if HAS_FASTAPI:
             <div class="summary-cards">
                 <div class="summary-card">
                     <div class="card-title">Current Period</div>
-                    <div class="card-value">{current.get('date_range_label', 'Unknown')}</div>
+                    <div class="card-value">{comparison.get('current_period_label') or 'Unknown'}</div>
                 </div>
                 <div class="summary-card">
                     <div class="card-title">Prior Period</div>
-                    <div class="card-value">{prior.get('date_range_label', 'Unknown')}</div>
+                    <div class="card-value">{comparison.get('prior_period_label') or 'Unknown'}</div>
                 </div>
             </div>
             
@@ -518,7 +521,7 @@ if HAS_FASTAPI:
             <div style="margin-top: 20px; padding: 20px; background: #0a0a0a; border-radius: 12px;">
                 <h4 style="color: #e5e7eb; margin-bottom: 12px;">Significant Changes</h4>
                 <ul style="color: #9ca3af; line-height: 1.8;">
-                    {''.join([f'<li>{change}</li>' for change in comparison.get('significant_changes', [])])}
+                    {''.join([f"<li>{change['alert']} {change['topic']}: {change['pct'] * 100:+.1f}% ({change['change']:+d})</li>" for change in comparison.get('significant_changes') or []])}
                 </ul>
             </div>
         </div>
@@ -528,8 +531,8 @@ if HAS_FASTAPI:
             """
             return html
         except HTTPException:
-                raise
-            except Exception as e:
+            raise
+        except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to compare snapshots: {str(e)}")
 
     @app.get("/health")
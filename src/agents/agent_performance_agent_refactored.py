@@ -14,7 +14,7 @@ from datetime import datetime
 import numpy as np
 
 from src.agents.base_agent import BaseAgent, AgentResult, AgentContext, ConfidenceLevel
-from src.agents.tools import ToolRegistry, AdminProfileLookupTool, QueryConversationsTool, CalculateFCRTool, CalculateCSATTool
+from src.agents.tools import ToolRegistry, ToolResultCache, AdminProfileLookupTool, QueryConversationsTool, CalculateFCRTool, CalculateCSATTool
 from src.agents.performance_analysis.metrics_calculator import PerformanceMetricsCalculator
 from src.agents.performance_analysis.data_extractor import ConversationDataExtractor
 from src.agents.performance_analysis.report_builder import VendorReportBuilder
@@ -46,9 +46,9 @@ class AgentPerformanceAgent(BaseAgent):
         }
     }
     
-    def __init__(self, agent_filter: str = 'horatio'):
+    def __init__(self, agent_filter: str = 'horatio', tool_cache: Optional[ToolResultCache] = None):
         # Setup tools before calling parent constructor
-        tool_registry = self._setup_tools()
+        tool_registry = self._setup_tools(tool_cache)
 
         super().__init__(
             name=f"AgentPerformanceAgent_{agent_filter}",
@@ -72,10 +72,10 @@ class AgentPerformanceAgent(BaseAgent):
         else:
             self.logger.warning(f"No tools registered for {self.name}")
 
-    def _setup_tools(self) -> ToolRegistry:
+    def _setup_tools(self, tool_cache: Optional[ToolResultCache] = None) -> ToolRegistry:
         """Initialize and register all tools needed for agent performance analysis"""
         try:
-            registry = ToolRegistry(enable_caching=True)
+            registry = ToolRegistry(enable_caching=True, cache=tool_cache)
 
             # Register all available tools
             registry.register(AdminProfileLookupTool())
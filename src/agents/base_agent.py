@@ -9,14 +9,16 @@ Implements the core patterns from Claude's research:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Sequence, Union
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer, field_validator
 from enum import Enum
 import logging
 import json
 import time
 
+from src.agents.conversation_store import ConversationStore, ConversationView, as_conversation_view
+
 # Conditional import for ToolRegistry to avoid circular imports
 try:
     from src.agents.tools.registry import ToolRegistry
@@ -34,17 +36,51 @@ class ConfidenceLevel(Enum):
 
 
 class AgentContext(BaseModel):
-    """Context passed to agents containing necessary data and metadata"""
+    """
+    Context passed to agents containing necessary data and metadata.
+    
+    Conversations are held as a read-only ConversationView over a shared
+    ConversationStore; lists passed in are wrapped, not validated or copied.
+    """
     analysis_id: str
     analysis_type: str
     start_date: datetime
     end_date: datetime
-    conversations: Optional[List[Dict]] = None
+    conversations: Optional[Sequence[Dict]] = None
     previous_results: Dict[str, Any] = Field(default_factory=dict)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
     class Config:
         arbitrary_types_allowed = True
+    
+    @field_validator('conversations', mode='plain')
+    @classmethod
+    def _wrap_conversations(cls, value):
+        return as_conversation_view(value)
+    
+    @field_serializer('conversations')
+    def _serialize_conversations(self, value):
+        return list(value) if value is not None else None
+    
+    @property
+    def conversation_store(self) -> Optional[ConversationStore]:
+        """Store backing the current conversations, if they are a view"""
+        if isinstance(self.conversations, ConversationView):
+            return self.conversations.store
+        return None
+    
+    def with_conversations(self, conversations: Optional[Sequence[Dict]], **updates) -> 'AgentContext':
+        """
+        Shallow copy of this context scoped to a subset of conversations.
+        
+        Subsets of the current store become views of it; other lists get their own store.
+        """
+        store = self.conversation_store
+        if conversations is not None and store is not None:
+            conversations = store.view_of(conversations)
+        else:
+            conversations = as_conversation_view(conversations)
+        return self.model_copy(update={'conversations': conversations, **updates})
 
 
 class AgentMetrics(BaseModel):
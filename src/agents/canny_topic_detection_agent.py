@@ -2,12 +2,15 @@
 Canny Topic Detection Agent for mapping Canny posts to taxonomy categories.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from collections import defaultdict, Counter
 
 from src.agents.base_agent import BaseAgent, AgentResult, AgentContext, ConfidenceLevel
 from src.services.ai_model_factory import AIModelFactory, AIModel
+from src.utils.ai_client_helper import get_recommended_semaphore
 
 
 logger = logging.getLogger(__name__)
@@ -19,16 +22,23 @@ class CannyTopicDetectionAgent(BaseAgent):
     
     Maps Canny posts to the existing taxonomy structure to enable unified analysis
     with Intercom conversations.
+    
+    Classifications are cached in DuckDB by post id and a hash of the post's
+    title and details, so only new or edited posts are sent to the LLM.
     """
     
-    def __init__(self, ai_factory: AIModelFactory):
+    BATCH_SIZE = 10
+    
+    def __init__(self, ai_factory: AIModelFactory, duckdb_storage=None):
         super().__init__(
             name="CannyTopicDetectionAgent",
             model="gpt-4o-mini",
             temperature=0.2
         )
         self.ai_factory = ai_factory
+        self.storage = duckdb_storage
         self.logger = logging.getLogger(__name__)
+        self.cache_stats = self._empty_cache_stats()
     
     def get_agent_specific_instructions(self) -> str:
         """Get agent-specific instructions for Canny topic detection"""
@@ -68,7 +78,7 @@ Map posts to appropriate categories based on content.
                 return AgentResult(
                     agent_name=self.name,
                     success=True,
-                    data={'topic_groups': {}},
+                    data={'topic_groups': {}, 'cache_stats': self._empty_cache_stats()},
                     confidence=1.0,
                     confidence_level=ConfidenceLevel.HIGH,
                     execution_time=0.0
@@ -85,7 +95,11 @@ Map posts to appropriate categories based on content.
             return AgentResult(
                 agent_name=self.name,
                 success=True,
-                data={'topic_groups': topic_groups, 'summary': summary},
+                data={
+                    'topic_groups': topic_groups,
+                    'summary': summary,
+                    'cache_stats': dict(self.cache_stats)
+                },
                 confidence=1.0,
                 confidence_level=ConfidenceLevel.HIGH,
                 execution_time=execution_time
@@ -124,6 +138,7 @@ Map posts to appropriate categories based on content.
             Dictionary mapping topic names to lists of posts
         """
         self.logger.info(f"Starting topic detection for {len(canny_posts)} Canny posts")
+        self.cache_stats = self._empty_cache_stats()
         
         if not canny_posts:
             return {}
@@ -206,6 +221,77 @@ Map posts to appropriate categories based on content.
             }
         }
     
+    @staticmethod
+    def _empty_cache_stats() -> Dict[str, int]:
+        """Fresh classification cache counters for a run."""
+        return {
+            'total_posts': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'llm_batches': 0,
+            'cached_writes': 0
+        }
+    
+    @staticmethod
+    def _content_hash(post: Dict[str, Any]) -> str:
+        """Hash of the post content that drives classification (title + details)."""
+        content = f"{post.get('title') or ''}\n{post.get('details') or ''}"
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    
+    def _load_cached_classifications(
+        self,
+        posts: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Apply cached classifications to unchanged posts.
+        
+        Returns:
+            Tuple of (posts classified from cache, posts that still need the LLM)
+        """
+        if not self.storage:
+            return [], list(posts)
+        
+        post_ids = [str(post['id']) for post in posts if post.get('id')]
+        try:
+            cached = self.storage.get_canny_topic_classifications(post_ids)
+        except Exception as e:
+            self.logger.warning(f"Failed to read Canny classification cache: {e}")
+            return [], list(posts)
+        
+        hits = []
+        misses = []
+        for post in posts:
+            entry = cached.get(str(post.get('id'))) if post.get('id') else None
+            if entry and entry['content_hash'] == self._content_hash(post):
+                post['detected_topic'] = entry['detected_topic']
+                post['topic_confidence'] = entry['topic_confidence']
+                hits.append(post)
+            else:
+                misses.append(post)
+        
+        return hits, misses
+    
+    def _store_cached_classifications(self, posts: List[Dict[str, Any]]):
+        """Persist AI classifications so unchanged posts skip the LLM next run."""
+        if not self.storage:
+            return
+        
+        rows = [
+            {
+                'post_id': str(post['id']),
+                'content_hash': self._content_hash(post),
+                'detected_topic': post['detected_topic'],
+                'topic_confidence': post.get('topic_confidence')
+            }
+            for post in posts
+            if post.get('id') and post.get('detected_topic')
+        ]
+        try:
+            self.storage.store_canny_topic_classifications(rows)
+            self.cache_stats['cached_writes'] += len(rows)
+        except Exception as e:
+            self.logger.warning(f"Failed to write Canny classification cache: {e}")
+    
     async def _classify_posts_with_ai(
         self,
         posts: List[Dict[str, Any]],
@@ -216,33 +302,92 @@ Map posts to appropriate categories based on content.
         """
         Classify posts into taxonomy categories using AI.
         
+        Posts whose id and content hash are already cached reuse the stored
+        classification. The remaining posts are split into batches that are
+        dispatched concurrently under the provider concurrency limit.
+        
         Returns:
             List of posts with 'detected_topic' field added
         """
         self.logger.info("Classifying Canny posts with AI")
         
+        cached_posts, pending_posts = self._load_cached_classifications(posts)
+        self.cache_stats['total_posts'] += len(posts)
+        self.cache_stats['cache_hits'] += len(cached_posts)
+        self.cache_stats['cache_misses'] += len(pending_posts)
+        self.logger.info(
+            f"Canny classification cache: {len(cached_posts)} hits, "
+            f"{len(pending_posts)} posts need classification"
+        )
+        
+        if not pending_posts:
+            return cached_posts
+        
         # Build taxonomy description for prompt
         taxonomy_desc = "\n".join([
             f"- {category}: {data['description']}"
             for category, data in taxonomy.items()
         ])
         
-        classified_posts = []
+        semaphore = get_recommended_semaphore(self.ai_factory.get_client(ai_model))  # Provider-specific semaphore
         
         # Process in batches to avoid token limits
-        batch_size = 10
-        for i in range(0, len(posts), batch_size):
-            batch = posts[i:i + batch_size]
-            
-            try:
-                # Build prompt with post titles and details
-                post_summaries = []
-                for idx, post in enumerate(batch):
-                    title = post.get('title', '')
-                    details = post.get('details', '')[:200]  # Limit details length
-                    post_summaries.append(f"{idx}. Title: {title}\n   Details: {details}")
-                
-                prompt = f"""Classify these Canny feature requests into categories based on the taxonomy below.
+        batches = [
+            pending_posts[i:i + self.BATCH_SIZE]
+            for i in range(0, len(pending_posts), self.BATCH_SIZE)
+        ]
+        
+        async def classify_with_semaphore(batch: List[Dict[str, Any]]):
+            async with semaphore:
+                return await self._classify_batch(batch, taxonomy_desc, ai_model, enable_fallback)
+        
+        batch_results = await asyncio.gather(
+            *[classify_with_semaphore(batch) for batch in batches],
+            return_exceptions=True
+        )
+        self.cache_stats['llm_batches'] += len(batches)
+        
+        classified_posts = list(cached_posts)
+        ai_classified = []
+        for batch, result in zip(batches, batch_results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"AI classification failed for batch: {result}, using fallback")
+                # Use fallback keyword matching
+                for post in batch:
+                    topic = self._fallback_keyword_classification(post, taxonomy)
+                    post['detected_topic'] = topic
+                    post['topic_confidence'] = 0.6  # Lower confidence for fallback
+                    classified_posts.append(post)
+            else:
+                ai_classified.extend(result)
+                classified_posts.extend(result)
+        
+        # Only AI classifications are cached; keyword fallbacks are retried next run
+        self._store_cached_classifications(ai_classified)
+        
+        return classified_posts
+    
+    async def _classify_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        taxonomy_desc: str,
+        ai_model: AIModel,
+        enable_fallback: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify a single batch of posts with one LLM call.
+        
+        Returns:
+            Posts from the batch that received a classification
+        """
+        # Build prompt with post titles and details
+        post_summaries = []
+        for idx, post in enumerate(batch):
+            title = post.get('title', '')
+            details = post.get('details', '')[:200]  # Limit details length
+            post_summaries.append(f"{idx}. Title: {title}\n   Details: {details}")
+        
+        prompt = f"""Classify these Canny feature requests into categories based on the taxonomy below.
 
 TAXONOMY:
 {taxonomy_desc}
@@ -255,37 +400,29 @@ For each post (by number), assign the most appropriate category. If multiple cat
 Return as JSON array:
 [{{"post_index": 0, "category": "Feedback", "confidence": 0.9}}, ...]
 """
-                
-                # Get AI classification
-                response = await self.ai_factory.generate_response(
-                    prompt=prompt,
-                    model=ai_model,
-                    temperature=0.2,  # Lower temperature for consistent classification
-                    enable_fallback=enable_fallback
-                )
-                
-                # Parse response
-                classifications = self._parse_ai_classification_response(response)
-                
-                # Apply classifications to posts
-                for classification in classifications:
-                    post_idx = classification.get('post_index', -1)
-                    if 0 <= post_idx < len(batch):
-                        post = batch[post_idx]
-                        post['detected_topic'] = classification.get('category', 'Unknown')
-                        post['topic_confidence'] = classification.get('confidence', 0.5)
-                        classified_posts.append(post)
-                
-            except Exception as e:
-                self.logger.warning(f"AI classification failed for batch: {e}, using fallback")
-                # Use fallback keyword matching
-                for post in batch:
-                    topic = self._fallback_keyword_classification(post, taxonomy)
-                    post['detected_topic'] = topic
-                    post['topic_confidence'] = 0.6  # Lower confidence for fallback
-                    classified_posts.append(post)
         
-        return classified_posts
+        # Get AI classification
+        response = await self.ai_factory.generate_response(
+            prompt=prompt,
+            model=ai_model,
+            temperature=0.2,  # Lower temperature for consistent classification
+            enable_fallback=enable_fallback
+        )
+        
+        # Parse response
+        classifications = self._parse_ai_classification_response(response)
+        
+        # Apply classifications to posts
+        classified = []
+        for classification in classifications:
+            post_idx = classification.get('post_index', -1)
+            if 0 <= post_idx < len(batch):
+                post = batch[post_idx]
+                post['detected_topic'] = classification.get('category', 'Unknown')
+                post['topic_confidence'] = classification.get('confidence', 0.5)
+                classified.append(post)
+        
+        return classified
     
     def _parse_ai_classification_response(self, response: Any) -> List[Dict[str, Any]]:
         """Parse AI classification response to extract classifications."""
@@ -10,7 +10,7 @@ Responsibilities:
 
 import logging
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Sequence
 from datetime import datetime
 
 from src.agents.base_agent import BaseAgent, AgentResult, AgentContext, ConfidenceLevel
@@ -111,7 +111,7 @@ Process ALL {len(context.conversations)} conversations using this classification
         if not context.conversations:
             raise ValueError("No conversations provided for classification")
         
-        if not isinstance(context.conversations, list):
+        if not isinstance(context.conversations, Sequence):
             raise ValueError("Conversations must be a list")
         
         return True
@@ -0,0 +1,135 @@
+"""
+Shared conversation store for agent pipelines.
+
+A run's conversations are loaded once into an immutable, id-indexed
+ConversationStore. Agents receive ConversationViews: read-only sequences of
+positions into the store, so per-stage subsets (paid tier, a topic, a sample)
+reference the same conversation dicts instead of copying lists or having
+pydantic re-validate them for every AgentContext.
+
+The store is immutable as a collection. The conversation dicts themselves are
+shared, not copied, so enrichment written by one stage is visible to the next
+exactly as it was with plain lists.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+class ConversationStore:
+    """Immutable, id-indexed collection of the conversations in one run."""
+
+    __slots__ = ('_conversations', '_index')
+
+    def __init__(self, conversations: Iterable[Dict]):
+        self._conversations: Tuple[Dict, ...] = tuple(conversations)
+        self._index: Dict[str, int] = {}
+        for position, conv in enumerate(self._conversations):
+            conv_id = conv.get('id') if isinstance(conv, dict) else None
+            if conv_id is not None:
+                self._index.setdefault(str(conv_id), position)
+
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+    def __contains__(self, conversation_id: Any) -> bool:
+        return str(conversation_id) in self._index
+
+    def get(self, conversation_id: Any) -> Optional[Dict]:
+        position = self._index.get(str(conversation_id))
+        return None if position is None else self._conversations[position]
+
+    def view(self, ids: Optional[Iterable[Any]] = None) -> 'ConversationView':
+        """View of the whole store, or of the given ids in order (unknown ids are skipped)."""
+        if ids is None:
+            return ConversationView(self, range(len(self._conversations)))
+        positions = [self._index[key] for key in map(str, ids) if key in self._index]
+        return ConversationView(self, tuple(positions))
+
+    def view_of(self, conversations: Iterable[Dict]) -> 'ConversationView':
+        """
+        Express an existing list of conversations as a view of this store.
+
+        Conversations are matched by id and identity. If any of them is not
+        held by this store, a view over a new store of that list is returned.
+        """
+        if isinstance(conversations, ConversationView) and conversations.store is self:
+            return conversations
+
+        conversations = list(conversations)
+        positions = []
+        for conv in conversations:
+            conv_id = conv.get('id') if isinstance(conv, dict) else None
+            position = self._index.get(str(conv_id)) if conv_id is not None else None
+            if position is None or self._conversations[position] is not conv:
+                return ConversationStore(conversations).view()
+            positions.append(position)
+        return ConversationView(self, tuple(positions))
+
+
+class ConversationView(Sequence):
+    """
+    Read-only sequence of conversations backed by a ConversationStore.
+    
+    Slices are plain lists (of the shared dicts) so prompt/JSON code that samples
+    ``conversations[:n]`` keeps working; use filter()/subset() for narrower views.
+    """
+
+    __slots__ = ('store', '_positions')
+
+    def __init__(self, store: ConversationStore, positions: Union[range, Tuple[int, ...]]):
+        self.store = store
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            conversations = self.store._conversations
+            return [conversations[p] for p in self._positions[item]]
+        return self.store._conversations[self._positions[item]]
+
+    def __iter__(self) -> Iterator[Dict]:
+        conversations = self.store._conversations
+        for position in self._positions:
+            yield conversations[position]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (ConversationView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ConversationView({len(self)} of {len(self.store)} conversations)"
+
+    @property
+    def ids(self) -> List[str]:
+        return [str(conv.get('id')) for conv in self]
+
+    def filter(self, predicate: Callable[[Dict], bool]) -> 'ConversationView':
+        """Subset of this view matching predicate, without copying conversations."""
+        conversations = self.store._conversations
+        return ConversationView(
+            self.store,
+            tuple(p for p in self._positions if predicate(conversations[p]))
+        )
+
+    def subset(self, ids: Iterable[Any]) -> 'ConversationView':
+        """View of the given ids, restricted to conversations in this view."""
+        allowed = set(self._positions)
+        view = self.store.view(ids)
+        return ConversationView(self.store, tuple(p for p in view._positions if p in allowed))
+
+    def to_list(self) -> List[Dict]:
+        """Materialize as a plain list (conversations are still shared, not copied)."""
+        return list(self)
+
+
+def as_conversation_view(conversations: Optional[Iterable[Dict]]) -> Optional[ConversationView]:
+    """Wrap a list of conversations in a view; views are returned unchanged."""
+    if conversations is None or isinstance(conversations, ConversationView):
+        return conversations
+    return ConversationStore(conversations).view()
@@ -18,6 +18,7 @@ from src.agents.base_agent import BaseAgent, AgentResult, AgentContext, Confiden
 from src.utils.ai_client_helper import get_ai_client
 from src.services.quote_translator import QuoteTranslator
 from src.utils.conversation_utils import extract_conversation_text
+from src.utils.language_identifier import get_language_identifier
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,9 @@ class ExampleExtractionAgent(BaseAgent):
         )
         self.ai_client = get_ai_client()
         self.translator = QuoteTranslator()
+        self.language_identifier = get_language_identifier()
+        # Quotes detected as English at or above this confidence skip the LLM translation call
+        self.english_skip_confidence = 0.8
     
     def _to_datetime_utc(self, value: Any) -> Optional[datetime]:
         """
@@ -464,12 +468,21 @@ Selection criteria:
         """
         translated_examples = []
         
-        for example in examples:
+        # The Language attribute describes the user, not the quote; many quotes from
+        # non-English workspaces are written in English, so check the text itself first
+        detected = self.language_identifier.identify_batch(
+            [example.get('preview', '') for example in examples]
+        )
+        
+        for example, (detected_language, detected_confidence) in zip(examples, detected):
             language = example.get('language', 'English')
             preview = example.get('preview', '')
+            detected_english = (
+                detected_language == 'en' and detected_confidence >= self.english_skip_confidence
+            )
             
             # Skip translation for English or very short quotes
-            if language == 'English' or len(preview.strip()) < 10:
+            if language == 'English' or detected_english or len(preview.strip()) < 10:
                 example['translation'] = None
                 example['needs_translation'] = False
                 translated_examples.append(example)
@@ -11,20 +11,127 @@ Purpose:
 """
 
 import logging
-from typing import Dict, Any, List
+import re
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 from collections import defaultdict
 from pydantic import ValidationError
 
 from src.agents.base_agent import BaseAgent, AgentResult, AgentContext, ConfidenceLevel
 from src.utils.ai_client_helper import get_ai_client
-from src.services.fin_escalation_analyzer import FinEscalationAnalyzer, is_fin_resolved, has_knowledge_gap
+from src.services.fin_escalation_analyzer import (
+    FinEscalationAnalyzer, is_fin_resolved, has_knowledge_gap, categorize_fin_outcome
+)
 from src.models.analysis_models import FinAnalysisPayload
 from src.utils.conversation_utils import extract_customer_messages, extract_conversation_text
+from src.utils.fin_metrics_calculator import is_deflected, summarize_dual_metrics
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class FinConversationRecord:
+    """Fin signals for one conversation, computed once and shared by tier and sub-topic metrics."""
+    conversation: Dict
+    text: str  # lowercased, HTML-cleaned conversation text
+    topics: List[str]
+    admin_participated: bool
+    deflected: bool
+    fin_resolved: bool
+    knowledge_gap: bool
+    rating: Optional[float]
+    rating_eligible: bool
+    outcome: str
+    outcome_confidence: float
+
+
+class SubtopicIndex:
+    """
+    Inverted index from Tier 1 topics and sub-topic signals to conversation positions.
+    
+    Built once per tier so matching a sub-topic is a set lookup instead of checking
+    every conversation of its Tier 1 topic. Matching follows
+    FinPerformanceAgent._match_conversation_to_subtopic: Tier 2 by exact tag name or
+    case-insensitive custom attribute value / conversation topic, Tier 3 by keyword
+    substring of the conversation text.
+    """
+    
+    def __init__(self, records: List[FinConversationRecord], subtopics_data: Dict):
+        self.by_topic: Dict[str, Set[int]] = defaultdict(set)
+        self.by_tag: Dict[str, Set[int]] = defaultdict(set)
+        self.by_value: Dict[str, Set[int]] = defaultdict(set)
+        self.by_keyword: Dict[str, Set[int]] = defaultdict(set)
+        
+        for position, record in enumerate(records):
+            conv = record.conversation
+            for topic in conv.get('detected_topics') or []:
+                self.by_topic[topic].add(position)
+            
+            tags = conv.get('tags', {})
+            for tag in (tags.get('tags', []) if isinstance(tags, dict) else []):
+                name = tag.get('name', tag) if isinstance(tag, dict) else tag
+                if isinstance(name, str):
+                    self.by_tag[name].add(position)
+            for value in (conv.get('custom_attributes') or {}).values():
+                self.by_value[str(value).lower()].add(position)
+            for topic in conv.get('conversation_topics') or []:
+                name = topic.get('name', '') if isinstance(topic, dict) else topic
+                self.by_value[str(name).lower()].add(position)
+        
+        self._index_keywords(records, subtopics_data)
+    
+    def _index_keywords(self, records: List[FinConversationRecord], subtopics_data: Dict) -> None:
+        """Find every Tier 3 keyword in each candidate conversation with one regex scan."""
+        keywords = set()
+        keyword_topics = set()
+        for tier1_topic, subtopics in subtopics_data.items():
+            for subtopic_data in subtopics.get('tier3', {}).values():
+                topic_keywords = {kw.lower() for kw in subtopic_data.get('keywords', []) if kw}
+                if topic_keywords:
+                    keywords |= topic_keywords
+                    keyword_topics.add(tier1_topic)
+        if not keywords:
+            return
+        
+        # Zero-width lookahead reports a match at every position; alternatives are
+        # ordered longest first, so each position yields its longest keyword and
+        # the shorter keywords matching there are exactly its keyword prefixes.
+        pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)) + '))'
+        )
+        prefixes = {
+            kw: [kw[:end] for end in range(1, len(kw) + 1) if kw[:end] in keywords]
+            for kw in keywords
+        }
+        
+        candidates = set().union(*(self.by_topic.get(topic, set()) for topic in keyword_topics))
+        for position in candidates:
+            for longest in {match.group(1) for match in pattern.finditer(records[position].text)}:
+                for kw in prefixes[longest]:
+                    self.by_keyword[kw].add(position)
+    
+    def match(self, tier1_topic: str, tier_level: str, subtopic_name: str, subtopic_data: Dict) -> List[int]:
+        """Positions (in input order) of the Tier 1 topic's conversations matching a sub-topic."""
+        members = self.by_topic.get(tier1_topic)
+        if not members:
+            return []
+        
+        if tier_level == 'tier2':
+            hits = self.by_tag.get(subtopic_name, set()) | self.by_value.get(subtopic_name.lower(), set())
+        elif tier_level == 'tier3':
+            keywords = [kw.lower() for kw in subtopic_data.get('keywords', [])]
+            if '' in keywords:
+                # An empty keyword is a substring of every text
+                hits = members
+            else:
+                hits = set().union(*(self.by_keyword.get(kw, set()) for kw in keywords))
+        else:
+            return []
+        
+        return sorted(hits & members)
+
+
 class FinPerformanceAgent(BaseAgent):
     """Agent specialized in Fin AI performance analysis with LLM insights"""
     
@@ -343,6 +450,9 @@ Calculate tier-specific metrics:
     def _calculate_tier_metrics(self, conversations: List[Dict], tier_name: str, subtopics_data: Dict = None) -> Dict:
         """
         Calculate Fin performance metrics for a specific tier.
+        
+        Each conversation is analyzed once into a FinConversationRecord; resolution,
+        knowledge gap, topic, CSAT and sub-topic metrics are aggregated from the records.
 
         Args:
             conversations: List of conversations for this tier
@@ -355,12 +465,16 @@ Calculate tier-specific metrics:
         if total == 0:
             return {}
 
+        records = [self._build_conversation_record(c) for c in conversations]
+
         # Resolution rate - Use DUAL METRICS for transparency
         # 1. Intercom-Compatible: Liberal (matches Intercom dashboard)
         # 2. Quality-Adjusted: Strict (true helpfulness)
-        from src.utils.fin_metrics_calculator import calculate_dual_metrics
-        
-        dual_metrics = calculate_dual_metrics(conversations)
+        dual_metrics = summarize_dual_metrics(
+            total,
+            sum(1 for r in records if r.deflected),
+            sum(1 for r in records if r.fin_resolved)
+        )
         
         # Extract both metrics
         intercom_metrics = dual_metrics.get('intercom_compatible', {})
@@ -378,26 +492,6 @@ Calculate tier-specific metrics:
         # Primary resolution rate = Intercom-compatible (more realistic)
         resolution_rate = deflection_rate
         
-        # CRITICAL FIX: Check conversation_parts for actual admin PARTICIPATION
-        # (admin_assignee_id represents ASSIGNMENT/routing, not participation)
-        def _admin_participated(conv):
-            conversation_parts = conv.get('conversation_parts', {})
-            if isinstance(conversation_parts, dict):
-                parts_list = conversation_parts.get('conversation_parts', [])
-            elif isinstance(conversation_parts, list):
-                parts_list = conversation_parts
-            else:
-                parts_list = []
-            
-            return any(
-                part.get('author', {}).get('type') == 'admin'
-                for part in parts_list
-                if isinstance(part, dict)
-            )
-        
-        resolved_by_fin = [c for c in conversations if not _admin_participated(c)]
-        escalated = [c for c in conversations if _admin_participated(c)]
-        
         self.logger.info(
             f"{tier_name} tier: "
             f"Intercom-Compatible Resolution: {deflection_rate:.1%} ({deflected_count}/{total}), "
@@ -405,45 +499,41 @@ Calculate tier-specific metrics:
             f"Gap: {comparison.get('deflection_gap', 0):.1f}%"
         )
 
-        # Knowledge gaps - Using standardized has_knowledge_gap() helper
+        # Single aggregation pass over the records
+        # CRITICAL FIX: resolved_by_fin uses actual admin PARTICIPATION in conversation_parts
+        # (admin_assignee_id represents ASSIGNMENT/routing, not participation)
+        resolved_by_fin_count = 0
         knowledge_gaps = []
+        topic_performance = defaultdict(lambda: {'total': 0, 'resolved': 0})
+        eligible_count = 0
+        all_ratings = []
         
-        for c in conversations:
-            conv_id = c.get('id')
+        for record in records:
+            is_resolved = not record.admin_participated
+            if is_resolved:
+                resolved_by_fin_count += 1
             
-            # Use standardized knowledge gap detection
-            if has_knowledge_gap(c):
-                knowledge_gaps.append(c)
-                
-                # DEBUG logging to show reason
-                text = extract_conversation_text(c, clean_html=True).lower()
-                rating_data = c.get('conversation_rating')
-                if isinstance(rating_data, dict):
-                    rating = rating_data.get('rating')
-                else:
-                    rating = rating_data if isinstance(rating_data, (int, float)) else None
-                
-                parts = c.get('conversation_parts', {}).get('conversation_parts', [])
-                admin_intervened = any(p.get('author', {}).get('type') == 'admin' for p in parts)
-                
+            # Knowledge gaps - Using standardized has_knowledge_gap() helper
+            if record.knowledge_gap:
+                knowledge_gaps.append(record.conversation)
                 self.logger.debug(
-                    f"Knowledge gap detected for {conv_id}: "
-                    f"admin_intervened={admin_intervened}, rating={rating}"
+                    f"Knowledge gap detected for {record.conversation.get('id')}: "
+                    f"admin_intervened={record.admin_participated}, rating={record.rating}"
                 )
-        
-        self.logger.info(f"{tier_name} tier knowledge gaps: {len(knowledge_gaps)} ({len(knowledge_gaps)/total*100:.1f}%)")
-
-        # Performance by topic
-        topic_performance = defaultdict(lambda: {'total': 0, 'resolved': 0})
-
-        for conv in conversations:
-            topics = conv.get('detected_topics', ['Other'])
-            is_resolved = conv in resolved_by_fin
-
-            for topic in topics:
+            
+            # Performance by topic
+            for topic in record.topics:
                 topic_performance[topic]['total'] += 1
                 if is_resolved:
                     topic_performance[topic]['resolved'] += 1
+            
+            # CSAT: Per user: "A CX Score is only calculated for conversations with at least 2 responses from both customer and agent"
+            if record.rating_eligible:
+                eligible_count += 1
+                if record.rating is not None:
+                    all_ratings.append(record.rating)
+        
+        self.logger.info(f"{tier_name} tier knowledge gaps: {len(knowledge_gaps)} ({len(knowledge_gaps)/total*100:.1f}%)")
 
         # Calculate rates
         topic_performance_dict = {}
@@ -469,37 +559,10 @@ Calculate tier-specific metrics:
         # Sub-topic performance
         performance_by_subtopic = None
         if subtopics_data is not None:
-            performance_by_subtopic = self._calculate_subtopic_performance(conversations, subtopics_data, resolved_by_fin, knowledge_gaps)
+            performance_by_subtopic = self._calculate_subtopic_performance(records, subtopics_data)
 
-        # CRITICAL: Calculate CSAT for the entire tier
-        # Per user: "A CX Score is only calculated for conversations with at least 2 responses from both customer and agent"
-        eligible_for_rating = []
-        all_ratings = []
-        
-        for c in conversations:
-            parts = c.get('conversation_parts', {}).get('conversation_parts', [])
-            user_parts = [p for p in parts if p.get('author', {}).get('type') == 'user']
-            # For Fin, check bot parts OR admin parts (Support Sal = Fin per user)
-            agent_parts = [p for p in parts if p.get('author', {}).get('type') in ['bot', 'admin']]
-            
-            # Eligible for rating if ≥2 responses from each side
-            if len(user_parts) >= 2 and len(agent_parts) >= 2:
-                eligible_for_rating.append(c)
-                # Extract rating (handle dict format)
-                rating_data = c.get('conversation_rating')
-                if isinstance(rating_data, dict):
-                    rating = rating_data.get('rating')
-                elif isinstance(rating_data, (int, float)):
-                    rating = rating_data
-                else:
-                    rating = None
-                
-                if rating is not None:
-                    all_ratings.append(rating)
-        
         overall_avg_rating = sum(all_ratings) / len(all_ratings) if all_ratings else None
         overall_rated_count = len(all_ratings)
-        eligible_count = len(eligible_for_rating)
         rating_response_rate = (overall_rated_count / eligible_count * 100) if eligible_count > 0 else 0
         
         self.logger.info(
@@ -509,22 +572,22 @@ Calculate tier-specific metrics:
             f"{tier_name} tier CSAT: No ratings ({eligible_count} eligible, {overall_rated_count} rated)"
         )
 
+        knowledge_gap_examples = []
+        for c in knowledge_gaps[:3]:
+            customer_messages = extract_customer_messages(c, clean_html=True)
+            knowledge_gap_examples.append({
+                'id': c.get('id'),
+                'preview': customer_messages[0][:100] if customer_messages else 'No preview available',
+                'intercom_url': self._build_intercom_url(c.get('id'))
+            })
+
         return {
             'total_conversations': total,
             'resolution_rate': resolution_rate,
-            'resolved_count': len(resolved_by_fin),
+            'resolved_count': resolved_by_fin_count,
             'knowledge_gaps_count': len(knowledge_gaps),
             'knowledge_gap_rate': len(knowledge_gaps) / total if total > 0 else 0,
-            'knowledge_gap_examples': [
-                {
-                    'id': c.get('id'),
-                    'preview': (extract_customer_messages(c, clean_html=True)[0][:100] 
-                              if extract_customer_messages(c, clean_html=True) 
-                              else 'No preview available'),
-                    'intercom_url': self._build_intercom_url(c.get('id'))
-                }
-                for c in knowledge_gaps[:3]
-            ],
+            'knowledge_gap_examples': knowledge_gap_examples,
             'performance_by_topic': topic_performance_dict,
             'top_performing_topics': top_performing,
             'struggling_topics': struggling,
@@ -536,6 +599,51 @@ Calculate tier-specific metrics:
             'rating_response_rate': rating_response_rate
         }
 
+    def _build_conversation_record(self, conv: Dict) -> FinConversationRecord:
+        """Walk one conversation once and collect every signal the tier metrics need."""
+        conversation_parts = conv.get('conversation_parts', {})
+        if isinstance(conversation_parts, dict):
+            parts_list = conversation_parts.get('conversation_parts', [])
+        elif isinstance(conversation_parts, list):
+            parts_list = conversation_parts
+        else:
+            parts_list = []
+        author_types = [
+            part.get('author', {}).get('type')
+            for part in parts_list
+            if isinstance(part, dict)
+        ]
+        
+        text = extract_conversation_text(conv, clean_html=True).lower()
+        
+        # Extract rating (handle dict format)
+        rating_data = conv.get('conversation_rating')
+        if isinstance(rating_data, dict):
+            rating = rating_data.get('rating')
+        else:
+            rating = rating_data if isinstance(rating_data, (int, float)) else None
+        
+        # Eligible for rating if ≥2 responses from each side
+        # For Fin, check bot parts OR admin parts (Support Sal = Fin per user)
+        user_count = author_types.count('user')
+        agent_count = sum(1 for author_type in author_types if author_type in ('bot', 'admin'))
+        
+        outcome_data = categorize_fin_outcome(conv)
+        
+        return FinConversationRecord(
+            conversation=conv,
+            text=text,
+            topics=conv.get('detected_topics', ['Other']),
+            admin_participated='admin' in author_types,
+            deflected=is_deflected(conv, text),
+            fin_resolved=is_fin_resolved(conv),
+            knowledge_gap=has_knowledge_gap(conv, text),
+            rating=rating,
+            rating_eligible=user_count >= 2 and agent_count >= 2,
+            outcome=outcome_data['outcome'],
+            outcome_confidence=outcome_data['confidence']
+        )
+
     def _compare_tiers(self, free_metrics: Dict, paid_metrics: Dict) -> Dict:
         """
         Compare Fin performance between Free and Paid tiers.
@@ -677,32 +785,34 @@ Insights:"""
                 fallback += f" {tier_comparison.get('resolution_rate_interpretation', '')}"
             return fallback
     
-    def _calculate_subtopic_performance(self, conversations: List[Dict], subtopics_data: Dict, resolved_by_fin: List[Dict], knowledge_gaps: List[Dict]) -> Dict:
+    def _calculate_subtopic_performance(self, records: List[FinConversationRecord], subtopics_data: Dict) -> Dict:
+        """
+        Aggregate Tier 2/3 sub-topic metrics through a SubtopicIndex built once for the tier.
+        
+        Cost follows the number of conversations plus matches rather than
+        topics x sub-topics x conversations.
+        """
+        index = SubtopicIndex(records, subtopics_data)
         subtopic_metrics = {}
         for tier1_topic, subtopics in subtopics_data.items():
             subtopic_metrics[tier1_topic] = {'tier2': {}, 'tier3': {}}
-            # Get conversations for this topic
-            convs_for_topic = [c for c in conversations if tier1_topic in c.get('detected_topics', [])]
-            self.logger.debug(f"Analyzing {len(convs_for_topic)} conversations for Tier 1 topic: {tier1_topic}")
-            # Tier 2 sub-topics
-            for subtopic_name, subtopic_data in subtopics['tier2'].items():
-                matched_convs = [c for c in convs_for_topic if self._match_conversation_to_subtopic(c, subtopic_name, 'tier2', subtopic_data)]
-                if matched_convs:
-                    metrics = self._calculate_single_subtopic_metrics(matched_convs, tier1_topic, subtopic_name, 'tier2')
-                    subtopic_metrics[tier1_topic]['tier2'][subtopic_name] = metrics
-            # Tier 3 sub-topics
-            for subtopic_name, subtopic_data in subtopics['tier3'].items():
-                matched_convs = [c for c in convs_for_topic if self._match_conversation_to_subtopic(c, subtopic_name, 'tier3', subtopic_data)]
-                if matched_convs:
-                    metrics = self._calculate_single_subtopic_metrics(matched_convs, tier1_topic, subtopic_name, 'tier3')
-                    subtopic_metrics[tier1_topic]['tier3'][subtopic_name] = metrics
+            self.logger.debug(f"Analyzing {len(index.by_topic.get(tier1_topic, ()))} conversations for Tier 1 topic: {tier1_topic}")
+            for tier_level in ('tier2', 'tier3'):
+                for subtopic_name, subtopic_data in subtopics[tier_level].items():
+                    matched = index.match(tier1_topic, tier_level, subtopic_name, subtopic_data)
+                    if matched:
+                        subtopic_metrics[tier1_topic][tier_level][subtopic_name] = self._aggregate_subtopic_metrics(
+                            [records[position] for position in matched]
+                        )
         return subtopic_metrics
 
     def _calculate_single_subtopic_metrics(self, conversations: List[Dict], tier1_topic: str, subtopic_name: str, tier_level: str) -> Dict:
         """Calculate metrics for a single sub-topic using NUANCED three-way categorization."""
-        from src.services.fin_escalation_analyzer import categorize_fin_outcome
-        
-        total = len(conversations)
+        return self._aggregate_subtopic_metrics([self._build_conversation_record(c) for c in conversations])
+
+    def _aggregate_subtopic_metrics(self, records: List[FinConversationRecord]) -> Dict:
+        """Three-way outcome (resolved / escalated / failed) metrics for a sub-topic's conversations."""
+        total = len(records)
         if total == 0:
             return {
                 'total': 0,
@@ -719,65 +829,36 @@ Insights:"""
                 'avg_confidence': 0
             }
         
-        # Use nuanced three-way categorization
-        resolved_convs = []
-        escalated_convs = []
-        failed_convs = []
-        gap_convs = []
+        outcome_counts = {'resolved': 0, 'escalated': 0, 'failed': 0}
+        gap_count = 0
         ratings = []
         confidences = []
         
-        for c in conversations:
-            # Get nuanced outcome
-            outcome_data = categorize_fin_outcome(c)
-            outcome = outcome_data['outcome']
-            confidence = outcome_data['confidence']
-            confidences.append(confidence)
-            
-            if outcome == 'resolved':
-                resolved_convs.append(c)
-            elif outcome == 'escalated':
-                escalated_convs.append(c)
-            elif outcome == 'failed':
-                failed_convs.append(c)
+        for record in records:
+            confidences.append(record.outcome_confidence)
+            if record.outcome in outcome_counts:
+                outcome_counts[record.outcome] += 1
             
             # Knowledge gap detection (only for failed cases)
-            if outcome == 'failed' or outcome == 'escalated':
-                from src.services.fin_escalation_analyzer import has_knowledge_gap
-                if has_knowledge_gap(c):
-                    gap_convs.append(c)
+            if record.outcome in ('failed', 'escalated') and record.knowledge_gap:
+                gap_count += 1
             
-            # Collect ratings
-            rating_data = c.get('conversation_rating')
-            if isinstance(rating_data, dict):
-                rating = rating_data.get('rating')
-            else:
-                rating = rating_data if isinstance(rating_data, (int, float)) else None
-            
-            if rating is not None:
-                ratings.append(rating)
-        
-        resolution_rate = len(resolved_convs) / total if total > 0 else 0
-        escalation_rate = len(escalated_convs) / total if total > 0 else 0
-        failed_rate = len(failed_convs) / total if total > 0 else 0
-        knowledge_gap_rate = len(gap_convs) / total if total > 0 else 0
-        avg_rating = sum(ratings) / len(ratings) if ratings else None
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-        rated_count = len(ratings)
+            if record.rating is not None:
+                ratings.append(record.rating)
         
         return {
             'total': total,
-            'resolution_rate': resolution_rate,
-            'escalation_rate': escalation_rate,
-            'failed_rate': failed_rate,
-            'knowledge_gap_rate': knowledge_gap_rate,
-            'avg_rating': avg_rating,
-            'rated_count': rated_count,
-            'resolved_count': len(resolved_convs),
-            'escalation_count': len(escalated_convs),
-            'failed_count': len(failed_convs),
-            'knowledge_gap_count': len(gap_convs),
-            'avg_confidence': avg_confidence
+            'resolution_rate': outcome_counts['resolved'] / total,
+            'escalation_rate': outcome_counts['escalated'] / total,
+            'failed_rate': outcome_counts['failed'] / total,
+            'knowledge_gap_rate': gap_count / total,
+            'avg_rating': sum(ratings) / len(ratings) if ratings else None,
+            'rated_count': len(ratings),
+            'resolved_count': outcome_counts['resolved'],
+            'escalation_count': outcome_counts['escalated'],
+            'failed_count': outcome_counts['failed'],
+            'knowledge_gap_count': gap_count,
+            'avg_confidence': sum(confidences) / len(confidences) if confidences else 0
         }
 
     def _detect_escalation_request(self, conv: Dict) -> bool:
@@ -534,6 +534,9 @@ Return ONLY valid JSON, no other text:
             trend_agent_data = context.previous_results.get('TrendAgent', {}).get('data', {})
             trend_insights = trend_agent_data.get('trend_insights', {})
             
+            # Conversation lookup for highlights/lowlights, built once for all topic cards
+            conv_lookup = self._build_conversation_lookup(context.conversations) if context.conversations else {}
+            
             for topic_name, topic_stats in sorted_topics:
                 # Get sentiment and examples for this topic (defensive reads)
                 sentiment = topic_sentiments.get(topic_name, {}).get('data', {}).get('sentiment_insight', 'No sentiment analysis available')
@@ -569,7 +572,8 @@ Return ONLY valid JSON, no other text:
                     trend_explanation,
                     period_label,
                     subtopics_for_topic,
-                    context.conversations  # Pass conversations for highlights/lowlights extraction
+                    context.conversations,  # Pass conversations for highlights/lowlights extraction
+                    conv_lookup=conv_lookup
                 )
                 output_sections.append(card)
             
@@ -775,93 +779,70 @@ Return ONLY valid JSON, no other text:
                 execution_time=execution_time
             )
     
-    def _format_topic_card(self, topic_name: str, stats: Dict, sentiment: str, examples: List[Dict], trend: str, trend_explanation: str = "", period_label: str = "Weekly", subtopics: Dict = None, conversations: List[Dict] = None) -> str:
+    def _format_topic_card(self, topic_name: str, stats: Dict, sentiment: str, examples: List[Dict], trend: str, trend_explanation: str = "", period_label: str = "Weekly", subtopics: Dict = None, conversations: List[Dict] = None, conv_lookup: Dict[str, Dict] = None) -> str:
         """Format a single topic card"""
         detection_method = stats.get('detection_method', 'unknown')
         method_label = "Intercom conversation attribute" if detection_method == 'attribute' else "Keyword detection" if detection_method == 'keyword' else "Detection method not specified"
         
-        card = f"""### {topic_name}{trend}
+        # Collect the card's parts and join them once at the end
+        parts = [f"""### {topic_name}{trend}
 **{stats['volume']} tickets / {stats['percentage']}% of {period_label.lower()} volume**  
 **Detection Method**: {method_label}
 
 **Sentiment**: {sentiment}
-"""
+"""]
         
         # Add trend explanation if available
         if trend_explanation:
-            card += f"\n**Trend Analysis**: {trend_explanation}\n"
+            parts.append(f"\n**Trend Analysis**: {trend_explanation}\n")
         
         # Add sub-topic breakdown if available
         if subtopics and (subtopics.get('tier2') or subtopics.get('tier3')):
-            card += "\n**Sub-Topic Breakdown**:\n"
+            parts.append("\n**Sub-Topic Breakdown**:\n")
             
             # Tier 2 sub-topics
             tier2 = subtopics.get('tier2', {})
             if tier2:
-                card += "\n_Tier 2: From Intercom Data_\n"
+                parts.append("\n_Tier 2: From Intercom Data_\n")
                 # Sort by volume descending and limit to top 10
                 sorted_tier2 = sorted(tier2.items(), key=lambda x: x[1].get('volume', 0), reverse=True)[:10]
                 for subtopic_name, subtopic_data in sorted_tier2:
                     volume = subtopic_data.get('volume', 0)
                     percentage = subtopic_data.get('percentage', 0)
                     source = subtopic_data.get('source', 'unknown')
-                    card += f"  - {subtopic_name}: {volume} conversations ({percentage}%) [Source: {source}]\n"
+                    parts.append(f"  - {subtopic_name}: {volume} conversations ({percentage}%) [Source: {source}]\n")
             
             # Tier 3 sub-topics
             tier3 = subtopics.get('tier3', {})
             if tier3:
-                card += "\n_Tier 3: AI-Discovered Themes_\n"
+                parts.append("\n_Tier 3: AI-Discovered Themes_\n")
                 # Sort by volume descending and limit to top 5
                 sorted_tier3 = sorted(tier3.items(), key=lambda x: x[1].get('volume', 0), reverse=True)[:5]
                 for theme_name, theme_data in sorted_tier3:
                     volume = theme_data.get('volume', 0)
                     percentage = theme_data.get('percentage', 0)
-                    card += f"  - {theme_name}: {volume} conversations ({percentage}%)\n"
+                    parts.append(f"  - {theme_name}: {volume} conversations ({percentage}%)\n")
             
-            card += "\n"
+            parts.append("\n")
         
         # Extract highlights/lowlights if conversations are provided
         if conversations and examples and len(examples) >= 5:
             try:
-                highlights_lowlights = self._extract_highlights_lowlights(examples, topic_name, conversations)
+                highlights_lowlights = self._extract_highlights_lowlights(examples, topic_name, conversations, conv_lookup=conv_lookup)
                 highlights = highlights_lowlights.get('highlights', [])
                 lowlights = highlights_lowlights.get('lowlights', [])
                 
                 # Format highlights
                 if highlights:
-                    card += "**Highlights** (Best Experiences) ✅:\n\n"
+                    parts.append("**Highlights** (Best Experiences) ✅:\n\n")
                     for i, example in enumerate(highlights, 1):
-                        preview = example.get('preview', 'No preview available')
-                        url = example.get('intercom_url', '#')
-                        language = example.get('language', 'English')
-                        translation = example.get('translation')
-                        
-                        if translation and language != 'English':
-                            card += f"{i}. \"{translation}\"\n"
-                            card += f"   _{language}: \"{preview}\"_\n"
-                            card += f"   **[📎 View in Intercom →]({url})**\n\n"
-                        else:
-                            lang_label = f"_{language}_ " if language and language != 'English' else ""
-                            card += f"{i}. {lang_label}\"{preview}\"\n"
-                            card += f"   **[📎 View in Intercom →]({url})**\n\n"
+                        parts.append(self._format_example_entry(i, example))
                 
                 # Format lowlights
                 if lowlights:
-                    card += "**Lowlights** (Areas for Improvement) ⚠️:\n\n"
+                    parts.append("**Lowlights** (Areas for Improvement) ⚠️:\n\n")
                     for i, example in enumerate(lowlights, 1):
-                        preview = example.get('preview', 'No preview available')
-                        url = example.get('intercom_url', '#')
-                        language = example.get('language', 'English')
-                        translation = example.get('translation')
-                        
-                        if translation and language != 'English':
-                            card += f"{i}. \"{translation}\"\n"
-                            card += f"   _{language}: \"{preview}\"_\n"
-                            card += f"   **[📎 View in Intercom →]({url})**\n\n"
-                        else:
-                            lang_label = f"_{language}_ " if language and language != 'English' else ""
-                            card += f"{i}. {lang_label}\"{preview}\"\n"
-                            card += f"   **[📎 View in Intercom →]({url})**\n\n"
+                        parts.append(self._format_example_entry(i, example))
                 
             except Exception as e:
                 self.logger.warning(f"Error extracting highlights/lowlights for {topic_name}: {e}")
@@ -869,34 +850,45 @@ Return ONLY valid JSON, no other text:
         
         # If no highlights/lowlights extraction, show all examples
         if not (conversations and examples and len(examples) >= 5):
-            card += "**Examples**:\n\n"
+            parts.append("**Examples**:\n\n")
         
         # Add examples with validation, language info, translation, and enhanced link formatting
         if examples and len(examples) > 0:
             for i, example in enumerate(examples, 1):
-                # Defensive read of example fields
-                preview = example.get('preview', 'No preview available') if isinstance(example, dict) else 'Invalid example format'
-                url = example.get('intercom_url', '#') if isinstance(example, dict) else '#'
-                language = example.get('language', 'English') if isinstance(example, dict) else 'English'
-                translation = example.get('translation') if isinstance(example, dict) else None
-                
-                # Format based on whether translation is available
-                if translation and language != 'English':
-                    # Show translation first (English), then original in italics
-                    card += f"{i}. \"{translation}\"\n"
-                    card += f"   _{language}: \"{preview}\"_\n"
-                    card += f"   **[📎 View in Intercom →]({url})**\n\n"
-                else:
-                    # Show language label for non-English without translation
-                    lang_label = f"_{language}_ " if language and language != 'English' else ""
-                    card += f"{i}. {lang_label}\"{preview}\"\n"
-                    card += f"   **[📎 View in Intercom →]({url})**\n\n"
+                parts.append(self._format_example_entry(i, example))
         else:
-            card += "_No examples available - topic may have low volume or quality conversations_\n"
+            parts.append("_No examples available - topic may have low volume or quality conversations_\n")
         
-        card += "\n---\n"
+        parts.append("\n---\n")
         
-        return card
+        return ''.join(parts)
+    
+    def _format_example_entry(self, number: int, example: Dict) -> str:
+        """Format one numbered example: translation or language label, preview and Intercom link"""
+        # Defensive read of example fields
+        if isinstance(example, dict):
+            preview = example.get('preview', 'No preview available')
+            url = example.get('intercom_url', '#')
+            language = example.get('language', 'English')
+            translation = example.get('translation')
+        else:
+            preview, url, language, translation = 'Invalid example format', '#', 'English', None
+        
+        # Format based on whether translation is available
+        if translation and language != 'English':
+            # Show translation first (English), then original in italics
+            return (
+                f"{number}. \"{translation}\"\n"
+                f"   _{language}: \"{preview}\"_\n"
+                f"   **[📎 View in Intercom →]({url})**\n\n"
+            )
+        
+        # Show language label for non-English without translation
+        lang_label = f"_{language}_ " if language and language != 'English' else ""
+        return (
+            f"{number}. {lang_label}\"{preview}\"\n"
+            f"   **[📎 View in Intercom →]({url})**\n\n"
+        )
     
     def _format_fin_card(self, fin_data: Dict) -> str:
         """Format Fin AI performance card"""
@@ -1353,7 +1345,12 @@ Return ONLY valid JSON, no other text:
             self.logger.warning(f"Error formatting comparison section: {e}")
             return "## Week-over-Week Changes 📊\n\n_Comparison data unavailable_\n\n"
     
-    def _extract_highlights_lowlights(self, examples: List[Dict], topic_name: str, conversations: List[Dict]) -> Dict[str, List[Dict]]:
+    @staticmethod
+    def _build_conversation_lookup(conversations: List[Dict]) -> Dict[str, Dict]:
+        """Conversations by id, with ids normalized to strings"""
+        return {str(conv.get('id')): conv for conv in conversations}
+    
+    def _extract_highlights_lowlights(self, examples: List[Dict], topic_name: str, conversations: List[Dict], conv_lookup: Dict[str, Dict] = None) -> Dict[str, List[Dict]]:
         """
         Extract highlights (best) and lowlights (worst) from examples based on CSAT, resolution time, and sentiment.
         
@@ -1361,6 +1358,7 @@ Return ONLY valid JSON, no other text:
             examples: List of example dicts
             topic_name: Topic name for context
             conversations: Full conversation list for looking up additional data
+            conv_lookup: Prebuilt lookup from _build_conversation_lookup (built from conversations if omitted)
             
         Returns:
             Dict with 'highlights' and 'lowlights' lists
@@ -1370,7 +1368,8 @@ Return ONLY valid JSON, no other text:
             return {'highlights': examples, 'lowlights': []}
         
         # Create conversation lookup with normalized string keys
-        conv_lookup = {str(conv.get('id')): conv for conv in conversations}
+        if conv_lookup is None:
+            conv_lookup = self._build_conversation_lookup(conversations)
         
         # Score each example
         scored_examples = []
@@ -35,6 +35,14 @@ class ConversationDataExtractor:
                     public_email = self._get_public_email_for_admin(conv, admin_id)
                     unique_admins[admin_id] = public_email
 
+        # Load the admin directory in bulk so the per-admin lookups below hit the cache
+        lookup_tool = self.tool_registry.tools.get('lookup_admin_profile')
+        if unique_admins and hasattr(lookup_tool, 'prefetch'):
+            try:
+                await lookup_tool.prefetch(unique_admins.keys())
+            except Exception as e:
+                logger.warning(f"Admin profile prefetch failed: {e}")
+
         # Use tool-based lookups for admin profiles
         tasks = []
         for admin_id, public_email in unique_admins.items():
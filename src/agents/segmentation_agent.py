@@ -19,6 +19,7 @@ Performance Modes:
 
 import logging
 import re
+from dataclasses import dataclass
 from typing import Dict, Any, List
 from datetime import datetime
 from pydantic import ValidationError
@@ -26,7 +27,7 @@ from pydantic import ValidationError
 from src.agents.base_agent import BaseAgent, AgentResult, AgentContext, ConfidenceLevel
 from src.models.analysis_models import CustomerTier, SegmentationPayload
 from src.services.fin_escalation_analyzer import is_fin_resolved
-from src.utils.conversation_utils import extract_conversation_text
+from src.utils.conversation_utils import clean_html_text
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,29 @@ def is_sal_or_fin(author: Dict) -> bool:
     return is_sal
 
 
+@dataclass
+class EscalationScan:
+    """
+    Signals gathered in one ordered walk over a paid conversation
+    (assignee, source, parts, then notes) for escalation-chain classification.
+
+    The part counters are only complete when the walk was not cut short,
+    i.e. when the chain was not already settled by senior staff detection.
+    """
+    has_senior_staff: bool = False
+    has_horatio: bool = False
+    has_boldr: bool = False
+    human_admin_parts: int = 0
+    bot_parts: int = 0
+    user_parts: int = 0
+    text_tail: str = ''  # End of the text seen so far, for names spanning two parts
+
+    def chain_settled(self, fin_involved: bool) -> bool:
+        """True once further parts cannot change the escalation chain."""
+        # Senior staff outranks vendors without Fin; with Fin it needs a vendor to be final
+        return self.has_senior_staff and (not fin_involved or self.has_horatio or self.has_boldr)
+
+
 class SegmentationAgent(BaseAgent):
     """
     Agent specialized in customer tier and agent type segmentation.
@@ -101,6 +125,13 @@ class SegmentationAgent(BaseAgent):
             'horatio': r'horatio|@horatio\.com|@hirehoratio\.co',
             'boldr': r'\bboldr\b|@boldrimpact\.com'
         }
+        
+        # Compiled once for the per-conversation escalation walk
+        self._tier1_regexes = {vendor: re.compile(pattern) for vendor, pattern in self.tier1_patterns.items()}
+        self._escalation_email_forms = tuple(
+            form for name in self.escalation_names for form in (name.replace(' ', '.'), name.replace(' ', ''))
+        )
+        self._name_overlap = max((len(name) for name in self.escalation_names), default=1) - 1
 
     def _extract_customer_tier(self, conv: Dict) -> CustomerTier:
         """
@@ -133,36 +164,36 @@ class SegmentationAgent(BaseAgent):
                 stripe_plan = custom_attrs.get('stripe_plan')
                 
                 if stripe_status == 'active' and stripe_plan:
-                    self.logger.debug(f"Found active Stripe subscription '{stripe_plan}' for conversation {conv_id}")
+                    self.logger.debug("Found active Stripe subscription '%s' for conversation %s", stripe_plan, conv_id)
                     
                     # Map Stripe plan to CustomerTier
                     plan_lower = str(stripe_plan).lower()
                     
                     if 'team' in plan_lower:
-                        self.logger.debug(f"Detected TEAM tier from Stripe plan for conversation {conv_id}")
+                        self.logger.debug("Detected TEAM tier from Stripe plan for conversation %s", conv_id)
                         return CustomerTier.TEAM
                     elif 'business' in plan_lower:
-                        self.logger.debug(f"Detected BUSINESS tier from Stripe plan for conversation {conv_id}")
+                        self.logger.debug("Detected BUSINESS tier from Stripe plan for conversation %s", conv_id)
                         return CustomerTier.BUSINESS
                     elif 'plus' in plan_lower:
-                        self.logger.debug(f"Detected PLUS tier from Stripe plan for conversation {conv_id}")
+                        self.logger.debug("Detected PLUS tier from Stripe plan for conversation %s", conv_id)
                         return CustomerTier.PLUS
                     elif 'pro' in plan_lower:
-                        self.logger.debug(f"Detected PRO tier from Stripe plan for conversation {conv_id}")
+                        self.logger.debug("Detected PRO tier from Stripe plan for conversation %s", conv_id)
                         return CustomerTier.PRO
                     elif 'ultra' in plan_lower:
-                        self.logger.debug(f"Detected ULTRA tier from Stripe plan for conversation {conv_id}")
+                        self.logger.debug("Detected ULTRA tier from Stripe plan for conversation %s", conv_id)
                         return CustomerTier.ULTRA
                     else:
                         # Active Stripe subscription but unrecognized plan name
                         # Default to TEAM (lowest paid tier) rather than FREE
-                        self.logger.debug(f"Active Stripe plan '{stripe_plan}' doesn't match known tiers, defaulting to TEAM for conversation {conv_id}")
+                        self.logger.debug("Active Stripe plan '%s' doesn't match known tiers, defaulting to TEAM for conversation %s", stripe_plan, conv_id)
                         return CustomerTier.TEAM
         
         # PRIORITY 2: Pre-validated tier from ConversationSchema (if Stripe not available)
         tier = conv.get('tier')
         if isinstance(tier, CustomerTier):
-            self.logger.debug(f"No Stripe data, using pre-validated tier {tier.value} for conversation {conv_id}")
+            self.logger.debug("No Stripe data, using pre-validated tier %s for conversation %s", tier.value, conv_id)
             return tier
         
         # PRIORITY 3: custom_attributes.tier string (fallback if Stripe and pre-validated unavailable)
@@ -171,11 +202,11 @@ class SegmentationAgent(BaseAgent):
                 tier_string_lower = tier.strip().lower()
                 for tier_enum in CustomerTier:
                     if tier_enum.value.lower() == tier_string_lower:
-                        self.logger.debug(f"No Stripe data, extracted tier {tier_enum.value} from top-level string for conversation {conv_id}")
+                        self.logger.debug("No Stripe data, extracted tier %s from top-level string for conversation %s", tier_enum.value, conv_id)
                         return tier_enum
-                self.logger.debug(f"Top-level tier string '{tier}' did not match any CustomerTier enum for conversation {conv_id}")
+                self.logger.debug("Top-level tier string '%s' did not match any CustomerTier enum for conversation %s", tier, conv_id)
             except Exception as e:
-                self.logger.debug(f"Error processing top-level tier string for conversation {conv_id}: {e}")
+                self.logger.debug("Error processing top-level tier string for conversation %s: %s", conv_id, e)
 
         # PRIORITY 4: Check contact custom_attributes.tier
         tier_string = None
@@ -198,13 +229,13 @@ class SegmentationAgent(BaseAgent):
                 tier_string_lower = str(tier_string).lower()
                 for tier_enum in CustomerTier:
                     if tier_enum.value.lower() == tier_string_lower:
-                        self.logger.debug(f"No Stripe data, extracted tier {tier_enum.value} from custom_attributes for conversation {conv_id}")
+                        self.logger.debug("No Stripe data, extracted tier %s from custom_attributes for conversation %s", tier_enum.value, conv_id)
                         return tier_enum
 
                 # Unknown tier value
-                self.logger.debug(f"Unknown tier value '{tier_string}' for conversation {conv_id}, defaulting to FREE")
+                self.logger.debug("Unknown tier value '%s' for conversation %s, defaulting to FREE", tier_string, conv_id)
             except Exception as e:
-                self.logger.debug(f"Error matching tier for conversation {conv_id}: {e}, defaulting to FREE")
+                self.logger.debug("Error matching tier for conversation %s: %s, defaulting to FREE", conv_id, e)
         
         # PRIORITY 5 (LAST): Check "Paid Users" segment as final fallback before FREE
         if contacts_data and isinstance(contacts_data, dict):
@@ -218,11 +249,11 @@ class SegmentationAgent(BaseAgent):
                     if 'segments' in segments and len(segments['segments']) > 0:
                         for segment in segments['segments']:
                             if segment.get('name') == 'Paid Users':
-                                self.logger.debug(f"Contact is in 'Paid Users' segment for conversation {conv_id}, defaulting to TEAM (lowest paid tier)")
+                                self.logger.debug("Contact is in 'Paid Users' segment for conversation %s, defaulting to TEAM (lowest paid tier)", conv_id)
                                 return CustomerTier.TEAM
 
         # Final default to FREE
-        self.logger.debug(f"No tier data found for conversation {conv_id}, defaulting to FREE")
+        self.logger.debug("No tier data found for conversation %s, defaulting to FREE", conv_id)
         return CustomerTier.FREE
 
     def get_agent_specific_instructions(self) -> str:
@@ -327,8 +358,15 @@ Output: Segmented conversations with agent type labels
                 'unknown': []        # Unclassified
             }
             
+            # Tier distribution tracking, tier data quality and language breakdown
+            tier_distribution = {'free': 0, 'team': 0, 'business': 0, 'pro': 0, 'plus': 0, 'ultra': 0, 'unknown': 0}
+            defaulted_tier_count = 0
+            language_distribution = {}
+            
+            # One pass over the corpus: tier is extracted once and shared with classification
             for conv in conversations:
-                segment, agent_type = self._classify_conversation(conv)
+                tier = self._extract_customer_tier(conv)
+                segment, agent_type = self._classify_conversation(conv, tier)
 
                 if segment == 'paid':
                     paid_customers.append(conv)
@@ -343,60 +381,15 @@ Output: Segmented conversations with agent type labels
                     agent_type = 'unknown'
                 
                 agent_distribution[agent_type].append(conv)
-
-            # Tier distribution tracking and tier data quality
-            tier_distribution = {'free': 0, 'team': 0, 'business': 0, 'pro': 0, 'plus': 0, 'ultra': 0, 'unknown': 0}
-            defaulted_tier_count = 0
-
-            for conv in conversations:
-                tier = self._extract_customer_tier(conv)
-                if tier == CustomerTier.FREE:
-                    tier_distribution['free'] += 1
-
-                    # Check if tier was defaulted (missing from all sources)
-                    # Check pre-validated tier
-                    has_tier = isinstance(conv.get('tier'), CustomerTier)
-                    # Check top-level string tier - must match a valid CustomerTier enum value
-                    if not has_tier:
-                        top_tier = conv.get('tier')
-                        if top_tier and isinstance(top_tier, str) and top_tier.strip():
-                            tier_string_lower = top_tier.strip().lower()
-                            has_tier = any(tier_enum.value.lower() == tier_string_lower for tier_enum in CustomerTier)
-                    # Check contact-level custom attributes - must match a valid CustomerTier enum value
-                    if not has_tier:
-                        contacts_data = conv.get('contacts', {})
-                        if contacts_data and isinstance(contacts_data, dict):
-                            contacts_list = contacts_data.get('contacts', [])
-                            if contacts_list and len(contacts_list) > 0:
-                                contact = contacts_list[0]
-                                custom_attrs = contact.get('custom_attributes', {})
-                                contact_tier = custom_attrs.get('tier')
-                                if contact_tier and isinstance(contact_tier, str) and contact_tier.strip():
-                                    tier_string_lower = contact_tier.strip().lower()
-                                    has_tier = any(tier_enum.value.lower() == tier_string_lower for tier_enum in CustomerTier)
-                    # Check conversation-level custom attributes - must match a valid CustomerTier enum value
-                    if not has_tier:
-                        custom_attrs = conv.get('custom_attributes', {})
-                        conv_tier = custom_attrs.get('tier')
-                        if conv_tier and isinstance(conv_tier, str) and conv_tier.strip():
-                            tier_string_lower = conv_tier.strip().lower()
-                            has_tier = any(tier_enum.value.lower() == tier_string_lower for tier_enum in CustomerTier)
-
-                    if not has_tier:
-                        defaulted_tier_count += 1
-
-                elif tier == CustomerTier.TEAM:
-                    tier_distribution['team'] += 1
-                elif tier == CustomerTier.BUSINESS:
-                    tier_distribution['business'] += 1
-                elif tier == CustomerTier.PRO:
-                    tier_distribution['pro'] += 1
-                elif tier == CustomerTier.PLUS:
-                    tier_distribution['plus'] += 1
-                elif tier == CustomerTier.ULTRA:
-                    tier_distribution['ultra'] += 1
-                else:
-                    tier_distribution['unknown'] += 1
+                
+                tier_key = tier.value if tier.value in tier_distribution else 'unknown'
+                tier_distribution[tier_key] += 1
+                if tier == CustomerTier.FREE and not self._has_tier_data(conv):
+                    # Tier was defaulted (missing from all sources)
+                    defaulted_tier_count += 1
+                
+                lang = conv.get('custom_attributes', {}).get('Language', 'English')
+                language_distribution[lang] = language_distribution.get(lang, 0) + 1
 
             # Log tier distribution
             total = len(conversations)
@@ -418,13 +411,7 @@ Output: Segmented conversations with agent type labels
                     f"Ultra: {tier_distribution['ultra']} ({ultra_pct}%)"
                 )
 
-            # Calculate language breakdown
-            language_distribution = {}
-            for conv in conversations:
-                lang = conv.get('custom_attributes', {}).get('Language', 'English')
-                language_distribution[lang] = language_distribution.get(lang, 0) + 1
-            
-            # Sort by count
+            # Sort languages by count
             sorted_languages = dict(sorted(
                 language_distribution.items(),
                 key=lambda x: x[1],
@@ -562,6 +549,37 @@ Output: Segmented conversations with agent type labels
                 execution_time=execution_time
             )
     
+    def _has_tier_data(self, conv: Dict) -> bool:
+        """True if any tier source (pre-validated, top-level, contact or conversation attribute) names a valid tier."""
+        # Check pre-validated tier
+        has_tier = isinstance(conv.get('tier'), CustomerTier)
+        # Check top-level string tier - must match a valid CustomerTier enum value
+        if not has_tier:
+            top_tier = conv.get('tier')
+            if top_tier and isinstance(top_tier, str) and top_tier.strip():
+                tier_string_lower = top_tier.strip().lower()
+                has_tier = any(tier_enum.value.lower() == tier_string_lower for tier_enum in CustomerTier)
+        # Check contact-level custom attributes - must match a valid CustomerTier enum value
+        if not has_tier:
+            contacts_data = conv.get('contacts', {})
+            if contacts_data and isinstance(contacts_data, dict):
+                contacts_list = contacts_data.get('contacts', [])
+                if contacts_list and len(contacts_list) > 0:
+                    contact = contacts_list[0]
+                    custom_attrs = contact.get('custom_attributes', {})
+                    contact_tier = custom_attrs.get('tier')
+                    if contact_tier and isinstance(contact_tier, str) and contact_tier.strip():
+                        tier_string_lower = contact_tier.strip().lower()
+                        has_tier = any(tier_enum.value.lower() == tier_string_lower for tier_enum in CustomerTier)
+        # Check conversation-level custom attributes - must match a valid CustomerTier enum value
+        if not has_tier:
+            custom_attrs = conv.get('custom_attributes', {})
+            conv_tier = custom_attrs.get('tier')
+            if conv_tier and isinstance(conv_tier, str) and conv_tier.strip():
+                tier_string_lower = conv_tier.strip().lower()
+                has_tier = any(tier_enum.value.lower() == tier_string_lower for tier_enum in CustomerTier)
+        return has_tier
+    
     def _determine_ai_participation(self, conv: Dict) -> bool:
         """
         Determine if Fin AI participated in conversation using SDK-compliant precedence.
@@ -588,23 +606,23 @@ Output: Segmented conversations with agent type labels
         ai_agent = conv.get('ai_agent')
         if ai_agent is not None:
             # ai_agent object exists -> Fin participated
-            self.logger.debug(f"Conversation {conv_id}: ai_agent object present -> Fin participated")
+            self.logger.debug("Conversation %s: ai_agent object present -> Fin participated", conv_id)
             return True
         
         # Priority 2: Check ai_agent_participated boolean field (fallback)
         ai_participated = conv.get('ai_agent_participated')
         if ai_participated is not None:
             # Use boolean value
-            self.logger.debug(f"Conversation {conv_id}: ai_agent_participated={ai_participated}")
+            self.logger.debug("Conversation %s: ai_agent_participated=%s", conv_id, ai_participated)
             return bool(ai_participated)
         
         # Priority 3: Content heuristic - check if starts with "Finn" (legacy fallback)
         if self._starts_with_finn(conv):
-            self.logger.debug(f"Conversation {conv_id}: Starts with 'Finn' -> Fin participated (heuristic)")
+            self.logger.debug("Conversation %s: Starts with 'Finn' -> Fin participated (heuristic)", conv_id)
             return True
         
         # No evidence of Fin participation
-        self.logger.debug(f"Conversation {conv_id}: No Fin participation detected")
+        self.logger.debug("Conversation %s: No Fin participation detected", conv_id)
         return False
     
     def _starts_with_finn(self, conv: Dict) -> bool:
@@ -629,7 +647,7 @@ Output: Segmented conversations with agent type labels
         
         return False
     
-    def _classify_conversation(self, conv: Dict) -> tuple[str, str]:
+    def _classify_conversation(self, conv: Dict, tier: CustomerTier = None) -> tuple[str, str]:
         """
         Classify conversation by customer tier and optionally ESCALATION CHAIN.
 
@@ -643,6 +661,10 @@ Output: Segmented conversations with agent type labels
         2. Free tier → always ('free', 'fin_ai') regardless of admin assignment
         3. Paid tier → detect escalation chain (if enabled) or simple Paid/Fin split
 
+        Args:
+            conv: Conversation dictionary
+            tier: Customer tier if already extracted (extracted from conv otherwise)
+
         Returns:
             (segment, agent_type) where:
             segment: 'paid', 'free', 'unknown'
@@ -652,11 +674,9 @@ Output: Segmented conversations with agent type labels
         conv_id = conv.get('id', 'unknown')
 
         # Step 1: Extract tier FIRST (tier-first classification)
-        tier = self._extract_customer_tier(conv)
-        
-        # Paid tiers: TEAM, BUSINESS, PRO, PLUS, ULTRA
-        is_paid_tier = tier in [CustomerTier.TEAM, CustomerTier.BUSINESS, CustomerTier.PRO, CustomerTier.PLUS, CustomerTier.ULTRA]
-        self.logger.debug(f"Conversation {conv_id} tier: {tier.value}")
+        if tier is None:
+            tier = self._extract_customer_tier(conv)
+        self.logger.debug("Conversation %s tier: %s", conv_id, tier.value)
 
         # Step 2: Free tier early return
         # Free tier customers can ONLY interact with Fin AI (no human escalation possible)
@@ -686,10 +706,7 @@ Output: Segmented conversations with agent type labels
                 return ('paid', 'unknown')  # Generic paid with human
         
         # DETAILED PATH: Track full escalation chains
-        # Extract actual conversation text for vendor/staff detection
-        text = extract_conversation_text(conv, clean_html=True).lower()
         ai_participated = self._determine_ai_participation(conv)
-        starts_with_finn = self._starts_with_finn(conv)
         
         # Get ai_agent object with resolution data (per Intercom SDK spec)
         # NOTE: ai_agent field is OPTIONAL - may be absent or None
@@ -701,180 +718,75 @@ Output: Segmented conversations with agent type labels
             ai_resolution_state = ai_agent.get('resolution_state')
             # resolution_state may also be None even when ai_agent exists
             if ai_resolution_state is not None:
-                self.logger.debug(f"Conversation {conv_id}: ai_agent.resolution_state = {ai_resolution_state}")
+                self.logger.debug("Conversation %s: ai_agent.resolution_state = %s", conv_id, ai_resolution_state)
             else:
-                self.logger.debug(f"Conversation {conv_id}: ai_agent present but resolution_state is None")
+                self.logger.debug("Conversation %s: ai_agent present but resolution_state is None", conv_id)
         else:
-            self.logger.debug(f"Conversation {conv_id}: ai_agent field is absent or None")
-
+            self.logger.debug("Conversation %s: ai_agent field is absent or None", conv_id)
+        
         # Log conversation data for debugging (ai_participated is now from helper)
         self.logger.debug(
-            f"Classifying paid tier conversation {conv_id}: "
-            f"admin_assignee_id={conv.get('admin_assignee_id')}, "
-            f"ai_participated={ai_participated} (via _determine_ai_participation), "
-            f"ai_resolution_state={ai_resolution_state}"
+            "Classifying paid tier conversation %s: admin_assignee_id=%s, "
+            "ai_participated=%s (via _determine_ai_participation), ai_resolution_state=%s",
+            conv_id, conv.get('admin_assignee_id'), ai_participated, ai_resolution_state
         )
         
-        # Extract admin emails from conversation parts and any assignee fields
-        admin_emails = []
-        
-        # Check conversation parts for admin emails (handle None case)
-        # NOTE: Filter out Sal/Support Sal as Sal is Fin AI, not a human admin
-        conversation_parts_data = conv.get('conversation_parts', {})
-        if conversation_parts_data is None:
-            conversation_parts_data = {}
-        conv_parts = conversation_parts_data.get('conversation_parts', [])
-        for part in conv_parts:
-            author = part.get('author', {})
-            if author.get('type') == 'admin':
-                # Skip Sal/Support Sal (Fin AI, not human)
-                if not is_sal_or_fin(author):
-                    email = author.get('email', '')
-                    if email:
-                        admin_emails.append(email.lower())
-        
-        # Check source/initial message for admin email
-        # NOTE: Filter out Sal/Support Sal as Sal is Fin AI, not a human admin
-        source = conv.get('source', {})
-        source_author = source.get('author', {})
-        if source_author.get('type') == 'admin':
-            # Skip Sal/Support Sal (Fin AI, not human)
-            if not is_sal_or_fin(source_author):
-                email = source_author.get('email', '')
-                if email:
-                    admin_emails.append(email.lower())
-        
-        # Check top-level assignee email if available
-        # NOTE: `assignee` field may be absent; `assignee.email` is per admin_assignee structure
-        # For reliable admin email resolution, use AdminProfileCache with admin_assignee_id
-        assignee_data = conv.get('assignee')
-        if assignee_data is not None and isinstance(assignee_data, dict):
-            assignee_email = assignee_data.get('email')
-            if assignee_email:
-                admin_emails.append(assignee_email.lower())
-                self.logger.debug(f"Conversation {conv_id}: Found assignee email: {assignee_email}")
-        
-        # Alternative: Resolve admin_assignee_id via AdminProfileCache for reliable email
-        # admin_assignee_id = conv.get('admin_assignee_id')
-        # if admin_assignee_id:
-        #     from src.services.admin_profile_cache import AdminProfileCache
-        #     cache = AdminProfileCache()
-        #     admin_profile = cache.get_admin_profile(admin_assignee_id)
-        #     if admin_profile and admin_profile.get('email'):
-        #         admin_emails.append(admin_profile['email'].lower())
-        
-        # Log extracted admin emails for debugging
-        if admin_emails:
-            self.logger.debug(f"Conversation {conv_id}: Found {len(admin_emails)} admin emails: {admin_emails}")
-        else:
-            self.logger.debug(f"Conversation {conv_id}: No admin emails found (might be Support Sal or bot)")
-        
-        # DETECT ESCALATION CHAIN - Don't return early, collect ALL agents
-        has_senior_staff = False
-        has_horatio = False
-        has_boldr = False
-        
-        # Check for senior staff (Dae-Ho, Max, Hilary)
-        for name in self.escalation_names:
-            if name in text:
-                has_senior_staff = True
-                self.logger.info(f"✓ Senior staff detected via text: {name}")
-                break
-            # Also check admin emails
-            for email in admin_emails:
-                if name.replace(' ', '.') in email or name.replace(' ', '') in email:
-                    has_senior_staff = True
-                    self.logger.info(f"✓ Senior staff detected via email: {email}")
-                    break
-        
-        # Check for vendor agents (Horatio/Boldr) via email domains
-        for email in admin_emails:
-            self.logger.debug(f"Checking email for agent type: {email}")
-            
-            # Horatio detection
-            if 'horatio' in email or 'hirehoratio' in email:
-                has_horatio = True
-                self.logger.info(f"✓ Horatio agent detected via email: {email}")
-            
-            # Boldr detection
-            if 'boldr' in email:
-                has_boldr = True
-                self.logger.info(f"✓ Boldr agent detected via email: {email}")
-        
-        # Fallback to text patterns for vendor detection
-        if not has_horatio and re.search(self.tier1_patterns['horatio'], text):
-            has_horatio = True
-            self.logger.debug(f"Horatio agent detected via text pattern in conversation {conv_id}")
-        
-        if not has_boldr and re.search(self.tier1_patterns['boldr'], text):
-            has_boldr = True
-            self.logger.debug(f"Boldr agent detected via text pattern in conversation {conv_id}")
-        
-        # NOW DETERMINE ESCALATION CHAIN based on detected agents
-        # Check if Fin was involved (already determined via _determine_ai_participation)
+        # DETECT ESCALATION CHAIN - one walk over admin emails and conversation text,
+        # stopping as soon as the chain can no longer change
+        # Priority: Senior Staff > Vendor > Fin Only
         fin_involved = ai_participated
+        scan = self._scan_escalation_chain(conv, fin_involved)
+        has_senior_staff = scan.has_senior_staff
+        has_horatio = scan.has_horatio
+        has_boldr = scan.has_boldr
         
-        if fin_involved:
-            self.logger.info(f"Conversation {conv_id}: Fin detected (via _determine_ai_participation: {ai_participated})")
-        
-        # ESCALATION CHAIN LOGIC:
-        # Priority: Senior Staff > Vendor > Fin Only
+        self.logger.debug(
+            "Conversation %s: fin=%s, senior_staff=%s, horatio=%s, boldr=%s",
+            conv_id, fin_involved, has_senior_staff, has_horatio, has_boldr
+        )
         
         if fin_involved:
             # Scenario 3: FIN → VENDOR → SENIOR STAFF
             if has_senior_staff and (has_horatio or has_boldr):
-                vendor = 'horatio' if has_horatio else 'boldr'
-                self.logger.info(f"🔥 ESCALATION CHAIN: Fin → {vendor.title()} → Senior Staff")
+                self.logger.debug("🔥 ESCALATION CHAIN: Fin → %s → Senior Staff", 'Horatio' if has_horatio else 'Boldr')
                 return 'paid', 'fin_to_vendor_to_senior'
             
             # Scenario 2A: FIN → HORATIO
             elif has_horatio:
-                self.logger.info(f"📈 ESCALATION CHAIN: Fin → Horatio")
+                self.logger.debug("📈 ESCALATION CHAIN: Fin → Horatio")
                 return 'paid', 'fin_to_horatio'
             
             # Scenario 2B: FIN → BOLDR
             elif has_boldr:
-                self.logger.info(f"📈 ESCALATION CHAIN: Fin → Boldr")
+                self.logger.debug("📈 ESCALATION CHAIN: Fin → Boldr")
                 return 'paid', 'fin_to_boldr'
             
             # Edge case: Fin → Senior Staff directly (skip vendor)
             elif has_senior_staff:
-                self.logger.info(f"🔥 ESCALATION CHAIN: Fin → Senior Staff (direct)")
+                self.logger.debug("🔥 ESCALATION CHAIN: Fin → Senior Staff (direct)")
                 return 'paid', 'fin_to_senior_direct'
             
             # Scenario 1: JUST FIN (no escalation)
             else:
-                self.logger.info(f"✅ NO ESCALATION: Just Fin")
+                self.logger.debug("✅ NO ESCALATION: Just Fin")
                 return 'paid', 'fin_only'
         
         # NO FIN DETECTED - Direct human handling
         # This means conversation went straight to human without Fin
         if has_senior_staff:
-            self.logger.info(f"Human only: Senior staff (no Fin)")
+            self.logger.debug("Human only: Senior staff (no Fin)")
             return 'paid', 'escalated'
         elif has_horatio:
-            self.logger.info(f"Human only: Horatio (no Fin)")
+            self.logger.debug("Human only: Horatio (no Fin)")
             return 'paid', 'horatio'
         elif has_boldr:
-            self.logger.info(f"Human only: Boldr (no Fin)")
+            self.logger.debug("Human only: Boldr (no Fin)")
             return 'paid', 'boldr'
         
-        # Check for HUMAN admin response in conversation parts (not Sal)
-        # NOTE: Sal/Support Sal is Fin AI, not a human admin
-        parts_list = conv.get('conversation_parts', {}).get('conversation_parts', [])
-        admin_parts = [p for p in parts_list if p.get('author', {}).get('type') == 'admin']
-        bot_parts = [p for p in parts_list if p.get('author', {}).get('type') == 'bot']
-        
-        # Filter out Sal from admin parts (Sal is Fin AI)
-        human_admin_parts = []
-        for part in admin_parts:
-            author = part.get('author', {})
-            # Skip Sal/Support Sal (Fin AI)
-            if not is_sal_or_fin(author):
-                human_admin_parts.append(part)
-        
-        has_admin_response = len(human_admin_parts) > 0
-        has_bot_response = len(bot_parts) > 0
+        # No known agent detected, so the walk covered every part: its counters are complete
+        # NOTE: Sal/Support Sal is Fin AI, not a human admin, and is not counted
+        has_admin_response = scan.human_admin_parts > 0
+        has_bot_response = scan.bot_parts > 0
         
         # Legacy fallback for old data without clear Fin markers
         # ai_participated is already determined via _determine_ai_participation()
@@ -882,38 +794,30 @@ Output: Segmented conversations with agent type labels
             # PRIMARY: Use Intercom's official ai_agent.resolution_state field (SDK spec)
             # This is the authoritative source from Intercom about whether Fin resolved it
             if ai_resolution_state:
-                self.logger.debug(f"Paid tier: Using ai_agent.resolution_state={ai_resolution_state}")
+                self.logger.debug("Paid tier: Using ai_agent.resolution_state=%s", ai_resolution_state)
                 
                 # Check if escalated to known human agents first (takes priority)
                 # If we already detected Horatio/Boldr/Escalated above, we wouldn't be here
                 
                 if ai_resolution_state.lower() in ['resolved', 'completed', 'closed']:
                     # Intercom says Fin resolved it - trust the SDK
-                    self.logger.debug(f"Paid tier: Fin RESOLVED per Intercom SDK (resolution_state={ai_resolution_state})")
+                    self.logger.debug("Paid tier: Fin RESOLVED per Intercom SDK (resolution_state=%s)", ai_resolution_state)
                     return 'paid', 'fin_resolved'
                 elif ai_resolution_state.lower() in ['escalated', 'handed_off', 'transferred']:
-                    # Intercom says it was escalated - check if to known agent or unknown
-                    self.logger.debug(f"Paid tier: Escalated per Intercom SDK (resolution_state={ai_resolution_state})")
-                    # Check for human admin emails to identify which agent
-                    if has_admin_response:
-                        for part in human_admin_parts:
-                            author_email = part.get('author', {}).get('email', '').lower()
-                            if author_email and '@' in author_email:
-                                if not any(x in author_email for x in ['support', 'fin', 'bot']):
-                                    return 'paid', 'unknown'  # Real human escalation
+                    # Intercom says it was escalated - the agent could not be identified above
+                    self.logger.debug("Paid tier: Escalated per Intercom SDK (resolution_state=%s)", ai_resolution_state)
                     return 'paid', 'unknown'  # Escalated but can't identify agent
                 else:
                     # Unknown resolution state - fall back to heuristics
-                    self.logger.debug(f"Paid tier: Unknown resolution_state '{ai_resolution_state}', using fallback logic")
+                    self.logger.debug("Paid tier: Unknown resolution_state '%s', using fallback logic", ai_resolution_state)
             
             # FALLBACK: If no ai_resolution_state, use heuristics (legacy conversations)
             if ai_resolution_state is None:
-                self.logger.debug(f"Paid tier: No ai_resolution_state, using fallback heuristics")
+                self.logger.debug("Paid tier: No ai_resolution_state, using fallback heuristics")
                 
                 # Check state, engagement, CSAT, reopens
-                user_parts = [p for p in parts_list if p.get('author', {}).get('type') == 'user']
                 is_closed = conv.get('state') == 'closed'
-                low_engagement = len(user_parts) <= 2
+                low_engagement = scan.user_parts <= 2
                 
                 rating_data = conv.get('conversation_rating')
                 if isinstance(rating_data, dict):
@@ -931,28 +835,139 @@ Output: Segmented conversations with agent type labels
                 if has_admin_response:
                     # Has admin + failed resolution signals = escalated
                     if not is_closed or has_bad_rating or reopens > 1:
-                        self.logger.debug(f"Paid tier: Fallback - escalated (admin present, poor resolution signals)")
+                        self.logger.debug("Paid tier: Fallback - escalated (admin present, poor resolution signals)")
                         return 'paid', 'unknown'
                 
                 # No human escalation + good signals = Fin resolved
                 if (is_closed or low_engagement) and not has_bad_rating and reopens <= 1:
-                    self.logger.debug(f"Paid tier: Fallback - Fin resolved (good resolution signals)")
-                    return 'paid', 'fin_resolved'
+                    self.logger.debug("Paid tier: Fallback - Fin resolved (good resolution signals)")
                 else:
-                    self.logger.debug(f"Paid tier: Fallback - Fin resolved (default, ai_participated via helper=True)")
-                    return 'paid', 'fin_resolved'
+                    self.logger.debug("Paid tier: Fallback - Fin resolved (default, ai_participated via helper=True)")
+                return 'paid', 'fin_resolved'
         
         # ai_participated=False (via helper) but has admin response → Real human handled without Fin
         if has_admin_response:
-            self.logger.debug(f"Paid customer: Human admin (ai_participated via helper=False)")
+            self.logger.debug("Paid customer: Human admin (ai_participated via helper=False)")
             return 'paid', 'unknown'
         
         # No AI, no admin → edge case
         if has_bot_response:
-            self.logger.debug(f"Paid tier: Bot response but ai_participated via helper=False")
+            self.logger.debug("Paid tier: Bot response but ai_participated via helper=False")
             return 'paid', 'fin_resolved'
-
+        
         # Cannot determine
-        self.logger.debug(f"Unable to classify conversation {conv_id} - insufficient data")
+        self.logger.debug("Unable to classify conversation %s - insufficient data", conv_id)
         return 'unknown', 'unknown'
-
+    
+    def _scan_escalation_chain(self, conv: Dict, fin_involved: bool) -> EscalationScan:
+        """
+        Walk a conversation once, in order, collecting escalation signals.
+        
+        Admin emails come from the assignee, the source author and human (non-Sal)
+        admin parts; text comes from the source, part and note bodies, matched part
+        by part as it is cleaned. The walk stops as soon as the chain is settled.
+        
+        Args:
+            conv: Conversation dictionary
+            fin_involved: Whether Fin participated (decides when the chain is settled)
+            
+        Returns:
+            EscalationScan with detected agents and part counts
+        """
+        scan = EscalationScan()
+        
+        # Check top-level assignee email if available
+        # NOTE: `assignee` field may be absent; `assignee.email` is per admin_assignee structure
+        # For reliable admin email resolution, use AdminProfileCache with admin_assignee_id
+        assignee_data = conv.get('assignee')
+        if assignee_data is not None and isinstance(assignee_data, dict):
+            assignee_email = assignee_data.get('email')
+            if assignee_email:
+                self._scan_admin_email(scan, assignee_email)
+        
+        # Source/initial message: admin author email, then body text
+        # NOTE: Filter out Sal/Support Sal as Sal is Fin AI, not a human admin
+        source = conv.get('source') or {}
+        if isinstance(source, dict):
+            source_author = source.get('author') or {}
+            if source_author.get('type') == 'admin' and not is_sal_or_fin(source_author):
+                email = source_author.get('email', '')
+                if email:
+                    self._scan_admin_email(scan, email)
+            body = source.get('body', '')
+            if body:
+                self._scan_text(scan, body)
+        
+        # Conversation parts, in order (handle None and list forms)
+        conversation_parts = conv.get('conversation_parts') or {}
+        if isinstance(conversation_parts, dict):
+            parts = conversation_parts.get('conversation_parts') or []
+        elif isinstance(conversation_parts, list):
+            parts = conversation_parts
+        else:
+            parts = []
+        
+        for part in parts:
+            if scan.chain_settled(fin_involved):
+                return scan
+            if not isinstance(part, dict):
+                continue
+            
+            author = part.get('author') or {}
+            author_type = author.get('type')
+            if author_type == 'admin':
+                # Skip Sal/Support Sal (Fin AI, not human)
+                if not is_sal_or_fin(author):
+                    scan.human_admin_parts += 1
+                    email = author.get('email', '')
+                    if email:
+                        self._scan_admin_email(scan, email)
+            elif author_type == 'bot':
+                scan.bot_parts += 1
+            elif author_type == 'user':
+                scan.user_parts += 1
+            
+            body = part.get('body', '')
+            if body:
+                self._scan_text(scan, body)
+        
+        # Internal notes contribute text only
+        notes = conv.get('notes', {})
+        if isinstance(notes, dict):
+            for note in notes.get('notes') or []:
+                if scan.chain_settled(fin_involved):
+                    return scan
+                if isinstance(note, dict) and note.get('body'):
+                    self._scan_text(scan, note['body'])
+        
+        return scan
+    
+    def _scan_admin_email(self, scan: EscalationScan, email: str) -> None:
+        """Record senior staff and vendor agents identified by a human admin email."""
+        email = email.lower()
+        
+        # Senior staff (Dae-Ho, Max, Hilary) as first.last or firstlast
+        if not scan.has_senior_staff and any(form in email for form in self._escalation_email_forms):
+            scan.has_senior_staff = True
+        
+        # Vendor agents via email domains ('hirehoratio' contains 'horatio')
+        if 'horatio' in email:
+            scan.has_horatio = True
+        if 'boldr' in email:
+            scan.has_boldr = True
+    
+    def _scan_text(self, scan: EscalationScan, body: str) -> None:
+        """Match one cleaned body against senior staff names and vendor text patterns."""
+        text = clean_html_text(body).lower()
+        
+        # Bodies join with a space, so a name can span the end of the previous one
+        window = scan.text_tail + text
+        if not scan.has_senior_staff and any(name in window for name in self.escalation_names):
+            scan.has_senior_staff = True
+        scan.text_tail = (window + ' ')[-self._name_overlap:] if self._name_overlap else ''
+        
+        # Fallback to text patterns for vendor detection
+        if not scan.has_horatio and self._tier1_regexes['horatio'].search(text):
+            scan.has_horatio = True
+        if not scan.has_boldr and self._tier1_regexes['boldr'].search(text):
+            scan.has_boldr = True
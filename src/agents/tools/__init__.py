@@ -6,6 +6,7 @@ This module provides the base classes and registry for tools that agents can use
 
 from src.agents.tools.base_tool import BaseTool, ToolDefinition, ToolParameter, ToolResult
 from src.agents.tools.registry import ToolRegistry
+from src.agents.tools.result_cache import ToolResultCache, FrozenToolResult
 from src.agents.tools.admin_tools import AdminProfileLookupTool
 from src.agents.tools.database_tools import QueryConversationsTool
 from src.agents.tools.metric_tools import CalculateFCRTool, CalculateCSATTool
@@ -16,6 +17,8 @@ __all__ = [
     'ToolParameter',
     'ToolResult',
     'ToolRegistry',
+    'ToolResultCache',
+    'FrozenToolResult',
     'AdminProfileLookupTool',
     'QueryConversationsTool',
     'CalculateFCRTool',
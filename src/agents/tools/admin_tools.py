@@ -3,7 +3,7 @@ from src.services.admin_profile_cache import AdminProfileCache
 from src.services.intercom_sdk_service import IntercomSDKService
 from src.services.duckdb_storage import DuckDBStorage
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 
 
 class AdminProfileLookupTool(BaseTool):
@@ -61,6 +61,10 @@ class AdminProfileLookupTool(BaseTool):
             ]
         )
 
+    async def prefetch(self, admin_ids: Iterable[str]) -> int:
+        """Warm the profile cache for a batch of admins before per-admin lookups."""
+        return await self.cache.warm_up(admin_ids)
+
     async def execute(self, **kwargs) -> ToolResult:
         admin_id = str(kwargs.get('admin_id', '')).strip()
         public_email = kwargs.get('public_email')
@@ -1,5 +1,8 @@
 from typing import Dict, List, Optional, Any
 from src.agents.tools.base_tool import BaseTool, ToolResult, ToolDefinition
+from src.agents.tools.result_cache import ToolResultCache
+from src.services.duckdb_storage import DuckDBStorage
+from src.utils.run_profiler import record_cache_hit
 import logging
 import hashlib
 import json
@@ -13,16 +16,21 @@ class ToolRegistry:
     performance tracking, and error handling.
     """
     
-    def __init__(self, enable_caching: bool = True):
+    def __init__(self, enable_caching: bool = True, cache: Optional[ToolResultCache] = None):
         """
         Initialize the tool registry.
         
         Args:
             enable_caching: Whether to enable caching for tool results
+            cache: Result cache to use; pass the same instance to several
+                registries to share results across agents in one run.
+                Defaults to a private cache invalidated by DuckDB ingests.
         """
         self.tools: Dict[str, BaseTool] = {}
         self.enable_caching = enable_caching
-        self.cache: Dict[str, ToolResult] = {}
+        self.cache = cache if cache is not None else ToolResultCache(
+            generation_fn=DuckDBStorage.ingest_generation
+        )
         self.execution_count: Dict[str, int] = {}
         self.cache_hit_count: int = 0
         self.logger = logging.getLogger(__name__)
@@ -67,17 +75,21 @@ class ToolRegistry:
             return ToolResult(success=False, data=None, error_message=f"Tool '{tool_name}' not found in registry")
         
         cache_key = self._make_cache_key(tool_name, kwargs)
-        if self.enable_caching and cache_key in self.cache:
-            self.cache_hit_count += 1
-            self.logger.info(f"Cache hit for tool: {tool_name}")
-            return self.cache[cache_key].model_copy(deep=True)
+        if self.enable_caching:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                # Cached results are frozen, so the entry itself is returned
+                self.cache_hit_count += 1
+                record_cache_hit()
+                self.logger.info(f"Cache hit for tool: {tool_name}")
+                return cached
         
         tool = self.tools[tool_name]
         result = await tool.safe_execute(**kwargs)
         self.execution_count[tool_name] += 1
         
         if result.success and self.enable_caching:
-            self.cache[cache_key] = result.model_copy(deep=True)
+            result = self.cache.put(cache_key, result)
         
         self.logger.info(f"Tool executed: {tool_name} - Success: {result.success}, Time: {result.execution_time_ms:.1f}ms")
         return result
@@ -109,7 +121,8 @@ class ToolRegistry:
             "execution_counts": self.execution_count,
             "cache_hits": self.cache_hit_count,
             "cache_entries": len(self.cache),
-            "cache_enabled": self.enable_caching
+            "cache_enabled": self.enable_caching,
+            "cache": self.cache.get_stats()
         }
     
     def clear_cache(self) -> None:
@@ -0,0 +1,201 @@
+"""Bounded, TTL-aware cache for tool results shared across agents."""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from pydantic import ConfigDict
+
+from src.agents.tools.base_tool import ToolResult
+
+
+class FrozenDict(dict):
+    """Read-only dict; still a dict, so JSON serialization and lookups work unchanged."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached tool results are read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __hash__(self):
+        return id(self)
+
+
+class FrozenToolResult(ToolResult):
+    """ToolResult whose fields and payload cannot be modified, so hits can be shared."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts, lists and sets into immutable equivalents."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+
+@dataclass
+class _CacheEntry:
+    result: FrozenToolResult
+    size_bytes: int
+    expires_at: float
+    generation: int
+
+
+class ToolResultCache:
+    """
+    LRU cache for successful tool results, bounded by entry count, payload
+    bytes and age.
+
+    Entries are stored as frozen results, so a hit returns the cached object
+    itself rather than a copy. When a generation function is supplied, entries
+    recorded under an older data generation (e.g. before the latest DuckDB
+    ingest) are treated as misses.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: float = 300.0,
+        generation_fn: Optional[Callable[[], int]] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total size of cached payloads (JSON-encoded bytes)
+            ttl_seconds: Seconds before a cached result expires
+            generation_fn: Returns the current data generation; entries from
+                older generations are invalidated
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.generation_fn = generation_fn
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self.total_bytes = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0
+        }
+        self.logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, record_stats=False) is not None
+
+    def get(self, key: str, record_stats: bool = True) -> Optional[FrozenToolResult]:
+        """Return the cached result for key, or None if absent, expired or stale."""
+        entry = self._entries.get(key)
+        if entry is None:
+            if record_stats:
+                self.stats["misses"] += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            if record_stats:
+                self.stats["misses"] += 1
+            return None
+
+        if entry.generation != self._current_generation():
+            self._remove(key)
+            self.stats["invalidations"] += 1
+            if record_stats:
+                self.stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        if record_stats:
+            self.stats["hits"] += 1
+        return entry.result
+
+    def put(self, key: str, result: ToolResult) -> ToolResult:
+        """
+        Cache a successful result and return its frozen form.
+
+        Results larger than the whole byte budget are returned frozen but not stored.
+        """
+        frozen = FrozenToolResult(
+            success=result.success,
+            data=freeze(result.data),
+            error_message=result.error_message,
+            execution_time_ms=result.execution_time_ms
+        )
+        size_bytes = self._estimate_size(result.data)
+        if size_bytes > self.max_bytes:
+            self.logger.debug(f"Tool result too large to cache ({size_bytes} bytes)")
+            return frozen
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _CacheEntry(
+            result=frozen,
+            size_bytes=size_bytes,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            generation=self._current_generation()
+        )
+        self.total_bytes += size_bytes
+        self._evict()
+        return frozen
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds
+        }
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until both bounds are satisfied."""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats["evictions"] += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size_bytes
+
+    def _current_generation(self) -> int:
+        if self.generation_fn is None:
+            return 0
+        try:
+            return self.generation_fn()
+        except Exception as e:
+            self.logger.warning(f"Failed to read cache generation: {e}")
+            return 0
+
+    @staticmethod
+    def _estimate_size(data: Any) -> int:
+        try:
+            return len(json.dumps(data, default=str).encode())
+        except (TypeError, ValueError):
+            return len(repr(data).encode())
@@ -33,6 +33,8 @@ from src.services.ai_model_factory import AIModelFactory, AIModel
 from src.services.duckdb_storage import DuckDBStorage
 from src.services.historical_snapshot_service import HistoricalSnapshotService
 from src.utils.agent_output_display import get_display
+from src.utils.agent_thinking_logger import AgentThinkingLogger
+from src.utils.run_profiler import KIND_AGENT, KIND_IO, profile_stage
 from src.config.modes import get_analysis_mode_config
 from src.models.analysis_models import (
     SegmentationPayload,
@@ -159,6 +161,10 @@ class TopicOrchestrator:
                             )
                     except Exception as e:
                         self.logger.warning(f"Snapshot migration failed: {e}")
+                    try:
+                        self._historical_snapshot_service.backfill_metrics_timeseries()
+                    except Exception as e:
+                        self.logger.warning(f"Metrics timeseries backfill failed: {e}")
             except Exception as e:
                 self.logger.warning(f"Failed to initialize historical snapshot service: {e}")
         return self._historical_snapshot_service
@@ -176,7 +182,10 @@ class TopicOrchestrator:
     def canny_topic_detection_agent(self):
         """Lazy-initialize Canny topic detection agent only when needed"""
         if self._canny_topic_detection_agent is None:
-            self._canny_topic_detection_agent = CannyTopicDetectionAgent(self.ai_factory)
+            self._canny_topic_detection_agent = CannyTopicDetectionAgent(
+                self.ai_factory,
+                duckdb_storage=self.duckdb_storage
+            )
         return self._canny_topic_detection_agent
     
     @property
@@ -239,6 +248,8 @@ class TopicOrchestrator:
                 'period_label': period_label
             }
         )
+        # View over the run's shared ConversationStore; stage subsets are views of it
+        all_conversations = context.conversations
         
         workflow_results = {}
         
@@ -265,7 +276,7 @@ class TopicOrchestrator:
                 await self.monitor.update_agent_status('SegmentationAgent', AgentStatus.RUNNING, 
                                                       f"Classifying {len(conversations)} conversations into Free/Paid tiers")
             
-            segmentation_result = await self.segmentation_agent.execute(context)
+            segmentation_result = await self._execute_agent(self.segmentation_agent, context)
             workflow_results['SegmentationAgent'] = _normalize_agent_result(segmentation_result)
             
             # Report agent completion
@@ -328,6 +339,8 @@ class TopicOrchestrator:
                     }
                 )
             
+            await self._end_stage()
+            
             # PHASE 2: Detect topics (on ALL conversations - paid AND free)
             # We need topics for both paid tier (for cards) and free tier (for Fin analysis)
             self.logger.info("🏷️  Phase 2: Topic Detection")
@@ -341,14 +354,14 @@ class TopicOrchestrator:
                     'method': 'AI classification with keyword fallback'
                 })
             
-            context.conversations = conversations  # Changed: detect topics for ALL conversations
+            context.conversations = all_conversations  # Changed: detect topics for ALL conversations
             
             # Report agent start
             if self.monitor:
                 await self.monitor.update_agent_status('TopicDetectionAgent', AgentStatus.RUNNING,
                                                       f"Classifying {len(conversations)} conversations into topics")
             
-            topic_detection_result = await self.topic_detection_agent.execute(context)
+            topic_detection_result = await self._execute_agent(self.topic_detection_agent, context)
             workflow_results['TopicDetectionAgent'] = _normalize_agent_result(topic_detection_result)
             
             # Report agent completion
@@ -455,6 +468,8 @@ class TopicOrchestrator:
             # ALSO pass topics_by_conversation to metadata for agents that need it
             context.metadata['topics_by_conversation'] = topics_by_conv
             
+            await self._end_stage()
+            
             # PHASE 2.5: Sub-Topic Detection
             self.logger.info("🔍 Phase 2.5: Sub-Topic Detection")
             subtopics_data = {}
@@ -462,18 +477,17 @@ class TopicOrchestrator:
             subtopic_payload: Optional[SubtopicDetectionResult] = None
             subtopic_start_time = datetime.now()
             try:
-                subtopic_context = context.model_copy()
+                subtopic_context = context.with_conversations(paid_conversations)
                 subtopic_context.previous_results = {
                     'TopicDetectionAgent': _normalize_agent_result(topic_detection_result)
                 }
-                subtopic_context.conversations = paid_conversations
                 
                 # Report agent start
                 if self.monitor:
                     await self.monitor.update_agent_status('SubTopicDetectionAgent', AgentStatus.RUNNING,
                                                           f"Analyzing {len(topic_dist)} topics for sub-categories")
                 
-                subtopic_detection_result = await self.subtopic_detection_agent.execute(subtopic_context)
+                subtopic_detection_result = await self._execute_agent(self.subtopic_detection_agent, subtopic_context)
                 workflow_results['SubTopicDetectionAgent'] = _normalize_agent_result(subtopic_detection_result)
                 
                 # Report agent completion
@@ -518,6 +532,8 @@ class TopicOrchestrator:
                     'data': {}
                 }
             
+            await self._end_stage()
+            
             # PHASE 2.6: Canny Topic Detection (if Canny posts provided)
             canny_topics_by_category = {}
             if canny_posts:
@@ -543,7 +559,8 @@ class TopicOrchestrator:
                             'total_posts': len(canny_posts),
                             'topics_by_category': {
                                 topic: data['count'] for topic, data in canny_topics_by_category.items()
-                            }
+                            },
+                            'cache_stats': dict(self.canny_topic_detection_agent.cache_stats)
                         }
                     }
                     
@@ -569,6 +586,8 @@ class TopicOrchestrator:
             else:
                 self.logger.info("⏭️  Phase 2.6: Skipping Canny Topic Detection (no Canny posts provided)")
             
+            await self._end_stage()
+            
             # PHASE 3: Analyze each topic
             self.logger.info("💭 Phase 3: Per-Topic Analysis")
             topic_sentiments = {}
@@ -633,11 +652,11 @@ class TopicOrchestrator:
                             'sentiment_insight': ''
                         }
                         
-                        sentiment_result = await self.topic_sentiment_agent.execute(topic_context)
+                        sentiment_result = await self._execute_agent(self.topic_sentiment_agent, topic_context)
                         
                         # Examples for this topic
                         topic_context.metadata['sentiment_insight'] = sentiment_result.data.get('sentiment_insight', '')
-                        examples_result = await self.example_extraction_agent.execute(topic_context)
+                        examples_result = await self._execute_agent(self.example_extraction_agent, topic_context)
                         
                         self.logger.info(f"   ✅ Completed topic {topic_num}/{total_topics}: {topic_name} - {len(examples_result.data.get('examples', []))} examples")
                         
@@ -702,6 +721,8 @@ class TopicOrchestrator:
                     'examples_count': len(examples_result.data.get('examples', []))
                 }
             
+            await self._end_stage()
+            
             # PHASE 4: Fin Analysis (on free and paid fin-resolved conversations)
             self.logger.info("🤖 Phase 4: Fin AI Performance Analysis")
             
@@ -734,7 +755,7 @@ class TopicOrchestrator:
                 await self.monitor.update_agent_status('FinPerformanceAgent', AgentStatus.RUNNING,
                                                       f"Analyzing Fin AI performance")
             
-            fin_result = await self.fin_performance_agent.execute(fin_context)
+            fin_result = await self._execute_agent(self.fin_performance_agent, fin_context)
             workflow_results['FinPerformanceAgent'] = _normalize_agent_result(fin_result)
             
             # Report agent completion
@@ -776,6 +797,8 @@ class TopicOrchestrator:
 
             self.logger.info(f"   ✅ Fin analysis complete")
             
+            await self._end_stage()
+            
             # PHASE 4.5: Analytical Insights
             self.logger.info("🔍 Phase 4.5: Analytical Insights (Correlation, Quality, Churn Risk, Confidence)")
             
@@ -794,8 +817,7 @@ class TopicOrchestrator:
             
             try:
                 # Build analytical context with all necessary data
-                analytical_context = context.model_copy()
-                analytical_context.conversations = conversations
+                analytical_context = context.with_conversations(all_conversations)
                 analytical_context.previous_results = {
                     'SegmentationAgent': _normalize_agent_result(segmentation_result),
                     'TopicDetectionAgent': _normalize_agent_result(topic_detection_result),
@@ -820,10 +842,10 @@ class TopicOrchestrator:
                 
                 # Run 4 agents in parallel using asyncio.gather()
                 correlation_result, quality_result, churn_result, confidence_result = await asyncio.gather(
-                    self.correlation_agent.execute(analytical_context),
-                    self.quality_insights_agent.execute(analytical_context),
-                    self.churn_risk_agent.execute(analytical_context),
-                    self.confidence_meta_agent.execute(analytical_context),
+                    self._execute_agent(self.correlation_agent, analytical_context),
+                    self._execute_agent(self.quality_insights_agent, analytical_context),
+                    self._execute_agent(self.churn_risk_agent, analytical_context),
+                    self._execute_agent(self.confidence_meta_agent, analytical_context),
                     return_exceptions=True
                 )
                 
@@ -907,6 +929,8 @@ class TopicOrchestrator:
                 
                 analytical_insights = {agent: workflow_results[agent] for agent in ['CorrelationAgent', 'QualityInsightsAgent', 'ChurnRiskAgent', 'ConfidenceMetaAgent']}
             
+            await self._end_stage()
+            
             # PHASE 4.6: Cross-Platform Correlation (if Canny posts provided)
             cross_platform_insights = {}
             if canny_posts and canny_topics_by_category:
@@ -964,6 +988,8 @@ class TopicOrchestrator:
                 else:
                     self.logger.info("⏭️  Phase 4.6: Skipping Cross-Platform Correlation (Canny topic detection failed)")
             
+            await self._end_stage()
+            
             # PHASE 5: Trend Analysis
             self.logger.info("📈 Phase 5: Trend Analysis")
             
@@ -986,7 +1012,7 @@ class TopicOrchestrator:
                 },
                 'week_id': week_id
             }
-            trend_result = await self.trend_agent.execute(trend_context)
+            trend_result = await self._execute_agent(self.trend_agent, trend_context)
             workflow_results['TrendAgent'] = _normalize_agent_result(trend_result)
             
             trend_execution_time = (datetime.now() - trend_start_time).total_seconds()
@@ -1020,6 +1046,8 @@ class TopicOrchestrator:
             
             self.logger.info(f"   ✅ Trend analysis complete")
             
+            await self._end_stage()
+            
             # PHASE 6: Format Output
             self.logger.info("📝 Phase 6: Output Formatting")
             
@@ -1034,9 +1062,8 @@ class TopicOrchestrator:
                 )
             
             output_start_time = datetime.now()
-            output_context = context.model_copy()
             # Ensure OutputFormatterAgent receives full conversation set
-            output_context.conversations = conversations
+            output_context = context.with_conversations(all_conversations)
             output_context.previous_results = {
                 'SegmentationAgent': _normalize_agent_result(segmentation_result),
                 'TopicDetectionAgent': _normalize_agent_result(topic_detection_result),
@@ -1055,18 +1082,12 @@ class TopicOrchestrator:
                 except Exception as e:
                     self.logger.warning(f"Error getting historical context: {e}")
             
-            # Get comparison data if prior snapshot exists
+            # Get comparison data if prior snapshot exists (precomputed when snapshots are saved)
             comparison_data = None
             if self.historical_snapshot_service and context.metadata.get('snapshot_id'):
                 try:
                     snapshot_id = context.metadata['snapshot_id']
-                    prior_snapshot = self.historical_snapshot_service.get_prior_snapshot(snapshot_id, period_type)
-                    if prior_snapshot:
-                        current_snapshot_data = {
-                            'topic_distribution': topic_dist,
-                            'segmentation_summary': segmentation_result.data if segmentation_result and segmentation_result.success else {}
-                        }
-                        comparison_data = self.historical_snapshot_service.calculate_comparison(current_snapshot_data, prior_snapshot)
+                    comparison_data = self.historical_snapshot_service.get_period_comparison(snapshot_id, period_type)
                 except Exception as e:
                     self.logger.warning(f"Error getting comparison data: {e}")
             
@@ -1083,7 +1104,7 @@ class TopicOrchestrator:
                 await self.monitor.update_agent_status('OutputFormatterAgent', AgentStatus.RUNNING,
                                                       "Formatting analysis for Gamma presentation")
             
-            formatter_result = await self.output_formatter_agent.execute(output_context)
+            formatter_result = await self._execute_agent(self.output_formatter_agent, output_context)
             workflow_results['OutputFormatterAgent'] = _normalize_agent_result(formatter_result)
             
             # 📋 SAVE AGENT DEBUG REPORT (Human-Readable Summary of All Agent Outputs)
@@ -1155,13 +1176,16 @@ class TopicOrchestrator:
                 'agent_results': workflow_results
             }
             
+            await self._end_stage()
+            
             # PHASE 6.5: Auto-save analysis snapshot (async to prevent blocking)
             self.logger.info("💾 Phase 6.5: Auto-saving analysis snapshot...")
             snapshot_id = None
             try:
                 if self.historical_snapshot_service is not None:
                     # Use async method to prevent blocking event loop during DuckDB operations
-                    snapshot_id = await self.historical_snapshot_service.save_snapshot_async(final_output, period_type)
+                    with profile_stage("snapshot_save", KIND_IO):
+                        snapshot_id = await self.historical_snapshot_service.save_snapshot_async(final_output, period_type)
                     self.logger.info(f"   ✅ Snapshot saved: {snapshot_id}")
                     
                     # Add to audit trail if enabled
@@ -1201,6 +1225,7 @@ class TopicOrchestrator:
                 except Exception as e:
                     logger.warning(f"Failed to display markdown preview: {e}")
             
+            await self._end_stage()
             self.logger.info(f"🎉 TopicOrchestrator: Complete in {total_time:.1f}s")
             self.logger.info(f"   Topics: {len(topic_dist)}, Paid: {len(paid_conversations)}, Free: {len(free_fin_only_conversations)}")
             
@@ -1217,7 +1242,17 @@ class TopicOrchestrator:
         except Exception as e:
             self.logger.error(f"TopicOrchestrator error: {e}")
             raise
-    
+
+    async def _end_stage(self):
+        """Stage boundary: wait for queued thinking-log output to reach disk (off the event loop)"""
+        if AgentThinkingLogger.is_enabled():
+            await asyncio.to_thread(AgentThinkingLogger.flush)
+
+    async def _execute_agent(self, agent, context: AgentContext):
+        """Run an agent in its own profile stage (no-op unless the run is profiled)"""
+        with profile_stage(getattr(agent, 'name', type(agent).__name__), KIND_AGENT):
+            return await agent.execute(context)
+
     def _aggregate_metrics(
         self,
         workflow_results: Dict,
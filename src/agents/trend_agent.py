@@ -17,6 +17,7 @@ from pathlib import Path
 from src.agents.base_agent import BaseAgent, AgentResult, AgentContext, ConfidenceLevel
 from src.utils.ai_client_helper import get_ai_client
 from src.services.historical_snapshot_service import HistoricalSnapshotService
+from src.services.trend_series_store import TrendSeriesStore
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,9 @@ logger = logging.getLogger(__name__)
 class TrendAgent(BaseAgent):
     """Agent specialized in week-over-week trend analysis with LLM interpretation"""
     
+    # Weeks of history read for trends (and retained in the rolling series store)
+    HISTORY_WEEKS = 12
+    
     def __init__(
         self, 
         historical_data_dir: Optional[Path] = None,
@@ -46,6 +50,10 @@ class TrendAgent(BaseAgent):
         # Keep historical_dir for backward compatibility (reading old JSON files during migration)
         self.historical_dir = historical_data_dir or Path("outputs/weekly_history")
         self.historical_dir.mkdir(parents=True, exist_ok=True)
+        # Rolling per-topic series appended once per saved week (replaces re-reading every week file)
+        self.series_store = TrendSeriesStore(
+            self.historical_dir / "trend_series.json", max_points=self.HISTORY_WEEKS
+        )
     
     def get_agent_specific_instructions(self) -> str:
         """Trend agent instructions"""
@@ -193,39 +201,68 @@ Output trends for:
         # NEW LOGIC: Try DuckDB first if service is available
         if self.historical_snapshot_service is not None:
             try:
-                self.logger.debug("Loading historical data from DuckDB")
-                snapshots = self.historical_snapshot_service.list_snapshots('weekly', limit=12)
+                self.logger.debug("Loading historical data from DuckDB metrics rollup")
+                service = self.historical_snapshot_service
+                volume_series = service.get_category_series('topic_volume', 'weekly', periods=self.HISTORY_WEEKS)
+                sentiment_series = service.get_category_series('topic_sentiment', 'weekly', periods=self.HISTORY_WEEKS)
                 
-                # Transform DuckDB snapshot format to expected format
-                historical = []
-                for snapshot in snapshots:
-                    historical.append({
-                        'week_id': snapshot['snapshot_id'],
-                        'timestamp': snapshot['created_at'],
-                        'results': {
-                            'topic_distribution': snapshot.get('topic_volumes', {}),
-                            'topic_sentiments': snapshot.get('topic_sentiments', {})
-                        }
+                # Pivot long-format metric rows back into per-week results
+                weeks: Dict[str, Dict] = {}
+                
+                def week_entry(point: Dict) -> Dict:
+                    return weeks.setdefault(point['snapshot_id'], {
+                        'week_id': point['snapshot_id'],
+                        'timestamp': point['period_start'],
+                        'results': {'topic_distribution': {}, 'topic_sentiments': {}}
                     })
                 
-                self.logger.debug(f"Loaded {len(historical)} snapshots from DuckDB")
+                for metric_name, points in volume_series.items():
+                    topic = metric_name[len('topic_volume.'):]
+                    for point in points:
+                        week_entry(point)['results']['topic_distribution'][topic] = {
+                            'volume': int(point['value'])
+                        }
+                
+                for metric_name, points in sentiment_series.items():
+                    topic, key = metric_name[len('topic_sentiment.'):].rsplit('.', 1)
+                    for point in points:
+                        sentiments = week_entry(point)['results']['topic_sentiments']
+                        sentiments.setdefault(topic, {})[key] = point['value']
+                
+                # Oldest first so historical[-1] is the most recent week
+                historical = sorted(weeks.values(), key=lambda w: w['timestamp'])
+                
+                self.logger.debug(f"Loaded {len(historical)} weeks from DuckDB metrics rollup")
                 return historical
             except Exception as e:
                 self.logger.warning(f"Failed to load from DuckDB, falling back to JSON files: {e}")
         
-        # FALLBACK LOGIC: Use existing JSON file reading
-        self.logger.debug("Loading historical data from JSON files")
-        historical = []
+        # FALLBACK LOGIC: Read the last weeks from the rolling series store
+        self.logger.debug("Loading historical data from trend series store")
+        if not self.series_store.path.exists():
+            self._migrate_legacy_weeks()
         
+        return self.series_store.history(self.HISTORY_WEEKS)
+    
+    def _migrate_legacy_weeks(self):
+        """Fold legacy week_*.json files into the series store (runs once, before the store exists)"""
+        legacy_weeks = []
         for file in sorted(self.historical_dir.glob("week_*.json")):
             try:
                 with open(file, 'r') as f:
-                    week_data = json.load(f)
-                    historical.append(week_data)
+                    legacy_weeks.append(json.load(f))
             except Exception as e:
                 self.logger.warning(f"Could not load {file}: {e}")
         
-        return historical
+        if not legacy_weeks:
+            return
+        
+        added = self.series_store.bootstrap_from_weeks(legacy_weeks)
+        try:
+            self.series_store.save()
+            self.logger.info(f"Migrated {added} legacy weekly files into trend series store")
+        except Exception as e:
+            self.logger.warning(f"Failed to save trend series store: {e}")
     
     def _save_week_data(self, week_id: str, results: Dict):
         """Save current week data for future comparisons to DuckDB and/or JSON"""
@@ -272,6 +309,13 @@ Output trends for:
             self.logger.debug(f"Saved week {week_id} data to JSON")
         except Exception as e:
             self.logger.warning(f"Failed to save to JSON: {e}")
+        
+        try:
+            self.series_store.append_week(week_id, results)
+            self.series_store.save()
+            self.logger.debug(f"Appended week {week_id} to trend series store")
+        except Exception as e:
+            self.logger.warning(f"Failed to append to trend series store: {e}")
     
     def _calculate_trends(self, current: Dict, historical: List[Dict]) -> Dict:
         """Calculate week-over-week trends"""
@@ -7,10 +7,14 @@ executable commands using different strategies.
 
 from .function_calling import FunctionCallingEngine
 from .rag_engine import RAGEngine
+from .bm25_index import BM25Index
+from .intent_matcher import IntentMatcher
 from .intent_classifier import IntentClassifier
 
 __all__ = [
     "FunctionCallingEngine",
     "RAGEngine", 
+    "BM25Index",
+    "IntentMatcher",
     "IntentClassifier",
 ]
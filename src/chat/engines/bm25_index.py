@@ -0,0 +1,222 @@
+"""
+Persistent inverted index with BM25 scoring for the RAG engine.
+
+Documents are tokenized once when added; queries only touch the postings of
+their own terms, so retrieval cost depends on query length and posting sizes
+rather than on the total number of documents. Top-k search uses MaxScore-style
+early termination: once the k-th best score exceeds what any unseen document
+could still reach, remaining (low-idf) terms only refine existing candidates.
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Function words carry no retrieval signal in command queries
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'do', 'for', 'from', 'give',
+    'i', 'in', 'is', 'it', 'me', 'my', 'of', 'on', 'or', 'please', 'show', 'some', 'that',
+    'the', 'this', 'to', 'us', 'we', 'what', 'with', 'you', 'your', 's'
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens without stop words."""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+class BM25Index:
+    """
+    Incrementally updatable BM25 inverted index.
+
+    Postings map term -> {doc_id: term frequency}. Document lengths and the
+    total length are maintained on every add/remove, so statistics never need
+    a full rebuild.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.doc_hashes: Dict[str, str] = {}
+        # Optional JSON-serializable payload stored with each document
+        self.payloads: Dict[str, Any] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_lengths
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def add_document(self, doc_id: str, text: str, payload: Any = None) -> bool:
+        """
+        Index a document, replacing any previous version with the same id.
+
+        Returns:
+            False if the document was already indexed with identical text
+        """
+        digest = self.content_hash(text)
+        if self.doc_hashes.get(doc_id) == digest:
+            return False
+        if doc_id in self.doc_lengths:
+            self.remove_document(doc_id)
+
+        term_counts = Counter(tokenize(text))
+        for term, count in term_counts.items():
+            self.postings.setdefault(term, {})[doc_id] = count
+
+        length = sum(term_counts.values())
+        self.doc_lengths[doc_id] = length
+        self.doc_hashes[doc_id] = digest
+        if payload is not None:
+            self.payloads[doc_id] = payload
+        self.total_length += length
+        return True
+
+    def remove_document(self, doc_id: str) -> None:
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self.doc_hashes.pop(doc_id, None)
+        self.payloads.pop(doc_id, None)
+        self.total_length -= length
+        for term in [t for t, docs in self.postings.items() if doc_id in docs]:
+            del self.postings[term][doc_id]
+            if not self.postings[term]:
+                del self.postings[term]
+
+    def idf(self, term: str) -> float:
+        """BM25 idf (non-negative variant)."""
+        doc_freq = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.doc_lengths) - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def max_term_score(self, term: str) -> float:
+        """Upper bound of a term's contribution to any document's score."""
+        return self.idf(term) * (self.k1 + 1)
+
+    def query_upper_bound(self, query: str) -> float:
+        """Upper bound of any document's score for this query (used to normalize scores)."""
+        return sum(self.max_term_score(term) for term in set(tokenize(query)) if term in self.postings)
+
+    def score(self, query: str, doc_id: str) -> float:
+        """BM25 score of one document for the query."""
+        if doc_id not in self.doc_lengths:
+            return 0.0
+        avg_length = self._average_length()
+        return sum(
+            self._term_score(term, self.idf(term), doc_id, avg_length)
+            for term in set(tokenize(query))
+            if doc_id in self.postings.get(term, ())
+        )
+
+    def search(self, query: str, top_k: int = 3) -> List[Tuple[str, float]]:
+        """
+        Return up to top_k (doc_id, score) pairs, best first.
+
+        Terms are processed in descending idf order. When the current k-th best
+        score is at least the summed upper bounds of the remaining terms, no
+        unseen document can enter the top k, so later terms only update
+        documents that are already candidates.
+        """
+        idfs = {term: self.idf(term) for term in set(tokenize(query)) if term in self.postings}
+        if not idfs or top_k <= 0:
+            return []
+
+        terms = sorted(idfs, key=idfs.get, reverse=True)
+        avg_length = self._average_length()
+        remaining_bound = sum(idfs.values()) * (self.k1 + 1)
+        scores: Dict[str, float] = {}
+        admit_new = True
+
+        for term in terms:
+            idf = idfs[term]
+            remaining_bound -= idf * (self.k1 + 1)
+            for doc_id in self.postings[term]:
+                if doc_id in scores:
+                    scores[doc_id] += self._term_score(term, idf, doc_id, avg_length)
+                elif admit_new:
+                    scores[doc_id] = self._term_score(term, idf, doc_id, avg_length)
+
+            if admit_new and len(scores) >= top_k:
+                kth_best = heapq.nlargest(top_k, scores.values())[-1]
+                admit_new = kth_best < remaining_bound
+
+        return heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], item[0]))
+
+    def save(self, path: Path) -> None:
+        """Write the index atomically as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'version': INDEX_FORMAT_VERSION,
+            'k1': self.k1,
+            'b': self.b,
+            'doc_lengths': self.doc_lengths,
+            'doc_hashes': self.doc_hashes,
+            'payloads': self.payloads,
+            'postings': self.postings
+        }
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['BM25Index']:
+        """Load a saved index; returns None if missing, unreadable or from another format version."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if payload.get('version') != INDEX_FORMAT_VERSION:
+                return None
+            index = cls(k1=payload['k1'], b=payload['b'])
+            index.doc_lengths = {doc_id: int(n) for doc_id, n in payload['doc_lengths'].items()}
+            index.doc_hashes = dict(payload['doc_hashes'])
+            index.payloads = dict(payload.get('payloads', {}))
+            index.postings = {
+                term: {doc_id: int(tf) for doc_id, tf in docs.items()}
+                for term, docs in payload['postings'].items()
+            }
+            index.total_length = sum(index.doc_lengths.values())
+            return index
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable BM25 index at {path}: {e}")
+            return None
+
+    def prune(self, keep_ids: Iterable[str]) -> int:
+        """Remove documents not in keep_ids; returns how many were removed."""
+        keep = set(keep_ids)
+        stale = [doc_id for doc_id in self.doc_lengths if doc_id not in keep]
+        for doc_id in stale:
+            self.remove_document(doc_id)
+        return len(stale)
+
+    def _average_length(self) -> float:
+        return self.total_length / len(self.doc_lengths) if self.doc_lengths else 0.0
+
+    def _term_score(self, term: str, idf: float, doc_id: str, avg_length: float) -> float:
+        tf = self.postings[term][doc_id]
+        length_norm = 1 - self.b + self.b * (self.doc_lengths[doc_id] / avg_length if avg_length else 1.0)
+        return idf * tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
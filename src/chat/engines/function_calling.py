@@ -18,9 +18,21 @@ from ..schemas import (
     create_safe_command_translation
 )
 from ..model_router import ModelRouter, QueryComplexity
+from .intent_matcher import IntentMatcher
 
 logger = logging.getLogger(__name__)
 
+_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+# Boolean flag -> phrases that switch it on
+BOOLEAN_FLAG_PHRASES = (
+    ("generate_gamma", ("with gamma", "gamma presentation")),
+    ("include_canny", ("with canny", "include canny")),
+    ("include_details", ("with details", "detailed")),
+    ("export_docs", ("export", "documentation")),
+    ("include_feedback", ("feedback",)),
+)
+
 
 @dataclass
 class FunctionDefinition:
@@ -50,6 +62,9 @@ class FunctionCallingEngine:
         # Function calling patterns
         self.patterns = self._define_patterns()
         
+        # Compiled once; rebuild with _build_matcher() after changing functions or patterns
+        self.matcher = self._build_matcher()
+        
         # Performance tracking
         self.stats = {
             "total_calls": 0,
@@ -405,6 +420,20 @@ class FunctionCallingEngine:
             ]
         }
     
+    def _define_keyword_boosts(self) -> Dict[str, Tuple[List[str], float]]:
+        """Define keywords that guarantee a minimum score for a function."""
+        return {
+            "voice_of_customer_analysis": (["voc", "voice of customer", "vof"], 0.9)
+        }
+    
+    def _build_matcher(self) -> IntentMatcher:
+        """Compile examples, patterns and keyword boosts into one intent matcher."""
+        return IntentMatcher(
+            examples={name: func_def.examples for name, func_def in self.functions.items()},
+            patterns=self.patterns,
+            boosts=self._define_keyword_boosts()
+        )
+    
     def _extract_date_range(self, query: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract date range from natural language query."""
         query_lower = query.lower()
@@ -453,8 +482,7 @@ class FunctionCallingEngine:
             return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
         
         # Extract specific dates (basic pattern)
-        date_pattern = r"(\d{4}-\d{2}-\d{2})"
-        dates = re.findall(date_pattern, query)
+        dates = _DATE_PATTERN.findall(query)
         if len(dates) >= 2:
             return dates[0], dates[1]
         elif len(dates) == 1:
@@ -466,25 +494,11 @@ class FunctionCallingEngine:
         """Extract boolean flags from query."""
         query_lower = query.lower()
         
-        flags = {}
-        
-        # Common boolean patterns
-        if "with gamma" in query_lower or "gamma presentation" in query_lower:
-            flags["generate_gamma"] = True
-        
-        if "with canny" in query_lower or "include canny" in query_lower:
-            flags["include_canny"] = True
-        
-        if "with details" in query_lower or "detailed" in query_lower:
-            flags["include_details"] = True
-        
-        if "export" in query_lower or "documentation" in query_lower:
-            flags["export_docs"] = True
-        
-        if "feedback" in query_lower:
-            flags["include_feedback"] = True
-        
-        return flags
+        return {
+            flag: True
+            for flag, phrases in BOOLEAN_FLAG_PHRASES
+            if any(phrase in query_lower for phrase in phrases)
+        }
     
     def _extract_time_period(self, query: str) -> Optional[str]:
         """Extract time period from query."""
@@ -522,46 +536,7 @@ class FunctionCallingEngine:
         Returns:
             Tuple of (function_name, confidence_score)
         """
-        query_lower = query.lower()
-        best_match = None
-        best_score = 0.0
-        
-        for func_name, func_def in self.functions.items():
-            score = 0.0
-            
-            # Check against examples
-            for example in func_def.examples:
-                example_lower = example.lower()
-                # Simple word overlap scoring
-                query_words = set(query_lower.split())
-                example_words = set(example_lower.split())
-                overlap = len(query_words.intersection(example_words))
-                example_score = overlap / max(len(query_words), len(example_words))
-                score = max(score, example_score)
-            
-            # Check against patterns
-            if func_name in self.patterns:
-                pattern_matches = 0
-                total_patterns = len(self.patterns[func_name])
-                
-                for pattern in self.patterns[func_name]:
-                    if re.search(pattern, query_lower):
-                        pattern_matches += 1
-                
-                if total_patterns > 0:
-                    pattern_score = pattern_matches / total_patterns
-                    score = max(score, pattern_score)
-            
-            # Boost score for exact keyword matches
-            if func_name == "voice_of_customer_analysis":
-                if any(word in query_lower for word in ["voc", "voice of customer", "vof"]):
-                    score = max(score, 0.9)
-            
-            if score > best_score:
-                best_score = score
-                best_match = func_name
-        
-        return best_match, best_score
+        return self.matcher.best_match(query)
     
     def _build_command_args(self, func_name: str, parameters: Dict[str, Any]) -> List[str]:
         """Build command arguments from function parameters."""
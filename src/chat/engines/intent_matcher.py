@@ -0,0 +1,140 @@
+"""
+Precompiled intent matcher for the function calling engine.
+
+Function examples, patterns and keyword boosts are compiled once when the engine
+starts. Example words go into posting lists (word -> examples containing it).
+Patterns that are plain literal alternations such as ``(?:report|analysis)`` are
+split into their phrases, and each distinct phrase is tested once per query for
+all functions that use it. Any other pattern stays a precompiled regex. Scoring a
+query touches only the postings of its own words plus one check per distinct
+phrase, whatever the number of functions.
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# "(?:a|b|c)" or a bare phrase, with no regex metacharacters in the alternatives
+_LITERAL_PATTERN = re.compile(r"\(\?:([^\\.^$*+?{}\[\]()]+)\)|([^\\.^$*+?{}\[\]()|]+)")
+
+
+def literal_alternatives(pattern: str) -> Optional[List[str]]:
+    """Phrases of a literal alternation pattern, or None when the pattern needs the regex engine."""
+    match = _LITERAL_PATTERN.fullmatch(pattern)
+    if not match:
+        return None
+    alternatives = match.group(1).split("|") if match.group(1) is not None else [match.group(2)]
+    return alternatives if all(alternatives) else None
+
+
+class IntentMatcher:
+    """
+    Scores a query against every function in one pass.
+
+    A function's score is the best of:
+    - example overlap: shared words / max(query words, example words), best example
+    - pattern coverage: fraction of the function's patterns found in the query
+    - keyword boost: a floor score when any boost keyword occurs in the query
+
+    Ties go to the function defined first.
+    """
+
+    def __init__(
+        self,
+        examples: Dict[str, Sequence[str]],
+        patterns: Dict[str, Sequence[str]],
+        boosts: Optional[Dict[str, Tuple[Sequence[str], float]]] = None
+    ):
+        boosts = boosts or {}
+        self.function_names: List[str] = list(examples)
+
+        # Posting lists over example words
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        self.example_owner: List[int] = []
+        self.example_sizes: List[int] = []
+        for index, name in enumerate(self.function_names):
+            for example in examples[name]:
+                example_id = len(self.example_owner)
+                words = set(example.lower().split())
+                self.example_owner.append(index)
+                self.example_sizes.append(len(words))
+                for word in words:
+                    self.postings[word].append(example_id)
+        self.postings = dict(self.postings)
+
+        # Pattern and boost slots: phrase -> slots it satisfies, plus regex fallbacks
+        self.slot_owner: List[int] = []
+        self.slot_floor: List[Optional[float]] = []  # None for patterns, floor score for boosts
+        self.phrase_slots: Dict[str, List[int]] = defaultdict(list)
+        self.regex_slots: List[Tuple[re.Pattern, int]] = []
+        self.pattern_counts: List[int] = []
+        for index, name in enumerate(self.function_names):
+            function_patterns = list(patterns.get(name, []))
+            self.pattern_counts.append(len(function_patterns))
+            for pattern in function_patterns:
+                self._add_slot(index, None, pattern, literal_alternatives(pattern))
+            if name in boosts:
+                keywords, floor = boosts[name]
+                self._add_slot(index, floor, None, list(keywords))
+        self.phrase_slots = dict(self.phrase_slots)
+
+    def _add_slot(self, owner: int, floor: Optional[float], pattern: Optional[str], phrases: Optional[List[str]]) -> None:
+        """Register a pattern or boost, by its phrases when it has them, else as a compiled regex."""
+        slot = len(self.slot_owner)
+        self.slot_owner.append(owner)
+        self.slot_floor.append(floor)
+        if phrases is None:
+            self.regex_slots.append((re.compile(pattern), slot))
+        else:
+            for phrase in set(phrases):
+                self.phrase_slots[phrase].append(slot)
+
+    def score(self, query: str) -> List[float]:
+        """Scores for every function, in definition order."""
+        query_lower = query.lower()
+        scores = [0.0] * len(self.function_names)
+
+        # Example overlap via postings of the query's words
+        query_words = set(query_lower.split())
+        overlaps: Dict[int, int] = defaultdict(int)
+        for word in query_words:
+            for example_id in self.postings.get(word, ()):
+                overlaps[example_id] += 1
+        for example_id, overlap in overlaps.items():
+            example_score = overlap / max(len(query_words), self.example_sizes[example_id])
+            owner = self.example_owner[example_id]
+            if example_score > scores[owner]:
+                scores[owner] = example_score
+
+        # Pattern coverage and keyword boosts
+        matched_slots = set()
+        for phrase, slots in self.phrase_slots.items():
+            if phrase in query_lower:
+                matched_slots.update(slots)
+        for regex, slot in self.regex_slots:
+            if regex.search(query_lower):
+                matched_slots.add(slot)
+
+        pattern_hits = [0] * len(self.function_names)
+        for slot in matched_slots:
+            floor = self.slot_floor[slot]
+            owner = self.slot_owner[slot]
+            if floor is None:
+                pattern_hits[owner] += 1
+            elif floor > scores[owner]:
+                scores[owner] = floor
+        for index, total in enumerate(self.pattern_counts):
+            if total:
+                scores[index] = max(scores[index], pattern_hits[index] / total)
+
+        return scores
+
+    def best_match(self, query: str) -> Tuple[Optional[str], float]:
+        """Highest scoring function and its score, or (None, 0.0) when nothing matches."""
+        best_match = None
+        best_score = 0.0
+        for name, score in zip(self.function_names, self.score(query)):
+            if score > best_score:
+                best_score = score
+                best_match = name
+        return best_match, best_score
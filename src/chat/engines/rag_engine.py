@@ -8,9 +8,10 @@ relevant documentation and examples before generating commands.
 import json
 import logging
 import time
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+from pathlib import Path
 import re
 
 from ..schemas import (
@@ -18,6 +19,7 @@ from ..schemas import (
     create_safe_command_translation
 )
 from ..model_router import ModelRouter, QueryComplexity
+from .bm25_index import BM25Index
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,19 @@ class DocumentationEntry:
     examples: List[str]
     tags: List[str]
     relevance_score: float = 0.0
+    
+    @property
+    def doc_id(self) -> str:
+        return f"{self.command}:{self.title}"
+    
+    def index_text(self) -> str:
+        """Text indexed for retrieval; title and tags are repeated to weight them above body text."""
+        return " ".join([
+            self.title, self.title, self.command,
+            " ".join(self.tags), " ".join(self.tags),
+            self.content,
+            " ".join(self.examples)
+        ])
 
 
 class RAGEngine:
@@ -41,12 +56,25 @@ class RAGEngine:
     and complex filtering scenarios by retrieving relevant documentation.
     """
     
-    def __init__(self, model_router: Optional[ModelRouter] = None):
+    def __init__(self, model_router: Optional[ModelRouter] = None, index_path: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
         self.model_router = model_router or ModelRouter()
         
-        # Documentation database
-        self.documentation = self._build_documentation_database()
+        # BM25 index; only read from / written to disk when index_path is given
+        self.index_path = Path(index_path) if index_path else None
+        self.index = (BM25Index.load(self.index_path) if self.index_path else None) or BM25Index()
+        
+        self._index_dirty = False
+        
+        # Documentation database: built-in entries plus anything persisted by an earlier session
+        self.documentation: List[DocumentationEntry] = []
+        self._docs_by_id: Dict[str, DocumentationEntry] = {}
+        self.add_documents(self._build_documentation_database(), persist=False)
+        for doc_id, payload in self.index.payloads.items():
+            if doc_id not in self._docs_by_id:
+                doc = DocumentationEntry(**payload)
+                self._docs_by_id[doc_id] = doc
+                self.documentation.append(doc)
         
         # Performance tracking
         self.stats = {
@@ -261,62 +289,90 @@ class RAGEngine:
             )
         ]
     
+    def add_documents(self, entries: Iterable[DocumentationEntry], persist: bool = True) -> int:
+        """
+        Add or update documentation entries in the index (e.g. command docs,
+        filter catalogs, past-report summaries).
+        
+        Returns:
+            Number of entries that were new or changed
+        """
+        changed = 0
+        for doc in entries:
+            previous = self._docs_by_id.get(doc.doc_id)
+            if previous is None:
+                self.documentation.append(doc)
+            elif previous is not doc:
+                self.documentation[self.documentation.index(previous)] = doc
+            self._docs_by_id[doc.doc_id] = doc
+            payload = asdict(doc)
+            payload.pop('relevance_score', None)
+            if self.index.add_document(doc.doc_id, doc.index_text(), payload=payload):
+                changed += 1
+        
+        if changed:
+            self._index_dirty = True
+            if persist:
+                self.save()
+        return changed
+    
+    def rebuild(self, entries: Iterable[DocumentationEntry]) -> int:
+        """
+        Make the indexed documentation exactly the built-in entries plus entries.
+        
+        Unchanged documents are not re-tokenized; documents from earlier loads
+        that are not re-added are pruned from the index.
+        
+        Returns:
+            Number of entries removed
+        """
+        docs = self._build_documentation_database() + list(entries)
+        keep_ids = {doc.doc_id for doc in docs}
+        self.add_documents(docs, persist=False)
+        
+        removed = self.index.prune(keep_ids)
+        self.documentation = [doc for doc in self.documentation if doc.doc_id in keep_ids]
+        self._docs_by_id = {doc.doc_id: doc for doc in self.documentation}
+        if removed:
+            self._index_dirty = True
+        self.save()
+        return removed
+    
+    def save(self) -> None:
+        """Save the index to index_path if it changed since it was loaded (no-op without a path)."""
+        if not self._index_dirty or self.index_path is None:
+            return
+        try:
+            self.index.save(self.index_path)
+            self._index_dirty = False
+        except OSError as e:
+            self.logger.warning(f"Failed to save RAG index to {self.index_path}: {e}")
+    
     def _calculate_relevance(self, query: str, doc_entry: DocumentationEntry) -> float:
-        """Calculate relevance score between query and documentation entry."""
-        query_lower = query.lower()
-        content_lower = doc_entry.content.lower()
-        title_lower = doc_entry.title.lower()
-        
-        score = 0.0
-        
-        # Title matching (highest weight)
-        title_words = set(title_lower.split())
-        query_words = set(query_lower.split())
-        title_overlap = len(title_words.intersection(query_words))
-        if title_words:
-            score += (title_overlap / len(title_words)) * 0.4
-        
-        # Content matching
-        content_words = set(content_lower.split())
-        content_overlap = len(content_words.intersection(query_words))
-        if content_words:
-            score += (content_overlap / len(content_words)) * 0.3
-        
-        # Tag matching
-        tag_matches = sum(1 for tag in doc_entry.tags if tag in query_lower)
-        if doc_entry.tags:
-            score += (tag_matches / len(doc_entry.tags)) * 0.2
-        
-        # Example matching
-        example_matches = 0
-        for example in doc_entry.examples:
-            example_words = set(example.lower().split())
-            example_overlap = len(example_words.intersection(query_words))
-            if example_words:
-                example_matches += example_overlap / len(example_words)
-        
-        if doc_entry.examples:
-            score += (example_matches / len(doc_entry.examples)) * 0.1
-        
-        return min(score, 1.0)
+        """Calculate relevance score between query and documentation entry (normalized BM25)."""
+        upper_bound = self.index.query_upper_bound(query)
+        if upper_bound <= 0:
+            return 0.0
+        return min(self.index.score(query, doc_entry.doc_id) / upper_bound, 1.0)
     
     def _retrieve_relevant_docs(self, query: str, top_k: int = 3) -> List[DocumentationEntry]:
         """Retrieve most relevant documentation entries for the query."""
-        # Calculate relevance scores
-        for doc in self.documentation:
-            doc.relevance_score = self._calculate_relevance(query, doc)
-        
-        # Sort by relevance and return top-k
-        sorted_docs = sorted(
-            self.documentation,
-            key=lambda x: x.relevance_score,
-            reverse=True
-        )
-        
-        # Filter out low-relevance entries
-        relevant_docs = [doc for doc in sorted_docs if doc.relevance_score > 0.1]
+        upper_bound = self.index.query_upper_bound(query)
+        if upper_bound <= 0:
+            return []
+        
+        relevant_docs = []
+        for doc_id, score in self.index.search(query, top_k=top_k):
+            doc = self._docs_by_id.get(doc_id)
+            if doc is None:
+                continue
+            doc.relevance_score = min(score / upper_bound, 1.0)
+            
+            # Filter out low-relevance entries
+            if doc.relevance_score > 0.1:
+                relevant_docs.append(doc)
         
-        return relevant_docs[:top_k]
+        return relevant_docs
     
     def _extract_parameters_from_context(self, query: str, docs: List[DocumentationEntry]) -> Dict[str, Any]:
         """Extract parameters from query using retrieved documentation context."""
@@ -7,6 +7,7 @@ to provide the best possible command translation with fallback mechanisms.
 
 import time
 import logging
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
@@ -47,7 +48,9 @@ class HybridCommandTranslator:
         
         # Initialize engines
         self.function_engine = FunctionCallingEngine()
-        self.rag_engine = RAGEngine()
+        self.rag_engine = RAGEngine(
+            index_path=str(Path(settings.output_directory) / "chat" / "rag_index.json")
+        )
         self.intent_classifier = IntentClassifier()
         
         # Initialize supporting components
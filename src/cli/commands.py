@@ -736,6 +736,28 @@ async def compare_snapshots(
         
         # Display detailed comparison if requested
         if show_details:
+            # Recent volume trend from the metrics rollup (single indexed query)
+            volume_series = service.get_metric_series(
+                ['total_conversations'],
+                current_snapshot.get('analysis_type', 'weekly'),
+                periods=8
+            ).get('total_conversations', [])
+            if volume_series:
+                trend_table = Table(title="Total Conversations (Recent Periods)", show_header=True)
+                trend_table.add_column("Snapshot", style="cyan")
+                trend_table.add_column("Period Start")
+                trend_table.add_column("Conversations", justify="right")
+                
+                for point in volume_series:
+                    trend_table.add_row(
+                        point['snapshot_id'],
+                        str(point['period_start']),
+                        f"{int(point['value']):,}"
+                    )
+                
+                console.print(trend_table)
+                console.print("")
+            
             # Sentiment changes
             sentiment_changes = comparison.get('sentiment_changes', {})
             if sentiment_changes:
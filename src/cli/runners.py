@@ -411,17 +411,28 @@ async def run_agent_performance_analysis(
     focus_categories: Optional[str] = None,
     generate_gamma: bool = False,
     individual_breakdown: bool = False,
-    analyze_troubleshooting: bool = False
+    analyze_troubleshooting: bool = False,
+    tool_cache: Optional[Any] = None
 ) -> Dict[str, Any]:
-    """Run comprehensive agent performance analysis with optional Gamma generation."""
+    """
+    Run comprehensive agent performance analysis with optional Gamma generation.
+    
+    tool_cache: ToolResultCache shared by the run's tool-calling agents (a new one per run if omitted)
+    """
     try:
         from src.services.chunked_fetcher import ChunkedFetcher
         from src.agents.agent_performance_agent import AgentPerformanceAgent
         from src.agents.base_agent import AgentContext
+        from src.agents.tools import ToolResultCache
+        from src.services.duckdb_storage import DuckDBStorage
         from src.services.gamma_generator import GammaGenerator
         from src.services.gamma_client import GammaAPIError
         from pathlib import Path
         
+        # One tool-result cache per run, shared by every agent that calls the tools
+        if tool_cache is None:
+            tool_cache = ToolResultCache(generation_fn=DuckDBStorage.ingest_generation)
+        
         agent_name = {'horatio': 'Horatio', 'boldr': 'Boldr', 'escalated': 'Senior Staff'}.get(agent, agent)
         
         console.print(f"\n📊 [bold cyan]{agent_name} Performance Analysis[/bold cyan]")
@@ -568,7 +579,7 @@ async def run_agent_performance_analysis(
         if analyze_troubleshooting:
             console.print("   🔍 Troubleshooting analysis enabled (analyzing diagnostic questions and escalation patterns)\n")
         
-        performance_agent = AgentPerformanceAgent(agent_filter=agent)
+        performance_agent = AgentPerformanceAgent(agent_filter=agent, tool_cache=tool_cache)
         result = await performance_agent.execute(
             context, 
             individual_breakdown=individual_breakdown,
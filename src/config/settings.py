@@ -29,6 +29,7 @@ class Settings(BaseSettings):
     intercom_max_retries: int = Field(3, env="INTERCOM_MAX_RETRIES")
     intercom_concurrency: int = Field(5, env="INTERCOM_CONCURRENCY")  # Max concurrent enrichment requests
     intercom_request_delay_ms: int = Field(200, env="INTERCOM_REQUEST_DELAY_MS")  # Delay between API requests
+    intercom_page_prefetch: int = Field(2, env="INTERCOM_PAGE_PREFETCH")  # Search pages requested ahead of processing (0 = off)
     
     # OpenAI Settings
     openai_model: str = Field("gpt-4o", env="OPENAI_MODEL")
@@ -50,10 +51,12 @@ class Settings(BaseSettings):
     sentiment_timeout: int = Field(60, env="SENTIMENT_TIMEOUT")  # SentimentAgent timeout
     output_formatter_timeout: int = Field(120, env="OUTPUT_FORMATTER_TIMEOUT")  # OutputFormatterAgent timeout (longer for complex reasoning)
     correlation_timeout: int = Field(60, env="CORRELATION_TIMEOUT")  # CorrelationAgent timeout
+    story_summary_timeout: int = Field(90, env="STORY_SUMMARY_TIMEOUT")  # Per-item story summary timeout (includes client retries)
     
     # LLM Concurrency Settings (provider-specific semaphore limits)
     openai_concurrency: int = Field(10, env="OPENAI_CONCURRENCY")  # Max concurrent OpenAI requests (default: 10)
     anthropic_concurrency: int = Field(2, env="ANTHROPIC_CONCURRENCY")  # Max concurrent Anthropic requests (default: 2, Tier 1 limit: 50 RPM)
+    story_extraction_concurrency: int = Field(10, env="STORY_EXTRACTION_CONCURRENCY")  # Max concurrent story summary requests
     
     # Canny API Settings
     canny_api_key: Optional[str] = Field(None, env="CANNY_API_KEY")
@@ -91,6 +94,8 @@ class Settings(BaseSettings):
     output_directory: str = Field("outputs", env="OUTPUT_DIRECTORY")
     log_level: str = Field("INFO", env="LOG_LEVEL")
     log_file: str = Field("intercom_analysis.log", env="LOG_FILE")
+    log_sink_overflow: str = Field("block", env="LOG_SINK_OVERFLOW")  # Background log writer when its queue is full: "block" or "drop"
+    log_sink_queue_size: int = Field(10000, env="LOG_SINK_QUEUE_SIZE")  # Max records queued for the background log writer
     
     @property
     def effective_output_directory(self) -> str:
@@ -155,6 +160,13 @@ class Settings(BaseSettings):
             raise ValueError(f'log_level must be one of {valid_levels}')
         return v.upper()
     
+    @field_validator('log_sink_overflow')
+    @classmethod
+    def validate_log_sink_overflow(cls, v):
+        if v.lower() not in ('block', 'drop'):
+            raise ValueError("log_sink_overflow must be 'block' or 'drop'")
+        return v.lower()
+    
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
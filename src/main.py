@@ -1714,9 +1714,14 @@ async def run_agent_performance_analysis(
     analyze_troubleshooting: bool = False,
     test_mode: bool = False,
     test_data_count: int = 100,
-    audit_trail: bool = False
+    audit_trail: bool = False,
+    tool_cache: Optional[Any] = None
 ):
-    """Run comprehensive agent performance analysis with optional Gamma generation."""
+    """
+    Run comprehensive agent performance analysis with optional Gamma generation.
+    
+    tool_cache: ToolResultCache shared by the run's tool-calling agents (a new one per run if omitted)
+    """
     try:
         # Comment 3: Add timing logs for heavy imports
         verbose_imports = verbose or os.getenv('VERBOSE', '').lower() in ('1', 'true', 'yes')
@@ -1733,11 +1738,17 @@ async def run_agent_performance_analysis(
         
         from src.agents.agent_performance_agent import AgentPerformanceAgent
         from src.agents.base_agent import AgentContext
+        from src.agents.tools import ToolResultCache
+        from src.services.duckdb_storage import DuckDBStorage
         from src.services.gamma_generator import GammaGenerator
         from src.services.gamma_client import GammaAPIError
         from pathlib import Path
         import json
         
+        # One tool-result cache per run, shared by every agent that calls the tools
+        if tool_cache is None:
+            tool_cache = ToolResultCache(generation_fn=DuckDBStorage.ingest_generation)
+        
         agent_name = {'horatio': 'Horatio', 'boldr': 'Boldr', 'escalated': 'Senior Staff'}.get(agent, agent)
         
         console.print(f"\n📊 [bold cyan]{agent_name} Performance Analysis[/bold cyan]")
@@ -1890,7 +1901,7 @@ async def run_agent_performance_analysis(
         console.print(f"🤖 [bold cyan]Analyzing {agent_name} Performance...[/bold cyan]\n")
         if analyze_troubleshooting:
             console.print("   🔍 Troubleshooting analysis enabled (analyzing diagnostic questions and escalation patterns)\n")
-        performance_agent = AgentPerformanceAgent(agent_filter=agent)
+        performance_agent = AgentPerformanceAgent(agent_filter=agent, tool_cache=tool_cache)
         result = await performance_agent.execute(
             context, 
             individual_breakdown=individual_breakdown,
@@ -2074,9 +2085,14 @@ async def run_agent_coaching_report(
     generate_gamma: bool,
     test_mode: bool = False,
     test_data_count: int = 100,
-    output_dir: str = 'outputs'
+    output_dir: str = 'outputs',
+    tool_cache: Optional[Any] = None
 ):
-    """Run coaching-focused analysis with individual agent breakdowns"""
+    """
+    Run coaching-focused analysis with individual agent breakdowns.
+    
+    tool_cache: ToolResultCache shared by the run's tool-calling agents (a new one per run if omitted)
+    """
     try:
         # Comment 3: Add timing logs for heavy imports
         verbose_imports = verbose or os.getenv('VERBOSE', '').lower() in ('1', 'true', 'yes')
@@ -2093,10 +2109,16 @@ async def run_agent_coaching_report(
         
         from src.agents.agent_performance_agent import AgentPerformanceAgent
         from src.agents.base_agent import AgentContext
+        from src.agents.tools import ToolResultCache
+        from src.services.duckdb_storage import DuckDBStorage
         from src.services.data_preprocessor import DataPreprocessor
         from pathlib import Path
         import json
         
+        # One tool-result cache per run, shared by every agent that calls the tools
+        if tool_cache is None:
+            tool_cache = ToolResultCache(generation_fn=DuckDBStorage.ingest_generation)
+        
         vendor_name = {'horatio': 'Horatio', 'boldr': 'Boldr'}.get(vendor, vendor.title())
         
         # Fetch conversations (test mode or real)
@@ -2172,7 +2194,7 @@ async def run_agent_coaching_report(
         
         # Run analysis with individual breakdown
         console.print(f"🤖 [bold cyan]Analyzing {vendor_name} Agent Performance...[/bold cyan]\n")
-        performance_agent = AgentPerformanceAgent(agent_filter=vendor)
+        performance_agent = AgentPerformanceAgent(agent_filter=vendor, tool_cache=tool_cache)
         result = await performance_agent.execute(context, individual_breakdown=True)
         
         if not result.success:
@@ -3575,7 +3597,7 @@ def generate_all_gamma(analysis_file, export_pdf, export_pptx, export_docs, outp
     try:
         import json
         from src.services.gamma_generator import GammaGenerator
-        from src.services.google_docs_exporter import GoogleDocsExporter
+        from src.services.google_docs_exporter import GoogleDocsExporter, DOC_STYLES
         from pathlib import Path
         
         # Load analysis results
@@ -3629,16 +3651,16 @@ def generate_all_gamma(analysis_file, export_pdf, export_pptx, export_docs, outp
             console.print(f"\n[yellow]Generating Google Docs markdown files...[/yellow]")
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
-            for style in ['executive', 'detailed', 'training']:
-                docs_filename = f"analysis_{style}_{timestamp}.md"
-                docs_path = output_path / docs_filename
-                
-                docs_exporter.export_to_markdown(
-                    analysis_results=analysis_results,
-                    output_path=docs_path,
-                    style=style
-                )
-                
+            # One export pass: quotes and categories are extracted once for all styles
+            docs_paths = docs_exporter.export_styles(
+                analysis_results=analysis_results,
+                output_paths={
+                    style: output_path / f"analysis_{style}_{timestamp}.md"
+                    for style in DOC_STYLES
+                }
+            )
+            
+            for style, docs_path in docs_paths.items():
                 console.print(f"[green]✅ {style.title()} markdown: {docs_path}[/green]")
         
         # Show summary
@@ -4531,6 +4553,8 @@ async def run_test_topic_based(conversations):
               help='AI model to use (openai or claude). Defaults to config setting.')
 @click.option('--audit-trail', is_flag=True, default=False,
               help='Enable audit trail logging for debugging and compliance')
+@click.option('--profile', is_flag=True, default=False,
+              help='Record per-stage wall/CPU time, process peak RSS, LLM calls, tokens and cache hits to a JSON profile (topic-based analysis only)')
 @click.option('--llm-topic-detection', is_flag=True, default=True,
               help='🤖 LLM-first topic detection (DEFAULT: ON for accuracy - use --no-llm-topic-detection to disable)')
 @click.option('--output-dir', default='outputs', help='Output directory')
@@ -4553,6 +4577,7 @@ def voice_of_customer_analysis(
     multi_agent: bool,
     analysis_type: str,
     audit_trail: bool,
+    profile: bool,
     output_dir: str
 ):
     """
@@ -4582,6 +4607,9 @@ def voice_of_customer_analysis(
         
         # With Gamma presentation (PowerPoint export)
         python src/main.py voice-of-customer --time-period week --output-format gamma --gamma-export pptx
+        
+        # Per-stage performance profile (saved as profile_*.json next to the report)
+        python src/main.py voice-of-customer --time-period week --profile
     """
     from src.utils.time_utils import calculate_date_range, format_date_range_for_display
     
@@ -4670,11 +4698,13 @@ def voice_of_customer_analysis(
     start_dt, end_dt = get_date_range_pacific(start_date, end_date)
     
     if analysis_type == 'topic-based':
-        asyncio.run(run_topic_based_analysis_custom(start_dt, end_dt, generate_gamma, test_mode, test_data_count_int, audit_trail))
+        asyncio.run(run_topic_based_analysis_custom(start_dt, end_dt, generate_gamma, test_mode, test_data_count_int, audit_trail, profile))
     elif analysis_type == 'synthesis':
+        if profile:
+            console.print("[yellow]⚠️  --profile is only supported for topic-based analysis[/yellow]")
         asyncio.run(run_synthesis_analysis_custom(start_dt, end_dt, generate_gamma, audit_trail))
     else:  # complete
-        asyncio.run(run_complete_analysis_custom(start_dt, end_dt, generate_gamma, audit_trail))
+        asyncio.run(run_complete_analysis_custom(start_dt, end_dt, generate_gamma, audit_trail, profile))
 
 
 @cli.command(name='agent-performance')
@@ -4916,9 +4946,22 @@ async def run_topic_based_analysis_custom(
     generate_gamma: bool,
     test_mode: bool = False,
     test_data_count: str = "100",
-    audit_trail: bool = False
+    audit_trail: bool = False,
+    profile: bool = False
 ):
     """Run topic-based analysis with custom date range"""
+    from src.utils.run_profiler import KIND_IO, profile_stage, start_profiling
+    
+    if profile:
+        profiler = start_profiling('voice-of-customer')
+        profiler.metadata.update({
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'test_mode': test_mode,
+            'generate_gamma': generate_gamma
+        })
+        console.print("⏱️  [cyan]Profiling: ENABLED[/cyan] - per-stage timings will be saved with the outputs\n")
+    
     try:
         # 🔧 ENABLE CONSOLE RECORDING (capture ALL output to .log file!)
         # This ensures users have complete logs even if SSE disconnects
@@ -4946,7 +4989,11 @@ async def run_topic_based_analysis_custom(
         audit = None
         if audit_trail:
             from src.utils.output_manager import get_output_directory
-            audit = AuditTrail(output_dir=str(get_output_directory()))
+            audit_dir = get_output_directory()
+            audit = AuditTrail(
+                output_dir=str(audit_dir),
+                event_log=audit_dir / f"audit_events_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+            )
             audit.step("Initialization", "Started Voice of Customer Analysis", {
                 'start_date': start_date.strftime('%Y-%m-%d'),
                 'end_date': end_date.strftime('%Y-%m-%d'),
@@ -4960,11 +5007,12 @@ async def run_topic_based_analysis_custom(
             console.print(f"🧪 [yellow]TEST MODE: Generating {test_data_count} mock conversations...[/yellow]")
             from src.services.test_data_generator import TestDataGenerator
             generator = TestDataGenerator()
-            conversations = generator.generate_conversations(
-                count=int(test_data_count),
-                start_date=start_date,
-                end_date=end_date
-            )
+            with profile_stage("test_data_generation"):
+                conversations = generator.generate_conversations(
+                    count=int(test_data_count),
+                    start_date=start_date,
+                    end_date=end_date
+                )
             console.print(f"   ✅ Generated {len(conversations)} test conversations\n")
             
             if audit:
@@ -4984,7 +5032,8 @@ async def run_topic_based_analysis_custom(
             
             # ChunkedFetcher now uses simple mode - no chunking, no timeouts
             fetcher = ChunkedFetcher()
-            conversations = await fetcher.fetch_conversations_chunked(start_date, end_date)
+            with profile_stage("fetch", KIND_IO):
+                conversations = await fetcher.fetch_conversations_chunked(start_date, end_date)
             console.print(f"   ✅ Fetched {len(conversations)} conversations\n")
             
             if audit:
@@ -5020,21 +5069,22 @@ async def run_topic_based_analysis_custom(
         orchestrator = TopicOrchestrator(audit_trail=audit, execution_monitor=monitor)
         week_id = start_date.strftime('%Y-W%W')
         
-        results = await orchestrator.execute_weekly_analysis(
-            conversations=conversations,
-            week_id=week_id,
-            start_date=start_date,
-            end_date=end_date,
-            period_type=period_type,
-            period_label=period_label
-        )
+        with profile_stage("orchestrator"):
+            results = await orchestrator.execute_weekly_analysis(
+                conversations=conversations,
+                week_id=week_id,
+                start_date=start_date,
+                end_date=end_date,
+                period_type=period_type,
+                period_label=period_label
+            )
         
         # Save output
         from src.utils.output_manager import get_output_file_path
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = get_output_file_path(f"topic_based_{week_id}_{timestamp}.md")
         
-        with open(report_file, 'w') as f:
+        with profile_stage("report_write", KIND_IO), open(report_file, 'w') as f:
             f.write(results.get('formatted_report', ''))
         
         # Save audit trail if enabled
@@ -5073,23 +5123,25 @@ async def run_topic_based_analysis_custom(
                 
                 console.print(f"   Sending {len(markdown_report)} characters to Gamma API...")
                 
-                generation_id = await gamma_client.generate_presentation(
-                    input_text=markdown_report,
-                    format="presentation",
-                    text_mode="preserve",  # Preserve our markdown text
-                    card_split="inputTextBreaks",  # Use our --- breaks for slides
-                    theme_name="Night Sky",  # Professional dark theme
-                    text_options={
-                        "tone": "professional, analytical",
-                        "audience": "executives, leadership team"
-                    }
-                )
+                with profile_stage("gamma_generation", KIND_IO):
+                    generation_id = await gamma_client.generate_presentation(
+                        input_text=markdown_report,
+                        format="presentation",
+                        text_mode="preserve",  # Preserve our markdown text
+                        card_split="inputTextBreaks",  # Use our --- breaks for slides
+                        theme_name="Night Sky",  # Professional dark theme
+                        text_options={
+                            "tone": "professional, analytical",
+                            "audience": "executives, leadership team"
+                        }
+                    )
                 
                 console.print(f"   ✅ Generation ID: {generation_id}")
                 console.print("   ⏳ Waiting for Gamma to process (max 8 minutes)...")
                 
                 # Use GammaClient.poll_generation() with backoff
-                status = await gamma_client.poll_generation(generation_id, max_polls=30, poll_interval=2.0)
+                with profile_stage("gamma_polling", KIND_IO):
+                    status = await gamma_client.poll_generation(generation_id, max_polls=30, poll_interval=2.0)
                 
                 console.print(f"   Poll completed with status: {status.get('status')}")
                 
@@ -5137,6 +5189,62 @@ async def run_topic_based_analysis_custom(
         import traceback
         traceback.print_exc()
         raise
+    finally:
+        if profile:
+            await _finish_run_profile(f"topic_based_{start_date.strftime('%Y-W%W')}")
+        
+        # Write the monitor's last buffered updates before the CLI exits
+        from src.services.execution_monitor import shutdown_execution_monitor
+        await shutdown_execution_monitor()
+
+
+async def _finish_run_profile(label: str):
+    """Stop --profile collection, save the JSON next to the run outputs and record it for the web UI"""
+    from rich.table import Table
+    from src.services.execution_monitor import get_execution_monitor
+    from src.utils.output_manager import get_output_file_path
+    from src.utils.run_profiler import stop_profiling
+    
+    profiler = stop_profiling()
+    if profiler is None:
+        return
+    
+    profile = profiler.to_dict()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    try:
+        profile_file = profiler.save(get_output_file_path(f"profile_{label}_{timestamp}.json"))
+    except OSError as e:
+        console.print(f"[yellow]⚠️  Could not save run profile: {e}[/yellow]")
+        return
+    
+    table = Table(title="Run Profile")
+    table.add_column("Stage")
+    table.add_column("Calls", justify="right")
+    table.add_column("Wall (s)", justify="right")
+    table.add_column("CPU (s)", justify="right")
+    table.add_column("Process peak RSS (MB)", justify="right")
+    table.add_column("LLM calls", justify="right")
+    table.add_column("Tokens in/out", justify="right")
+    table.add_column("Cache hits", justify="right")
+    for stage in profile['stages']:
+        depth = stage['path'].count('/')
+        table.add_row(
+            "  " * depth + stage['name'],
+            str(stage['calls']),
+            f"{stage['wall_seconds']:.2f}",
+            f"{stage['cpu_seconds']:.2f}",
+            f"{stage['process_peak_rss_mb']:.0f}" if stage['process_peak_rss_mb'] is not None else "-",
+            str(stage['llm_calls']),
+            f"{stage['input_tokens']}/{stage['output_tokens']}",
+            str(stage['cache_hits'])
+        )
+    console.print(table)
+    console.print(f"⏱️  Profile: {profile_file}")
+    
+    try:
+        await get_execution_monitor().record_profile(profile)
+    except Exception as e:
+        console.print(f"[yellow]⚠️  Could not record profile in execution history: {e}[/yellow]")
 
 
 async def run_synthesis_analysis_custom(start_date: datetime, end_date: datetime, generate_gamma: bool, audit_trail: bool = False):
@@ -5177,9 +5285,9 @@ async def run_synthesis_analysis_custom(start_date: datetime, end_date: datetime
     console.print(f"📁 Results saved: {results_file}")
 
 
-async def run_complete_analysis_custom(start_date: datetime, end_date: datetime, generate_gamma: bool, audit_trail: bool = False):
+async def run_complete_analysis_custom(start_date: datetime, end_date: datetime, generate_gamma: bool, audit_trail: bool = False, profile: bool = False):
     """Run both analyses"""
-    await run_topic_based_analysis_custom(start_date, end_date, generate_gamma, audit_trail=audit_trail)
+    await run_topic_based_analysis_custom(start_date, end_date, generate_gamma, audit_trail=audit_trail, profile=profile)
     console.print("\n" + "="*80 + "\n")
     await run_synthesis_analysis_custom(start_date, end_date, generate_gamma, audit_trail)
     console.print("\n🎉 Complete analysis finished!")
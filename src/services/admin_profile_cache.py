@@ -7,7 +7,7 @@ nested/work emails from admin objects.
 
 import asyncio
 import logging
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Iterable
 from datetime import datetime, timedelta
 from functools import wraps
 
@@ -41,7 +41,15 @@ def retry_with_backoff(max_retries=3, base_delay=1.0):
 
 
 class AdminProfileCache:
-    """Cache Intercom admin profiles with session and persistent storage"""
+    """
+    Cache Intercom admin profiles with session and persistent storage.
+    
+    Call warm_up() before a run that touches many admins: it loads valid
+    profiles from DuckDB in one query and the rest of the directory with a
+    single admins.list call. Directory entries go through the same profile
+    builder as per-admin lookups. Concurrent lookups for the same admin share
+    one in-flight request.
+    """
     
     def __init__(self, intercom_service, duckdb_storage: Optional[DuckDBStorage] = None):
         """
@@ -57,6 +65,18 @@ class AdminProfileCache:
         self.cache_ttl_days = 7  # Refresh profiles older than 7 days
         self.logger = logging.getLogger(__name__)
         
+        # In-flight lookups keyed by admin ID (single-flight)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._directory_loaded = False
+        # Directory payloads whose vendor depends on the caller's public_email
+        self._directory_payloads: Dict[str, Dict[str, Any]] = {}
+        self._stats = {
+            'db_hits': 0,
+            'api_lookups': 0,
+            'merged_lookups': 0,
+            'directory_profiles': 0
+        }
+        
         # Ensure DuckDB schema is created if storage is provided
         if self.storage:
             try:
@@ -86,16 +106,49 @@ class AdminProfileCache:
             self.logger.debug(f"Admin {admin_id} found in session cache")
             return self.session_cache[admin_id]
         
+        # Join an in-flight lookup for the same admin instead of issuing another
+        inflight = self._inflight.get(admin_id)
+        if inflight is not None:
+            self._stats['merged_lookups'] += 1
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[admin_id] = future
+        try:
+            profile = await self._load_profile(admin_id, client, public_email)
+            future.set_result(profile)
+            return profile
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve the exception so an unawaited future doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(admin_id, None)
+    
+    async def _load_profile(
+        self,
+        admin_id: str,
+        client,
+        public_email: Optional[str] = None
+    ) -> AdminProfile:
+        """Resolve a session-cache miss from DuckDB, then the API"""
         # Check DuckDB cache
         if self.storage:
             cached = self._get_from_db(admin_id)
             if cached and self._is_cache_valid(cached):
                 self.logger.debug(f"Admin {admin_id} found in DB cache")
+                self._stats['db_hits'] += 1
                 self.session_cache[admin_id] = cached
                 return cached
         
-        # Fetch from Intercom API
-        profile = await self._fetch_from_api(admin_id, client, public_email)
+        # Build from the prefetched directory payload, else fetch from Intercom API
+        payload = self._directory_payloads.pop(admin_id, None)
+        if payload is not None:
+            profile = self._profile_from_api_data(admin_id, payload, public_email)
+        else:
+            self._stats['api_lookups'] += 1
+            profile = await self._fetch_from_api(admin_id, client, public_email)
         
         # Cache it
         self.session_cache[admin_id] = profile
@@ -104,6 +157,80 @@ class AdminProfileCache:
         
         return profile
     
+    async def warm_up(self, admin_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Preload admin profiles into the session cache.
+        
+        Valid DuckDB entries are read in one query; if any requested admin is
+        still missing, the whole directory is fetched with one admins.list call
+        and written back in one batch. Admins whose vendor cannot be told from
+        their work email are kept as raw payloads and built by get_admin_profile,
+        which can fall back to the conversation's public_email without an API call.
+        
+        Args:
+            admin_ids: Admin IDs needed for the run; None loads the full directory
+            
+        Returns:
+            Number of profiles in the session cache after warm-up
+        """
+        wanted = None if admin_ids is None else {str(a) for a in admin_ids} - set(self.session_cache)
+        if wanted is not None and not wanted:
+            return len(self.session_cache)
+        
+        if self.storage:
+            cached = self._get_many_from_db(wanted)
+            for admin_id, profile in cached.items():
+                if self._is_cache_valid(profile):
+                    self.session_cache.setdefault(admin_id, profile)
+                    self._stats['db_hits'] += 1
+        
+        missing = None if wanted is None else wanted - set(self.session_cache)
+        if (missing is None or missing) and not self._directory_loaded:
+            try:
+                profiles = await self._fetch_directory()
+            except Exception as e:
+                self.logger.warning(f"Admin directory prefetch failed, falling back to per-admin lookups: {e}")
+                profiles = []
+            
+            for profile in profiles:
+                self.session_cache.setdefault(profile.id, profile)
+            self._stats['directory_profiles'] = len(profiles) + len(self._directory_payloads)
+            if self.storage and profiles:
+                self._store_many_in_db(profiles)
+        
+        self.logger.info(f"Admin profile warm-up complete: {len(self.session_cache)} profiles cached")
+        return len(self.session_cache)
+    
+    @retry_with_backoff(max_retries=3, base_delay=1.0)
+    async def _fetch_directory(self) -> List[AdminProfile]:
+        """
+        Fetch every workspace admin with a single admins.list call.
+        
+        Returns profiles whose vendor is known from the work email; the other
+        payloads are kept for get_admin_profile.
+        """
+        self.logger.info("Fetching admin directory from API")
+        admin_list = await self.intercom_service.client.admins.list()
+        data = self.intercom_service._model_to_dict(admin_list)
+        self._directory_loaded = True
+        
+        profiles = []
+        for admin in data.get('admins') or []:
+            admin_id = str(admin.get('id', '')).strip()
+            if not admin_id or admin_id in self.session_cache:
+                continue
+            work_email = (admin.get('email') or '').strip()
+            if self._identify_vendor(work_email) == 'unknown':
+                self._directory_payloads[admin_id] = admin
+                continue
+            profiles.append(self._profile_from_api_data(admin_id, admin))
+        
+        self.logger.info(
+            f"Admin directory returned {len(profiles)} vendor profiles, "
+            f"{len(self._directory_payloads)} resolved on lookup"
+        )
+        return profiles
+    
     @retry_with_backoff(max_retries=3, base_delay=1.0)
     async def _fetch_from_api(
         self,
@@ -124,63 +251,7 @@ class AdminProfileCache:
             # Log full API response for debugging
             self.logger.debug(f"Admin API response for {admin_id}: {data}")
             
-            # Enhanced email extraction with fallback and validation
-            work_email = data.get('email', '').strip() if data.get('email') else ''
-            
-            # CRITICAL: Log if work_email is empty
-            if not work_email:
-                self.logger.warning(
-                    f"Admin API returned NO WORK EMAIL for {admin_id} "
-                    f"(name: {data.get('name')}, public_email: {public_email})"
-                )
-                # Try to infer vendor from public_email if available
-                if public_email:
-                    self.logger.info(f"Attempting vendor detection from public_email: {public_email}")
-                    inferred_vendor = self._identify_vendor(public_email)
-                    if inferred_vendor != 'unknown':
-                        self.logger.info(f"Inferred vendor from public_email: {inferred_vendor}")
-            
-            # If no work email from API, use public_email but log warning
-            if not work_email and public_email:
-                work_email = public_email.strip()
-                self.logger.warning(
-                    f"Using public_email as work_email for admin {admin_id} "
-                    f"(API returned no work email - vendor detection may fail!)"
-                )
-            
-            # Validate email with basic regex
-            if work_email and not self._validate_email(work_email):
-                self.logger.warning(f"Invalid email format for admin {admin_id}: {work_email}")
-                work_email = ''
-            
-            name = data.get('name', 'Unknown')
-            
-            # Determine vendor from work_email (or public_email as last resort)
-            vendor = self._identify_vendor(work_email)
-            
-            # If vendor is unknown but we have public_email, try that too
-            if vendor == 'unknown' and public_email and public_email != work_email:
-                vendor_from_public = self._identify_vendor(public_email)
-                if vendor_from_public != 'unknown':
-                    vendor = vendor_from_public
-                    self.logger.info(f"Vendor identified from public_email: {vendor}")
-            
-            profile = AdminProfile(
-                id=admin_id,
-                name=name,
-                email=work_email,
-                public_email=public_email or work_email,
-                vendor=vendor,
-                active=data.get('away_mode_enabled', False) is False,
-                cached_at=datetime.now()
-            )
-            
-            self.logger.info(
-                f"Fetched admin {name} ({admin_id}): "
-                f"work_email={work_email}, public_email={public_email}, vendor={profile.vendor}"
-            )
-            
-            return profile
+            return self._profile_from_api_data(admin_id, data, public_email)
             
         except ApiError as e:
             # SDK API errors
@@ -193,6 +264,71 @@ class AdminProfileCache:
             self.logger.warning(f"Failed to fetch admin {admin_id}: {e}")
             return self._create_fallback_profile(admin_id, None, public_email)
     
+    def _profile_from_api_data(
+        self,
+        admin_id: str,
+        data: Dict[str, Any],
+        public_email: Optional[str] = None
+    ) -> AdminProfile:
+        """Build an AdminProfile from an Intercom admin payload"""
+        # Enhanced email extraction with fallback and validation
+        work_email = data.get('email', '').strip() if data.get('email') else ''
+        
+        # CRITICAL: Log if work_email is empty
+        if not work_email:
+            self.logger.warning(
+                f"Admin API returned NO WORK EMAIL for {admin_id} "
+                f"(name: {data.get('name')}, public_email: {public_email})"
+            )
+            # Try to infer vendor from public_email if available
+            if public_email:
+                self.logger.info(f"Attempting vendor detection from public_email: {public_email}")
+                inferred_vendor = self._identify_vendor(public_email)
+                if inferred_vendor != 'unknown':
+                    self.logger.info(f"Inferred vendor from public_email: {inferred_vendor}")
+        
+        # If no work email from API, use public_email but log warning
+        if not work_email and public_email:
+            work_email = public_email.strip()
+            self.logger.warning(
+                f"Using public_email as work_email for admin {admin_id} "
+                f"(API returned no work email - vendor detection may fail!)"
+            )
+        
+        # Validate email with basic regex
+        if work_email and not self._validate_email(work_email):
+            self.logger.warning(f"Invalid email format for admin {admin_id}: {work_email}")
+            work_email = ''
+        
+        name = data.get('name', 'Unknown')
+        
+        # Determine vendor from work_email (or public_email as last resort)
+        vendor = self._identify_vendor(work_email)
+        
+        # If vendor is unknown but we have public_email, try that too
+        if vendor == 'unknown' and public_email and public_email != work_email:
+            vendor_from_public = self._identify_vendor(public_email)
+            if vendor_from_public != 'unknown':
+                vendor = vendor_from_public
+                self.logger.info(f"Vendor identified from public_email: {vendor}")
+        
+        profile = AdminProfile(
+            id=admin_id,
+            name=name,
+            email=work_email,
+            public_email=public_email or work_email,
+            vendor=vendor,
+            active=data.get('away_mode_enabled', False) is False,
+            cached_at=datetime.now()
+        )
+        
+        self.logger.info(
+            f"Fetched admin {name} ({admin_id}): "
+            f"work_email={work_email}, public_email={public_email}, vendor={profile.vendor}"
+        )
+        
+        return profile
+    
     def _extract_vendor_from_email(self, email: str) -> Optional[str]:
         """
         Extract vendor name from email domain.
@@ -368,73 +504,88 @@ class AdminProfileCache:
     
     def _get_from_db(self, admin_id: str) -> Optional[AdminProfile]:
         """Retrieve admin profile from DuckDB cache"""
+        return self._get_many_from_db([admin_id]).get(admin_id)
+    
+    def _get_many_from_db(self, admin_ids: Optional[Iterable[str]] = None) -> Dict[str, AdminProfile]:
+        """Retrieve admin profiles from DuckDB cache in one query (all rows if admin_ids is None)"""
         if not self.storage or not self.storage.conn:
-            return None
+            return {}
         
         try:
-            # Ensure schema exists before reading
-            self.storage.ensure_schema()
-            
-            result = self.storage.conn.execute(
-                """
+            sql = """
                 SELECT admin_id, name, email, public_email, vendor, active, last_updated
                 FROM admin_profiles
-                WHERE admin_id = ?
-                """,
-                [admin_id]
-            ).fetchone()
+            """
+            params: List[Any] = []
+            if admin_ids is not None:
+                params = [list(admin_ids)]
+                if not params[0]:
+                    return {}
+                sql += " WHERE list_contains(?, admin_id)"
             
-            if result:
-                return AdminProfile(
-                    id=result[0],
-                    name=result[1],
-                    email=result[2],
-                    public_email=result[3],
-                    vendor=result[4],
-                    active=result[5],
-                    cached_at=result[6]
-                )
+            rows = self.storage.conn.execute(sql, params).fetchall()
             
-            return None
+            return {
+                row[0]: AdminProfile(
+                    id=row[0],
+                    name=row[1],
+                    email=row[2],
+                    public_email=row[3],
+                    vendor=row[4],
+                    active=row[5],
+                    cached_at=row[6]
+                )
+                for row in rows
+            }
             
         except Exception as e:
-            self.logger.warning(f"Error retrieving admin {admin_id} from DB: {e}")
-            return None
+            self.logger.warning(f"Error retrieving admin profiles from DB: {e}")
+            return {}
     
     def _store_in_db(self, profile: AdminProfile):
         """Store admin profile in DuckDB cache"""
-        if not self.storage or not self.storage.conn:
+        self._store_many_in_db([profile])
+    
+    def _store_many_in_db(self, profiles: List[AdminProfile]):
+        """Upsert admin profiles in one batched statement, keeping first_seen for known admins"""
+        if not self.storage or not self.storage.conn or not profiles:
             return
         
         try:
-            # Ensure schema exists before writing
-            self.storage.ensure_schema()
-            
             now = datetime.now()
             
-            # Use INSERT OR REPLACE pattern
-            self.storage.conn.execute(
+            self.storage.conn.executemany(
                 """
-                INSERT OR REPLACE INTO admin_profiles 
+                INSERT INTO admin_profiles 
                 (admin_id, name, email, public_email, vendor, active, first_seen, last_updated)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (admin_id) DO UPDATE SET
+                    name = excluded.name,
+                    email = excluded.email,
+                    public_email = excluded.public_email,
+                    vendor = excluded.vendor,
+                    active = excluded.active,
+                    last_updated = excluded.last_updated
                 """,
                 [
-                    profile.id,
-                    profile.name,
-                    profile.email,
-                    profile.public_email,
-                    profile.vendor,
-                    profile.active,
-                    now,  # first_seen (will be overwritten if exists)
-                    now   # last_updated
+                    [
+                        profile.id,
+                        profile.name,
+                        profile.email,
+                        profile.public_email,
+                        profile.vendor,
+                        profile.active,
+                        now,  # first_seen (kept if the admin already exists)
+                        now   # last_updated
+                    ]
+                    for profile in profiles
                 ]
             )
             
-            self.logger.debug(f"Stored admin {profile.id} in DB cache")
+            self.logger.debug(f"Stored {len(profiles)} admins in DB cache")
             
         except Exception as e:
-            self.logger.warning(f"Error storing admin {profile.id} in DB: {e}")
+            self.logger.warning(f"Error storing {len(profiles)} admins in DB: {e}")
     
     def _is_cache_valid(self, profile: AdminProfile) -> bool:
         """Check if cached profile is still valid"""
@@ -453,6 +604,8 @@ class AdminProfileCache:
         """Get cache statistics"""
         return {
             'session_cache_size': len(self.session_cache),
-            'cache_ttl_days': self.cache_ttl_days
+            'cache_ttl_days': self.cache_ttl_days,
+            'directory_loaded': self._directory_loaded,
+            **self._stats
         }
 
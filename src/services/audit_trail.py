@@ -24,18 +24,68 @@ To disable scrubbing (not recommended for production):
 
 Configuration:
 - SCRUB_AUDIT_DATA: Enable/disable PII scrubbing (default: true)
+
+Event streaming:
+Pass event_log to also stream every recorded event as JSONL through the shared
+background LogSink. Events are scrubbed on the writer thread (tool calls are
+scrubbed when recorded). Phase boundaries ask the sink to write what is queued
+without waiting; saving reports waits for the sink to flush.
 """
 
+import copy
 import logging
 import os
 import re
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 from pathlib import Path
 import json
 
 logger = logging.getLogger(__name__)
 
+# Sensitive patterns, compiled once (all matched case-insensitively)
+SENSITIVE_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in [
+        # Email addresses
+        (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL_REDACTED]'),
+        # Bearer tokens
+        (r'Bearer\s+[a-zA-Z0-9_\-\.]+', 'Bearer [TOKEN_REDACTED]'),
+        # API keys (20+ alphanumeric chars)
+        (r'\b[A-Za-z0-9_-]{20,}\b', '[API_KEY_REDACTED]'),
+        # Intercom conversation IDs (numeric)
+        (r'\bconversation_id["\s:]+\d+', 'conversation_id: [ID_REDACTED]'),
+        # Admin IDs in various formats
+        (r'\badmin_id["\s:]+\d+', 'admin_id: [ID_REDACTED]'),
+        # Environment variable secrets
+        (r'(API_KEY|SECRET|TOKEN|PASSWORD)\s*[:=]\s*[^\s]+', r'\1: [REDACTED]'),
+        # Hex tokens (32+ chars)
+        (r'\b[a-f0-9]{32,}\b', '[HEX_TOKEN_REDACTED]'),
+    ]
+]
+
+
+def _snapshot(value: Any) -> Any:
+    """Deep copy of value, or its repr if it cannot be copied."""
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        return repr(value)
+
+
+def scrub_sensitive_data(data: Any) -> Any:
+    """Recursively return a copy of data with sensitive strings redacted."""
+    if isinstance(data, dict):
+        return {k: scrub_sensitive_data(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [scrub_sensitive_data(item) for item in data]
+    elif isinstance(data, str):
+        for pattern, replacement in SENSITIVE_PATTERNS:
+            data = pattern.sub(replacement, data)
+        return data
+    # Primitives (int, float, bool, None) pass through
+    return data
+
 
 class AuditTrail:
     """
@@ -63,7 +113,12 @@ class AuditTrail:
     - SCRUB_AUDIT_DATA: Enable/disable PII scrubbing (default: true)
     """
     
-    def __init__(self, output_dir: str = "outputs", scrub_pii: bool = None):
+    def __init__(
+        self,
+        output_dir: str = "outputs",
+        scrub_pii: bool = None,
+        event_log: Optional[Union[str, Path]] = None
+    ):
         self.steps = []
         self.start_time = datetime.now()
         self.output_dir = Path(output_dir)
@@ -78,23 +133,31 @@ class AuditTrail:
             scrub_pii = os.getenv('SCRUB_AUDIT_DATA', 'true').lower() == 'true'
         self.scrub_pii = scrub_pii
         
-        # Define sensitive patterns
-        self.sensitive_patterns = [
-            # Email addresses
-            (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL_REDACTED]'),
-            # Bearer tokens
-            (r'Bearer\s+[a-zA-Z0-9_\-\.]+', 'Bearer [TOKEN_REDACTED]'),
-            # API keys (20+ alphanumeric chars)
-            (r'\b[A-Za-z0-9_-]{20,}\b', '[API_KEY_REDACTED]'),
-            # Intercom conversation IDs (numeric)
-            (r'\bconversation_id["\s:]+\d+', 'conversation_id: [ID_REDACTED]'),
-            # Admin IDs in various formats
-            (r'\badmin_id["\s:]+\d+', 'admin_id: [ID_REDACTED]'),
-            # Environment variable secrets
-            (r'(API_KEY|SECRET|TOKEN|PASSWORD)\s*[:=]\s*[^\s]+', r'\1: [REDACTED]'),
-            # Hex tokens (32+ chars)
-            (r'\b[a-f0-9]{32,}\b', '[HEX_TOKEN_REDACTED]'),
-        ]
+        self.sensitive_patterns = SENSITIVE_PATTERNS
+        
+        # Optional JSONL event stream written by the background log sink
+        self.event_log = Path(event_log) if event_log else None
+        self._sink = None
+        if self.event_log:
+            from src.utils.log_sink import get_log_sink
+            self._sink = get_log_sink()
+        self._current_phase = None
+    
+    def _emit(self, event_type: str, data: Dict[str, Any], scrub: Optional[bool] = None):
+        """Stream an event to the JSONL event log (scrubbed on the writer thread)."""
+        if self._sink is None:
+            return
+        self._sink.write_json(
+            self.event_log,
+            {'event_type': event_type, **data},
+            scrub=self.scrub_pii if scrub is None else scrub
+        )
+    
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until streamed events have been written to disk."""
+        if self._sink is None:
+            return True
+        return self._sink.flush(timeout)
     
     def step(self, phase: str, action: str, details: Dict[str, Any] = None):
         """
@@ -113,7 +176,14 @@ class AuditTrail:
             'action': action,
             'details': details or {}
         }
+        # Phase changes are stage boundaries: have earlier events written now,
+        # without blocking the (often async) caller
+        if phase != self._current_phase:
+            if self._current_phase is not None and self._sink is not None:
+                self._sink.request_flush()
+            self._current_phase = phase
         self.steps.append(step_data)
+        self._emit('step', step_data)
         
         # Also log it
         self.logger.info(f"[AUDIT] {phase}: {action}")
@@ -138,6 +208,7 @@ class AuditTrail:
             'supporting_data': data or {}
         }
         self.decisions.append(decision_data)
+        self._emit('decision', decision_data)
         self.logger.info(f"[DECISION] {question} → {answer}")
         self.logger.debug(f"[DECISION] Because: {reasoning}")
     
@@ -157,6 +228,7 @@ class AuditTrail:
             'resolution': resolution
         }
         self.warnings.append(warning_data)
+        self._emit('warning', warning_data)
         self.logger.warning(f"[AUDIT WARNING] {issue}")
     
     def data_quality_check(self, check_name: str, passed: bool, details: Dict[str, Any]):
@@ -175,6 +247,7 @@ class AuditTrail:
             'details': details
         }
         self.data_quality_issues.append(check_data)
+        self._emit('data_quality_check', check_data)
 
         status = "✅ PASSED" if passed else "❌ FAILED"
         self.logger.info(f"[DATA QUALITY] {check_name}: {status}")
@@ -192,22 +265,7 @@ class AuditTrail:
         """
         if not self.scrub_pii:
             return data
-        
-        if isinstance(data, dict):
-            return {k: self._scrub_sensitive_data(v, preserve_structure) for k, v in data.items()}
-        
-        elif isinstance(data, list):
-            return [self._scrub_sensitive_data(item, preserve_structure) for item in data]
-        
-        elif isinstance(data, str):
-            scrubbed = data
-            for pattern, replacement in self.sensitive_patterns:
-                scrubbed = re.sub(pattern, replacement, scrubbed, flags=re.IGNORECASE)
-            return scrubbed
-        
-        else:
-            # Primitives (int, float, bool, None) pass through
-            return data
+        return scrub_sensitive_data(data)
     
     def tool_call(self, tool_name: str, arguments: Dict[str, Any], result: Any, success: bool, execution_time_ms: float, error_message: str = None):
         """
@@ -221,9 +279,10 @@ class AuditTrail:
             execution_time_ms: Execution time in milliseconds
             error_message: Error message if execution failed
         """
-        # Scrub sensitive data before storing
-        scrubbed_arguments = self._scrub_sensitive_data(arguments)
-        scrubbed_result = self._scrub_sensitive_data(result)
+        # Scrub a snapshot now: the caller may mutate arguments or result after
+        # this returns, while the log sink serializes the event later
+        scrubbed_arguments = self._scrub_sensitive_data(_snapshot(arguments))
+        scrubbed_result = self._scrub_sensitive_data(_snapshot(result))
         scrubbed_error = self._scrub_sensitive_data(error_message) if error_message else None
         
         tool_call_data = {
@@ -237,6 +296,7 @@ class AuditTrail:
             '_scrubbed': self.scrub_pii  # Flag to indicate if scrubbing was applied
         }
         self.tool_calls.append(tool_call_data)
+        self._emit('tool_call', tool_call_data, scrub=False)
 
         # Log the tool call (use scrubbed data)
         if success:
@@ -244,7 +304,8 @@ class AuditTrail:
         else:
             self.logger.warning(f"[TOOL CALL] {tool_name} - FAILED: {scrubbed_error}")
         
-        self.logger.debug(f"[TOOL CALL] Scrubbed Arguments: {scrubbed_arguments}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"[TOOL CALL] Scrubbed Arguments: {scrubbed_arguments}")
     
     def generate_report(self) -> str:
         """
@@ -425,6 +486,7 @@ class AuditTrail:
         
         filepath = self.output_dir / filename
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.flush()
         
         report = self.generate_report()
         
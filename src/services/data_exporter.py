@@ -1,11 +1,19 @@
 """
 Data export service for spreadsheet and other format exports.
+
+Conversation exports are derived from one feature table: each conversation
+is walked once (text extraction, keyword categorization, technical pattern
+detection, part statistics) into a flat feature row. Every sheet or file is
+a column projection, filter or aggregate of that table. CSV and Parquet
+exports process the table in chunks and append each chunk to the output,
+so memory stays bounded by the chunk size plus the small running aggregates.
 """
 
 import logging
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Union
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 import json
@@ -14,13 +22,192 @@ from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Columns of each row-level view of the feature table, with the Parquet/Arrow
+# kind of each column ('str', 'float', 'int' or 'bool')
+CONVERSATION_COLUMNS = {
+    'conversation_id': 'str',
+    'conversation_url': 'str',
+    'created_at': 'str',
+    'updated_at': 'str',
+    'closed_at': 'str',
+    'state': 'str',
+    'priority': 'str',
+    'source_type': 'str',
+    'source_subject': 'str',
+    'source_body': 'str',
+    'source_url': 'str',
+    'conversation_rating': 'float',
+    'tags': 'str',
+    'topics': 'str',
+    'has_attachments': 'bool',
+    'auto_translated': 'bool',
+    'fin_ai_preview': 'bool',
+    'copilot_used': 'bool',
+    'language': 'str',
+    'ai_agent_participated': 'bool',
+    'ai_resolution_state': 'str',
+    'ai_source_title': 'str',
+    'contact_id': 'str',
+    'contact_email': 'str',
+    'contact_name': 'str',
+    'contact_country': 'str',
+    'contact_city': 'str',
+    'user_tier': 'str',
+    'admin_assignee_id': 'str',
+    'team_assignee_id': 'str',
+    'sla_applied': 'str',
+    'time_to_assignment': 'float',
+    'time_to_admin_reply': 'float',
+    'time_to_first_close': 'float',
+    'median_time_to_reply': 'float',
+    'handling_time': 'float',
+    'count_reopens': 'float',
+    'count_assignments': 'float',
+    'count_conversation_parts': 'float',
+    'total_messages': 'int',
+    'agent_messages': 'int',
+    'customer_messages': 'int',
+    'first_response_time_seconds': 'float',
+    'first_response_time_hours': 'float',
+    'resolution_time_seconds': 'float',
+    'resolution_time_hours': 'float',
+}
+
+TIME_ANALYSIS_COLUMNS = [
+    'conversation_id', 'date', 'hour', 'day_of_week', 'week', 'month', 'quarter', 'state', 'source_type'
+]
+
+TOPIC_ANALYSIS_COLUMNS = [
+    'conversation_id', 'primary_topic', 'secondary_topics', 'is_billing_related', 'is_technical_issue',
+    'is_product_question', 'is_account_related', 'text_length', 'word_count'
+]
+
+TECHNICAL_COLUMNS = [
+    'conversation_id', 'conversation_url', 'created_at', 'state', 'priority', 'admin_assignee_id', 'tags',
+    'topics', 'language', 'ai_agent_participated', 'fin_ai_preview', 'copilot_used', 'conversation_rating',
+    'time_to_admin_reply', 'handling_time', 'count_conversation_parts', 'count_reopens',
+    'cache_clear_mentioned', 'browser_switch_mentioned', 'connection_issue_mentioned', 'escalation_mentioned',
+    'product_issue_mentioned', 'detected_keywords', 'escalated_to', 'escalation_notes', 'agent_actions',
+    'resolution_notes', 'customer_response', 'primary_issue_category'
+]
+
+# view name -> (columns, boolean feature column selecting its rows, {feature column: view column})
+_ROW_VIEWS = {
+    'conversations': (list(CONVERSATION_COLUMNS), None, {}),
+    'time_analysis': (TIME_ANALYSIS_COLUMNS, '_has_timestamp', {}),
+    'topic_analysis': (TOPIC_ANALYSIS_COLUMNS, None, {}),
+    'satisfaction': (
+        ['conversation_id', 'conversation_rating', 'rating_category', 'source_type', 'contact_country',
+         'user_tier', 'created_at', 'state'],
+        '_has_rating',
+        {'conversation_rating': 'rating', 'contact_country': 'country'}
+    ),
+    'technical': (TECHNICAL_COLUMNS, None, {}),
+}
+
+FEATURE_COLUMNS = list(dict.fromkeys(
+    list(CONVERSATION_COLUMNS) + TIME_ANALYSIS_COLUMNS + TOPIC_ANALYSIS_COLUMNS + ['rating_category']
+    + TECHNICAL_COLUMNS + ['_has_timestamp', '_has_rating']
+))
+
+# (agent_email, conversation_id, response_time_seconds, conversation_rating) per admin part
+AgentResponse = Tuple[str, Any, Optional[float], Any]
+
+# Technical issue flags in priority order for primary_issue_category
+_ISSUE_PRIORITY = ['escalation', 'cache_clear', 'browser_switch', 'connection_issue', 'product_issue']
+
+
+class SummaryAccumulator:
+    """Running aggregates behind the metrics and agent performance sheets, fed one feature chunk at a time."""
+
+    def __init__(self):
+        self.total = 0
+        self.closed = 0
+        self.response_times: List[float] = []
+        self.ratings: List[float] = []
+        self.source_types: Counter = Counter()
+        self.countries: Counter = Counter()
+        self.agents: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, features: pd.DataFrame, agent_responses: List[AgentResponse]):
+        self.total += len(features)
+        self.closed += int((features['state'] == 'closed').sum())
+        self.response_times.extend(features['first_response_time_seconds'].dropna().tolist())
+        self.ratings.extend(features.loc[features['_has_rating'], 'conversation_rating'].tolist())
+        self.source_types.update(features['source_type'].dropna())
+        self.countries.update(country for country in features['contact_country'].dropna() if country)
+
+        for agent_email, conversation_id, response_time, rating in agent_responses:
+            agent = self.agents.get(agent_email)
+            if agent is None:
+                agent = self.agents[agent_email] = {
+                    'total_responses': 0, 'conversations_handled': set(), 'response_times': [], 'ratings': []
+                }
+            agent['total_responses'] += 1
+            agent['conversations_handled'].add(conversation_id)
+            if response_time is not None:
+                agent['response_times'].append(response_time)
+            if rating:
+                agent['ratings'].append(rating)
+
+    def metrics_frame(self) -> pd.DataFrame:
+        if not self.total:
+            return pd.DataFrame()
+
+        response_times, ratings = self.response_times, self.ratings
+        metrics_data = [
+            {'metric': 'Total Conversations', 'value': self.total, 'type': 'count'},
+            {'metric': 'Closed Conversations', 'value': self.closed, 'type': 'count'},
+            {'metric': 'Resolution Rate', 'value': self.closed / self.total * 100, 'type': 'percentage'},
+            {'metric': 'Average Response Time (hours)', 'value': np.mean(response_times) / 3600 if response_times else 0, 'type': 'time'},
+            {'metric': 'Median Response Time (hours)', 'value': np.median(response_times) / 3600 if response_times else 0, 'type': 'time'},
+            {'metric': 'Average Rating', 'value': np.mean(ratings) if ratings else 0, 'type': 'rating'},
+            {'metric': 'Median Rating', 'value': np.median(ratings) if ratings else 0, 'type': 'rating'},
+        ]
+
+        # Add source type breakdown
+        for source_type, count in self.source_types.most_common():
+            metrics_data.append({
+                'metric': f'Conversations via {str(source_type).title()}',
+                'value': count,
+                'type': 'count'
+            })
+
+        # Add top countries
+        for country, count in self.countries.most_common(10):
+            metrics_data.append({
+                'metric': f'Conversations from {country}',
+                'value': count,
+                'type': 'count'
+            })
+
+        return pd.DataFrame(metrics_data)
+
+    def agent_performance_frame(self) -> pd.DataFrame:
+        performance_data = []
+        for agent_email, data in self.agents.items():
+            performance_data.append({
+                'agent_email': agent_email,
+                'total_responses': data['total_responses'],
+                'conversations_handled': len(data['conversations_handled']),
+                'average_response_time_hours': np.mean(data['response_times']) / 3600 if data['response_times'] else 0,
+                'median_response_time_hours': np.median(data['response_times']) / 3600 if data['response_times'] else 0,
+                'average_rating': np.mean(data['ratings']) if data['ratings'] else 0,
+                'total_ratings': len(data['ratings'])
+            })
+
+        return pd.DataFrame(performance_data)
+
 
 class DataExporter:
     """Service for exporting data to various formats."""
 
-    def __init__(self):
-        self.output_dir = Path(settings.output_directory)
-        self.output_dir.mkdir(exist_ok=True)
+    # Conversations per feature chunk for streamed (CSV/Parquet) exports
+    EXPORT_CHUNK_SIZE = 5000
+
+    def __init__(self, output_dir: Optional[str] = None):
+        self.output_dir = Path(output_dir or settings.output_directory)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
         self.redact_sensitive = settings.redact_sensitive_outputs
     
@@ -35,73 +222,82 @@ class DataExporter:
         
         output_path = self.output_dir / f"{filename}.xlsx"
         
+        # Excel sheets are written whole, so the feature table is built in full (still one pass)
+        features, summary = self._build_features(conversations)
+        
         with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
             # Main conversations sheet
-            conversations_df = self._prepare_conversations_dataframe(conversations)
-            conversations_df.to_excel(writer, sheet_name='Conversations', index=False)
+            self._view(features, 'conversations').to_excel(writer, sheet_name='Conversations', index=False)
             
             # Metrics summary sheet
             if include_metrics:
-                metrics_df = self._prepare_metrics_dataframe(conversations)
-                metrics_df.to_excel(writer, sheet_name='Metrics_Summary', index=False)
+                summary.metrics_frame().to_excel(writer, sheet_name='Metrics_Summary', index=False)
             
             # Time-based analysis sheet
-            time_analysis_df = self._prepare_time_analysis_dataframe(conversations)
-            time_analysis_df.to_excel(writer, sheet_name='Time_Analysis', index=False)
+            self._view(features, 'time_analysis').to_excel(writer, sheet_name='Time_Analysis', index=False)
             
             # Topic analysis sheet
-            topic_analysis_df = self._prepare_topic_analysis_dataframe(conversations)
-            topic_analysis_df.to_excel(writer, sheet_name='Topic_Analysis', index=False)
+            self._view(features, 'topic_analysis').to_excel(writer, sheet_name='Topic_Analysis', index=False)
             
             # Agent performance sheet
-            agent_performance_df = self._prepare_agent_performance_dataframe(conversations)
-            agent_performance_df.to_excel(writer, sheet_name='Agent_Performance', index=False)
+            summary.agent_performance_frame().to_excel(writer, sheet_name='Agent_Performance', index=False)
             
             # Customer satisfaction sheet
-            satisfaction_df = self._prepare_satisfaction_dataframe(conversations)
-            satisfaction_df.to_excel(writer, sheet_name='Customer_Satisfaction', index=False)
+            self._view(features, 'satisfaction').to_excel(writer, sheet_name='Customer_Satisfaction', index=False)
         
         self.logger.info(f"Excel export completed: {output_path}")
         return str(output_path)
     
     def export_conversations_to_csv(
         self,
-        conversations: List[Dict],
+        conversations: Iterable[Dict],
         filename: str,
         split_by_category: bool = True
     ) -> List[str]:
-        """Export conversations to CSV files with optional sanitization."""
-        self.logger.info(f"Exporting {len(conversations)} conversations to CSV")
+        """
+        Export conversations to CSV files with optional sanitization.
+        
+        Row-level files are appended one feature chunk at a time; the metrics
+        and agent performance files are written from running aggregates at the end.
+        """
+        self.logger.info(f"Exporting {self._count_label(conversations)} conversations to CSV")
 
         # Apply sanitization if enabled
         if self.redact_sensitive:
             self.logger.info("Applying sensitive data redaction to CSV exports")
-            conversations = [self._sanitize_dict(conv) for conv in conversations]
-
-        output_files = []
 
-        if split_by_category:
+        views = ['conversations', 'time_analysis', 'topic_analysis', 'satisfaction'] if split_by_category else ['conversations']
+        paths = {
+            view: self.output_dir / (f"{filename}_{view}.csv" if split_by_category else f"{filename}.csv")
+            for view in views
+        }
+        written = set()
+        summary = SummaryAccumulator()
+        
+        for features, agent_responses in self._iter_feature_chunks(conversations, sanitize=self.redact_sensitive):
+            summary.add(features, agent_responses)
+            for view in views:
+                df = self._view(features, view)
+                if df.empty:
+                    continue
+                df.to_csv(paths[view], mode='a' if view in written else 'w', header=view not in written, index=False)
+                written.add(view)
+        
+        if not split_by_category:
+            # Single CSV file (header only when there are no conversations)
+            if 'conversations' not in written:
+                self._view(self._feature_frame([]), 'conversations').to_csv(paths['conversations'], index=False)
+            output_files = [str(paths['conversations'])]
+        else:
             # Export different categories to separate CSV files
-            categories = {
-                'conversations': self._prepare_conversations_dataframe(conversations),
-                'metrics': self._prepare_metrics_dataframe(conversations),
-                'time_analysis': self._prepare_time_analysis_dataframe(conversations),
-                'topic_analysis': self._prepare_topic_analysis_dataframe(conversations),
-                'agent_performance': self._prepare_agent_performance_dataframe(conversations),
-                'satisfaction': self._prepare_satisfaction_dataframe(conversations)
-            }
-            
-            for category, df in categories.items():
+            for view, df in (('metrics', summary.metrics_frame()), ('agent_performance', summary.agent_performance_frame())):
                 if not df.empty:
-                    output_path = self.output_dir / f"{filename}_{category}.csv"
-                    df.to_csv(output_path, index=False)
-                    output_files.append(str(output_path))
-        else:
-            # Single CSV file
-            df = self._prepare_conversations_dataframe(conversations)
-            output_path = self.output_dir / f"{filename}.csv"
-            df.to_csv(output_path, index=False)
-            output_files.append(str(output_path))
+                    paths[view] = self.output_dir / f"{filename}_{view}.csv"
+                    df.to_csv(paths[view], index=False)
+                    written.add(view)
+            
+            category_order = ['conversations', 'metrics', 'time_analysis', 'topic_analysis', 'agent_performance', 'satisfaction']
+            output_files = [str(paths[view]) for view in category_order if view in written]
         
         self.logger.info(f"CSV export completed: {len(output_files)} files")
         return output_files
@@ -183,392 +379,310 @@ class DataExporter:
     
     def export_to_parquet(
         self, 
-        conversations: List[Dict], 
+        conversations: Iterable[Dict], 
         filename: str
     ) -> str:
-        """Export conversations to Parquet format for efficient storage."""
-        self.logger.info(f"Exporting {len(conversations)} conversations to Parquet")
+        """Export conversations to Parquet format for efficient storage, one row group per feature chunk."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        self.logger.info(f"Exporting {self._count_label(conversations)} conversations to Parquet")
         
-        df = self._prepare_conversations_dataframe(conversations)
         output_path = self.output_dir / f"{filename}.parquet"
+        arrow_types = {'str': pa.string(), 'float': pa.float64(), 'int': pa.int64(), 'bool': pa.bool_()}
+        schema = pa.schema([(column, arrow_types[kind]) for column, kind in CONVERSATION_COLUMNS.items()])
         
-        df.to_parquet(output_path, index=False)
+        # Columns are coerced to fixed types so every chunk matches the file schema
+        with pq.ParquetWriter(output_path, schema) as writer:
+            for features, _ in self._iter_feature_chunks(conversations, text=False):
+                df = self._coerce_columns(self._view(features, 'conversations'), CONVERSATION_COLUMNS)
+                writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
         
         self.logger.info(f"Parquet export completed: {output_path}")
         return str(output_path)
     
     def export_technical_troubleshooting_analysis(
         self, 
-        conversations: List[Dict], 
+        conversations: Iterable[Dict], 
         filename: str
     ) -> str:
         """Export technical troubleshooting analysis to CSV."""
-        self.logger.info(f"Exporting technical troubleshooting analysis for {len(conversations)} conversations")
+        self.logger.info(f"Exporting technical troubleshooting analysis for {self._count_label(conversations)} conversations")
         
         output_path = self.output_dir / f"{filename}_technical_troubleshooting.csv"
         
-        # Prepare technical troubleshooting data
-        tech_data = []
-        
-        for conv in conversations:
-            # Extract all conversation text
-            full_text = self._extract_conversation_text(conv)
-            
-            # Detect technical troubleshooting patterns
-            patterns = self._detect_technical_patterns(full_text)
-            
-            # Extract agent actions and escalations
-            agent_actions = self._extract_agent_actions(conv)
-            escalations = self._detect_escalations(full_text)
-            
-            # Get conversation metadata
-            row = {
-                'conversation_id': conv.get('id'),
-                'conversation_url': f"https://app.intercom.com/a/inbox/{conv.get('id')}",
-                'created_at': self._format_timestamp(conv.get('created_at')),
-                'state': conv.get('state'),
-                'priority': conv.get('priority'),
-                'admin_assignee_id': conv.get('admin_assignee_id'),
-                'tags': ', '.join([tag.get('name', tag) if isinstance(tag, dict) else tag for tag in conv.get('tags', {}).get('tags', [])]),
-                'topics': ', '.join([topic.get('name', topic) if isinstance(topic, dict) else topic for topic in conv.get('topics', {}).get('topics', [])]),
-                'language': conv.get('custom_attributes', {}).get('Language', ''),
-                'ai_agent_participated': conv.get('ai_agent_participated', False),
-                'fin_ai_preview': conv.get('custom_attributes', {}).get('Fin AI Agent: Preview', False),
-                'copilot_used': conv.get('custom_attributes', {}).get('Copilot used', False),
-                'conversation_rating': conv.get('conversation_rating'),
-                'time_to_admin_reply': conv.get('statistics', {}).get('time_to_admin_reply'),
-                'handling_time': conv.get('statistics', {}).get('handling_time'),
-                'count_conversation_parts': conv.get('statistics', {}).get('count_conversation_parts'),
-                'count_reopens': conv.get('statistics', {}).get('count_reopens'),
-            }
-            
-            # Add detected patterns
-            row.update({
-                'cache_clear_mentioned': patterns.get('cache_clear', False),
-                'browser_switch_mentioned': patterns.get('browser_switch', False),
-                'connection_issue_mentioned': patterns.get('connection_issue', False),
-                'escalation_mentioned': patterns.get('escalation', False),
-                'product_issue_mentioned': patterns.get('product_issue', False),
-                'detected_keywords': ', '.join(patterns.get('keywords', [])),
-                'escalated_to': ', '.join(escalations.get('escalated_to', [])),
-                'escalation_notes': escalations.get('notes', ''),
-                'agent_actions': ', '.join(agent_actions.get('actions', [])),
-                'resolution_notes': agent_actions.get('resolution_notes', ''),
-                'customer_response': agent_actions.get('customer_response', ''),
-            })
-            
-            # Determine primary issue category
-            if patterns.get('escalation'):
-                row['primary_issue_category'] = 'escalation'
-            elif patterns.get('cache_clear'):
-                row['primary_issue_category'] = 'cache_clear'
-            elif patterns.get('browser_switch'):
-                row['primary_issue_category'] = 'browser_switch'
-            elif patterns.get('connection_issue'):
-                row['primary_issue_category'] = 'connection_issue'
-            elif patterns.get('product_issue'):
-                row['primary_issue_category'] = 'product_issue'
-            else:
-                row['primary_issue_category'] = 'other'
-            
-            tech_data.append(row)
-        
-        # Create DataFrame and export
-        df = pd.DataFrame(tech_data)
-        df.to_csv(output_path, index=False)
+        header = True
+        for features, _ in self._iter_feature_chunks(conversations, technical=True):
+            self._view(features, 'technical').to_csv(output_path, mode='w' if header else 'a', header=header, index=False)
+            header = False
+        if header:
+            self._view(self._feature_frame([]), 'technical').to_csv(output_path, index=False)
         
         self.logger.info(f"Technical troubleshooting analysis export completed: {output_path}")
         return str(output_path)
     
-    # Data preparation methods
-    def _prepare_conversations_dataframe(self, conversations: List[Dict]) -> pd.DataFrame:
-        """Prepare conversations data for DataFrame."""
-        data = []
+    # Feature table
+    def _extract_features(
+        self,
+        conv: Dict,
+        text: bool = True,
+        technical: bool = False
+    ) -> Tuple[Dict[str, Any], List[AgentResponse]]:
+        """
+        Compute the feature row of one conversation plus one entry per admin reply.
         
-        for conv in conversations:
-            # Basic conversation info
-            row = {
-                'conversation_id': conv.get('id'),
-                'conversation_url': f"https://app.intercom.com/a/inbox/{conv.get('id')}",
-                'created_at': self._format_timestamp(conv.get('created_at')),
-                'updated_at': self._format_timestamp(conv.get('updated_at')),
-                'closed_at': self._format_timestamp(conv.get('statistics', {}).get('last_close_at')),
-                'state': conv.get('state'),
-                'priority': conv.get('priority'),
-                'source_type': conv.get('source', {}).get('type'),
-                'source_subject': conv.get('source', {}).get('subject'),
-                'source_body': conv.get('source', {}).get('body', '')[:500],  # Truncate for readability
-                'source_url': conv.get('source', {}).get('url'),
-                'conversation_rating': conv.get('conversation_rating'),
-                'tags': ', '.join([tag.get('name', tag) if isinstance(tag, dict) else tag for tag in conv.get('tags', {}).get('tags', [])]),
-                'topics': ', '.join([topic.get('name', topic) if isinstance(topic, dict) else topic for topic in conv.get('topics', {}).get('topics', [])]),
-            }
-            
+        Text columns (topic analysis) need the conversation text extracted, and
+        technical troubleshooting columns (pattern, escalation and agent action
+        detection) scan it further, so each group is only computed when requested.
+        """
+        conversation_id = conv.get('id')
+        created_ts = conv.get('created_at')
+        source = conv.get('source') or {}
+        stats = conv.get('statistics') or {}
+        custom_attrs = conv.get('custom_attributes') or {}
+        ai_agent = conv.get('ai_agent') or {}
+        contacts = (conv.get('contacts') or {}).get('contacts')
+        contact = (contacts[0] or {}) if contacts else {}
+        location = contact.get('location') or {}
+        rating = conv.get('conversation_rating')
+        created_dt = datetime.fromtimestamp(created_ts) if created_ts else None
+        
+        row = {
+            'conversation_id': conversation_id,
+            'conversation_url': f"https://app.intercom.com/a/inbox/{conversation_id}",
+            'created_at': created_dt.strftime('%Y-%m-%d %H:%M:%S') if created_dt else '',
+            'updated_at': self._format_timestamp(conv.get('updated_at')),
+            'closed_at': self._format_timestamp(stats.get('last_close_at')),
+            'state': conv.get('state'),
+            'priority': conv.get('priority'),
+            'source_type': source.get('type'),
+            'source_subject': source.get('subject'),
+            'source_body': (source.get('body') or '')[:500],  # Truncate for readability
+            'source_url': source.get('url'),
+            'conversation_rating': rating,
+            'tags': ', '.join([tag.get('name', tag) if isinstance(tag, dict) else tag for tag in (conv.get('tags') or {}).get('tags', [])]),
+            'topics': ', '.join([topic.get('name', topic) if isinstance(topic, dict) else topic for topic in (conv.get('topics') or {}).get('topics', [])]),
             # Custom attributes (Hilary's metadata)
-            custom_attrs = conv.get('custom_attributes', {})
-            row.update({
-                'has_attachments': custom_attrs.get('Has attachments', False),
-                'auto_translated': custom_attrs.get('Auto-translated', False),
-                'fin_ai_preview': custom_attrs.get('Fin AI Agent: Preview', False),
-                'copilot_used': custom_attrs.get('Copilot used', False),
-                'language': custom_attrs.get('Language', ''),
-            })
-            
+            'has_attachments': custom_attrs.get('Has attachments', False),
+            'auto_translated': custom_attrs.get('Auto-translated', False),
+            'fin_ai_preview': custom_attrs.get('Fin AI Agent: Preview', False),
+            'copilot_used': custom_attrs.get('Copilot used', False),
+            'language': custom_attrs.get('Language', ''),
             # AI Agent participation
-            row['ai_agent_participated'] = conv.get('ai_agent_participated', False)
-            row['ai_resolution_state'] = conv.get('ai_agent', {}).get('resolution_state')
-            row['ai_source_title'] = conv.get('ai_agent', {}).get('source_title')
-            
+            'ai_agent_participated': conv.get('ai_agent_participated', False),
+            'ai_resolution_state': ai_agent.get('resolution_state'),
+            'ai_source_title': ai_agent.get('source_title'),
             # Contact information
-            contact = conv.get('contacts', {}).get('contacts', [{}])[0] if conv.get('contacts', {}).get('contacts') else {}
-            row.update({
-                'contact_id': contact.get('id'),
-                'contact_email': contact.get('email'),
-                'contact_name': contact.get('name'),
-                'contact_country': contact.get('location', {}).get('country'),
-                'contact_city': contact.get('location', {}).get('city'),
-                'user_tier': contact.get('custom_attributes', {}).get('tier'),
-            })
-            
+            'contact_id': contact.get('id'),
+            'contact_email': contact.get('email'),
+            'contact_name': contact.get('name'),
+            'contact_country': location.get('country'),
+            'contact_city': location.get('city'),
+            'user_tier': (contact.get('custom_attributes') or {}).get('tier'),
             # Assignment and team info
-            row.update({
-                'admin_assignee_id': conv.get('admin_assignee_id'),
-                'team_assignee_id': conv.get('team_assignee_id'),
-                'sla_applied': conv.get('sla_applied'),
-            })
-            
+            'admin_assignee_id': conv.get('admin_assignee_id'),
+            'team_assignee_id': conv.get('team_assignee_id'),
+            'sla_applied': conv.get('sla_applied'),
             # Statistics
-            stats = conv.get('statistics', {})
-            row.update({
-                'time_to_assignment': stats.get('time_to_assignment'),
-                'time_to_admin_reply': stats.get('time_to_admin_reply'),
-                'time_to_first_close': stats.get('time_to_first_close'),
-                'median_time_to_reply': stats.get('median_time_to_reply'),
-                'handling_time': stats.get('handling_time'),
-                'count_reopens': stats.get('count_reopens'),
-                'count_assignments': stats.get('count_assignments'),
-                'count_conversation_parts': stats.get('count_conversation_parts'),
-            })
-            
-            # Conversation parts
-            parts = conv.get('conversation_parts', {}).get('conversation_parts', [])
+            'time_to_assignment': stats.get('time_to_assignment'),
+            'time_to_admin_reply': stats.get('time_to_admin_reply'),
+            'time_to_first_close': stats.get('time_to_first_close'),
+            'median_time_to_reply': stats.get('median_time_to_reply'),
+            'handling_time': stats.get('handling_time'),
+            'count_reopens': stats.get('count_reopens'),
+            'count_assignments': stats.get('count_assignments'),
+            'count_conversation_parts': stats.get('count_conversation_parts'),
+            'rating_category': self._categorize_rating(rating) if rating else None,
+            '_has_rating': bool(rating),
+            '_has_timestamp': bool(created_ts),
+        }
+        
+        # Conversation parts: message counts, first response and per-agent replies in one walk
+        parts = (conv.get('conversation_parts') or {}).get('conversation_parts', [])
+        agent_messages = customer_messages = 0
+        first_agent_response = None
+        agent_responses: List[AgentResponse] = []
+        for part in parts:
+            author = part.get('author') or {}
+            author_type = author.get('type')
+            if author_type == 'admin':
+                agent_messages += 1
+                part_created = part.get('created_at')
+                if first_agent_response is None:
+                    first_agent_response = part_created
+                response_time = part_created - (created_ts or 0) if part_created is not None else None
+                agent_responses.append((author.get('email', 'unknown'), conversation_id, response_time, rating))
+            elif author_type == 'user':
+                customer_messages += 1
+        row.update({
+            'total_messages': len(parts),
+            'agent_messages': agent_messages,
+            'customer_messages': customer_messages,
+            'first_response_time_seconds': None,
+            'first_response_time_hours': None,
+            'resolution_time_seconds': None,
+            'resolution_time_hours': None,
+        })
+        
+        # Response time calculation
+        if first_agent_response:
+            response_time = first_agent_response - (created_ts or 0)
+            row['first_response_time_seconds'] = response_time
+            row['first_response_time_hours'] = response_time / 3600
+        
+        # Resolution time
+        if conv.get('state') == 'closed' and conv.get('closed_at'):
+            resolution_time = conv.get('closed_at') - (created_ts or 0)
+            row['resolution_time_seconds'] = resolution_time
+            row['resolution_time_hours'] = resolution_time / 3600
+        
+        # Time dimensions
+        if created_dt:
             row.update({
-                'total_messages': len(parts),
-                'agent_messages': sum(1 for part in parts if part.get('author', {}).get('type') == 'admin'),
-                'customer_messages': sum(1 for part in parts if part.get('author', {}).get('type') == 'user'),
+                'date': created_dt.date(),
+                'hour': created_dt.hour,
+                'day_of_week': created_dt.strftime('%A'),
+                'week': created_dt.strftime('%Y-W%U'),
+                'month': created_dt.strftime('%Y-%m'),
+                'quarter': f"{created_dt.year}-Q{(created_dt.month-1)//3+1}",
             })
-            
-            # Response time calculation
-            if parts:
-                first_agent_response = None
-                for part in parts:
-                    if part.get('author', {}).get('type') == 'admin':
-                        first_agent_response = part.get('created_at')
-                        break
-                
-                if first_agent_response:
-                    response_time = first_agent_response - conv.get('created_at', 0)
-                    row['first_response_time_seconds'] = response_time
-                    row['first_response_time_hours'] = response_time / 3600
-            
-            # Resolution time
-            if conv.get('state') == 'closed' and conv.get('closed_at'):
-                resolution_time = conv.get('closed_at') - conv.get('created_at', 0)
-                row['resolution_time_seconds'] = resolution_time
-                row['resolution_time_hours'] = resolution_time / 3600
-            
-            data.append(row)
         
-        return pd.DataFrame(data)
+        if not (text or technical):
+            return row, agent_responses
+        
+        # Text features: extracted and scanned once per conversation
+        text = self._extract_conversation_text(conv)
+        topics = self._categorize_conversation(text)
+        row.update({
+            'primary_topic': topics.get('primary', 'other'),
+            'secondary_topics': ', '.join(topics.get('secondary', [])),
+            'is_billing_related': topics.get('billing', False),
+            'is_technical_issue': topics.get('technical', False),
+            'is_product_question': topics.get('product', False),
+            'is_account_related': topics.get('account', False),
+            'text_length': len(text),
+            'word_count': len(text.split()),
+        })
+        
+        if not technical:
+            return row, agent_responses
+        
+        patterns = self._detect_technical_patterns(text)
+        escalations = self._detect_escalations(text)
+        agent_actions = self._extract_agent_actions(conv)
+        row.update({
+            'cache_clear_mentioned': patterns.get('cache_clear', False),
+            'browser_switch_mentioned': patterns.get('browser_switch', False),
+            'connection_issue_mentioned': patterns.get('connection_issue', False),
+            'escalation_mentioned': patterns.get('escalation', False),
+            'product_issue_mentioned': patterns.get('product_issue', False),
+            'detected_keywords': ', '.join(patterns.get('keywords', [])),
+            'escalated_to': ', '.join(escalations.get('escalated_to', [])),
+            'escalation_notes': escalations.get('notes', ''),
+            'agent_actions': ', '.join(agent_actions.get('actions', [])),
+            'resolution_notes': agent_actions.get('resolution_notes', ''),
+            'customer_response': agent_actions.get('customer_response', ''),
+            'primary_issue_category': next((issue for issue in _ISSUE_PRIORITY if patterns.get(issue)), 'other'),
+        })
+        
+        return row, agent_responses
     
-    def _prepare_metrics_dataframe(self, conversations: List[Dict]) -> pd.DataFrame:
-        """Prepare metrics summary for DataFrame."""
-        if not conversations:
-            return pd.DataFrame()
-        
-        # Calculate basic metrics
-        total_conversations = len(conversations)
-        closed_conversations = sum(1 for conv in conversations if conv.get('state') == 'closed')
-        
-        # Response times
-        response_times = []
-        for conv in conversations:
-            parts = conv.get('conversation_parts', {}).get('conversation_parts', [])
-            for part in parts:
-                if part.get('author', {}).get('type') == 'admin':
-                    response_time = part.get('created_at') - conv.get('created_at', 0)
-                    response_times.append(response_time)
-                    break
-        
-        # Ratings
-        ratings = [conv.get('conversation_rating') for conv in conversations if conv.get('conversation_rating')]
-        
-        # Source types
-        source_types = [conv.get('source', {}).get('type') for conv in conversations]
-        source_type_counts = pd.Series(source_types).value_counts()
+    def _feature_frame(self, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        return pd.DataFrame(rows, columns=FEATURE_COLUMNS)
+    
+    def _iter_feature_chunks(
+        self,
+        conversations: Iterable[Dict],
+        chunk_size: Optional[int] = None,
+        sanitize: bool = False,
+        text: bool = True,
+        technical: bool = False
+    ) -> Iterator[Tuple[pd.DataFrame, List[AgentResponse]]]:
+        """Yield (feature frame, agent replies) for consecutive chunks of conversations."""
+        chunk_size = chunk_size or self.EXPORT_CHUNK_SIZE
+        rows: List[Dict[str, Any]] = []
+        agent_responses: List[AgentResponse] = []
         
-        # Countries
-        countries = []
         for conv in conversations:
-            contact = conv.get('contacts', {}).get('contacts', [{}])[0] if conv.get('contacts', {}).get('contacts') else {}
-            country = contact.get('location', {}).get('country')
-            if country:
-                countries.append(country)
-        country_counts = pd.Series(countries).value_counts()
-        
-        metrics_data = [
-            {'metric': 'Total Conversations', 'value': total_conversations, 'type': 'count'},
-            {'metric': 'Closed Conversations', 'value': closed_conversations, 'type': 'count'},
-            {'metric': 'Resolution Rate', 'value': (closed_conversations / total_conversations * 100) if total_conversations > 0 else 0, 'type': 'percentage'},
-            {'metric': 'Average Response Time (hours)', 'value': np.mean(response_times) / 3600 if response_times else 0, 'type': 'time'},
-            {'metric': 'Median Response Time (hours)', 'value': np.median(response_times) / 3600 if response_times else 0, 'type': 'time'},
-            {'metric': 'Average Rating', 'value': np.mean(ratings) if ratings else 0, 'type': 'rating'},
-            {'metric': 'Median Rating', 'value': np.median(ratings) if ratings else 0, 'type': 'rating'},
-        ]
-        
-        # Add source type breakdown
-        for source_type, count in source_type_counts.items():
-            metrics_data.append({
-                'metric': f'Conversations via {source_type.title()}', 
-                'value': count, 
-                'type': 'count'
-            })
-        
-        # Add top countries
-        for country, count in country_counts.head(10).items():
-            metrics_data.append({
-                'metric': f'Conversations from {country}', 
-                'value': count, 
-                'type': 'count'
-            })
-        
-        return pd.DataFrame(metrics_data)
+            if sanitize:
+                conv = self._sanitize_dict(conv)
+            row, responses = self._extract_features(conv, text, technical)
+            rows.append(row)
+            agent_responses.extend(responses)
+            if len(rows) >= chunk_size:
+                yield self._feature_frame(rows), agent_responses
+                rows, agent_responses = [], []
+        
+        if rows:
+            yield self._feature_frame(rows), agent_responses
+    
+    def _build_features(self, conversations: Iterable[Dict], technical: bool = False) -> Tuple[pd.DataFrame, SummaryAccumulator]:
+        """Build the full feature table and its aggregates in one pass."""
+        summary = SummaryAccumulator()
+        chunks = []
+        for features, agent_responses in self._iter_feature_chunks(conversations, technical=technical):
+            summary.add(features, agent_responses)
+            chunks.append(features)
+        features = pd.concat(chunks, ignore_index=True) if chunks else self._feature_frame([])
+        return features, summary
+    
+    def _view(self, features: pd.DataFrame, view: str) -> pd.DataFrame:
+        """Project the feature table onto one row-level sheet."""
+        columns, row_filter, renames = _ROW_VIEWS[view]
+        if row_filter:
+            features = features[features[row_filter].astype(bool)]
+        return features[columns].rename(columns=renames).reset_index(drop=True)
+    
+    @staticmethod
+    def _coerce_columns(df: pd.DataFrame, kinds: Dict[str, str]) -> pd.DataFrame:
+        """Cast columns to the fixed dtypes of their kind (None stays missing)."""
+        df = df.copy()
+        for column, kind in kinds.items():
+            values = df[column]
+            if kind == 'str':
+                df[column] = values.astype(object).where(values.notna(), None).map(
+                    lambda value: value if value is None or isinstance(value, str) else str(value)
+                )
+            elif kind == 'bool':
+                df[column] = pd.array([None if pd.isna(value) else bool(value) for value in values], dtype='boolean')
+            elif kind == 'int':
+                df[column] = pd.to_numeric(values, errors='coerce').astype('Int64')
+            else:
+                df[column] = pd.to_numeric(values, errors='coerce').astype('float64')
+        return df
+    
+    @staticmethod
+    def _count_label(conversations: Iterable[Dict]) -> str:
+        return str(len(conversations)) if hasattr(conversations, '__len__') else 'streamed'
+    
+    # Data preparation methods (views of the feature table)
+    def _prepare_conversations_dataframe(self, conversations: List[Dict]) -> pd.DataFrame:
+        """Prepare conversations data for DataFrame."""
+        return self._view(self._build_features(conversations)[0], 'conversations')
+    
+    def _prepare_metrics_dataframe(self, conversations: List[Dict]) -> pd.DataFrame:
+        """Prepare metrics summary for DataFrame."""
+        return self._build_features(conversations)[1].metrics_frame()
     
     def _prepare_time_analysis_dataframe(self, conversations: List[Dict]) -> pd.DataFrame:
         """Prepare time-based analysis for DataFrame."""
-        if not conversations:
-            return pd.DataFrame()
-        
-        time_data = []
-        
-        for conv in conversations:
-            created_at = conv.get('created_at')
-            if created_at:
-                dt = datetime.fromtimestamp(created_at)
-                time_data.append({
-                    'conversation_id': conv.get('id'),
-                    'date': dt.date(),
-                    'hour': dt.hour,
-                    'day_of_week': dt.strftime('%A'),
-                    'week': dt.strftime('%Y-W%U'),
-                    'month': dt.strftime('%Y-%m'),
-                    'quarter': f"{dt.year}-Q{(dt.month-1)//3+1}",
-                    'state': conv.get('state'),
-                    'source_type': conv.get('source', {}).get('type'),
-                })
-        
-        return pd.DataFrame(time_data)
+        return self._view(self._build_features(conversations)[0], 'time_analysis')
     
     def _prepare_topic_analysis_dataframe(self, conversations: List[Dict]) -> pd.DataFrame:
         """Prepare topic analysis for DataFrame."""
-        if not conversations:
-            return pd.DataFrame()
-        
-        topic_data = []
-        
-        for conv in conversations:
-            text = self._extract_conversation_text(conv)
-            topics = self._categorize_conversation(text)
-            
-            topic_data.append({
-                'conversation_id': conv.get('id'),
-                'primary_topic': topics.get('primary', 'other'),
-                'secondary_topics': ', '.join(topics.get('secondary', [])),
-                'is_billing_related': topics.get('billing', False),
-                'is_technical_issue': topics.get('technical', False),
-                'is_product_question': topics.get('product', False),
-                'is_account_related': topics.get('account', False),
-                'text_length': len(text),
-                'word_count': len(text.split()),
-            })
-        
-        return pd.DataFrame(topic_data)
+        return self._view(self._build_features(conversations)[0], 'topic_analysis')
     
     def _prepare_agent_performance_dataframe(self, conversations: List[Dict]) -> pd.DataFrame:
         """Prepare agent performance analysis for DataFrame."""
-        if not conversations:
-            return pd.DataFrame()
-        
-        agent_data = {}
-        
-        for conv in conversations:
-            parts = conv.get('conversation_parts', {}).get('conversation_parts', [])
-            
-            for part in parts:
-                author = part.get('author', {})
-                if author.get('type') == 'admin':
-                    agent_email = author.get('email', 'unknown')
-                    
-                    if agent_email not in agent_data:
-                        agent_data[agent_email] = {
-                            'agent_email': agent_email,
-                            'total_responses': 0,
-                            'conversations_handled': set(),
-                            'response_times': [],
-                            'ratings': []
-                        }
-                    
-                    agent_data[agent_email]['total_responses'] += 1
-                    agent_data[agent_email]['conversations_handled'].add(conv.get('id'))
-                    
-                    # Response time
-                    response_time = part.get('created_at') - conv.get('created_at', 0)
-                    agent_data[agent_email]['response_times'].append(response_time)
-                    
-                    # Rating
-                    rating = conv.get('conversation_rating')
-                    if rating:
-                        agent_data[agent_email]['ratings'].append(rating)
-        
-        # Convert to DataFrame
-        performance_data = []
-        for agent_email, data in agent_data.items():
-            performance_data.append({
-                'agent_email': agent_email,
-                'total_responses': data['total_responses'],
-                'conversations_handled': len(data['conversations_handled']),
-                'average_response_time_hours': np.mean(data['response_times']) / 3600 if data['response_times'] else 0,
-                'median_response_time_hours': np.median(data['response_times']) / 3600 if data['response_times'] else 0,
-                'average_rating': np.mean(data['ratings']) if data['ratings'] else 0,
-                'total_ratings': len(data['ratings'])
-            })
-        
-        return pd.DataFrame(performance_data)
+        return self._build_features(conversations)[1].agent_performance_frame()
     
     def _prepare_satisfaction_dataframe(self, conversations: List[Dict]) -> pd.DataFrame:
         """Prepare customer satisfaction analysis for DataFrame."""
-        if not conversations:
-            return pd.DataFrame()
-        
-        satisfaction_data = []
-        
-        for conv in conversations:
-            rating = conv.get('conversation_rating')
-            if rating:
-                contact = conv.get('contacts', {}).get('contacts', [{}])[0] if conv.get('contacts', {}).get('contacts') else {}
-                
-                satisfaction_data.append({
-                    'conversation_id': conv.get('id'),
-                    'rating': rating,
-                    'rating_category': self._categorize_rating(rating),
-                    'source_type': conv.get('source', {}).get('type'),
-                    'country': contact.get('location', {}).get('country'),
-                    'user_tier': contact.get('custom_attributes', {}).get('tier'),
-                    'created_at': self._format_timestamp(conv.get('created_at')),
-                    'state': conv.get('state'),
-                })
-        
-        return pd.DataFrame(satisfaction_data)
+        return self._view(self._build_features(conversations)[0], 'satisfaction')
+    
+    def _prepare_technical_dataframe(self, conversations: List[Dict]) -> pd.DataFrame:
+        """Prepare technical troubleshooting analysis for DataFrame."""
+        return self._view(self._build_features(conversations, technical=True)[0], 'technical')
     
     def _prepare_executive_summary_dataframe(self, analysis_results: Any) -> pd.DataFrame:
         """Prepare executive summary for DataFrame."""
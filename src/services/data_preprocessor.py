@@ -6,16 +6,22 @@ Handles data validation, normalization, and missing data with confidence levels.
 import logging
 import re
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any, Tuple, Set
+from typing import List, Dict, Optional, Any, Tuple, Set, AsyncIterable
 from pathlib import Path
 import json
 
 from src.config.settings import settings
 from src.models.analysis_models import ConversationSchema
+from src.services.stratified_sampler import StratifiedSampler
 from src.utils.conversation_utils import extract_conversation_text, extract_customer_messages
+from src.utils.language_identifier import get_language_identifier
+from src.utils.run_profiler import profiled
 
 logger = logging.getLogger(__name__)
 
+# Default seed so repeated runs over the same data sample the same conversations
+DEFAULT_SAMPLING_SEED = 42
+
 
 class DataPreprocessor:
     """
@@ -60,8 +66,12 @@ class DataPreprocessor:
             'account': ['account', 'login', 'password', 'sign in', 'authentication']
         }
         
+        # Shared trigram language identifier (profiles are built once per process)
+        self.language_identifier = get_language_identifier()
+        
         self.logger.info("Initialized DataPreprocessor with confidence-based inference")
     
+    @profiled("preprocessing")
     def preprocess_conversations(
         self, 
         conversations: List[Dict[str, Any]], 
@@ -153,7 +163,8 @@ class DataPreprocessor:
                 processed_conversations = self._statistical_sampling(
                     processed_conversations, 
                     options['max_conversations'], 
-                    stats
+                    stats,
+                    seed=options.get('sampling_seed')
                 )
                 self.logger.info(f"Statistical sampling completed: {len(processed_conversations)} conversations")
             
@@ -312,7 +323,12 @@ class DataPreprocessor:
             "confidence_distribution": {"high": 0, "medium": 0, "low": 0, "none": 0}
         }
         
-        for conv in conversations:
+        # Identify languages for the whole batch in one vectorized pass
+        languages = self.language_identifier.identify_batch(
+            [extract_conversation_text(conv, clean_html=True) for conv in conversations]
+        )
+        
+        for conv, (language, language_confidence) in zip(conversations, languages):
             # Infer category from text content
             category, confidence = self._infer_category(conv)
             if category and confidence > self.low_confidence_threshold:
@@ -329,10 +345,9 @@ class DataPreprocessor:
                 inferred_stats["topics_inferred"] += 1
             
             # Infer language from text content
-            language, confidence = self._infer_language(conv)
-            if language and confidence > self.low_confidence_threshold:
+            if language and language_confidence > self.low_confidence_threshold:
                 conv['inferred_language'] = language
-                conv['language_confidence'] = confidence
+                conv['language_confidence'] = language_confidence
                 inferred_stats["languages_inferred"] += 1
         
         stats["inferred_data"] = inferred_stats
@@ -392,33 +407,7 @@ class DataPreprocessor:
         """Infer conversation language from text content."""
         # Use centralized utility from conversation_utils
         text = extract_conversation_text(conv, clean_html=True)
-        
-        # Simple language detection based on common words
-        english_words = ['the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by']
-        spanish_words = ['el', 'la', 'de', 'que', 'y', 'a', 'en', 'un', 'es', 'se', 'no', 'te', 'lo', 'le']
-        french_words = ['le', 'la', 'de', 'et', 'à', 'un', 'il', 'que', 'ne', 'se', 'ce', 'pas', 'tout']
-        
-        text_lower = text.lower()
-        
-        english_count = sum(1 for word in english_words if word in text_lower)
-        spanish_count = sum(1 for word in spanish_words if word in text_lower)
-        french_count = sum(1 for word in french_words if word in text_lower)
-        
-        total_words = len(text.split())
-        if total_words < 5:  # Too short to determine language
-            return None, 0.0
-        
-        if english_count > spanish_count and english_count > french_count:
-            confidence = min(0.9, english_count / total_words * 10)
-            return 'en', confidence
-        elif spanish_count > english_count and spanish_count > french_count:
-            confidence = min(0.9, spanish_count / total_words * 10)
-            return 'es', confidence
-        elif french_count > english_count and french_count > spanish_count:
-            confidence = min(0.9, french_count / total_words * 10)
-            return 'fr', confidence
-        
-        return None, 0.0
+        return self.language_identifier.identify(text)
     
     # NOTE: _extract_conversation_text() removed - now using centralized extract_conversation_text() from conversation_utils
     
@@ -577,45 +566,54 @@ class DataPreprocessor:
         self, 
         conversations: List[Dict[str, Any]], 
         max_count: int, 
-        stats: Dict[str, Any]
+        stats: Dict[str, Any],
+        seed: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Perform statistical sampling to reduce dataset size."""
+        """
+        Perform stratified sampling to reduce dataset size.
+        
+        Strata are (category, tier, day); the sample is drawn in one pass and is
+        reproducible for a given seed.
+        """
         if len(conversations) <= max_count:
             return conversations
         
-        # Stratified sampling by category if available
-        categories = {}
-        for conv in conversations:
-            category = conv.get('inferred_category', 'unknown')
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(conv)
-        
-        sampled = []
-        samples_per_category = max_count // len(categories)
-        
-        for category, convs in categories.items():
-            if len(convs) <= samples_per_category:
-                sampled.extend(convs)
-            else:
-                # Random sampling within category
-                import random
-                sampled.extend(random.sample(convs, samples_per_category))
-        
-        # Fill remaining slots randomly
-        remaining = max_count - len(sampled)
-        if remaining > 0:
-            remaining_convs = [conv for conv in conversations if conv not in sampled]
-            if remaining_convs:
-                import random
-                sampled.extend(random.sample(remaining_convs, min(remaining, len(remaining_convs))))
+        sampler = StratifiedSampler(max_count, seed=self._sampling_seed(seed))
+        sampler.extend(conversations)
+        sampled = sampler.result()
         
         stats["sampling_applied"] = True
         stats["original_count"] = len(conversations)
         stats["sampled_count"] = len(sampled)
+        stats["sampling"] = sampler.get_stats()
         
         return sampled
     
+    async def sample_conversation_stream(
+        self,
+        chunks: AsyncIterable[List[Dict[str, Any]]],
+        max_count: int,
+        seed: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Stratified sample of a chunk stream (e.g. ChunkedFetcher.fetch_conversations_streaming).
+        
+        Produces the same sample as _statistical_sampling on the concatenated
+        chunks, while holding at most max_count conversations per stratum.
+        
+        Returns:
+            Tuple of (sampled_conversations, sampling_stats)
+        """
+        sampler = StratifiedSampler(max_count, seed=self._sampling_seed(seed))
+        await sampler.consume(chunks)
+        sampled = sampler.result()
+        
+        self.logger.info(f"Stream sampling completed: {len(sampled)} of {sampler.seen} conversations")
+        return sampled, sampler.get_stats()
+    
+    def _sampling_seed(self, seed: Optional[int]) -> int:
+        return seed if seed is not None else self.config.get('sampling_seed', DEFAULT_SAMPLING_SEED)
+    
     def get_preprocessing_report(self, stats: Dict[str, Any]) -> str:
         """Generate a human-readable preprocessing report."""
         report = []
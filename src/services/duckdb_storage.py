@@ -21,10 +21,23 @@ VALID_ANALYSIS_TYPES = {'weekly', 'monthly', 'quarterly', 'custom'}
 class DuckDBStorage:
     """DuckDB-based storage for analytical queries."""
     
+    # Bumped on every ingest so caches of query results can detect stale data
+    _ingest_generation = 0
+    
+    @classmethod
+    def ingest_generation(cls) -> int:
+        """Return the process-wide ingest counter."""
+        return cls._ingest_generation
+    
+    @classmethod
+    def _mark_ingested(cls):
+        cls._ingest_generation += 1
+    
     def __init__(self, db_path: str = "conversations.duckdb"):
         self.db_path = Path(db_path)
         self.conn = None
         self._schema_initialized = False
+        self._transaction_depth = 0
         self._initialize_database()
     
     def _initialize_database(self):
@@ -55,8 +68,18 @@ class DuckDBStorage:
                 storage.store_conversations(...)
                 storage.store_analysis_snapshot(...)
         
-        Automatically commits on success, rolls back on error.
+        Automatically commits on success, rolls back on error. Nested calls
+        join the outermost transaction, which commits or rolls back everything.
         """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield self.conn
+            finally:
+                self._transaction_depth -= 1
+            return
+        
+        self._transaction_depth = 1
         try:
             self.conn.begin()
             yield self.conn
@@ -66,6 +89,8 @@ class DuckDBStorage:
             self.conn.rollback()
             logger.error(f"Transaction rolled back due to error: {e}")
             raise
+        finally:
+            self._transaction_depth = 0
     
     @contextmanager
     def get_connection(self):
@@ -240,6 +265,15 @@ class DuckDBStorage:
             engagement_trends JSON
         );
         
+        -- Canny topic classification cache (post id + title/details hash)
+        CREATE TABLE IF NOT EXISTS canny_topic_classifications (
+            post_id VARCHAR PRIMARY KEY,
+            content_hash VARCHAR,
+            detected_topic VARCHAR,
+            topic_confidence FLOAT,
+            classified_at TIMESTAMP
+        );
+        
         -- Admin profiles cache for agent performance tracking
         CREATE TABLE IF NOT EXISTS admin_profiles (
             admin_id VARCHAR PRIMARY KEY,
@@ -370,6 +404,8 @@ class DuckDBStorage:
         CREATE INDEX IF NOT EXISTS idx_snapshots_type ON analysis_snapshots(analysis_type);
         CREATE INDEX IF NOT EXISTS idx_snapshots_reviewed ON analysis_snapshots(reviewed);
         CREATE INDEX IF NOT EXISTS idx_timeseries_metric ON metrics_timeseries(metric_name);
+        CREATE INDEX IF NOT EXISTS idx_timeseries_category ON metrics_timeseries(category);
+        CREATE INDEX IF NOT EXISTS idx_snapshots_type_period ON analysis_snapshots(analysis_type, period_start);
         CREATE INDEX IF NOT EXISTS idx_timeseries_snapshot ON metrics_timeseries(snapshot_id);
         CREATE UNIQUE INDEX IF NOT EXISTS uniq_timeseries_snapshot_metric ON metrics_timeseries(snapshot_id, metric_name);
         CREATE INDEX IF NOT EXISTS idx_comparative_current ON comparative_analyses(current_snapshot_id);
@@ -436,6 +472,7 @@ class DuckDBStorage:
                 'canny_comments',
                 'canny_votes',
                 'canny_weekly_snapshots',
+                'canny_topic_classifications',
                 'admin_profiles',
                 'agent_performance_history',
                 'vendor_performance_history',
@@ -491,6 +528,7 @@ class DuckDBStorage:
             batch = conversations[i:i + batch_size]
             self._store_batch(batch)
         
+        self._mark_ingested()
         logger.info("All conversations stored successfully")
     
     def _store_batch(self, conversations: List[Dict]):
@@ -1009,6 +1047,7 @@ class DuckDBStorage:
             batch = posts[i:i + batch_size]
             self._store_canny_batch(batch)
         
+        self._mark_ingested()
         logger.info("All Canny posts stored successfully")
     
     def _store_canny_batch(self, posts: List[Dict]):
@@ -1142,6 +1181,65 @@ class DuckDBStorage:
             json.dumps(snapshot_data['engagement_trends'])
         ])
     
+    def get_canny_topic_classifications(self, post_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get cached Canny topic classifications for the given post ids.
+        
+        Args:
+            post_ids: Canny post ids to look up
+            
+        Returns:
+            Dict mapping post_id to {'content_hash', 'detected_topic', 'topic_confidence'}
+        """
+        if not post_ids:
+            return {}
+        
+        placeholders = ', '.join(['?'] * len(post_ids))
+        rows = self.conn.execute(
+            f"""
+            SELECT post_id, content_hash, detected_topic, topic_confidence
+            FROM canny_topic_classifications
+            WHERE post_id IN ({placeholders})
+            """,
+            list(post_ids)
+        ).fetchall()
+        
+        return {
+            row[0]: {
+                'content_hash': row[1],
+                'detected_topic': row[2],
+                'topic_confidence': row[3]
+            }
+            for row in rows
+        }
+    
+    def store_canny_topic_classifications(self, classifications: List[Dict]):
+        """
+        Store Canny topic classifications (batch upsert).
+        
+        Args:
+            classifications: List of dicts with post_id, content_hash,
+                detected_topic and topic_confidence
+        """
+        if not classifications:
+            return
+        
+        now = datetime.now()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO canny_topic_classifications VALUES (?, ?, ?, ?, ?)",
+            [
+                [
+                    c['post_id'],
+                    c['content_hash'],
+                    c['detected_topic'],
+                    c.get('topic_confidence'),
+                    now
+                ]
+                for c in classifications
+            ]
+        )
+        logger.info(f"Stored {len(classifications)} Canny topic classifications")
+    
     def get_canny_posts_by_date_range(self, start_date: date, end_date: date) -> pd.DataFrame:
         """Get Canny posts in date range."""
         sql = """
@@ -1360,38 +1458,55 @@ class DuckDBStorage:
             serialized_data.setdefault('reviewed_at', None)
             serialized_data.setdefault('notes', None)
             
-            # Insert into database
+            # Upsert rather than INSERT OR REPLACE: comparative_analyses and
+            # metrics_timeseries reference the row, so it must not be deleted.
+            # DuckDB rewrites indexed columns as delete + insert, so a re-save
+            # only refreshes the payload; type and period are fixed by the id
+            # and review state is owned by mark_snapshot_reviewed.
             sql = """
-            INSERT OR REPLACE INTO analysis_snapshots
+            INSERT INTO analysis_snapshots
             (snapshot_id, analysis_type, period_start, period_end, created_at,
              total_conversations, date_range_label, insights_summary,
              topic_volumes, topic_sentiments, tier_distribution,
              agent_attribution, resolution_metrics, fin_performance, key_patterns,
              reviewed, reviewed_by, reviewed_at, notes)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (snapshot_id) DO UPDATE SET
+                created_at = EXCLUDED.created_at,
+                total_conversations = EXCLUDED.total_conversations,
+                date_range_label = EXCLUDED.date_range_label,
+                insights_summary = EXCLUDED.insights_summary,
+                topic_volumes = EXCLUDED.topic_volumes,
+                topic_sentiments = EXCLUDED.topic_sentiments,
+                tier_distribution = EXCLUDED.tier_distribution,
+                agent_attribution = EXCLUDED.agent_attribution,
+                resolution_metrics = EXCLUDED.resolution_metrics,
+                fin_performance = EXCLUDED.fin_performance,
+                key_patterns = EXCLUDED.key_patterns
             """
             
-            self.conn.execute(sql, [
-                serialized_data['snapshot_id'],
-                serialized_data['analysis_type'],
-                serialized_data['period_start'],
-                serialized_data['period_end'],
-                serialized_data['created_at'],
-                serialized_data['total_conversations'],
-                serialized_data['date_range_label'],
-                serialized_data['insights_summary'],
-                serialized_data['topic_volumes'],
-                serialized_data['topic_sentiments'],
-                serialized_data['tier_distribution'],
-                serialized_data['agent_attribution'],
-                serialized_data['resolution_metrics'],
-                serialized_data['fin_performance'],
-                serialized_data['key_patterns'],
-                serialized_data['reviewed'],
-                serialized_data['reviewed_by'],
-                serialized_data['reviewed_at'],
-                serialized_data['notes']
-            ])
+            with self.transaction():
+                self.conn.execute(sql, [
+                    serialized_data['snapshot_id'],
+                    serialized_data['analysis_type'],
+                    serialized_data['period_start'],
+                    serialized_data['period_end'],
+                    serialized_data['created_at'],
+                    serialized_data['total_conversations'],
+                    serialized_data['date_range_label'],
+                    serialized_data['insights_summary'],
+                    serialized_data['topic_volumes'],
+                    serialized_data['topic_sentiments'],
+                    serialized_data['tier_distribution'],
+                    serialized_data['agent_attribution'],
+                    serialized_data['resolution_metrics'],
+                    serialized_data['fin_performance'],
+                    serialized_data['key_patterns'],
+                    serialized_data['reviewed'],
+                    serialized_data['reviewed_by'],
+                    serialized_data['reviewed_at'],
+                    serialized_data['notes']
+                ])
             
             logger.info(f"Successfully stored analysis snapshot: {snapshot_data['snapshot_id']}")
             return True
@@ -1505,6 +1620,126 @@ class DuckDBStorage:
             logger.error(f"Failed to retrieve snapshots by type: {e}")
             return []
     
+    def get_recent_snapshots(self, limit: int = 10, analysis_types: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Get the most recent analysis snapshots across several types in one query.
+        
+        Args:
+            limit: Maximum number of snapshots to return
+            analysis_types: Types to include (default: weekly, monthly, quarterly)
+            
+        Returns:
+            List of snapshot dicts, most recent period first
+        """
+        try:
+            analysis_types = analysis_types or ['weekly', 'monthly', 'quarterly']
+            placeholders = ', '.join(['?'] * len(analysis_types))
+            sql = f"""
+            SELECT * FROM analysis_snapshots
+            WHERE analysis_type IN ({placeholders})
+            ORDER BY period_start DESC
+            LIMIT ?
+            """
+            
+            results = self.conn.execute(sql, [*analysis_types, limit]).fetchall()
+            
+            columns = [
+                'snapshot_id', 'analysis_type', 'period_start', 'period_end', 'created_at',
+                'total_conversations', 'date_range_label', 'insights_summary',
+                'topic_volumes', 'topic_sentiments', 'tier_distribution',
+                'agent_attribution', 'resolution_metrics', 'fin_performance', 'key_patterns',
+                'reviewed', 'reviewed_by', 'reviewed_at', 'notes'
+            ]
+            json_fields = [
+                'topic_volumes', 'topic_sentiments', 'tier_distribution',
+                'agent_attribution', 'resolution_metrics', 'fin_performance', 'key_patterns'
+            ]
+            
+            snapshots = []
+            for result in results:
+                snapshot = dict(zip(columns, result))
+                
+                # Deserialize JSON fields
+                for field in json_fields:
+                    if snapshot[field]:
+                        try:
+                            snapshot[field] = json.loads(snapshot[field])
+                        except Exception:
+                            snapshot[field] = None
+                
+                snapshots.append(snapshot)
+            
+            return snapshots
+            
+        except Exception as e:
+            logger.error(f"Failed to retrieve recent snapshots: {e}")
+            return []
+    
+    def get_snapshot_metadata(self, analysis_type: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """
+        Get snapshot metadata only (no JSON payload columns).
+        
+        Args:
+            analysis_type: Optional type filter
+            limit: Maximum number of rows to return
+            
+        Returns:
+            List of dicts with snapshot_id, analysis_type, period_start, period_end,
+            created_at, total_conversations, date_range_label and reviewed,
+            most recent period first
+        """
+        try:
+            where = "WHERE analysis_type = ?" if analysis_type else ""
+            params = [analysis_type, limit] if analysis_type else [limit]
+            sql = f"""
+            SELECT snapshot_id, analysis_type, period_start, period_end, created_at,
+                   total_conversations, date_range_label, reviewed
+            FROM analysis_snapshots
+            {where}
+            ORDER BY period_start DESC
+            LIMIT ?
+            """
+            
+            columns = [
+                'snapshot_id', 'analysis_type', 'period_start', 'period_end', 'created_at',
+                'total_conversations', 'date_range_label', 'reviewed'
+            ]
+            return [dict(zip(columns, row)) for row in self.conn.execute(sql, params).fetchall()]
+            
+        except Exception as e:
+            logger.error(f"Failed to retrieve snapshot metadata: {e}")
+            return []
+    
+    def get_snapshot_stats(self, analysis_type: str) -> Dict[str, Any]:
+        """
+        Get count and period bounds for a snapshot type with a single aggregate query.
+        
+        Args:
+            analysis_type: Type of analysis ('weekly', 'monthly', 'quarterly')
+            
+        Returns:
+            Dict with count, earliest_period_start and latest_period_start
+        """
+        try:
+            row = self.conn.execute(
+                """
+                SELECT COUNT(*), MIN(period_start), MAX(period_start)
+                FROM analysis_snapshots
+                WHERE analysis_type = ?
+                """,
+                [analysis_type]
+            ).fetchone()
+            
+            return {
+                'count': row[0] if row else 0,
+                'earliest_period_start': row[1] if row else None,
+                'latest_period_start': row[2] if row else None
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to retrieve snapshot stats: {e}")
+            return {'count': 0, 'earliest_period_start': None, 'latest_period_start': None}
+    
     def get_snapshots_by_date_range(self, start_date: date, end_date: date) -> List[Dict]:
         """
         Get analysis snapshots within a date range.
@@ -1611,14 +1846,18 @@ class DuckDBStorage:
                     logger.error(f"Missing required field: {field}")
                     return False
             
-            # Verify referenced snapshots exist
-            current_snapshot = self.get_analysis_snapshot(comparison_data['current_snapshot_id'])
-            prior_snapshot = self.get_analysis_snapshot(comparison_data['prior_snapshot_id'])
+            # Verify referenced snapshots exist (key lookup, no payload deserialization)
+            existing = {
+                row[0] for row in self.conn.execute(
+                    "SELECT snapshot_id FROM analysis_snapshots WHERE snapshot_id IN (?, ?)",
+                    [comparison_data['current_snapshot_id'], comparison_data['prior_snapshot_id']]
+                ).fetchall()
+            }
             
-            if not current_snapshot:
+            if comparison_data['current_snapshot_id'] not in existing:
                 logger.error(f"Current snapshot not found: {comparison_data['current_snapshot_id']}")
                 return False
-            if not prior_snapshot:
+            if comparison_data['prior_snapshot_id'] not in existing:
                 logger.error(f"Prior snapshot not found: {comparison_data['prior_snapshot_id']}")
                 return False
             
@@ -1668,6 +1907,64 @@ class DuckDBStorage:
             logger.error(f"Failed to store comparative analysis: {e}")
             return False
     
+    def get_comparative_analysis(self, comparison_id: str) -> Optional[Dict]:
+        """
+        Retrieve a stored comparative analysis by ID (primary key lookup).
+        
+        Period labels and totals of both snapshots are joined in, so callers
+        can render a comparison without loading either snapshot payload.
+        
+        Args:
+            comparison_id: Comparison identifier (comp_<current>_<prior>)
+            
+        Returns:
+            Dict with comparison data, or None if not found
+        """
+        try:
+            sql = """
+            SELECT c.comparison_id, c.comparison_type, c.current_snapshot_id, c.prior_snapshot_id,
+                   c.created_at, c.volume_changes, c.sentiment_changes, c.resolution_changes,
+                   c.significant_changes, c.emerging_patterns, c.declining_patterns,
+                   cur.date_range_label, prior.date_range_label,
+                   cur.total_conversations, prior.total_conversations
+            FROM comparative_analyses c
+            LEFT JOIN analysis_snapshots cur ON cur.snapshot_id = c.current_snapshot_id
+            LEFT JOIN analysis_snapshots prior ON prior.snapshot_id = c.prior_snapshot_id
+            WHERE c.comparison_id = ?
+            """
+            result = self.conn.execute(sql, [comparison_id]).fetchone()
+            
+            if not result:
+                return None
+            
+            columns = [
+                'comparison_id', 'comparison_type', 'current_snapshot_id', 'prior_snapshot_id',
+                'created_at', 'volume_changes', 'sentiment_changes', 'resolution_changes',
+                'significant_changes', 'emerging_patterns', 'declining_patterns',
+                'current_period_label', 'prior_period_label',
+                'current_total_conversations', 'prior_total_conversations'
+            ]
+            comparison = dict(zip(columns, result))
+            
+            # Deserialize JSON fields
+            json_fields = [
+                'volume_changes', 'sentiment_changes', 'resolution_changes',
+                'significant_changes', 'emerging_patterns', 'declining_patterns'
+            ]
+            for field in json_fields:
+                if comparison[field]:
+                    try:
+                        comparison[field] = json.loads(comparison[field])
+                    except Exception as e:
+                        logger.warning(f"Failed to deserialize {field}: {e}")
+                        comparison[field] = None
+            
+            return comparison
+            
+        except Exception as e:
+            logger.error(f"Failed to retrieve comparative analysis: {e}")
+            return None
+    
     def store_metrics_timeseries(self, metrics: List[Dict]) -> bool:
         """
         Store metrics timeseries data (batch insert).
@@ -1689,25 +1986,41 @@ class DuckDBStorage:
                 logger.warning("No metrics to store")
                 return True
             
-            # Verify all referenced snapshots exist
-            snapshot_ids = set(metric.get('snapshot_id') for metric in metrics)
-            for snapshot_id in snapshot_ids:
-                if not self.get_analysis_snapshot(snapshot_id):
-                    logger.error(f"Snapshot not found: {snapshot_id}")
-                    return False
-            
-            # Use pandas DataFrame for efficient batch insert
-            df = pd.DataFrame(metrics)
-            
             # Ensure required columns exist
             required_columns = ['metric_id', 'snapshot_id', 'metric_name', 'metric_value', 'metric_unit', 'category']
-            for col in required_columns:
-                if col not in df.columns:
-                    logger.error(f"Missing required column: {col}")
+            for metric in metrics:
+                for col in required_columns:
+                    if col not in metric:
+                        logger.error(f"Missing required column: {col}")
+                        return False
+            
+            # Verify all referenced snapshots exist (id lookup only, no JSON payloads)
+            snapshot_ids = list(set(metric['snapshot_id'] for metric in metrics))
+            placeholders = ', '.join(['?'] * len(snapshot_ids))
+            existing = {
+                row[0] for row in self.conn.execute(
+                    f"SELECT snapshot_id FROM analysis_snapshots WHERE snapshot_id IN ({placeholders})",
+                    snapshot_ids
+                ).fetchall()
+            }
+            for snapshot_id in snapshot_ids:
+                if snapshot_id not in existing:
+                    logger.error(f"Snapshot not found: {snapshot_id}")
                     return False
             
             # Insert batch
-            self.conn.execute("INSERT OR REPLACE INTO metrics_timeseries SELECT * FROM df", {"df": df})
+            self.conn.executemany(
+                """
+                INSERT INTO metrics_timeseries
+                (metric_id, snapshot_id, metric_name, metric_value, metric_unit, category)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (metric_id) DO UPDATE SET
+                    metric_value = EXCLUDED.metric_value,
+                    metric_unit = EXCLUDED.metric_unit,
+                    category = EXCLUDED.category
+                """,
+                [[metric[col] for col in required_columns] for metric in metrics]
+            )
             
             logger.info(f"Successfully stored {len(metrics)} metric records")
             return True
@@ -1716,6 +2029,134 @@ class DuckDBStorage:
             logger.error(f"Failed to store metrics timeseries: {e}")
             return False
     
+    def replace_snapshot_metrics(self, snapshot_id: str, metrics: List[Dict]) -> bool:
+        """
+        Replace all metrics_timeseries rows of a snapshot (rollup rebuild on save).
+        
+        Args:
+            snapshot_id: Snapshot whose rollup is being rebuilt
+            metrics: Metric dicts as accepted by store_metrics_timeseries
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self.transaction():
+                self.conn.execute("DELETE FROM metrics_timeseries WHERE snapshot_id = ?", [snapshot_id])
+                if not metrics:
+                    return True
+                if not self.store_metrics_timeseries(metrics):
+                    raise ValueError(f"Failed to store metrics for snapshot {snapshot_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to replace snapshot metrics: {e}")
+            return False
+    
+    def get_metric_series(
+        self,
+        metric_names: List[str],
+        analysis_type: str = 'weekly',
+        periods: int = 12
+    ) -> List[Dict]:
+        """
+        Get the last N periods of one or more metrics in a single indexed query.
+        
+        Args:
+            metric_names: Metric names to fetch (e.g. ['total_conversations'])
+            analysis_type: Snapshot type to read
+            periods: Number of most recent snapshots to include
+            
+        Returns:
+            List of dicts with snapshot_id, period_start, metric_name and metric_value,
+            oldest period first
+        """
+        if not metric_names:
+            return []
+        
+        try:
+            placeholders = ', '.join(['?'] * len(metric_names))
+            sql = f"""
+            WITH recent AS (
+                SELECT snapshot_id, period_start
+                FROM analysis_snapshots
+                WHERE analysis_type = ?
+                ORDER BY period_start DESC
+                LIMIT ?
+            )
+            SELECT r.snapshot_id, r.period_start, m.metric_name, m.metric_value
+            FROM recent r
+            JOIN metrics_timeseries m ON m.snapshot_id = r.snapshot_id
+            WHERE m.metric_name IN ({placeholders})
+            ORDER BY r.period_start ASC, m.metric_name
+            """
+            
+            rows = self.conn.execute(sql, [analysis_type, periods, *metric_names]).fetchall()
+            columns = ['snapshot_id', 'period_start', 'metric_name', 'metric_value']
+            return [dict(zip(columns, row)) for row in rows]
+            
+        except Exception as e:
+            logger.error(f"Failed to retrieve metric series: {e}")
+            return []
+    
+    def get_metric_series_by_category(
+        self,
+        category: str,
+        analysis_type: str = 'weekly',
+        periods: int = 12
+    ) -> List[Dict]:
+        """
+        Get the last N periods of every metric in a category (e.g. all topic volumes).
+        
+        Args:
+            category: Metric category (e.g. 'topic_volume')
+            analysis_type: Snapshot type to read
+            periods: Number of most recent snapshots to include
+            
+        Returns:
+            List of dicts with snapshot_id, period_start, metric_name and metric_value,
+            oldest period first
+        """
+        try:
+            sql = """
+            WITH recent AS (
+                SELECT snapshot_id, period_start
+                FROM analysis_snapshots
+                WHERE analysis_type = ?
+                ORDER BY period_start DESC
+                LIMIT ?
+            )
+            SELECT r.snapshot_id, r.period_start, m.metric_name, m.metric_value
+            FROM recent r
+            JOIN metrics_timeseries m ON m.snapshot_id = r.snapshot_id
+            WHERE m.category = ?
+            ORDER BY r.period_start ASC, m.metric_name
+            """
+            
+            rows = self.conn.execute(sql, [analysis_type, periods, category]).fetchall()
+            columns = ['snapshot_id', 'period_start', 'metric_name', 'metric_value']
+            return [dict(zip(columns, row)) for row in rows]
+            
+        except Exception as e:
+            logger.error(f"Failed to retrieve metric series for category {category}: {e}")
+            return []
+    
+    def get_snapshot_ids_without_metrics(self) -> List[str]:
+        """Get ids of snapshots that have no metrics_timeseries rollup yet."""
+        try:
+            rows = self.conn.execute(
+                """
+                SELECT s.snapshot_id
+                FROM analysis_snapshots s
+                LEFT JOIN metrics_timeseries m ON m.snapshot_id = s.snapshot_id
+                WHERE m.snapshot_id IS NULL
+                ORDER BY s.period_start
+                """
+            ).fetchall()
+            return [row[0] for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to find snapshots without metrics: {e}")
+            return []
+    
     def close(self):
         """Close database connection."""
         if self.conn:
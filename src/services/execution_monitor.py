@@ -11,9 +11,10 @@ import sqlite3
 import json
 import asyncio
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass, field, asdict
 import uuid
@@ -111,6 +112,9 @@ class ExecutionRun:
     total_cost: float = 0.0
     total_tokens: Dict[str, int] = field(default_factory=lambda: {"input": 0, "output": 0})
     
+    # Run-level totals from --profile (per-stage rows live in stage_profiles)
+    profile: Dict[str, Any] = field(default_factory=dict)
+    
     def to_dict(self):
         return {
             "id": self.id,
@@ -132,7 +136,8 @@ class ExecutionRun:
             "errors": self.errors,
             "warnings": self.warnings,
             "total_cost": self.total_cost,
-            "total_tokens": self.total_tokens
+            "total_tokens": self.total_tokens,
+            "profile": self.profile
         }
 
 
@@ -142,9 +147,13 @@ class ExecutionStore:
     
     Survives Railway redeploys by using persistent volume mount.
     Compatible with Railway's /mnt/persistent/ pattern.
+    
+    Keeps a single WAL-mode connection for the lifetime of the store. Status
+    updates are queued with queue_run() and coalesced into one batched write
+    per flush interval, executed off the event loop.
     """
     
-    def __init__(self, db_path: str = "/app/outputs/executions.db"):
+    def __init__(self, db_path: str = "/app/outputs/executions.db", flush_interval: float = 0.5):
         """
         Initialize execution store.
         
@@ -152,20 +161,39 @@ class ExecutionStore:
             db_path: Path to SQLite database
                     Default: /app/outputs/executions.db (ephemeral but same as other outputs)
                     For persistence: Set EXECUTION_DB_PATH=/mnt/persistent/executions.db
+            flush_interval: Seconds to coalesce queued run updates before writing
         """
         import os
         db_path = os.getenv('EXECUTION_DB_PATH', db_path)
         
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
         self.logger = logging.getLogger(__name__)
         
+        # One connection shared by the event loop and writer threads
+        self._conn_lock = threading.Lock()
+        self._conn = self._connect()
+        
+        # Runs awaiting the next batched write, keyed by run ID (latest state wins)
+        self._pending: Dict[str, ExecutionRun] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        
         self._init_db()
         self.logger.info(f"ExecutionStore initialized: {self.db_path}")
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection in WAL mode so readers never block the writer"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
     def _init_db(self):
         """Initialize database schema"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn_lock, self._conn as conn:
             # Execution runs table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS execution_runs (
@@ -210,53 +238,129 @@ class ExecutionStore:
                 )
             """)
             
+            # Per-stage performance profiles (written once per --profile run)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS stage_profiles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT,
+                    path TEXT,
+                    name TEXT,
+                    kind TEXT,
+                    parent TEXT,
+                    calls INTEGER,
+                    errors INTEGER,
+                    wall_seconds REAL,
+                    cpu_seconds REAL,
+                    process_peak_rss_mb REAL,
+                    llm_calls INTEGER,
+                    input_tokens INTEGER,
+                    output_tokens INTEGER,
+                    cached_tokens INTEGER,
+                    cache_hits INTEGER,
+                    llm_wait_seconds REAL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (run_id) REFERENCES execution_runs(id)
+                )
+            """)
+            
             # Create indexes for fast queries
             conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_status ON execution_runs(status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_started ON execution_runs(started_at DESC)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_agents_run ON agent_executions(run_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_profiles_run ON stage_profiles(run_id)")
             
             self.logger.info("Database schema initialized")
     
     def save_run(self, run: ExecutionRun):
-        """Save or update execution run"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO execution_runs 
-                (id, name, command, args, status, started_at, completed_at, 
-                 date_range, conversations_count, current_phase, progress_percentage,
-                 gamma_url, summary_stats, total_cost, total_tokens, data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                run.id,
-                run.name,
-                run.command,
-                json.dumps(run.args),
-                run.status.value,
-                run.started_at.isoformat(),
-                run.completed_at.isoformat() if run.completed_at else None,
-                json.dumps(run.date_range),
-                run.conversations_count,
-                run.current_phase,
-                run.progress_percentage,
-                run.gamma_url,
-                json.dumps(run.summary_stats),
-                run.total_cost,
-                json.dumps(run.total_tokens),
-                json.dumps(run.to_dict())
-            ))
+        """Save or update execution run immediately"""
+        self._pending.pop(run.id, None)
+        self._write_runs([self._serialize_run(run)])
+    
+    def queue_run(self, run: ExecutionRun):
+        """
+        Queue a run for the next batched write.
+        
+        Repeated updates to the same run within one flush interval collapse
+        into a single write. Outside an event loop the run is written immediately.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save_run(run)
+            return
+        
+        self._pending[run.id] = run
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._delayed_flush())
+    
+    async def _delayed_flush(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+    
+    async def flush(self):
+        """Write all queued runs in one transaction on a worker thread"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        
+        # Serialize flushes so an older snapshot never lands after a newer one
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            runs = list(self._pending.values())
+            self._pending.clear()
             
-            # Save agent executions
-            for agent in run.agents:
-                self._save_agent(conn, run.id, agent)
-    
-    def _save_agent(self, conn, run_id: str, agent: AgentExecution):
-        """Save or update agent execution"""
-        conn.execute("""
-            INSERT OR REPLACE INTO agent_executions
-            (run_id, agent_name, status, started_at, completed_at, duration_seconds,
-             input_summary, output_summary, token_usage, cost, confidence, error_message)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+            # Snapshot on the loop thread, where runs are mutated
+            rows = [self._serialize_run(run) for run in runs]
+            try:
+                await asyncio.to_thread(self._write_runs, rows)
+            except Exception as e:
+                self.logger.error(f"Failed to flush {len(rows)} execution runs: {e}")
+                for run in runs:
+                    self._pending.setdefault(run.id, run)
+    
+    def close(self):
+        """Write any queued runs and close the connection"""
+        if self._pending:
+            runs = list(self._pending.values())
+            self._pending.clear()
+            self._write_runs([self._serialize_run(run) for run in runs])
+        with self._conn_lock:
+            self._conn.close()
+    
+    async def aclose(self):
+        """Flush queued runs and close the connection from the event loop"""
+        # Write now rather than waiting on a delayed flush that shutdown would cancel
+        await self.flush()
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await asyncio.to_thread(self.close)
+    
+    def _serialize_run(self, run: ExecutionRun) -> Tuple[tuple, List[tuple]]:
+        """Build the run row and agent rows for a write"""
+        run_row = (
+            run.id,
+            run.name,
+            run.command,
+            json.dumps(run.args),
+            run.status.value,
+            run.started_at.isoformat(),
+            run.completed_at.isoformat() if run.completed_at else None,
+            json.dumps(run.date_range),
+            run.conversations_count,
+            run.current_phase,
+            run.progress_percentage,
+            run.gamma_url,
+            json.dumps(run.summary_stats),
+            run.total_cost,
+            json.dumps(run.total_tokens),
+            json.dumps(run.to_dict())
+        )
+        agent_rows = [self._serialize_agent(run.id, agent) for agent in run.agents]
+        return run_row, agent_rows
+    
+    @staticmethod
+    def _serialize_agent(run_id: str, agent: AgentExecution) -> tuple:
+        return (
             run_id,
             agent.name,
             agent.status.value,
@@ -269,72 +373,117 @@ class ExecutionStore:
             agent.cost,
             agent.confidence,
             agent.error_message
-        ))
+        )
+    
+    def _write_runs(self, rows: List[Tuple[tuple, List[tuple]]]):
+        """Upsert runs and replace their agent rows in a single transaction"""
+        with self._conn_lock, self._conn as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO execution_runs 
+                (id, name, command, args, status, started_at, completed_at, 
+                 date_range, conversations_count, current_phase, progress_percentage,
+                 gamma_url, summary_stats, total_cost, total_tokens, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [run_row for run_row, _ in rows])
+            
+            # Agent rows have a surrogate key, so replace them per run rather
+            # than appending a fresh copy on every save
+            conn.executemany(
+                "DELETE FROM agent_executions WHERE run_id = ?",
+                [(run_row[0],) for run_row, _ in rows]
+            )
+            conn.executemany("""
+                INSERT INTO agent_executions
+                (run_id, agent_name, status, started_at, completed_at, duration_seconds,
+                 input_summary, output_summary, token_usage, cost, confidence, error_message)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [agent_row for _, agent_rows in rows for agent_row in agent_rows])
+    
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict]:
+        with self._conn_lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
     
     def get_run(self, run_id: str) -> Optional[Dict]:
         """Get execution run by ID"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute("""
-                SELECT * FROM execution_runs WHERE id = ?
-            """, (run_id,)).fetchone()
-            
-            if row:
-                run_dict = dict(row)
-                # Load agents
-                agents = self.get_run_agents(run_id)
-                run_dict['agents'] = agents
-                return run_dict
-            return None
+        rows = self._query("""
+            SELECT * FROM execution_runs WHERE id = ?
+        """, (run_id,))
+        
+        if rows:
+            run_dict = rows[0]
+            # Load agents
+            agents = self.get_run_agents(run_id)
+            run_dict['agents'] = agents
+            return run_dict
+        return None
     
     def get_run_agents(self, run_id: str) -> List[Dict]:
         """Get all agent executions for a run"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("""
-                SELECT * FROM agent_executions 
-                WHERE run_id = ?
-                ORDER BY id ASC
-            """, (run_id,)).fetchall()
-            return [dict(row) for row in rows]
+        return self._query("""
+            SELECT * FROM agent_executions 
+            WHERE run_id = ?
+            ORDER BY id ASC
+        """, (run_id,))
+    
+    def save_profile(self, run_id: str, stages: List[Dict[str, Any]]):
+        """Replace the per-stage profile rows of a run"""
+        rows = [
+            (
+                run_id, stage['path'], stage['name'], stage['kind'], stage['parent'],
+                stage['calls'], stage['errors'], stage['wall_seconds'], stage['cpu_seconds'],
+                stage['process_peak_rss_mb'], stage['llm_calls'], stage['input_tokens'],
+                stage['output_tokens'], stage['cached_tokens'], stage['cache_hits'],
+                stage['llm_wait_seconds']
+            )
+            for stage in stages
+        ]
+        with self._conn_lock, self._conn as conn:
+            conn.execute("DELETE FROM stage_profiles WHERE run_id = ?", (run_id,))
+            conn.executemany("""
+                INSERT INTO stage_profiles
+                (run_id, path, name, kind, parent, calls, errors, wall_seconds, cpu_seconds,
+                 process_peak_rss_mb, llm_calls, input_tokens, output_tokens, cached_tokens,
+                 cache_hits, llm_wait_seconds)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+    
+    def get_run_profile(self, run_id: str) -> List[Dict]:
+        """Get the per-stage profile of a run, in stage entry order"""
+        return self._query("""
+            SELECT * FROM stage_profiles
+            WHERE run_id = ?
+            ORDER BY id ASC
+        """, (run_id,))
     
     def get_recent_runs(self, limit: int = 50, status: Optional[str] = None) -> List[Dict]:
         """Get recent execution runs"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            if status:
-                rows = conn.execute("""
-                    SELECT * FROM execution_runs 
-                    WHERE status = ?
-                    ORDER BY started_at DESC 
-                    LIMIT ?
-                """, (status, limit)).fetchall()
-            else:
-                rows = conn.execute("""
-                    SELECT * FROM execution_runs 
-                    ORDER BY started_at DESC 
-                    LIMIT ?
-                """, (limit,)).fetchall()
-            
-            return [dict(row) for row in rows]
+        if status:
+            return self._query("""
+                SELECT * FROM execution_runs 
+                WHERE status = ?
+                ORDER BY started_at DESC 
+                LIMIT ?
+            """, (status, limit))
+        
+        return self._query("""
+            SELECT * FROM execution_runs 
+            ORDER BY started_at DESC 
+            LIMIT ?
+        """, (limit,))
     
     def get_stats(self) -> Dict:
         """Get execution statistics"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            stats = conn.execute("""
-                SELECT 
-                    COUNT(*) as total_runs,
-                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                    AVG(total_cost) as avg_cost,
-                    SUM(total_cost) as total_cost
-                FROM execution_runs
-            """).fetchone()
-            
-            return dict(stats) if stats else {}
+        rows = self._query("""
+            SELECT 
+                COUNT(*) as total_runs,
+                SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
+                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
+                AVG(total_cost) as avg_cost,
+                SUM(total_cost) as total_cost
+            FROM execution_runs
+        """)
+        
+        return rows[0] if rows else {}
 
 
 class ExecutionMonitor:
@@ -353,6 +502,7 @@ class ExecutionMonitor:
         self.store = store or ExecutionStore()
         self.current_run: Optional[ExecutionRun] = None
         self.listeners: List[asyncio.Queue] = []
+        self.dropped_messages = 0
         self.logger = logging.getLogger(__name__)
         
         # Agent execution order (for progress calculation)
@@ -398,7 +548,8 @@ class ExecutionMonitor:
             self.current_run.agents.append(AgentExecution(name=agent_name))
         
         # Persist immediately
-        self.store.save_run(self.current_run)
+        self.store.queue_run(self.current_run)
+        await self.store.flush()
         
         # Broadcast to listeners
         await self.broadcast({
@@ -468,8 +619,8 @@ class ExecutionMonitor:
         total_agents = len(self.current_run.agent_order)
         self.current_run.progress_percentage = (completed_agents / total_agents * 100) if total_agents > 0 else 0
         
-        # Persist
-        self.store.save_run(self.current_run)
+        # Persist (coalesced with other updates in this flush interval)
+        self.store.queue_run(self.current_run)
         
         # Broadcast
         await self.broadcast({
@@ -495,7 +646,7 @@ class ExecutionMonitor:
         if status:
             self.current_run.status = status
         
-        self.store.save_run(self.current_run)
+        self.store.queue_run(self.current_run)
         
         await self.broadcast({
             "type": "phase_update",
@@ -520,7 +671,8 @@ class ExecutionMonitor:
         
         duration = (self.current_run.completed_at - self.current_run.started_at).total_seconds()
         
-        self.store.save_run(self.current_run)
+        self.store.queue_run(self.current_run)
+        await self.store.flush()
         
         await self.broadcast({
             "type": "execution_completed",
@@ -545,7 +697,8 @@ class ExecutionMonitor:
             "message": error_message
         })
         
-        self.store.save_run(self.current_run)
+        self.store.queue_run(self.current_run)
+        await self.store.flush()
         
         await self.broadcast({
             "type": "execution_failed",
@@ -556,6 +709,29 @@ class ExecutionMonitor:
         
         self.logger.error(f"Execution failed: {self.current_run.id} - {error_message}")
     
+    async def record_profile(self, profile: Dict[str, Any]):
+        """Store a RunProfiler.to_dict() result for the current run"""
+        if not self.current_run:
+            return
+        
+        self.current_run.profile = {
+            "totals": profile.get("totals", {}),
+            "stage_count": len(profile.get("stages", []))
+        }
+        try:
+            await asyncio.to_thread(self.store.save_profile, self.current_run.id, profile.get("stages", []))
+        except Exception as e:
+            self.logger.warning(f"Failed to store profile for {self.current_run.id}: {e}")
+            return
+        self.store.queue_run(self.current_run)
+        
+        await self.broadcast({
+            "type": "profile_recorded",
+            "run_id": self.current_run.id,
+            "totals": self.current_run.profile["totals"],
+            "message": f"Profile recorded ({self.current_run.profile['stage_count']} stages)"
+        })
+    
     async def add_file(self, filename: str, path: str, file_type: str, size: int):
         """Track output file"""
         if not self.current_run:
@@ -570,7 +746,7 @@ class ExecutionMonitor:
         }
         
         self.current_run.output_files.append(file_info)
-        self.store.save_run(self.current_run)
+        self.store.queue_run(self.current_run)
         
         await self.broadcast({
             "type": "file_created",
@@ -578,13 +754,41 @@ class ExecutionMonitor:
             "message": f"Created: {filename}"
         })
     
+    async def get_run(self, run_id: str) -> Optional[Dict]:
+        """Read a stored run on a worker thread (store reads wait on the shared connection)"""
+        return await asyncio.to_thread(self.store.get_run, run_id)
+    
+    async def get_recent_runs(self, limit: int = 50, status: Optional[str] = None) -> List[Dict]:
+        """Read recent stored runs on a worker thread"""
+        return await asyncio.to_thread(self.store.get_recent_runs, limit, status)
+    
+    async def get_run_profile(self, run_id: str) -> List[Dict]:
+        """Read a run's stage profile on a worker thread"""
+        return await asyncio.to_thread(self.store.get_run_profile, run_id)
+    
+    async def get_stats(self) -> Dict:
+        """Read execution statistics on a worker thread"""
+        return await asyncio.to_thread(self.store.get_stats)
+    
+    async def shutdown(self):
+        """Persist any queued run updates and close the store"""
+        await self.store.aclose()
+    
     async def broadcast(self, message: dict):
-        """Send message to all listening clients"""
+        """
+        Send message to all listening clients without waiting on any of them.
+        
+        A client whose queue is full has its oldest pending message dropped,
+        so a slow SSE consumer lags behind instead of stalling the others.
+        """
         dead_queues = []
         for queue in self.listeners:
             try:
-                await asyncio.wait_for(queue.put(message), timeout=1.0)
-            except (asyncio.TimeoutError, Exception):
+                if queue.full():
+                    queue.get_nowait()
+                    self.dropped_messages += 1
+                queue.put_nowait(message)
+            except Exception:
                 dead_queues.append(queue)
         
         # Clean up dead connections
@@ -626,3 +830,12 @@ def get_execution_monitor() -> ExecutionMonitor:
         _monitor_instance = ExecutionMonitor()
     return _monitor_instance
 
+
+async def shutdown_execution_monitor():
+    """Flush and close the global monitor's store, if one was created (call at process shutdown)"""
+    global _monitor_instance
+    if _monitor_instance is None:
+        return
+    monitor, _monitor_instance = _monitor_instance, None
+    await monitor.shutdown()
+
@@ -8,10 +8,11 @@ tracking active executions, queuing, and cleanup.
 import asyncio
 import logging
 import json
+import os
 from pathlib import Path
 from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Deque
+from typing import Dict, List, Optional, Any, Deque, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
@@ -61,14 +62,21 @@ class ExecutionStateManager:
     - Execution queuing with position tracking
     - Automatic cleanup of old executions
     - Concurrent execution limits
-    - State persistence for downloads
+    - State persistence for downloads (coalesced, written off the event loop)
     - Cancellation signal tracking
     """
     
-    def __init__(self, max_concurrent: int = 5, max_queue_size: int = 20, persistence_dir: str = "/app/outputs/jobs"):
+    def __init__(
+        self,
+        max_concurrent: int = 5,
+        max_queue_size: int = 20,
+        persistence_dir: str = "/app/outputs/jobs",
+        flush_interval: float = 0.5
+    ):
         self.max_concurrent = max_concurrent
         self.max_queue_size = max_queue_size
         self.persistence_dir = Path(persistence_dir)
+        self.flush_interval = flush_interval
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # Create persistence directory
@@ -83,6 +91,11 @@ class ExecutionStateManager:
         # Thread safety
         self._lock = asyncio.Lock()
         
+        # Persistence: dirty execution IDs are written together once per flush interval
+        self._dirty: set = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        
         # Statistics
         self._stats = {
             "total_executions": 0,
@@ -416,6 +429,7 @@ class ExecutionStateManager:
                 
                 # Remove from memory
                 del self._executions[exec_id]
+                self._dirty.discard(exec_id)
                 deleted_count += 1
             
             self.logger.info(
@@ -507,37 +521,75 @@ class ExecutionStateManager:
             return executions[:limit]
     
     def _save_to_disk(self, execution_id: str):
-        """Save execution state to disk for persistence."""
+        """
+        Mark execution state for persistence.
+        
+        Bursts of updates to the same execution are coalesced into one file
+        write per flush interval. Outside an event loop the write happens immediately.
+        """
+        self._dirty.add(execution_id)
+        
         try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_state_files(self._collect_dirty_states())
+            return
+        
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._delayed_flush())
+    
+    async def _delayed_flush(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush_to_disk()
+    
+    async def flush_to_disk(self):
+        """Write all pending execution states on a worker thread."""
+        async with self._flush_lock:
+            states = self._collect_dirty_states()
+            if states:
+                await asyncio.to_thread(self._write_state_files, states)
+    
+    def _collect_dirty_states(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Snapshot pending executions as JSON-ready dicts and clear the dirty set."""
+        states = []
+        for execution_id in self._dirty:
             execution = self._executions.get(execution_id)
-            if not execution:
-                return
-            
-            # Convert to dict for JSON serialization
-            data = {
-                "execution_id": execution.execution_id,
-                "command": execution.command,
-                "args": execution.args,
-                "status": execution.status.value,
-                "start_time": execution.start_time.isoformat(),
-                "end_time": execution.end_time.isoformat() if execution.end_time else None,
-                "error_message": execution.error_message,
-                "return_code": execution.return_code,
-                "queue_position": execution.queue_position,
-                "gamma_metadata": execution.gamma_metadata,  # Include Gamma metadata
-                "audit_files": execution.audit_files,  # Include audit files
-                "output_files": execution.output_files,  # Include output files
-                "output_count": len(list(execution.output_buffer)) if execution.output_buffer else 0
-            }
-            
-            # Save to file
-            filepath = self.persistence_dir / f"{execution_id}.json"
-            import json
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            if execution:
+                states.append((execution_id, self._serialize_execution(execution)))
+        self._dirty.clear()
+        return states
+    
+    @staticmethod
+    def _serialize_execution(execution: ExecutionState) -> Dict[str, Any]:
+        """Convert execution state to a dict for JSON serialization."""
+        return {
+            "execution_id": execution.execution_id,
+            "command": execution.command,
+            "args": execution.args,
+            "status": execution.status.value,
+            "start_time": execution.start_time.isoformat(),
+            "end_time": execution.end_time.isoformat() if execution.end_time else None,
+            "error_message": execution.error_message,
+            "return_code": execution.return_code,
+            "queue_position": execution.queue_position,
+            "gamma_metadata": execution.gamma_metadata,  # Include Gamma metadata
+            "audit_files": execution.audit_files,  # Include audit files
+            "output_files": execution.output_files,  # Include output files
+            "output_count": len(execution.output_buffer) if execution.output_buffer else 0
+        }
+    
+    def _write_state_files(self, states: List[Tuple[str, Dict[str, Any]]]):
+        """Save execution states to disk, replacing each file atomically."""
+        for execution_id, data in states:
+            try:
+                filepath = self.persistence_dir / f"{execution_id}.json"
+                tmp_path = filepath.with_suffix(".json.tmp")
+                with open(tmp_path, 'w') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, filepath)
                 
-        except Exception as e:
-            self.logger.error(f"Failed to save execution {execution_id} to disk: {e}")
+            except Exception as e:
+                self.logger.error(f"Failed to save execution {execution_id} to disk: {e}")
     
     def _load_from_disk(self):
         """Load existing executions from disk on startup."""
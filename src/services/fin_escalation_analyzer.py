@@ -6,7 +6,7 @@ escalation patterns, success rates, and opportunities for improvement.
 """
 
 import logging
-from typing import List, Dict, Any, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set
 from collections import Counter, defaultdict
 from datetime import datetime
 import re
@@ -875,7 +875,7 @@ def categorize_fin_outcome(conversation: Dict[str, Any]) -> Dict[str, Any]:
             }
 
 
-def has_knowledge_gap(conversation: Dict[str, Any]) -> bool:
+def has_knowledge_gap(conversation: Dict[str, Any], text: Optional[str] = None) -> bool:
     """
     Detect if unresolved conversation indicates a knowledge gap.
     
@@ -891,6 +891,7 @@ def has_knowledge_gap(conversation: Dict[str, Any]) -> bool:
     
     Args:
         conversation: Dict with conversation data
+        text: Optional precomputed lowercased conversation text (clean_html=True)
         
     Returns:
         bool: True if conversation indicates a knowledge gap
@@ -900,8 +901,9 @@ def has_knowledge_gap(conversation: Dict[str, Any]) -> bool:
         return False
     
     # Extract conversation text and rating from actual conversation structure
-    from src.utils.conversation_utils import extract_conversation_text
-    text = extract_conversation_text(conversation, clean_html=True).lower()
+    if text is None:
+        from src.utils.conversation_utils import extract_conversation_text
+        text = extract_conversation_text(conversation, clean_html=True).lower()
     
     # Extract rating (handle dict format)
     rating_data = conversation.get('conversation_rating')
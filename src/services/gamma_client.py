@@ -500,6 +500,9 @@ class GammaClient:
         """
         Poll generation status until completion or failure.
 
+        Runs a GammaPollScheduler for this one generation, so single and
+        batched decks share the same polling loop.
+
         Supports:
         - Exponential backoff with jitter
         - Special handling for 429 (rate limit) - doesn't count as hard failure
@@ -517,171 +520,41 @@ class GammaClient:
         Raises:
             GammaAPIError: If generation fails or times out
         """
-        max_polls = max_polls or self.max_polls
-        poll_interval = poll_interval or self.poll_interval
-
-        start_time = time.time()
+        scheduler = GammaPollScheduler(self, max_polls=max_polls, poll_interval=poll_interval)
         self.logger.info(
             "gamma_polling_started",
             generation_id=generation_id,
-            max_polls=max_polls,
-            initial_interval=poll_interval,
+            max_polls=scheduler.max_polls,
+            initial_interval=scheduler.poll_interval,
             max_total_wait_seconds=self.max_total_wait_seconds
         )
-
-        poll_count = 0
-        rate_limit_count = 0
-        retry_5xx_count = 0
-        current_interval = poll_interval
-
-        while poll_count < max_polls:
-            # Check total timeout
-            elapsed_time = time.time() - start_time
-            if elapsed_time >= self.max_total_wait_seconds:
-                self.logger.error(
-                    "gamma_polling_total_timeout",
-                    generation_id=generation_id,
-                    elapsed_seconds=elapsed_time,
-                    max_wait_seconds=self.max_total_wait_seconds
-                )
-                raise GammaAPIError(
-                    f"Generation polling timed out after {elapsed_time:.1f}s "
-                    f"(max: {self.max_total_wait_seconds}s)"
-                )
-
-            try:
-                status_result = await self.get_generation_status(generation_id)
-                status = status_result.get('status')
-
-                self.logger.debug(
-                    "gamma_polling_status",
-                    generation_id=generation_id,
-                    poll_attempt=poll_count + 1,
-                    status=status,
-                    elapsed_seconds=elapsed_time
-                )
-
-                if status == 'completed':
-                    elapsed_total = time.time() - start_time
-
-                    # Validate Gamma URL from API response
-                    gamma_url = status_result.get('gammaUrl')
-                    if gamma_url:
-                        # Ensure URL is from API response, not manually constructed
-                        if not gamma_url.startswith('https://gamma.app/'):
-                            self.logger.warning(
-                                "gamma_url_invalid_pattern",
-                                generation_id=generation_id,
-                                gamma_url=gamma_url
-                            )
-                        # Verify it's not just generation_id appended
-                        if gamma_url == f"https://gamma.app/{generation_id}":
-                            self.logger.warning(
-                                "gamma_url_appears_constructed",
-                                generation_id=generation_id,
-                                gamma_url=gamma_url,
-                                message="URL may be manually constructed instead of from API"
-                            )
-                        # Log full URL for debugging
-                        self.logger.debug(
-                            "gamma_url_received",
-                            generation_id=generation_id,
-                            full_url=gamma_url
-                        )
-
-                    self.logger.info(
-                        "gamma_generation_completed",
-                        generation_id=generation_id,
-                        poll_attempts=poll_count + 1,
-                        total_time_seconds=elapsed_total,
-                        rate_limit_count=rate_limit_count,
-                        retry_5xx_count=retry_5xx_count,
-                        gamma_url=gamma_url,
-                        credits_used=status_result.get('credits', {}).get('deducted', 0)
-                    )
-                    return status_result
-
-                elif status == 'failed':
-                    error_msg = status_result.get('error', 'Unknown error')
-                    self.logger.error(
-                        "gamma_generation_failed",
-                        generation_id=generation_id,
-                        error=error_msg
-                    )
-                    raise GammaAPIError(f"Generation failed: {error_msg}")
-
-                elif status in ['pending', 'processing']:
-                    # Continue polling with exponential backoff
-                    poll_count += 1
-                    if poll_count < max_polls:
-                        current_interval = self._calculate_backoff(poll_count, base=poll_interval)
-                        self.logger.debug(
-                            "gamma_polling_wait",
-                            generation_id=generation_id,
-                            wait_seconds=current_interval,
-                            poll_attempt=poll_count
-                        )
-                        await asyncio.sleep(current_interval)
-                    continue
-
-                else:
-                    self.logger.warning(
-                        "gamma_unknown_status",
-                        generation_id=generation_id,
-                        status=status
-                    )
-                    poll_count += 1
-                    if poll_count < max_polls:
-                        current_interval = self._calculate_backoff(poll_count, base=poll_interval)
-                        await asyncio.sleep(current_interval)
-                    continue
-
-            except GammaAPIError as e:
-                # Check if this is a 429 rate limit error
-                if "429" in str(e):
-                    rate_limit_count += 1
-                    # Don't count as hard failure, use exponential backoff with jitter
-                    backoff_wait = self._calculate_backoff(rate_limit_count, base=5.0, max_wait=30)
-                    self.logger.warning(
-                        "gamma_rate_limit_429",
-                        generation_id=generation_id,
-                        rate_limit_count=rate_limit_count,
-                        backoff_seconds=backoff_wait
-                    )
-                    await asyncio.sleep(backoff_wait)
-                    continue  # Don't increment poll_count
-
-                # Re-raise other API errors
-                raise
-
-            except Exception as e:
-                self.logger.error(
-                    "gamma_polling_error",
-                    generation_id=generation_id,
-                    poll_attempt=poll_count + 1,
-                    error=str(e),
-                    exc_info=True
-                )
-                poll_count += 1
-                if poll_count < max_polls:
-                    current_interval = self._calculate_backoff(poll_count, base=poll_interval)
-                    await asyncio.sleep(current_interval)
-                continue
-
-        # Max polls reached
-        elapsed_total = time.time() - start_time
-        self.logger.error(
-            "gamma_polling_max_attempts",
+        return await scheduler.wait_for(generation_id)
+
+    def _check_gamma_url(self, generation_id: str, gamma_url: Optional[str]) -> None:
+        """Warn if a completed generation's URL does not look like it came from the API."""
+        if not gamma_url:
+            return
+        # Ensure URL is from API response, not manually constructed
+        if not gamma_url.startswith('https://gamma.app/'):
+            self.logger.warning(
+                "gamma_url_invalid_pattern",
+                generation_id=generation_id,
+                gamma_url=gamma_url
+            )
+        # Verify it's not just generation_id appended
+        if gamma_url == f"https://gamma.app/{generation_id}":
+            self.logger.warning(
+                "gamma_url_appears_constructed",
+                generation_id=generation_id,
+                gamma_url=gamma_url,
+                message="URL may be manually constructed instead of from API"
+            )
+        # Log full URL for debugging
+        self.logger.debug(
+            "gamma_url_received",
             generation_id=generation_id,
-            max_polls=max_polls,
-            elapsed_seconds=elapsed_total,
-            rate_limit_count=rate_limit_count
+            full_url=gamma_url
         )
-        raise GammaAPIError(
-            f"Generation polling exceeded {max_polls} attempts "
-            f"(elapsed: {elapsed_total:.1f}s, rate limits: {rate_limit_count})"
-        )
-
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -704,3 +577,221 @@ class GammaAPIError(Exception):
     """Exception raised for Gamma API errors."""
     pass
 
+
+class GammaPollScheduler:
+    """
+    Shared polling loop for several outstanding Gamma generations.
+
+    Every waiter registers its generation ID here and a single loop checks
+    the status of all outstanding IDs together on each tick; poll_generation()
+    is the one-generation case. A 429 on any status check
+    backs off the whole scheduler, so concurrent decks never hammer the API.
+
+    Usage:
+        scheduler = GammaPollScheduler(client)
+        results = await asyncio.gather(
+            scheduler.wait_for(id_a), scheduler.wait_for(id_b)
+        )
+    """
+
+    def __init__(
+        self,
+        client: GammaClient,
+        max_polls: Optional[int] = None,
+        poll_interval: Optional[float] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            client: GammaClient used for status checks and backoff settings
+            max_polls: Maximum status checks per generation (default: client.max_polls)
+            poll_interval: Initial poll interval in seconds (default: client.poll_interval)
+        """
+        self.client = client
+        self.max_polls = max_polls or client.max_polls
+        self.poll_interval = poll_interval or client.poll_interval
+        self.logger = structlog.get_logger()
+
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._poll_counts: Dict[str, int] = {}
+        self._start_times: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.rate_limit_count = 0
+        self.status_checks = 0
+
+    async def wait_for(self, generation_id: str) -> Dict[str, Any]:
+        """
+        Wait until a generation completes.
+
+        Args:
+            generation_id: ID returned from generate_presentation
+
+        Returns:
+            Final generation result with gammaUrl
+
+        Raises:
+            GammaAPIError: If generation fails or times out
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[generation_id] = future
+        self._poll_counts[generation_id] = 0
+        self._start_times[generation_id] = time.time()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            return await future
+        finally:
+            self._forget(generation_id)
+
+    def _forget(self, generation_id: str) -> None:
+        """Stop tracking a generation (resolved, failed or cancelled)."""
+        self._waiters.pop(generation_id, None)
+        self._poll_counts.pop(generation_id, None)
+        self._start_times.pop(generation_id, None)
+
+    def _resolve(self, generation_id: str, result: Any = None, error: Optional[Exception] = None) -> None:
+        """Complete a waiter with a result or an error."""
+        future = self._waiters.pop(generation_id, None)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    async def _run(self) -> None:
+        """Run the polling loop, failing every waiter if the loop itself breaks."""
+        try:
+            await self._poll_loop()
+        except Exception as e:
+            self.logger.error("gamma_poll_scheduler_failed", error=str(e), exc_info=True)
+            for generation_id in list(self._waiters):
+                self._resolve(generation_id, error=GammaAPIError(f"Polling scheduler failed: {e}"))
+
+    async def _poll_loop(self) -> None:
+        """Poll all outstanding generations until none are left."""
+        while self._waiters:
+            now = time.time()
+            generation_ids = []
+            for generation_id, future in list(self._waiters.items()):
+                if future.done():
+                    self._waiters.pop(generation_id, None)
+                    continue
+                elapsed = now - self._start_times[generation_id]
+                if elapsed >= self.client.max_total_wait_seconds:
+                    self.logger.error(
+                        "gamma_polling_total_timeout",
+                        generation_id=generation_id,
+                        elapsed_seconds=elapsed,
+                        max_wait_seconds=self.client.max_total_wait_seconds
+                    )
+                    self._resolve(generation_id, error=GammaAPIError(
+                        f"Generation polling timed out after {elapsed:.1f}s "
+                        f"(max: {self.client.max_total_wait_seconds}s)"
+                    ))
+                    continue
+                generation_ids.append(generation_id)
+
+            if not generation_ids:
+                break
+
+            results = await asyncio.gather(
+                *[self.client.get_generation_status(gid) for gid in generation_ids],
+                return_exceptions=True
+            )
+            self.status_checks += len(generation_ids)
+
+            rate_limited = False
+            for generation_id, result in zip(generation_ids, results):
+                if isinstance(result, GammaAPIError) and "429" in str(result):
+                    # Doesn't count as a poll attempt; the whole scheduler backs off
+                    rate_limited = True
+                    continue
+                self._handle_status(generation_id, result)
+
+            if not self._waiters:
+                break
+
+            if rate_limited:
+                self.rate_limit_count += 1
+                wait = self.client._calculate_backoff(self.rate_limit_count, base=5.0, max_wait=30)
+                self.logger.warning(
+                    "gamma_rate_limit_429",
+                    outstanding_generations=len(self._waiters),
+                    rate_limit_count=self.rate_limit_count,
+                    backoff_seconds=wait
+                )
+            else:
+                # Back off by the least-polled generation so new submissions stay responsive
+                min_polls = min(self._poll_counts.get(gid, 0) for gid in self._waiters)
+                wait = self.client._calculate_backoff(min_polls, base=self.poll_interval)
+            await asyncio.sleep(wait)
+
+    def _handle_status(self, generation_id: str, result: Any) -> None:
+        """Apply one status check result to its waiter."""
+        if generation_id not in self._waiters:
+            return
+
+        if isinstance(result, Exception):
+            if isinstance(result, GammaAPIError):
+                self._resolve(generation_id, error=result)
+                return
+            self.logger.error(
+                "gamma_polling_error",
+                generation_id=generation_id,
+                poll_attempt=self._poll_counts[generation_id] + 1,
+                error=str(result)
+            )
+            self._count_poll(generation_id)
+            return
+
+        status = result.get('status')
+        if status == 'completed':
+            self.client._check_gamma_url(generation_id, result.get('gammaUrl'))
+            self.logger.info(
+                "gamma_generation_completed",
+                generation_id=generation_id,
+                poll_attempts=self._poll_counts[generation_id] + 1,
+                total_time_seconds=time.time() - self._start_times[generation_id],
+                rate_limit_count=self.rate_limit_count,
+                gamma_url=result.get('gammaUrl'),
+                credits_used=result.get('credits', {}).get('deducted', 0)
+            )
+            self._resolve(generation_id, result=result)
+        elif status == 'failed':
+            error_msg = result.get('error', 'Unknown error')
+            self.logger.error(
+                "gamma_generation_failed",
+                generation_id=generation_id,
+                error=error_msg
+            )
+            self._resolve(generation_id, error=GammaAPIError(f"Generation failed: {error_msg}"))
+        else:
+            if status not in ['pending', 'processing']:
+                self.logger.warning(
+                    "gamma_unknown_status",
+                    generation_id=generation_id,
+                    status=status
+                )
+            self._count_poll(generation_id)
+
+    def _count_poll(self, generation_id: str) -> None:
+        """Record a non-final poll and fail the waiter once max_polls is reached."""
+        self._poll_counts[generation_id] += 1
+        if self._poll_counts[generation_id] >= self.max_polls:
+            elapsed = time.time() - self._start_times[generation_id]
+            self.logger.error(
+                "gamma_polling_max_attempts",
+                generation_id=generation_id,
+                max_polls=self.max_polls,
+                elapsed_seconds=elapsed,
+                rate_limit_count=self.rate_limit_count
+            )
+            self._resolve(generation_id, error=GammaAPIError(
+                f"Generation polling exceeded {self.max_polls} attempts "
+                f"(elapsed: {elapsed:.1f}s, rate limits: {self.rate_limit_count})"
+            ))
+
@@ -3,6 +3,7 @@ Gamma Generator Service for Intercom Analysis Tool.
 Generates professional Gamma presentations from analysis results using real Gamma API.
 """
 
+import asyncio
 import time
 import structlog
 from datetime import datetime
@@ -10,7 +11,8 @@ from typing import List, Dict, Optional, Any
 from pathlib import Path
 import json
 
-from src.services.gamma_client import GammaClient, GammaAPIError
+from src.services.gamma_client import GammaClient, GammaAPIError, GammaPollScheduler
+from src.services.google_docs_exporter import GoogleDocsExporter
 from src.services.presentation_builder import PresentationBuilder
 from src.config.gamma_prompts import GammaPrompts
 from src.utils.time_utils import detect_period_type
@@ -57,7 +59,9 @@ class GammaGenerator:
         analysis_results: Dict,
         style: str = "executive",
         export_format: Optional[str] = None,
-        output_dir: Optional[Path] = None
+        output_dir: Optional[Path] = None,
+        poll_scheduler: Optional[GammaPollScheduler] = None,
+        docs_exporter: Optional[GoogleDocsExporter] = None
     ) -> Dict[str, Any]:
         """
         Generate a Gamma presentation from analysis results.
@@ -67,6 +71,9 @@ class GammaGenerator:
             style: Presentation style ("executive", "detailed", "training")
             export_format: Export format ("pdf" or "pptx")
             output_dir: Output directory for saving results
+            poll_scheduler: Shared scheduler to poll through (default: poll this generation alone)
+            docs_exporter: Shared markdown exporter, reusing its export model across styles
+                (default: a new exporter for this generation)
             
         Returns:
             Dictionary with gamma_url, generation_id, and metadata
@@ -137,7 +144,10 @@ class GammaGenerator:
             )
             
             # Poll for completion
-            result = await self.client.poll_generation(generation_id)
+            if poll_scheduler is not None:
+                result = await poll_scheduler.wait_for(generation_id)
+            else:
+                result = await self.client.poll_generation(generation_id)
             
             elapsed = time.time() - start_time
             
@@ -157,9 +167,6 @@ class GammaGenerator:
             
             # Generate markdown summary (non-blocking)
             try:
-                from src.services.google_docs_exporter import GoogleDocsExporter
-                from pathlib import Path
-                
                 # Check if we should display markdown preview
                 try:
                     config = get_analysis_mode_config()
@@ -170,7 +177,7 @@ class GammaGenerator:
                     show_markdown_preview = True
                     markdown_max_lines = 50
                 
-                docs_exporter = GoogleDocsExporter()
+                docs_exporter = docs_exporter or GoogleDocsExporter()
                 markdown_output_dir = output_dir if output_dir else Path("outputs")
                 markdown_output_dir.mkdir(parents=True, exist_ok=True)
                 
@@ -441,6 +448,9 @@ class GammaGenerator:
         """
         Generate all presentation styles.
         
+        Styles are submitted concurrently and share one GammaPollScheduler, so
+        total wall time is close to that of the slowest single deck.
+        
         Args:
             analysis_results: Analysis results dictionary
             export_format: Export format ("pdf" or "pptx")
@@ -451,17 +461,21 @@ class GammaGenerator:
         """
         self.logger.info("generating_all_presentation_styles")
         
-        results = {}
         styles = ["executive", "detailed", "training"]
+        poll_scheduler = GammaPollScheduler(self.client)
+        # One markdown exporter so quotes and categories are extracted once for all styles
+        docs_exporter = GoogleDocsExporter()
         
-        for style in styles:
+        async def generate_style(style: str) -> Dict[str, Any]:
             try:
                 self.logger.info(f"generating_{style}_presentation")
-                results[style] = await self.generate_from_analysis(
+                return await self.generate_from_analysis(
                     analysis_results=analysis_results,
                     style=style,
                     export_format=export_format,
-                    output_dir=output_dir
+                    output_dir=output_dir,
+                    poll_scheduler=poll_scheduler,
+                    docs_exporter=docs_exporter
                 )
             except Exception as e:
                 self.logger.error(
@@ -469,15 +483,20 @@ class GammaGenerator:
                     error=str(e),
                     exc_info=True
                 )
-                results[style] = {
+                return {
                     'error': str(e),
                     'style': style,
                     'generation_successful': False
                 }
         
+        style_results = await asyncio.gather(*[generate_style(style) for style in styles])
+        results = dict(zip(styles, style_results))
+        
         self.logger.info(
             "all_presentation_styles_complete",
-            successful_generations=len([r for r in results.values() if r.get('generation_successful', True)])
+            successful_generations=len([r for r in results.values() if r.get('generation_successful', True)]),
+            status_checks=poll_scheduler.status_checks,
+            rate_limit_count=poll_scheduler.rate_limit_count
         )
         
         return results
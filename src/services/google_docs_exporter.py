@@ -3,14 +3,50 @@ Google Docs Exporter Service for Intercom Analysis Tool.
 Exports analysis results to markdown format for Google Docs import.
 """
 
+import hashlib
 import structlog
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Any
 from pathlib import Path
 import json
 
 logger = structlog.get_logger()
 
+DOC_STYLES = ("executive", "detailed", "training")
+
+
+@dataclass
+class MarkdownExportModel:
+    """
+    Shared view of one analysis run, rendered by every markdown style.
+    
+    Categories are ranked once. Customer quotes are extracted on demand, in
+    conversation order, and only as far as the largest requesting style needs,
+    so rendering several styles walks each conversation at most once.
+    """
+    conversations: List[Dict]
+    category_results: Dict
+    start_date: str
+    end_date: str
+    ranked_categories: List[Dict]
+    quote_source: Iterator[Dict]
+    quotes: List[Dict] = field(default_factory=list)
+    
+    def top_categories(self, limit: int) -> List[Dict]:
+        """Top categories by volume."""
+        return self.ranked_categories[:limit]
+    
+    def customer_quotes(self, max_quotes: int) -> List[Dict]:
+        """First max_quotes customer quotes, extracting more only when needed."""
+        while len(self.quotes) < max_quotes:
+            quote = next(self.quote_source, None)
+            if quote is None:
+                break
+            self.quotes.append(quote)
+        return self.quotes[:max_quotes]
+
 
 class GoogleDocsExporter:
     """
@@ -26,6 +62,10 @@ class GoogleDocsExporter:
     
     def __init__(self):
         self.logger = structlog.get_logger()
+        # Export model of the last analysis results rendered (shared across styles),
+        # keyed by a hash of the content it was built from
+        self._model_key: Optional[str] = None
+        self._model: Optional[MarkdownExportModel] = None
         
         self.logger.info("google_docs_exporter_initialized")
     
@@ -46,16 +86,20 @@ class GoogleDocsExporter:
         Returns:
             Path to exported markdown file
         """
+        return self._write_markdown(self.build_export_model(analysis_results), output_path, style)
+    
+    def _write_markdown(self, model: MarkdownExportModel, output_path: Path, style: str) -> Path:
+        """Render one style from the export model and write it to output_path."""
         self.logger.info(
             "exporting_to_markdown",
             output_path=str(output_path),
             style=style,
-            conversation_count=len(analysis_results.get('conversations', []))
+            conversation_count=len(model.conversations)
         )
         
         try:
-            # Build markdown content
-            markdown_content = self._build_markdown_content(analysis_results, style)
+            # Build markdown content from the shared export model
+            markdown_content = self._build_markdown_content(model, style)
             
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -81,37 +125,88 @@ class GoogleDocsExporter:
             )
             raise
     
-    def _build_markdown_content(self, analysis_results: Dict, style: str) -> str:
-        """Build markdown content from analysis results."""
+    def export_styles(
+        self,
+        analysis_results: Dict,
+        output_paths: Dict[str, Path]
+    ) -> Dict[str, Path]:
+        """
+        Export analysis results in several styles from one export model.
         
-        # Extract key data
+        Args:
+            analysis_results: Analysis results dictionary
+            output_paths: Output file path per style ("executive", "detailed", "training")
+            
+        Returns:
+            Path to each exported markdown file, by style
+        """
+        model = self.build_export_model(analysis_results)
+        return {
+            style: self._write_markdown(model, output_path, style)
+            for style, output_path in output_paths.items()
+        }
+    
+    def build_export_model(self, analysis_results: Dict) -> MarkdownExportModel:
+        """
+        Build (or reuse) the export model for analysis results.
+        
+        The model of the last results is kept under a hash of the content it
+        is built from, so exporting the same run in several styles ranks
+        categories and extracts quotes once, and results changed in place
+        since the last export get a fresh model.
+        """
         conversations = analysis_results.get('conversations', [])
         category_results = analysis_results.get('category_results', {})
-        start_date = analysis_results.get('start_date', 'Unknown')
-        end_date = analysis_results.get('end_date', 'Unknown')
+        key = self._content_key(analysis_results)
+        if self._model is not None and self._model_key == key:
+            return self._model
+        
+        self._model = MarkdownExportModel(
+            conversations=conversations,
+            category_results=category_results,
+            start_date=analysis_results.get('start_date', 'Unknown'),
+            end_date=analysis_results.get('end_date', 'Unknown'),
+            ranked_categories=self._get_top_categories(category_results, len(category_results)),
+            quote_source=self._iter_customer_quotes(conversations)
+        )
+        self._model_key = key
+        return self._model
+    
+    @staticmethod
+    def _content_key(analysis_results: Dict) -> str:
+        """Hash of the analysis results fields the export model is built from."""
+        content = json.dumps(
+            [
+                analysis_results.get('conversations', []),
+                analysis_results.get('category_results', {}),
+                analysis_results.get('start_date', 'Unknown'),
+                analysis_results.get('end_date', 'Unknown')
+            ],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    
+    def _build_markdown_content(self, model: MarkdownExportModel, style: str) -> str:
+        """Build markdown content from the export model."""
         
         # Build content based on style
         if style == "executive":
-            return self._build_executive_markdown(conversations, category_results, start_date, end_date)
+            return self._build_executive_markdown(model)
         elif style == "detailed":
-            return self._build_detailed_markdown(conversations, category_results, start_date, end_date)
+            return self._build_detailed_markdown(model)
         elif style == "training":
-            return self._build_training_markdown(conversations, category_results, start_date, end_date)
+            return self._build_training_markdown(model)
         else:
-            return self._build_detailed_markdown(conversations, category_results, start_date, end_date)
+            return self._build_detailed_markdown(model)
     
-    def _build_executive_markdown(
-        self,
-        conversations: List[Dict],
-        category_results: Dict,
-        start_date: str,
-        end_date: str
-    ) -> str:
+    def _build_executive_markdown(self, model: MarkdownExportModel) -> str:
         """Build executive-style markdown."""
         
-        total_conversations = len(conversations)
-        top_categories = self._get_top_categories(category_results, 5)
-        customer_quotes = self._extract_customer_quotes(conversations, 3)
+        start_date, end_date = model.start_date, model.end_date
+        total_conversations = len(model.conversations)
+        top_categories = model.top_categories(5)
+        customer_quotes = model.customer_quotes(3)
         
         content = f"""# Customer Support Analysis: {start_date} to {end_date}
 
@@ -185,18 +280,13 @@ We analyzed **{total_conversations:,}** customer conversations and identified cr
         
         return content
     
-    def _build_detailed_markdown(
-        self,
-        conversations: List[Dict],
-        category_results: Dict,
-        start_date: str,
-        end_date: str
-    ) -> str:
+    def _build_detailed_markdown(self, model: MarkdownExportModel) -> str:
         """Build detailed analysis markdown."""
         
-        total_conversations = len(conversations)
-        all_categories = self._get_top_categories(category_results, 10)
-        customer_quotes = self._extract_customer_quotes(conversations, 5)
+        start_date, end_date = model.start_date, model.end_date
+        category_results = model.category_results
+        total_conversations = len(model.conversations)
+        customer_quotes = model.customer_quotes(5)
         
         content = f"""# Comprehensive Customer Support Analysis: {start_date} to {end_date}
 
@@ -328,18 +418,13 @@ Recommended in 30 days to track implementation progress
         
         return content
     
-    def _build_training_markdown(
-        self,
-        conversations: List[Dict],
-        category_results: Dict,
-        start_date: str,
-        end_date: str
-    ) -> str:
+    def _build_training_markdown(self, model: MarkdownExportModel) -> str:
         """Build training-focused markdown."""
         
-        total_conversations = len(conversations)
-        training_categories = self._get_top_categories(category_results, 6)
-        customer_quotes = self._extract_customer_quotes(conversations, 4)
+        start_date, end_date = model.start_date, model.end_date
+        total_conversations = len(model.conversations)
+        training_categories = model.top_categories(6)
+        customer_quotes = model.customer_quotes(4)
         
         content = f"""# Customer Support Training Materials: {start_date} to {end_date}
 
@@ -550,18 +635,14 @@ Recommended in 30 days to track implementation progress
     
     def _extract_customer_quotes(self, conversations: List[Dict], max_quotes: int) -> List[Dict]:
         """Extract customer quotes with context."""
-        quotes = []
-        
+        return list(islice(self._iter_customer_quotes(conversations), max(max_quotes, 0)))
+    
+    def _iter_customer_quotes(self, conversations: List[Dict]) -> Iterator[Dict]:
+        """Yield customer quotes in conversation order, extracting each only when requested."""
         for conv in conversations:
-            if len(quotes) >= max_quotes:
-                break
-            
-            # Extract quote from conversation
             quote_data = self._extract_quote_from_conversation(conv)
             if quote_data:
-                quotes.append(quote_data)
-        
-        return quotes[:max_quotes]
+                yield quote_data
     
     def _extract_quote_from_conversation(self, conversation: Dict) -> Optional[Dict]:
         """Extract a compelling quote from a single conversation."""
@@ -205,6 +205,8 @@ class HistoricalSnapshotService:  # pylint: disable=too-many-public-methods
             
             if ok:
                 logger.info("Snapshot %s stored successfully", snapshot_id)
+                self._store_metric_rollup(snapshot_id, snapshot_dict)
+                self._precompute_comparisons(snapshot_dict)
             else:
                 logger.warning("Snapshot %s failed to store", snapshot_id)
             return snapshot_id
@@ -215,14 +217,56 @@ class HistoricalSnapshotService:  # pylint: disable=too-many-public-methods
 
     # ------------------------------------------------------------------
     def get_prior_snapshot(self, current_snapshot_id: str, analysis_type: str = "weekly") -> Optional[Dict[str, Any]]:
-        current_date = self._parse_snapshot_date(current_snapshot_id)
-        if not current_date:
+        prior_id = self._adjacent_snapshot_id(current_snapshot_id, analysis_type, -1)
+        if not prior_id:
             return None
-        delta = {"weekly": 7, "monthly": 30, "quarterly": 90}.get(analysis_type, 7)
-        prior_date = current_date - timedelta(days=delta)
-        prior_id = self._generate_snapshot_id(prior_date, analysis_type)
         return self.db.get_analysis_snapshot(prior_id)
 
+    # ------------------------------------------------------------------
+    def get_comparison(self, current_snapshot_id: str, prior_snapshot_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored comparison of two snapshots with one indexed lookup.
+
+        Comparisons are precomputed when snapshots are saved.  Pairs stored
+        before that (or never compared) are calculated once from the snapshots
+        and stored, so later lookups hit the table.  Returns ``None`` if either
+        snapshot does not exist.
+        """
+        comparison = self.db.get_comparative_analysis(self._comparison_id(current_snapshot_id, prior_snapshot_id))
+        if comparison:
+            return comparison
+
+        current = self.db.get_analysis_snapshot(current_snapshot_id)
+        prior = self.db.get_analysis_snapshot(prior_snapshot_id)
+        if not current or not prior:
+            return None
+        return self.calculate_comparison(current, prior)
+
+    def get_period_comparison(self, snapshot_id: str, analysis_type: str = "weekly") -> Optional[Dict[str, Any]]:
+        """Return the comparison of *snapshot_id* with the immediately preceding period."""
+        prior_id = self._adjacent_snapshot_id(snapshot_id, analysis_type, -1)
+        if not prior_id:
+            return None
+        return self.get_comparison(snapshot_id, prior_id)
+
+    def _precompute_comparisons(self, snapshot: Dict[str, Any]) -> None:
+        """Compare a saved snapshot with its neighbouring periods and store both results. Never raises.
+
+        The following period is included so that re-saving (or backfilling) a
+        snapshot refreshes the comparison that uses it as the prior period.
+        """
+        try:
+            snapshot_id = snapshot["snapshot_id"]
+            analysis_type = snapshot["analysis_type"]
+            prior = self.get_prior_snapshot(snapshot_id, analysis_type)
+            if prior:
+                self._store_comparison(self._build_comparison(snapshot, prior))
+            following_id = self._adjacent_snapshot_id(snapshot_id, analysis_type, 1)
+            following = self.db.get_analysis_snapshot(following_id) if following_id else None
+            if following:
+                self._store_comparison(self._build_comparison(following, snapshot))
+        except Exception as exc:  # noqa: broad-except
+            logger.warning("Comparison precompute failed for %s: %s", snapshot.get("snapshot_id"), exc)
+
     # ------------------------------------------------------------------
     def calculate_comparison(self, current_snapshot: Dict[str, Any], prior_snapshot: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -237,34 +281,10 @@ class HistoricalSnapshotService:  # pylint: disable=too-many-public-methods
         - declining_patterns: Topics disappearing
         """
         try:
-            comparison_id = f"comp_{current_snapshot['snapshot_id']}_{prior_snapshot['snapshot_id']}"
-            
-            # Calculate all comparison dimensions
-            volume_changes = self._calculate_volume_deltas(current_snapshot, prior_snapshot)
-            sentiment_changes = self._calculate_sentiment_deltas(current_snapshot, prior_snapshot)
-            resolution_changes = self._calculate_resolution_deltas(current_snapshot, prior_snapshot)
-            significant_changes = self._identify_significant_changes(volume_changes)
-            emerging_patterns = self._detect_emerging_patterns(current_snapshot, prior_snapshot)
-            declining_patterns = self._detect_declining_patterns(current_snapshot, prior_snapshot)
-            
-            comparison_data = {
-                "comparison_id": comparison_id,
-                "comparison_type": "week_over_week" if current_snapshot["analysis_type"] == "weekly" else "period",
-                "current_snapshot_id": current_snapshot["snapshot_id"],
-                "prior_snapshot_id": prior_snapshot["snapshot_id"],
-                "volume_changes": volume_changes,
-                "sentiment_changes": sentiment_changes,
-                "resolution_changes": resolution_changes,
-                "significant_changes": significant_changes,
-                "emerging_patterns": emerging_patterns,
-                "declining_patterns": declining_patterns,
-            }
+            comparison_data = self._build_comparison(current_snapshot, prior_snapshot)
             
             # Store in DuckDB for historical retrieval
-            self.db.store_comparative_analysis(comparison_data)
-            logger.info(f"Comparison calculated: {len(significant_changes)} significant changes, "
-                       f"{len(emerging_patterns)} emerging, {len(declining_patterns)} declining")
-            
+            self._store_comparison(comparison_data)
             return comparison_data
             
         except Exception as exc:
@@ -283,6 +303,35 @@ class HistoricalSnapshotService:  # pylint: disable=too-many-public-methods
                 "declining_patterns": [],
             }
 
+    def _build_comparison(self, current_snapshot: Dict[str, Any], prior_snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute all comparison dimensions of two snapshots (no storage)."""
+        volume_changes = self._calculate_volume_deltas(current_snapshot, prior_snapshot)
+        return {
+            "comparison_id": self._comparison_id(current_snapshot["snapshot_id"], prior_snapshot["snapshot_id"]),
+            "comparison_type": "week_over_week" if current_snapshot["analysis_type"] == "weekly" else "period",
+            "current_snapshot_id": current_snapshot["snapshot_id"],
+            "prior_snapshot_id": prior_snapshot["snapshot_id"],
+            "volume_changes": volume_changes,
+            "sentiment_changes": self._calculate_sentiment_deltas(current_snapshot, prior_snapshot),
+            "resolution_changes": self._calculate_resolution_deltas(current_snapshot, prior_snapshot),
+            "significant_changes": self._identify_significant_changes(volume_changes),
+            "emerging_patterns": self._detect_emerging_patterns(current_snapshot, prior_snapshot),
+            "declining_patterns": self._detect_declining_patterns(current_snapshot, prior_snapshot),
+            # Same snapshot metadata that get_comparative_analysis joins in
+            "current_period_label": current_snapshot.get("date_range_label"),
+            "prior_period_label": prior_snapshot.get("date_range_label"),
+            "current_total_conversations": current_snapshot.get("total_conversations"),
+            "prior_total_conversations": prior_snapshot.get("total_conversations"),
+        }
+
+    def _store_comparison(self, comparison_data: Dict[str, Any]) -> bool:
+        ok = self.db.store_comparative_analysis(comparison_data)
+        logger.info(f"Comparison {comparison_data['comparison_id']} calculated: "
+                    f"{len(comparison_data['significant_changes'])} significant changes, "
+                    f"{len(comparison_data['emerging_patterns'])} emerging, "
+                    f"{len(comparison_data['declining_patterns'])} declining")
+        return ok
+
     # ------------------------------------------------------------------
     # Comparison helper methods
     # ------------------------------------------------------------------
@@ -503,28 +552,124 @@ class HistoricalSnapshotService:  # pylint: disable=too-many-public-methods
 
     # ------------------------------------------------------------------
     def get_historical_context(self) -> Dict[str, Any]:
-        snaps = self.db.get_snapshots_by_type("weekly", 1000)
-        # Sort by period_start ascending to ensure stable baseline reference
-        snaps = sorted(snaps, key=lambda s: s.get("period_start") or date.min)
-        weeks_available = len(snaps)
+        # Count and earliest period come from one aggregate query – no snapshot payloads
+        stats = self.db.get_snapshot_stats("weekly")
+        weeks_available = stats.get("count", 0)
         return {
             "has_baseline": weeks_available >= 4,
             "weeks_available": weeks_available,
             "can_do_trends": weeks_available >= 4,
             "can_do_seasonality": weeks_available >= 12,
             # Use earliest snapshot's period_start as stable baseline
-            "baseline_date": snaps[0]["period_start"] if weeks_available >= 4 else None,
+            "baseline_date": stats.get("earliest_period_start") if weeks_available >= 4 else None,
         }
 
     # ------------------------------------------------------------------
     def list_snapshots(self, analysis_type: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
         if analysis_type:
             return self.db.get_snapshots_by_type(analysis_type, limit)
-        # merge all
-        snaps = []
-        for t in ("weekly", "monthly", "quarterly"):
-            snaps.extend(self.db.get_snapshots_by_type(t, limit))
-        return sorted(snaps, key=lambda s: (s["period_start"] or date.min), reverse=True)[:limit]
+        return self.db.get_recent_snapshots(limit)
+
+    # ------------------------------------------------------------------
+    def list_snapshot_metadata(self, analysis_type: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """List snapshot ids, periods and totals without loading JSON payloads."""
+        return self.db.get_snapshot_metadata(analysis_type, limit)
+
+    # ------------------------------------------------------------------
+    # Metrics timeseries rollup
+    # ------------------------------------------------------------------
+
+    def get_metric_series(
+        self, metric_names: List[str], analysis_type: str = "weekly", periods: int = 12
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the last *periods* points for each metric, oldest first.
+
+        Reads the long-format ``metrics_timeseries`` rollup with a single query;
+        snapshot JSON blobs are never deserialized.
+        """
+        series: Dict[str, List[Dict[str, Any]]] = {name: [] for name in metric_names}
+        for row in self.db.get_metric_series(metric_names, analysis_type, periods):
+            series[row["metric_name"]].append({
+                "snapshot_id": row["snapshot_id"],
+                "period_start": row["period_start"],
+                "value": row["metric_value"],
+            })
+        return series
+
+    def get_category_series(
+        self, category: str, analysis_type: str = "weekly", periods: int = 12
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the last *periods* points of every metric in *category*, oldest first."""
+        series: Dict[str, List[Dict[str, Any]]] = {}
+        for row in self.db.get_metric_series_by_category(category, analysis_type, periods):
+            series.setdefault(row["metric_name"], []).append({
+                "snapshot_id": row["snapshot_id"],
+                "period_start": row["period_start"],
+                "value": row["metric_value"],
+            })
+        return series
+
+    def backfill_metrics_timeseries(self) -> int:
+        """Build the rollup for snapshots saved before it existed. Returns snapshots processed."""
+        processed = 0
+        for snapshot_id in self.db.get_snapshot_ids_without_metrics():
+            snapshot = self.db.get_analysis_snapshot(snapshot_id)
+            if snapshot and self._store_metric_rollup(snapshot_id, snapshot):
+                processed += 1
+        if processed:
+            logger.info("Backfilled metrics_timeseries for %d snapshots", processed)
+        return processed
+
+    def _store_metric_rollup(self, snapshot_id: str, snapshot: Dict[str, Any]) -> bool:
+        """Rebuild the metrics_timeseries rows of one snapshot. Never raises."""
+        try:
+            return self.db.replace_snapshot_metrics(snapshot_id, self._build_metric_rows(snapshot_id, snapshot))
+        except Exception as exc:  # noqa: broad-except
+            logger.warning("Metric rollup failed for %s: %s", snapshot_id, exc)
+            return False
+
+    @staticmethod
+    def _build_metric_rows(snapshot_id: str, snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Flatten a snapshot into long-format metric rows.
+
+        Metric names are dotted paths: ``total_conversations``,
+        ``topic_volume.<topic>``, ``topic_sentiment.<topic>.<key>``,
+        ``tier.<tier>`` and ``resolution.<metric>``.
+        """
+        rows: List[Dict[str, Any]] = []
+
+        def add(name: str, value: Any, unit: Optional[str], category: str) -> None:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return
+            rows.append({
+                "metric_id": f"{snapshot_id}:{name}",
+                "snapshot_id": snapshot_id,
+                "metric_name": name,
+                "metric_value": float(value),
+                "metric_unit": unit,
+                "category": category,
+            })
+
+        add("total_conversations", snapshot.get("total_conversations") or 0, "conversations", "summary")
+
+        for topic, volume in (snapshot.get("topic_volumes") or {}).items():
+            # Legacy TrendAgent snapshots store {topic: {"volume": n, ...}}
+            if isinstance(volume, dict):
+                volume = volume.get("volume")
+            add(f"topic_volume.{topic}", volume, "conversations", "topic_volume")
+
+        for topic, sentiment in (snapshot.get("topic_sentiments") or {}).items():
+            if isinstance(sentiment, dict):
+                for key, value in sentiment.items():
+                    add(f"topic_sentiment.{topic}.{key}", value, "ratio", "topic_sentiment")
+
+        for tier, count in (snapshot.get("tier_distribution") or {}).items():
+            add(f"tier.{tier}", count, "conversations", "tier_distribution")
+
+        for key, value in (snapshot.get("resolution_metrics") or {}).items():
+            add(f"resolution.{key}", value, None, "resolution")
+
+        return rows
 
     # ------------------------------------------------------------------
     # Async Methods for Non-Blocking Operations
@@ -548,6 +693,11 @@ class HistoricalSnapshotService:  # pylint: disable=too-many-public-methods
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.list_snapshots, analysis_type, limit)
     
+    async def get_comparison_async(self, current_snapshot_id: str, prior_snapshot_id: str) -> Optional[Dict[str, Any]]:
+        """Async wrapper for get_comparison."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_comparison, current_snapshot_id, prior_snapshot_id)
+    
     async def get_historical_context_async(self) -> Dict[str, Any]:
         """Async wrapper for get_historical_context."""
         loop = asyncio.get_event_loop()
@@ -610,6 +760,19 @@ class HistoricalSnapshotService:  # pylint: disable=too-many-public-methods
     def _generate_snapshot_id(dt: date, analysis_type: str) -> str:
         return f"{analysis_type}_{dt.strftime('%Y%m%d')}"
 
+    @classmethod
+    def _adjacent_snapshot_id(cls, snapshot_id: str, analysis_type: str, periods: int) -> Optional[str]:
+        """Id of the snapshot *periods* periods away (negative = earlier)."""
+        snapshot_date = cls._parse_snapshot_date(snapshot_id)
+        if not snapshot_date:
+            return None
+        delta = {"weekly": 7, "monthly": 30, "quarterly": 90}.get(analysis_type, 7)
+        return cls._generate_snapshot_id(snapshot_date + timedelta(days=delta * periods), analysis_type)
+
+    @staticmethod
+    def _comparison_id(current_snapshot_id: str, prior_snapshot_id: str) -> str:
+        return f"comp_{current_snapshot_id}_{prior_snapshot_id}"
+
     # ----- extraction helpers --------------------------------------------------
 
     @staticmethod
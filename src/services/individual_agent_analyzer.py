@@ -5,7 +5,10 @@ Analyzes performance of individual agents within a vendor team,
 with taxonomy-based category/subcategory breakdown.
 """
 
+import asyncio
 import logging
+import re
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from collections import defaultdict
@@ -25,6 +28,32 @@ from src.utils.conversation_utils import extract_conversation_text, extract_cust
 
 logger = logging.getLogger(__name__)
 
+# Tier-2 staff whose mention in a conversation marks it as escalated
+ESCALATION_NAMES = ('dae-ho', 'max jackson', 'hilary')
+_ESCALATION_PATTERN = re.compile('|'.join(re.escape(name) for name in ESCALATION_NAMES))
+
+
+@dataclass
+class ConversationFeatures:
+    """Per-conversation values derived once and shared by every metric"""
+    conversation: Dict
+    closed: bool
+    reopened: bool
+    escalated: bool
+    resolution_hours: Optional[float]
+    response_hours: Optional[float]
+    complexity: float
+    rating: Optional[float]
+    categories: List[Dict] = field(default_factory=list)
+
+    @property
+    def fcr(self) -> bool:
+        return self.closed and not self.reopened
+
+
+def _is_escalated(text: str) -> bool:
+    return _ESCALATION_PATTERN.search(text.lower()) is not None
+
 
 class IndividualAgentAnalyzer:
     """Analyze performance of individual agents within a vendor"""
@@ -44,7 +73,8 @@ class IndividualAgentAnalyzer:
         admin_cache: AdminProfileCache,
         duckdb_storage: Optional[DuckDBStorage] = None,
         enable_troubleshooting_analysis: bool = False,
-        audit=None
+        audit=None,
+        max_concurrent_agents: int = 8
     ):
         """
         Initialize individual agent analyzer.
@@ -55,6 +85,7 @@ class IndividualAgentAnalyzer:
             duckdb_storage: Optional DuckDB storage
             enable_troubleshooting_analysis: Enable AI-powered troubleshooting analysis (slower)
             audit: Optional AuditTrail instance for detailed logging
+            max_concurrent_agents: Agents whose metrics are computed concurrently
         """
         self.vendor = vendor
         self.admin_cache = admin_cache
@@ -63,6 +94,7 @@ class IndividualAgentAnalyzer:
         self.audit = audit
         self.logger = logging.getLogger(__name__)
         self.taxonomy = taxonomy_manager
+        self.agent_semaphore = asyncio.Semaphore(max(1, max_concurrent_agents))
         
         # Initialize troubleshooting analyzer if enabled
         if enable_troubleshooting_analysis:
@@ -125,18 +157,23 @@ class IndividualAgentAnalyzer:
                     "limited" if attribution_rate >= 85 else "poor"
                 )
         
-        # Calculate metrics for each agent
-        agent_metrics = []
-        for agent_id, agent_convs in conversations_by_agent.items():
-            if agent_id not in admin_details_map:
-                continue
-            
-            metrics = await self._calculate_individual_metrics(
-                agent_id, 
-                agent_convs, 
-                admin_details_map[agent_id]
-            )
-            agent_metrics.append(metrics)
+        # Derive each conversation's features once, then compute agents concurrently
+        features_by_agent = {
+            agent_id: self._build_features(agent_convs)
+            for agent_id, agent_convs in conversations_by_agent.items()
+            if agent_id in admin_details_map
+        }
+        
+        async def calculate(agent_id: str) -> IndividualAgentMetrics:
+            async with self.agent_semaphore:
+                return await self._calculate_individual_metrics(
+                    agent_id,
+                    conversations_by_agent[agent_id],
+                    admin_details_map[agent_id],
+                    features=features_by_agent[agent_id]
+                )
+        
+        agent_metrics = list(await asyncio.gather(*(calculate(agent_id) for agent_id in features_by_agent)))
         
         # Rank agents
         agent_metrics = self._rank_agents(agent_metrics)
@@ -298,62 +335,81 @@ class IndividualAgentAnalyzer:
         
         return dict(conversations_by_agent)
     
+    def _build_features(self, convs: List[Dict]) -> List[ConversationFeatures]:
+        """Extract text, taxonomy categories and timings once per conversation"""
+        features = []
+        for conv in convs:
+            closed = conv.get('state') == 'closed'
+            reply_seconds = conv.get('time_to_admin_reply')
+            features.append(ConversationFeatures(
+                conversation=conv,
+                closed=closed,
+                reopened=(conv.get('count_reopens', 0) or 0) > 0,
+                escalated=_is_escalated(extract_conversation_text(conv, clean_html=True)),
+                resolution_hours=self._resolution_hours(conv) if closed else None,
+                response_hours=reply_seconds / 3600 if reply_seconds else None,
+                complexity=conv.get('count_conversation_parts', 0) or 0,
+                rating=conv.get('conversation_rating'),
+                categories=self._extract_categories(conv)
+            ))
+        return features
+    
+    def _resolution_hours(self, conv: Dict) -> Optional[float]:
+        """Hours between creation and last update, or None when either is missing"""
+        created = conv.get('created_at')
+        updated = conv.get('updated_at')
+        if not (created and updated):
+            return None
+        if isinstance(created, (int, float)):
+            return (updated - created) / 3600
+        return (updated - created).total_seconds() / 3600
+    
     async def _calculate_individual_metrics(
         self, 
         agent_id: str, 
         convs: List[Dict], 
-        agent_info: Dict
+        agent_info: Dict,
+        features: Optional[List[ConversationFeatures]] = None
     ) -> IndividualAgentMetrics:
-        """Calculate comprehensive metrics for one agent"""
+        """Calculate comprehensive metrics for one agent in a single pass over its feature rows"""
+        if features is None:
+            features = self._build_features(convs)
+        
+        closed_convs, fcr_convs, reopened_convs, escalated = [], [], [], []
+        rated_convs, ratings = [], []
+        resolution_times, response_times = [], []
+        total_complexity = 0.0
+        
+        for row in features:
+            conv = row.conversation
+            if row.closed:
+                closed_convs.append(conv)
+                (reopened_convs if row.reopened else fcr_convs).append(conv)
+                if row.resolution_hours is not None:
+                    resolution_times.append(row.resolution_hours)
+            if row.escalated:
+                escalated.append(conv)
+            if row.response_hours is not None:
+                response_times.append(row.response_hours)
+            if row.rating is not None:
+                rated_convs.append(conv)
+                ratings.append(row.rating)
+            total_complexity += row.complexity
         
         # Basic metrics
-        closed_convs = [c for c in convs if c.get('state') == 'closed']
-        fcr_convs = [c for c in closed_convs if c.get('count_reopens', 0) == 0]
-        reopened_convs = [c for c in closed_convs if c.get('count_reopens', 0) > 0]
-        
         fcr_rate = len(fcr_convs) / len(closed_convs) if len(closed_convs) > 0 else 0.0
         reopen_rate = len(reopened_convs) / len(closed_convs) if len(closed_convs) > 0 else 0.0
-        
-        # Escalations
-        escalated = [
-            c for c in convs
-            if any(name in extract_conversation_text(c, clean_html=True).lower() 
-                  for name in ['dae-ho', 'max jackson', 'hilary'])
-        ]
         escalation_rate = len(escalated) / len(convs) if len(convs) > 0 else 0.0
         
-        # Resolution times
-        resolution_times = []
-        for conv in closed_convs:
-            created = conv.get('created_at')
-            updated = conv.get('updated_at')
-            if created and updated:
-                if isinstance(created, (int, float)):
-                    hours = (updated - created) / 3600
-                else:
-                    hours = (updated - created).total_seconds() / 3600
-                resolution_times.append(hours)
-        
+        # Resolution and response times
         median_resolution = float(np.median(resolution_times)) if len(resolution_times) > 0 else 0.0
         over_48h = len([t for t in resolution_times if t > 48])
-        
-        # Response times
-        response_times = [
-            (c.get('time_to_admin_reply', 0) or 0) / 3600 
-            for c in convs 
-            if c.get('time_to_admin_reply')
-        ]
         median_response = float(np.median(response_times)) if len(response_times) > 0 else 0.0
         
         # Complexity
-        avg_complexity = float(np.mean([
-            c.get('count_conversation_parts', 0) for c in convs
-        ])) if len(convs) > 0 else 0.0
+        avg_complexity = total_complexity / len(convs) if len(convs) > 0 else 0.0
         
         # CSAT metrics (customer satisfaction)
-        rated_convs = [c for c in convs if c.get('conversation_rating') is not None]
-        ratings = [c.get('conversation_rating') for c in rated_convs]
-        
         csat_score = float(np.mean(ratings)) if ratings else 0.0
         csat_survey_count = len(rated_convs)
         negative_csat_count = len([r for r in ratings if r <= 2])  # 1★ or 2★
@@ -368,8 +424,7 @@ class IndividualAgentAnalyzer:
         }
         
         # Taxonomy-based performance breakdown
-        perf_by_category = self._analyze_category_performance(convs)
-        perf_by_subcategory = self._analyze_subcategory_performance(convs)
+        perf_by_category, perf_by_subcategory = self._analyze_taxonomy_performance(features)
         
         # Identify strengths and weaknesses
         strong_cats, weak_cats = self._identify_category_strengths_weaknesses(perf_by_category)
@@ -464,122 +519,66 @@ class IndividualAgentAnalyzer:
             worst_csat_examples=worst_csat_examples
         )
     
-    def _analyze_category_performance(self, convs: List[Dict]) -> Dict[str, CategoryPerformance]:
-        """Analyze performance by primary taxonomy category"""
-        category_stats = defaultdict(lambda: {
-            'total': 0,
-            'fcr_count': 0,
-            'escalated_count': 0,
-            'resolution_times': []
-        })
-        
-        for conv in convs:
-            # Get category from tags/topics using taxonomy
-            categories = self._extract_categories(conv)
-            
-            for category in categories:
-                primary = category.get('primary', 'Unknown')
-                category_stats[primary]['total'] += 1
-                
-                if conv.get('state') == 'closed' and conv.get('count_reopens', 0) == 0:
-                    category_stats[primary]['fcr_count'] += 1
-                
-                if any(name in extract_conversation_text(conv, clean_html=True).lower() 
-                      for name in ['dae-ho', 'max jackson', 'hilary']):
-                    category_stats[primary]['escalated_count'] += 1
-                
-                # Resolution time
-                if conv.get('state') == 'closed':
-                    created = conv.get('created_at')
-                    updated = conv.get('updated_at')
-                    if created and updated:
-                        if isinstance(created, (int, float)):
-                            hours = (updated - created) / 3600
-                        else:
-                            hours = (updated - created).total_seconds() / 3600
-                        category_stats[primary]['resolution_times'].append(hours)
-        
-        # Convert to CategoryPerformance objects
-        result = {}
-        for category, stats in category_stats.items():
-            if stats['total'] >= 3:  # Minimum sample size
-                fcr_rate = stats['fcr_count'] / stats['total'] if stats['total'] > 0 else 0.0
-                escalation_rate = stats['escalated_count'] / stats['total'] if stats['total'] > 0 else 0.0
-                median_res = float(np.median(stats['resolution_times'])) if len(stats['resolution_times']) > 0 else 0.0
-                
-                result[category] = CategoryPerformance(
-                    primary_category=category,
-                    subcategory=None,
-                    volume=stats['total'],
-                    fcr_rate=fcr_rate,
-                    escalation_rate=escalation_rate,
-                    median_resolution_hours=float(median_res),
-                    performance_level=self._assess_performance_level(fcr_rate, escalation_rate)
-                )
+    def _analyze_taxonomy_performance(
+        self,
+        features: List[ConversationFeatures]
+    ) -> tuple[Dict[str, CategoryPerformance], Dict[str, CategoryPerformance]]:
+        """Analyze performance by primary category and by subcategory in one grouped pass"""
+        def new_stats() -> Dict[str, Any]:
+            return {'total': 0, 'fcr_count': 0, 'escalated_count': 0, 'resolution_times': []}
         
-        return result
-    
-    def _analyze_subcategory_performance(self, convs: List[Dict]) -> Dict[str, CategoryPerformance]:
-        """Analyze performance by subcategory"""
-        subcategory_stats = defaultdict(lambda: {
-            'primary': '',
-            'total': 0,
-            'fcr_count': 0,
-            'escalated_count': 0,
-            'resolution_times': []
-        })
+        category_stats = defaultdict(new_stats)
+        subcategory_stats = defaultdict(new_stats)
         
-        for conv in convs:
-            categories = self._extract_categories(conv)
-            
-            for category in categories:
+        for row in features:
+            for category in row.categories:
                 primary = category.get('primary', 'Unknown')
                 subcategory = category.get('subcategory')
-                
+                groups = [category_stats[primary]]
                 if subcategory:
-                    key = f"{primary}>{subcategory}"
-                    subcategory_stats[key]['primary'] = primary
-                    subcategory_stats[key]['total'] += 1
-                    
-                    if conv.get('state') == 'closed' and conv.get('count_reopens', 0) == 0:
-                        subcategory_stats[key]['fcr_count'] += 1
-                    
-                    if any(name in extract_conversation_text(conv, clean_html=True).lower() 
-                          for name in ['dae-ho', 'max jackson', 'hilary']):
-                        subcategory_stats[key]['escalated_count'] += 1
-                    
-                    # Resolution time
-                    if conv.get('state') == 'closed':
-                        created = conv.get('created_at')
-                        updated = conv.get('updated_at')
-                        if created and updated:
-                            if isinstance(created, (int, float)):
-                                hours = (updated - created) / 3600
-                            else:
-                                hours = (updated - created).total_seconds() / 3600
-                            subcategory_stats[key]['resolution_times'].append(hours)
-        
-        # Convert to CategoryPerformance objects
-        result = {}
+                    groups.append(subcategory_stats[f"{primary}>{subcategory}"])
+                
+                for stats in groups:
+                    stats['total'] += 1
+                    if row.fcr:
+                        stats['fcr_count'] += 1
+                    if row.escalated:
+                        stats['escalated_count'] += 1
+                    if row.resolution_hours is not None:
+                        stats['resolution_times'].append(row.resolution_hours)
+        
+        by_category = {
+            category: self._build_category_performance(category, None, stats)
+            for category, stats in category_stats.items()
+            if stats['total'] >= 3  # Minimum sample size
+        }
+        by_subcategory = {}
         for key, stats in subcategory_stats.items():
             if stats['total'] >= 2:  # Lower threshold for subcategories
-                fcr_rate = stats['fcr_count'] / stats['total'] if stats['total'] > 0 else 0.0
-                escalation_rate = stats['escalated_count'] / stats['total'] if stats['total'] > 0 else 0.0
-                median_res = float(np.median(stats['resolution_times'])) if len(stats['resolution_times']) > 0 else 0.0
-                
                 primary, subcat = key.split('>', 1)
-                
-                result[key] = CategoryPerformance(
-                    primary_category=primary,
-                    subcategory=subcat,
-                    volume=stats['total'],
-                    fcr_rate=fcr_rate,
-                    escalation_rate=escalation_rate,
-                    median_resolution_hours=float(median_res),
-                    performance_level=self._assess_performance_level(fcr_rate, escalation_rate)
-                )
+                by_subcategory[key] = self._build_category_performance(primary, subcat, stats)
         
-        return result
+        return by_category, by_subcategory
+    
+    def _build_category_performance(
+        self,
+        primary: str,
+        subcategory: Optional[str],
+        stats: Dict[str, Any]
+    ) -> CategoryPerformance:
+        fcr_rate = stats['fcr_count'] / stats['total'] if stats['total'] > 0 else 0.0
+        escalation_rate = stats['escalated_count'] / stats['total'] if stats['total'] > 0 else 0.0
+        median_res = float(np.median(stats['resolution_times'])) if len(stats['resolution_times']) > 0 else 0.0
+        
+        return CategoryPerformance(
+            primary_category=primary,
+            subcategory=subcategory,
+            volume=stats['total'],
+            fcr_rate=fcr_rate,
+            escalation_rate=escalation_rate,
+            median_resolution_hours=float(median_res),
+            performance_level=self._assess_performance_level(fcr_rate, escalation_rate)
+        )
     
     def _extract_categories(self, conv: Dict) -> List[Dict]:
         """Extract categories from conversation using taxonomy"""
@@ -864,7 +863,7 @@ class IndividualAgentAnalyzer:
             
             # Get whether it was reopened or escalated (red flags)
             reopened = conv.get('count_reopens', 0) > 0
-            escalated = any(name in full_text.lower() for name in ['dae-ho', 'max jackson', 'hilary'])
+            escalated = _is_escalated(full_text)
             
             red_flags = []
             if reopened:
@@ -49,6 +49,7 @@ from intercom.core.pagination import AsyncPager
 
 from src.config.settings import settings
 from src.utils.retry import async_retry
+from src.utils.run_profiler import KIND_IO, profiled
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,7 @@ class IntercomSDKService:
         self.rate_limit_buffer = settings.intercom_rate_limit_buffer
         self.concurrency = settings.intercom_concurrency
         self.request_delay = settings.intercom_request_delay_ms / 1000.0  # Convert to seconds
+        self.page_prefetch = settings.intercom_page_prefetch
         
         # Initialize the AsyncIntercom client
         self.client = AsyncIntercom(
@@ -211,6 +213,11 @@ class IntercomSDKService:
                 request_options=request_options
             )
             
+            # Request the next search pages while the current one is processed
+            # (older SDK builds without with_prefetch fetch on demand)
+            if self.page_prefetch > 0 and hasattr(pager, 'with_prefetch'):
+                pager = pager.with_prefetch(self.page_prefetch)
+            
             # Track duplicate prevention
             seen_ids: set[str] = set()
             
@@ -291,6 +298,7 @@ class IntercomSDKService:
             self.logger.error(f"Error fetching conversations: {e}")
             raise
     
+    @profiled("enrichment", KIND_IO)
     async def _enrich_conversations_with_contact_details(
         self,
         conversations: List[Dict]
@@ -3,6 +3,8 @@ Story-driven data preprocessor that focuses on extracting customer narratives
 and emotional experiences from Intercom and Canny data.
 """
 
+import asyncio
+import hashlib
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
@@ -10,10 +12,15 @@ import re
 import json
 
 from src.services.openai_client import OpenAIClient
+from src.config.settings import settings
 from src.config.story_driven_prompts import StoryDrivenPrompts
+from src.utils.run_profiler import record_cache_hit
 
 logger = logging.getLogger(__name__)
 
+SUMMARY_FAILED = "Story summary generation failed"
+NO_STORY_SUMMARY = "No story elements detected"
+
 
 class StoryDrivenPreprocessor:
     """
@@ -25,6 +32,16 @@ class StoryDrivenPreprocessor:
         self.logger = logging.getLogger(__name__)
         self.openai_client = OpenAIClient()
         
+        # Story summaries run concurrently under one shared limit, each with its own timeout
+        self.summary_semaphore = asyncio.Semaphore(max(1, settings.story_extraction_concurrency))
+        self.summary_timeout = settings.story_summary_timeout
+        
+        # Summaries keyed by content hash; identical conversations/posts reuse one LLM result
+        self._summary_cache: Dict[str, str] = {}
+        # In-flight summaries keyed by content hash (single-flight)
+        self._summary_inflight: Dict[str, asyncio.Future] = {}
+        self.summary_stats = self._empty_summary_stats()
+        
         # Emotional indicators for story extraction
         self.emotional_indicators = {
             'frustration': ['frustrated', 'annoying', 'terrible', 'awful', 'hate', 'disappointed', 'angry'],
@@ -67,13 +84,15 @@ class StoryDrivenPreprocessor:
         self.logger.info(f"Starting story-driven preprocessing for {len(conversations)} conversations and {len(canny_posts)} Canny posts")
         
         options = options or {}
+        self.summary_stats = self._empty_summary_stats()
         
         try:
-            # Step 1: Extract customer stories from conversations
-            conversation_stories = await self._extract_conversation_stories(conversations, options)
-            
-            # Step 2: Extract stories from Canny feedback
-            canny_stories = await self._extract_canny_stories(canny_posts, options)
+            # Steps 1-2: Extract customer stories from conversations and Canny feedback together
+            conversation_stories, canny_stories = await asyncio.gather(
+                self._extract_conversation_stories(conversations, options),
+                self._extract_canny_stories(canny_posts, options)
+            )
+            self.logger.info(f"Story summary stats: {self.summary_stats}")
             
             # Step 3: Identify emotional patterns
             emotional_patterns = self._identify_emotional_patterns(conversation_stories, canny_stories)
@@ -105,7 +124,8 @@ class StoryDrivenPreprocessor:
                     'conversation_count': len(conversations),
                     'canny_post_count': len(canny_posts),
                     'preprocessing_timestamp': datetime.now().isoformat(),
-                    'options': options
+                    'options': options,
+                    'story_summary_stats': dict(self.summary_stats)
                 },
                 'conversation_stories': conversation_stories,
                 'canny_stories': canny_stories,
@@ -133,15 +153,17 @@ class StoryDrivenPreprocessor:
         self.logger.info(f"Extracting stories from {len(conversations)} conversations")
         
         stories = []
-        
-        for conv in conversations:
-            try:
-                story = await self._extract_single_conversation_story(conv, options)
-                if story:
-                    stories.append(story)
-            except Exception as e:
-                self.logger.warning(f"Failed to extract story from conversation {conv.get('id', 'unknown')}: {e}")
+        results = await asyncio.gather(
+            *[self._extract_single_conversation_story(conv, options) for conv in conversations],
+            return_exceptions=True
+        )
+        
+        for conv, story in zip(conversations, results):
+            if isinstance(story, Exception):
+                self.logger.warning(f"Failed to extract story from conversation {conv.get('id', 'unknown')}: {story}")
                 continue
+            if story:
+                stories.append(story)
         
         self.logger.info(f"Extracted {len(stories)} conversation stories")
         return stories
@@ -171,8 +193,12 @@ class StoryDrivenPreprocessor:
             # Identify journey stage
             journey_stage = self._identify_journey_stage(conversation_text)
             
-            # Generate story summary using AI
-            story_summary = await self._generate_story_summary(conversation_text, options)
+            # Generate story summary using AI, skipping conversations with no story to tell
+            if any(story_elements.values()):
+                story_summary = await self._generate_story_summary(conversation_text, options)
+            else:
+                self.summary_stats['prefiltered'] += 1
+                story_summary = NO_STORY_SUMMARY
             
             return {
                 'conversation_id': conversation.get('id'),
@@ -316,12 +342,11 @@ Provide a brief story summary (2-3 sentences) that captures:
 
 Focus on the human story, not just the technical details."""
 
-            summary = await self.openai_client.generate_analysis(prompt)
-            return summary
+            return await self._generate_cached_summary('conversation', conversation_text, prompt)
             
         except Exception as e:
             self.logger.warning(f"Failed to generate story summary: {e}")
-            return "Story summary generation failed"
+            return SUMMARY_FAILED
     
     async def _extract_canny_stories(
         self, 
@@ -332,15 +357,17 @@ Focus on the human story, not just the technical details."""
         self.logger.info(f"Extracting stories from {len(canny_posts)} Canny posts")
         
         stories = []
-        
-        for post in canny_posts:
-            try:
-                story = await self._extract_single_canny_story(post, options)
-                if story:
-                    stories.append(story)
-            except Exception as e:
-                self.logger.warning(f"Failed to extract story from Canny post {post.get('id', 'unknown')}: {e}")
+        results = await asyncio.gather(
+            *[self._extract_single_canny_story(post, options) for post in canny_posts],
+            return_exceptions=True
+        )
+        
+        for post, story in zip(canny_posts, results):
+            if isinstance(story, Exception):
+                self.logger.warning(f"Failed to extract story from Canny post {post.get('id', 'unknown')}: {story}")
                 continue
+            if story:
+                stories.append(story)
         
         self.logger.info(f"Extracted {len(stories)} Canny stories")
         return stories
@@ -427,12 +454,82 @@ Provide a brief story summary (2-3 sentences) that captures:
 
 Focus on the customer's perspective and needs."""
 
-            summary = await self.openai_client.generate_analysis(prompt)
-            return summary
+            return await self._generate_cached_summary('canny', post_text, prompt)
             
         except Exception as e:
             self.logger.warning(f"Failed to generate Canny story summary: {e}")
-            return "Story summary generation failed"
+            return SUMMARY_FAILED
+    
+    @staticmethod
+    def _empty_summary_stats() -> Dict[str, int]:
+        """Fresh story summary counters for a run."""
+        return {
+            'llm_calls': 0,
+            'cache_hits': 0,
+            'prefiltered': 0,
+            'timeouts': 0
+        }
+    
+    @staticmethod
+    def _content_hash(kind: str, text: str) -> str:
+        """Hash of the text a story summary is generated from."""
+        return hashlib.sha256(f"{kind}\n{text}".encode('utf-8')).hexdigest()
+    
+    async def _generate_cached_summary(self, kind: str, text: str, prompt: str) -> str:
+        """
+        Generate a story summary under the shared concurrency limit and per-item timeout.
+        
+        Results are cached by content hash, and duplicates that arrive while the
+        same summary is in flight await that request instead of issuing another.
+        Timeouts and failures are raised to every waiting caller and never cached.
+        """
+        key = self._content_hash(kind, text)
+        cached = self._cached_summary(key)
+        if cached is not None:
+            return cached
+        
+        inflight = self._summary_inflight.get(key)
+        if inflight is not None:
+            summary = await asyncio.shield(inflight)
+            self.summary_stats['cache_hits'] += 1
+            record_cache_hit()
+            return summary
+        
+        future = asyncio.get_running_loop().create_future()
+        self._summary_inflight[key] = future
+        try:
+            summary = await self._generate_summary(prompt)
+            self._summary_cache[key] = summary
+            future.set_result(summary)
+            return summary
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve the exception so an unawaited future doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            self._summary_inflight.pop(key, None)
+    
+    async def _generate_summary(self, prompt: str) -> str:
+        """Run one story summary LLM call under the concurrency limit and timeout."""
+        async with self.summary_semaphore:
+            self.summary_stats['llm_calls'] += 1
+            try:
+                return await asyncio.wait_for(
+                    self.openai_client.generate_analysis(prompt),
+                    timeout=self.summary_timeout
+                )
+            except asyncio.TimeoutError:
+                self.summary_stats['timeouts'] += 1
+                raise TimeoutError(f"story summary timed out after {self.summary_timeout}s")
+    
+    def _cached_summary(self, key: str) -> Optional[str]:
+        """Return a cached summary, counting the hit."""
+        summary = self._summary_cache.get(key)
+        if summary is not None:
+            self.summary_stats['cache_hits'] += 1
+            record_cache_hit()
+        return summary
     
     def _identify_emotional_patterns(
         self, 
@@ -0,0 +1,159 @@
+"""
+Streaming stratified sampler for conversation datasets.
+
+Draws a reproducible stratified sample in a single pass over either an
+in-memory list or a stream of chunks (e.g. ChunkedFetcher.fetch_conversations_streaming).
+
+Each conversation gets a pseudo-random priority derived from the seed and its
+id, so the sample does not depend on arrival order or chunking. Each stratum
+(category, tier, day) keeps only its lowest-priority conversations in a
+bounded heap; when the stream ends, the sample budget is split across strata
+in proportion to their observed sizes and each stratum contributes its
+lowest-priority members (bottom-k sampling, i.e. a uniform random sample).
+"""
+
+import hashlib
+import heapq
+import logging
+import random
+from datetime import date, datetime, timezone
+from typing import Any, AsyncIterable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def default_stratum_key(conv: Dict[str, Any]) -> Tuple[str, str, Optional[date]]:
+    """Stratify by category, customer tier and creation day."""
+    category = conv.get('inferred_category') or conv.get('category') or 'unknown'
+    tier = conv.get('tier') or 'unknown'
+    tier = getattr(tier, 'value', tier)
+    return str(category), str(tier), _created_day(conv.get('created_at'))
+
+
+def _created_day(value: Any) -> Optional[date]:
+    try:
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value, tz=timezone.utc).date()
+        if isinstance(value, str) and value:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).date()
+    except (ValueError, OSError, OverflowError):
+        pass
+    return None
+
+
+class StratifiedSampler:
+    """
+    Single-pass, reproducible stratified sampler.
+
+    Memory per stratum is bounded by max_count conversations regardless of
+    how many the stratum receives, and each conversation is handled in O(log k).
+    """
+
+    def __init__(
+        self,
+        max_count: int,
+        seed: Optional[int] = None,
+        stratum_key: Callable[[Dict[str, Any]], Hashable] = default_stratum_key
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            max_count: Target sample size
+            seed: Seed for reproducible sampling (None for a random seed)
+            stratum_key: Function mapping a conversation to its stratum
+        """
+        self.max_count = max(0, int(max_count))
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.stratum_key = stratum_key
+        self._rng = random.Random(self.seed)
+        self._salt = str(self.seed).encode()
+        # stratum -> max-heap of (-priority, sequence, conversation)
+        self._reservoirs: Dict[Hashable, List[Tuple[float, int, Dict[str, Any]]]] = {}
+        self._counts: Dict[Hashable, int] = {}
+        self.seen = 0
+
+    def add(self, conv: Dict[str, Any]) -> None:
+        """Offer one conversation to the sample."""
+        sequence = self.seen
+        self.seen += 1
+        if self.max_count == 0:
+            return
+
+        stratum = self.stratum_key(conv)
+        self._counts[stratum] = self._counts.get(stratum, 0) + 1
+        reservoir = self._reservoirs.setdefault(stratum, [])
+        entry = (-self._priority(conv), sequence, conv)
+
+        if len(reservoir) < self.max_count:
+            heapq.heappush(reservoir, entry)
+        elif entry > reservoir[0]:
+            # Lower priority than the current worst kept member
+            heapq.heapreplace(reservoir, entry)
+
+    def extend(self, conversations: Iterable[Dict[str, Any]]) -> None:
+        for conv in conversations:
+            self.add(conv)
+
+    async def consume(self, chunks: AsyncIterable[List[Dict[str, Any]]]) -> None:
+        """Offer every conversation from an async stream of chunks."""
+        async for chunk in chunks:
+            self.extend(chunk)
+
+    def result(self) -> List[Dict[str, Any]]:
+        """Return the sample in arrival order."""
+        selected: List[Tuple[int, Dict[str, Any]]] = []
+        for stratum, quota in self.allocation().items():
+            members = sorted(self._reservoirs[stratum], reverse=True)[:quota]
+            selected.extend((sequence, conv) for _, sequence, conv in members)
+        selected.sort(key=lambda item: item[0])
+        return [conv for _, conv in selected]
+
+    def allocation(self) -> Dict[Hashable, int]:
+        """Split max_count across strata proportionally (largest remainder)."""
+        total = sum(self._counts.values())
+        if total <= self.max_count:
+            return dict(self._counts)
+
+        quotas = {}
+        remainders = []
+        for stratum, count in self._counts.items():
+            exact = self.max_count * count / total
+            quotas[stratum] = int(exact)
+            remainders.append((exact - int(exact), count, stratum))
+
+        leftover = self.max_count - sum(quotas.values())
+        remainders.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        for _, _, stratum in remainders[:leftover]:
+            quotas[stratum] += 1
+        return quotas
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'seen': self.seen,
+            'strata': len(self._counts),
+            'sample_size': min(self.max_count, sum(self._counts.values())),
+            'seed': self.seed
+        }
+
+    def _priority(self, conv: Dict[str, Any]) -> float:
+        """Seeded priority in [0, 1); id-derived so it is independent of arrival order."""
+        conv_id = conv.get('id')
+        if conv_id is None:
+            return self._rng.random()
+        digest = hashlib.blake2b(str(conv_id).encode(), digest_size=8, key=self._salt[:64]).digest()
+        return int.from_bytes(digest, 'big') / 2 ** 64
+
+
+def stratified_sample(
+    conversations: Iterable[Dict[str, Any]],
+    max_count: int,
+    seed: Optional[int] = None,
+    stratum_key: Callable[[Dict[str, Any]], Hashable] = default_stratum_key
+) -> List[Dict[str, Any]]:
+    """Convenience wrapper: stratified sample of an in-memory collection."""
+    sampler = StratifiedSampler(max_count, seed=seed, stratum_key=stratum_key)
+    sampler.extend(conversations)
+    return sampler.result()
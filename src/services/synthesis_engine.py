@@ -6,9 +6,11 @@ comprehensive insights and identify patterns across different conversation types
 """
 
 import logging
-from typing import List, Dict, Any, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set
 from collections import defaultdict, Counter
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import combinations
 import json
 
 from src.services.openai_client import OpenAIClient
@@ -16,6 +18,121 @@ from src.config.prompts import PromptTemplates
 
 logger = logging.getLogger(__name__)
 
+# data_summary list -> key naming the item in each entry
+INDEXED_ITEM_FIELDS = {'topics': 'topic', 'tags': 'tag'}
+
+
+@dataclass
+class CategorySignals:
+    """Values read once from one category analyzer's results."""
+    total_conversations: int = 0
+    filtered_conversations: int = 0
+    sentiment: Dict[str, int] = field(default_factory=dict)
+    escalation_rate: Optional[float] = None  # None when there is no escalation analysis
+    success_rate: Optional[float] = None  # None when there is no success analysis
+    failure_rate: float = 0
+
+    @property
+    def priority_score(self) -> float:
+        return (
+            (self.filtered_conversations * 0.4)
+            + ((self.escalation_rate or 0) * 0.3)
+            + (self.failure_rate * 0.3)
+        )
+
+
+@dataclass
+class CategoryIndex:
+    """
+    Inverted index over category results, built in one pass.
+
+    Maps each top topic/tag to its summed count and the categories listing it
+    (in category order), and aggregates common issues, escalation triggers and
+    success patterns. Overlaps and correlations are answered from the index
+    instead of rescanning every category's lists per item or per category pair.
+    """
+    categories: Dict[str, CategorySignals] = field(default_factory=dict)
+    item_totals: Dict[str, Dict[str, int]] = field(
+        default_factory=lambda: {item_type: defaultdict(int) for item_type in INDEXED_ITEM_FIELDS}
+    )
+    item_categories: Dict[str, Dict[str, List[str]]] = field(
+        default_factory=lambda: {item_type: defaultdict(list) for item_type in INDEXED_ITEM_FIELDS}
+    )
+    category_item_counts: Dict[str, Dict[str, int]] = field(
+        default_factory=lambda: {item_type: {} for item_type in INDEXED_ITEM_FIELDS}
+    )
+    issue_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    escalation_triggers: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    success_patterns: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    @classmethod
+    def build(cls, category_results: Dict[str, Dict[str, Any]]) -> 'CategoryIndex':
+        index = cls()
+        for category, results in category_results.items():
+            data_summary = results.get('data_summary', {})
+            analysis_results = results.get('analysis_results', {})
+            
+            signals = CategorySignals(
+                total_conversations=data_summary.get('total_conversations', 0),
+                filtered_conversations=data_summary.get('filtered_conversations', 0),
+                sentiment=data_summary.get('sentiment_distribution', {}),
+                failure_rate=analysis_results.get('failure_analysis', {}).get('failure_rate', 0)
+            )
+            
+            for item_type, item_field in INDEXED_ITEM_FIELDS.items():
+                seen = set()
+                for item_data in data_summary.get(f'top_{item_type}', []):
+                    item = item_data[item_field]
+                    index.item_totals[item_type][item] += item_data['count']
+                    if item not in seen:
+                        seen.add(item)
+                        index.item_categories[item_type][item].append(category)
+                index.category_item_counts[item_type][category] = len(seen)
+            
+            if 'common_issues' in analysis_results:
+                for issue in analysis_results['common_issues']:
+                    index.issue_counts[issue] += 1
+            
+            if 'escalation_analysis' in analysis_results:
+                escalation_analysis = analysis_results['escalation_analysis']
+                signals.escalation_rate = escalation_analysis.get('escalation_rate', 0)
+                for trigger, count in escalation_analysis.get('statistics', {}).items():
+                    index.escalation_triggers[trigger] += count
+            
+            if 'success_analysis' in analysis_results:
+                success_analysis = analysis_results['success_analysis']
+                signals.success_rate = success_analysis.get('success_rate', 0)
+                for pattern, count in success_analysis.get('statistics', {}).items():
+                    index.success_patterns[pattern] += count
+            
+            index.categories[category] = signals
+        return index
+
+    def overlapping_items(self, item_type: str) -> Dict[str, Any]:
+        """Items listed by more than one category."""
+        overlapping = {}
+        categories_by_item = self.item_categories[item_type]
+        for item, total_count in self.item_totals[item_type].items():
+            categories = categories_by_item[item]
+            if total_count > 1 and len(categories) > 1:
+                overlapping[item] = {
+                    'total_count': total_count,
+                    'categories': list(categories),
+                    'category_count': len(categories)
+                }
+        return overlapping
+
+    def shared_item_counts(self) -> Dict[Tuple[str, str], Dict[str, int]]:
+        """Shared topic/tag counts for every category pair that shares at least one item."""
+        shared: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(
+            lambda: dict.fromkeys(INDEXED_ITEM_FIELDS, 0)
+        )
+        for item_type, categories_by_item in self.item_categories.items():
+            for categories in categories_by_item.values():
+                for pair in combinations(categories, 2):
+                    shared[pair][item_type] += 1
+        return shared
+
 
 class SynthesisEngine:
     """
@@ -62,20 +179,23 @@ class SynthesisEngine:
                 'summary': {}
             }
         
+        # Index topics, tags, issues and per-category rates in a single pass
+        index = CategoryIndex.build(category_results)
+        
         # Extract common metrics across categories
-        cross_category_metrics = self._extract_cross_category_metrics(category_results)
+        cross_category_metrics = self._extract_cross_category_metrics(index)
         
         # Identify cross-category patterns
-        cross_category_patterns = self._identify_cross_category_patterns(category_results)
+        cross_category_patterns = self._identify_cross_category_patterns(index)
         
         # Generate trend analysis
-        trend_analysis = self._analyze_cross_category_trends(category_results)
+        trend_analysis = self._analyze_cross_category_trends(index)
         
         # Identify priority areas
-        priority_areas = self._identify_priority_areas(category_results)
+        priority_areas = self._identify_priority_areas(index)
         
         # Generate actionable insights
-        actionable_insights = self._generate_actionable_insights(category_results)
+        actionable_insights = self._generate_actionable_insights(index, cross_category_patterns)
         
         # Create executive summary
         executive_summary = self._create_executive_summary(
@@ -107,12 +227,10 @@ class SynthesisEngine:
                     'end_date': end_date.strftime('%Y-%m-%d')
                 },
                 'total_conversations': sum(
-                    result.get('data_summary', {}).get('total_conversations', 0)
-                    for result in category_results.values()
+                    signals.total_conversations for signals in index.categories.values()
                 ),
                 'filtered_conversations': sum(
-                    result.get('data_summary', {}).get('filtered_conversations', 0)
-                    for result in category_results.values()
+                    signals.filtered_conversations for signals in index.categories.values()
                 )
             },
             'cross_category_metrics': cross_category_metrics,
@@ -127,7 +245,7 @@ class SynthesisEngine:
         self.logger.info("Category results synthesis completed")
         return results
 
-    def _extract_cross_category_metrics(self, category_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    def _extract_cross_category_metrics(self, index: CategoryIndex) -> Dict[str, Any]:
         """Extract common metrics across all categories."""
         metrics = {
             'total_conversations_by_category': {},
@@ -140,80 +258,34 @@ class SynthesisEngine:
         }
         
         # Extract conversation volumes
-        for category, results in category_results.items():
-            data_summary = results.get('data_summary', {})
-            metrics['total_conversations_by_category'][category] = data_summary.get('total_conversations', 0)
-            metrics['conversation_volume_distribution'][category] = data_summary.get('filtered_conversations', 0)
+        for category, signals in index.categories.items():
+            metrics['total_conversations_by_category'][category] = signals.total_conversations
+            metrics['conversation_volume_distribution'][category] = signals.filtered_conversations
         
         # Extract sentiment distributions
-        for category, results in category_results.items():
-            data_summary = results.get('data_summary', {})
-            sentiment = data_summary.get('sentiment_distribution', {})
-            if sentiment:
-                metrics['sentiment_distribution_by_category'][category] = sentiment
-        
-        # Extract topic and tag overlaps
-        all_topics = defaultdict(int)
-        all_tags = defaultdict(int)
-        
-        for category, results in category_results.items():
-            data_summary = results.get('data_summary', {})
-            
-            # Collect topics
-            topics = data_summary.get('top_topics', [])
-            for topic in topics:
-                all_topics[topic['topic']] += topic['count']
-            
-            # Collect tags
-            tags = data_summary.get('top_tags', [])
-            for tag in tags:
-                all_tags[tag['tag']] += tag['count']
+        for category, signals in index.categories.items():
+            if signals.sentiment:
+                metrics['sentiment_distribution_by_category'][category] = signals.sentiment
         
         # Find overlapping topics and tags
-        metrics['topic_overlap'] = self._find_overlapping_items(all_topics, category_results, 'topics')
-        metrics['tag_overlap'] = self._find_overlapping_items(all_tags, category_results, 'tags')
+        metrics['topic_overlap'] = index.overlapping_items('topics')
+        metrics['tag_overlap'] = index.overlapping_items('tags')
         
         return metrics
 
-    def _identify_cross_category_patterns(self, category_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    def _identify_cross_category_patterns(self, index: CategoryIndex) -> Dict[str, Any]:
         """Identify patterns that span multiple categories."""
-        patterns = {
-            'common_issues': defaultdict(int),
-            'escalation_patterns': defaultdict(int),
-            'success_patterns': defaultdict(int),
-            'temporal_patterns': defaultdict(int),
-            'user_behavior_patterns': defaultdict(int)
+        return {
+            'common_issues': dict(index.issue_counts),
+            'escalation_patterns': dict(index.escalation_triggers),
+            'success_patterns': dict(index.success_patterns),
+            'temporal_patterns': {},
+            'user_behavior_patterns': {}
         }
-        
-        # Analyze common issues across categories
-        for category, results in category_results.items():
-            analysis_results = results.get('analysis_results', {})
-            
-            # Extract common issues from each category
-            if 'common_issues' in analysis_results:
-                for issue in analysis_results['common_issues']:
-                    patterns['common_issues'][issue] += 1
-            
-            # Extract escalation patterns
-            if 'escalation_analysis' in analysis_results:
-                escalation_stats = analysis_results['escalation_analysis'].get('statistics', {})
-                for trigger, count in escalation_stats.items():
-                    patterns['escalation_patterns'][trigger] += count
-            
-            # Extract success patterns
-            if 'success_analysis' in analysis_results:
-                success_stats = analysis_results['success_analysis'].get('statistics', {})
-                for pattern, count in success_stats.items():
-                    patterns['success_patterns'][pattern] += count
-        
-        # Convert defaultdicts to regular dicts
-        for pattern_type in patterns:
-            patterns[pattern_type] = dict(patterns[pattern_type])
-        
-        return patterns
 
-    def _analyze_cross_category_trends(self, category_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_cross_category_trends(self, index: CategoryIndex) -> Dict[str, Any]:
         """Analyze trends across categories."""
+        categories = index.categories
         trends = {
             'volume_trends': {},
             'sentiment_trends': {},
@@ -223,49 +295,33 @@ class SynthesisEngine:
         }
         
         # Analyze volume trends
-        category_volumes = {}
-        for category, results in category_results.items():
-            data_summary = results.get('data_summary', {})
-            category_volumes[category] = data_summary.get('filtered_conversations', 0)
-        
-        trends['volume_trends'] = self._calculate_volume_trends(category_volumes)
+        trends['volume_trends'] = self._calculate_volume_trends({
+            category: signals.filtered_conversations for category, signals in categories.items()
+        })
         
         # Analyze sentiment trends
-        sentiment_trends = {}
-        for category, results in category_results.items():
-            data_summary = results.get('data_summary', {})
-            sentiment = data_summary.get('sentiment_distribution', {})
-            if sentiment:
-                sentiment_trends[category] = sentiment
-        
-        trends['sentiment_trends'] = self._calculate_sentiment_trends(sentiment_trends)
+        trends['sentiment_trends'] = self._calculate_sentiment_trends({
+            category: signals.sentiment for category, signals in categories.items() if signals.sentiment
+        })
         
         # Analyze escalation trends
-        escalation_trends = {}
-        for category, results in category_results.items():
-            analysis_results = results.get('analysis_results', {})
-            if 'escalation_analysis' in analysis_results:
-                escalation_rate = analysis_results['escalation_analysis'].get('escalation_rate', 0)
-                escalation_trends[category] = escalation_rate
-        
-        trends['escalation_trends'] = self._calculate_escalation_trends(escalation_trends)
+        trends['escalation_trends'] = self._calculate_escalation_trends({
+            category: signals.escalation_rate
+            for category, signals in categories.items() if signals.escalation_rate is not None
+        })
         
         # Analyze success trends
-        success_trends = {}
-        for category, results in category_results.items():
-            analysis_results = results.get('analysis_results', {})
-            if 'success_analysis' in analysis_results:
-                success_rate = analysis_results['success_analysis'].get('success_rate', 0)
-                success_trends[category] = success_rate
-        
-        trends['success_trends'] = self._calculate_success_trends(success_trends)
+        trends['success_trends'] = self._calculate_success_trends({
+            category: signals.success_rate
+            for category, signals in categories.items() if signals.success_rate is not None
+        })
         
         # Calculate category correlations
-        trends['category_correlation'] = self._calculate_category_correlations(category_results)
+        trends['category_correlation'] = self._calculate_category_correlations(index)
         
         return trends
 
-    def _identify_priority_areas(self, category_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    def _identify_priority_areas(self, index: CategoryIndex) -> Dict[str, Any]:
         """Identify priority areas based on analysis results."""
         priorities = {
             'high_priority_categories': [],
@@ -276,28 +332,13 @@ class SynthesisEngine:
         }
         
         # Identify high-priority categories based on volume and issues
-        category_priorities = {}
-        for category, results in category_results.items():
-            data_summary = results.get('data_summary', {})
-            analysis_results = results.get('analysis_results', {})
-            
-            # Calculate priority score
-            volume = data_summary.get('filtered_conversations', 0)
-            escalation_rate = analysis_results.get('escalation_analysis', {}).get('escalation_rate', 0)
-            failure_rate = analysis_results.get('failure_analysis', {}).get('failure_rate', 0)
-            
-            priority_score = (volume * 0.4) + (escalation_rate * 0.3) + (failure_rate * 0.3)
-            category_priorities[category] = priority_score
-        
-        # Sort categories by priority
-        sorted_priorities = sorted(category_priorities.items(), key=lambda x: x[1], reverse=True)
+        sorted_priorities = self._sorted_category_priorities(index)
         priorities['high_priority_categories'] = [cat for cat, score in sorted_priorities[:3]]
         
         # Identify escalation hotspots
         escalation_hotspots = []
-        for category, results in category_results.items():
-            analysis_results = results.get('analysis_results', {})
-            escalation_rate = analysis_results.get('escalation_analysis', {}).get('escalation_rate', 0)
+        for category, signals in index.categories.items():
+            escalation_rate = signals.escalation_rate or 0
             
             if escalation_rate > 30:  # Threshold for high escalation rate
                 escalation_hotspots.append({
@@ -310,9 +351,8 @@ class SynthesisEngine:
         
         # Identify success opportunities
         success_opportunities = []
-        for category, results in category_results.items():
-            analysis_results = results.get('analysis_results', {})
-            success_rate = analysis_results.get('success_analysis', {}).get('success_rate', 0)
+        for category, signals in index.categories.items():
+            success_rate = signals.success_rate or 0
             
             if success_rate < 70:  # Threshold for improvement opportunity
                 success_opportunities.append({
@@ -324,17 +364,25 @@ class SynthesisEngine:
         priorities['success_opportunities'] = sorted(success_opportunities, key=lambda x: x['improvement_potential'], reverse=True)
         
         # Generate resource allocation recommendations
-        priorities['resource_allocation'] = self._generate_resource_allocation_recommendations(category_results)
+        priorities['resource_allocation'] = self._generate_resource_allocation_recommendations(sorted_priorities)
         
         return priorities
 
-    def _generate_actionable_insights(self, category_results: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _sorted_category_priorities(self, index: CategoryIndex) -> List[Tuple[str, float]]:
+        """Categories ordered by priority score (volume, escalation and failure rates), highest first."""
+        category_priorities = {
+            category: signals.priority_score for category, signals in index.categories.items()
+        }
+        return sorted(category_priorities.items(), key=lambda x: x[1], reverse=True)
+
+    def _generate_actionable_insights(
+        self,
+        index: CategoryIndex,
+        cross_category_patterns: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         """Generate actionable insights from the analysis."""
         insights = []
-        
-        # Generate insights based on cross-category patterns
-        cross_category_patterns = self._identify_cross_category_patterns(category_results)
-        
+
         # Insight 1: Common issues across categories
         common_issues = cross_category_patterns.get('common_issues', {})
         if common_issues:
@@ -375,11 +423,9 @@ class SynthesisEngine:
             })
         
         # Insight 4: Category-specific insights
-        for category, results in category_results.items():
-            analysis_results = results.get('analysis_results', {})
-            
+        for category, signals in index.categories.items():
             # Check for high escalation rates
-            escalation_rate = analysis_results.get('escalation_analysis', {}).get('escalation_rate', 0)
+            escalation_rate = signals.escalation_rate or 0
             if escalation_rate > 40:
                 insights.append({
                     'type': 'category_escalation',
@@ -391,7 +437,7 @@ class SynthesisEngine:
                 })
             
             # Check for low success rates
-            success_rate = analysis_results.get('success_analysis', {}).get('success_rate', 0)
+            success_rate = signals.success_rate or 0
             if success_rate < 60:
                 insights.append({
                     'type': 'category_success',
@@ -509,36 +555,6 @@ class SynthesisEngine:
         
         return recommendations
 
-    def _find_overlapping_items(
-        self,
-        all_items: Dict[str, int],
-        category_results: Dict[str, Dict[str, Any]],
-        item_type: str
-    ) -> Dict[str, Any]:
-        """Find items that appear in multiple categories."""
-        overlapping = {}
-        
-        for item, total_count in all_items.items():
-            if total_count > 1:  # Appears in multiple categories
-                categories = []
-                for category, results in category_results.items():
-                    data_summary = results.get('data_summary', {})
-                    items = data_summary.get(f'top_{item_type}', [])
-                    
-                    for item_data in items:
-                        if item_data[item_type[:-1]] == item:  # Remove 's' from item_type
-                            categories.append(category)
-                            break
-                
-                if len(categories) > 1:
-                    overlapping[item] = {
-                        'total_count': total_count,
-                        'categories': categories,
-                        'category_count': len(categories)
-                    }
-        
-        return overlapping
-
     def _calculate_volume_trends(self, category_volumes: Dict[str, int]) -> Dict[str, Any]:
         """Calculate volume trends across categories."""
         total_volume = sum(category_volumes.values())
@@ -599,84 +615,55 @@ class SynthesisEngine:
         
         return trends
 
-    def _calculate_category_correlations(self, category_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    def _calculate_category_correlations(self, index: CategoryIndex) -> Dict[str, Any]:
         """Calculate correlations between categories."""
         correlations = {}
         
-        # This is a simplified correlation calculation
-        # In a real implementation, you would use statistical methods
-        categories = list(category_results.keys())
+        # This is a simplified correlation calculation: the average Jaccard
+        # similarity of the categories' top topics and top tags. Only pairs
+        # sharing at least one item can pass the threshold, so just those are
+        # scored. In a real implementation, you would use statistical methods
+        positions = {category: position for position, category in enumerate(index.categories)}
+        shared_counts = index.shared_item_counts()
         
-        for i, cat1 in enumerate(categories):
-            for cat2 in categories[i+1:]:
-                # Calculate correlation based on shared topics/tags
-                correlation_score = self._calculate_simple_correlation(
-                    category_results[cat1],
-                    category_results[cat2]
-                )
-                
-                if correlation_score > 0.3:  # Threshold for significant correlation
-                    correlations[f"{cat1}-{cat2}"] = {
-                        'correlation_score': correlation_score,
-                        'strength': 'strong' if correlation_score > 0.7 else 'medium'
-                    }
+        for cat1, cat2 in sorted(shared_counts, key=lambda pair: (positions[pair[0]], positions[pair[1]])):
+            correlation_score = self._calculate_simple_correlation(index, cat1, cat2, shared_counts[(cat1, cat2)])
+            
+            if correlation_score > 0.3:  # Threshold for significant correlation
+                correlations[f"{cat1}-{cat2}"] = {
+                    'correlation_score': correlation_score,
+                    'strength': 'strong' if correlation_score > 0.7 else 'medium'
+                }
         
         return correlations
 
-    def _calculate_simple_correlation(self, results1: Dict[str, Any], results2: Dict[str, Any]) -> float:
-        """Calculate a simple correlation score between two category results."""
-        # This is a simplified correlation calculation
-        # In a real implementation, you would use proper statistical methods
-        
-        data1 = results1.get('data_summary', {})
-        data2 = results2.get('data_summary', {})
-        
-        # Compare topics
-        topics1 = set(topic['topic'] for topic in data1.get('top_topics', []))
-        topics2 = set(topic['topic'] for topic in data2.get('top_topics', []))
-        
-        topic_overlap = len(topics1.intersection(topics2))
-        topic_union = len(topics1.union(topics2))
-        
-        topic_correlation = topic_overlap / topic_union if topic_union > 0 else 0
-        
-        # Compare tags
-        tags1 = set(tag['tag'] for tag in data1.get('top_tags', []))
-        tags2 = set(tag['tag'] for tag in data2.get('top_tags', []))
-        
-        tag_overlap = len(tags1.intersection(tags2))
-        tag_union = len(tags1.union(tags2))
-        
-        tag_correlation = tag_overlap / tag_union if tag_union > 0 else 0
-        
-        # Average the correlations
-        return (topic_correlation + tag_correlation) / 2
+    def _calculate_simple_correlation(
+        self,
+        index: CategoryIndex,
+        cat1: str,
+        cat2: str,
+        shared: Dict[str, int]
+    ) -> float:
+        """Calculate a simple correlation score between two categories from their shared item counts."""
+        correlations = []
+        for item_type in INDEXED_ITEM_FIELDS:
+            item_counts = index.category_item_counts[item_type]
+            overlap = shared[item_type]
+            union = item_counts[cat1] + item_counts[cat2] - overlap
+            correlations.append(overlap / union if union > 0 else 0)
+        
+        # Average the topic and tag correlations
+        return sum(correlations) / len(correlations)
 
-    def _generate_resource_allocation_recommendations(self, category_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
-        """Generate resource allocation recommendations."""
+    def _generate_resource_allocation_recommendations(self, sorted_priorities: List[Tuple[str, float]]) -> Dict[str, Any]:
+        """Generate resource allocation recommendations from categories sorted by priority score."""
         recommendations = {
             'high_priority_categories': [],
             'medium_priority_categories': [],
             'low_priority_categories': [],
             'resource_suggestions': {}
         }
-        
-        # Calculate priority scores for each category
-        category_priorities = {}
-        for category, results in category_results.items():
-            data_summary = results.get('data_summary', {})
-            analysis_results = results.get('analysis_results', {})
-            
-            volume = data_summary.get('filtered_conversations', 0)
-            escalation_rate = analysis_results.get('escalation_analysis', {}).get('escalation_rate', 0)
-            failure_rate = analysis_results.get('failure_analysis', {}).get('failure_rate', 0)
-            
-            priority_score = (volume * 0.4) + (escalation_rate * 0.3) + (failure_rate * 0.3)
-            category_priorities[category] = priority_score
-        
-        # Sort categories by priority
-        sorted_priorities = sorted(category_priorities.items(), key=lambda x: x[1], reverse=True)
-        
+
         # Categorize by priority level
         total_categories = len(sorted_priorities)
         high_count = max(1, total_categories // 3)
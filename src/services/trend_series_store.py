@@ -0,0 +1,182 @@
+"""
+Rolling per-topic weekly series for TrendAgent.
+
+Each saved week appends one point per topic (volume and numeric sentiment
+scores) to a small JSON file. Only the most recent ``max_points`` weeks are
+kept, so reading history for trend calculation costs the same no matter how
+many weeks have been analyzed. Legacy ``week_*.json`` files are folded in once,
+the first time the store is created next to them.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SERIES_FORMAT_VERSION = 1
+
+
+class TrendSeriesStore:
+    """
+    Weekly topic series persisted as one JSON file.
+
+    Layout: ``weeks`` lists the retained weeks in week_id order, ``volume`` maps
+    topic -> {week_id: volume} and ``sentiment`` maps topic -> {key: {week_id: value}}.
+    Appending a week that is already retained replaces its points in place;
+    a backfilled week is slotted in by week_id, and one older than a full
+    window is ignored.
+    """
+
+    def __init__(self, path: Path, max_points: int = 12):
+        if max_points < 1:
+            raise ValueError("max_points must be at least 1")
+        self.path = Path(path)
+        self.max_points = max_points
+        self.weeks: List[Dict[str, str]] = []
+        self.weeks_recorded = 0
+        self.volume: Dict[str, Dict[str, float]] = {}
+        self.sentiment: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.weeks)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if payload.get('version') != SERIES_FORMAT_VERSION:
+                logger.warning(f"Ignoring trend series {self.path}: unsupported format version")
+                return
+            self.weeks = sorted(payload['weeks'], key=lambda week: week['week_id'])
+            self.weeks_recorded = int(payload.get('weeks_recorded', len(self.weeks)))
+            self.volume = payload.get('volume', {})
+            self.sentiment = payload.get('sentiment', {})
+        except Exception as e:
+            logger.warning(f"Could not load trend series {self.path}: {e}")
+        self._prune()
+
+    def save(self) -> None:
+        """Write the series atomically as JSON."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'version': SERIES_FORMAT_VERSION,
+            'weeks_recorded': self.weeks_recorded,
+            'weeks': self.weeks,
+            'volume': self.volume,
+            'sentiment': self.sentiment
+        }
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    def append_week(self, week_id: str, results: Dict[str, Any], timestamp: Optional[str] = None) -> None:
+        """Record one week's topic volumes and numeric sentiment scores (in memory; call save())."""
+        timestamp = timestamp or datetime.now().isoformat()
+        existing = next((week for week in self.weeks if week['week_id'] == week_id), None)
+        if existing is not None:
+            # Re-run of a retained week: replace its points
+            existing['timestamp'] = timestamp
+            self._drop_week_points({week_id})
+        elif len(self.weeks) >= self.max_points and week_id < self.weeks[0]['week_id']:
+            logger.debug(f"Ignoring week {week_id}: older than the retained trend window")
+            return
+        else:
+            index = next(
+                (i for i, week in enumerate(self.weeks) if week['week_id'] > week_id),
+                len(self.weeks)
+            )
+            self.weeks.insert(index, {'week_id': week_id, 'timestamp': timestamp})
+            self.weeks_recorded += 1
+
+        for topic, stats in (results.get('topic_distribution') or {}).items():
+            volume = stats.get('volume', 0) if isinstance(stats, dict) else stats
+            if _is_number(volume):
+                self.volume.setdefault(topic, {})[week_id] = volume
+
+        for topic, scores in (results.get('topic_sentiments') or {}).items():
+            if not isinstance(scores, dict):
+                continue
+            for key, value in scores.items():
+                if _is_number(value):
+                    self.sentiment.setdefault(topic, {}).setdefault(key, {})[week_id] = value
+
+        self._prune()
+
+    def bootstrap_from_weeks(self, weeks: Iterable[Dict[str, Any]]) -> int:
+        """Fold legacy per-week result files (oldest first) into the series. Returns weeks added."""
+        added = 0
+        for week in weeks:
+            try:
+                self.append_week(week['week_id'], week.get('results') or {}, week.get('timestamp'))
+                added += 1
+            except Exception as e:
+                logger.warning(f"Skipping legacy week {week.get('week_id')}: {e}")
+        return added
+
+    def history(self, points: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        The last *points* retained weeks as TrendAgent historical entries, oldest first.
+
+        Each entry has ``week_id``, ``timestamp`` and ``results`` holding
+        ``topic_distribution`` ({topic: {'volume': n}}) and ``topic_sentiments``.
+        """
+        weeks = self.weeks[-points:] if points else self.weeks
+        history = [
+            {
+                'week_id': week['week_id'],
+                'timestamp': week['timestamp'],
+                'results': {'topic_distribution': {}, 'topic_sentiments': {}}
+            }
+            for week in weeks
+        ]
+        by_week = {entry['week_id']: entry['results'] for entry in history}
+
+        for topic, series in self.volume.items():
+            for week_id, value in series.items():
+                if week_id in by_week:
+                    by_week[week_id]['topic_distribution'][topic] = {'volume': value}
+
+        for topic, keys in self.sentiment.items():
+            for key, series in keys.items():
+                for week_id, value in series.items():
+                    if week_id in by_week:
+                        by_week[week_id]['topic_sentiments'].setdefault(topic, {})[key] = value
+
+        return history
+
+    def _prune(self) -> None:
+        """Keep only the max_points latest weeks by week_id and drop topics without retained points."""
+        if len(self.weeks) > self.max_points:
+            dropped = {week['week_id'] for week in self.weeks[:-self.max_points]}
+            self.weeks = self.weeks[-self.max_points:]
+            self._drop_week_points(dropped)
+
+    def _drop_week_points(self, week_ids: set) -> None:
+        for topic in list(self.volume):
+            series = self.volume[topic]
+            for week_id in week_ids & series.keys():
+                del series[week_id]
+            if not series:
+                del self.volume[topic]
+
+        for topic in list(self.sentiment):
+            keys = self.sentiment[topic]
+            for key in list(keys):
+                for week_id in week_ids & keys[key].keys():
+                    del keys[key][week_id]
+                if not keys[key]:
+                    del keys[key]
+            if not keys:
+                del self.sentiment[topic]
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
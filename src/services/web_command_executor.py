@@ -39,6 +39,8 @@ class WebCommandExecutor:
     
     # Security constants
     MAX_OUTPUT_LINES = 10000  # Maximum number of output lines to buffer
+    OUTPUT_READ_CHUNK_SIZE = 64 * 1024  # Bytes read from a process pipe per block
+    OUTPUT_QUEUE_BATCHES = 64  # Line batches buffered between pipe readers and the consumer
     MAX_ARG_LENGTH = 1024  # Maximum length of a single argument
     MAX_ARGS_COUNT = 100  # Maximum number of arguments
     MAX_REQUEST_SIZE = 10 * 1024 * 1024  # 10MB max request payload
@@ -75,7 +77,7 @@ class WebCommandExecutor:
                 "--include-comments", "--include-votes", "--include-trends",
                 "--separate-agent-feedback",
                 # Debugging and audit options
-                "--audit-trail", "--analyze-troubleshooting",
+                "--audit-trail", "--analyze-troubleshooting", "--profile",
                 # Other options
                 "--export-format", "--limit", "--category", "--subcategory", "--filter-category"
             },
@@ -124,6 +126,9 @@ class WebCommandExecutor:
         (r'\b[a-f0-9]{32,}\b', '[HEX_TOKEN_REDACTED]'),
     ]
     
+    # Precompiled once; applied in order, since a replacement can create a match for a later pattern
+    _REDACTION_RULES = [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in SENSITIVE_PATTERNS]
+    
     # Stack trace patterns to filter
     STACK_TRACE_PATTERNS = [
         r'Traceback \(most recent call last\):.*?(?=\n[A-Z]|\Z)',
@@ -159,8 +164,8 @@ class WebCommandExecutor:
         filtered = text
         
         # Apply sensitive pattern filtering
-        for pattern, replacement in self.SENSITIVE_PATTERNS:
-            filtered = re.sub(pattern, replacement, filtered, flags=re.IGNORECASE)
+        for pattern, replacement in self._REDACTION_RULES:
+            filtered = pattern.sub(replacement, filtered)
         
         # Stack trace filtering DISABLED for easier debugging
         # Uncomment to re-enable in production:
@@ -334,79 +339,74 @@ class WebCommandExecutor:
         # Fall back to project root (3 levels up from this file)
         return Path(__file__).resolve().parent.parent.parent
     
-    async def _merge_async_iters(
+    async def _merge_output_streams(
         self, 
-        stdout_iter: AsyncIterator[bytes], 
-        stderr_iter: AsyncIterator[bytes],
+        stdout: asyncio.StreamReader, 
+        stderr: asyncio.StreamReader,
         execution_id: str
-    ) -> AsyncIterator[tuple[str, str]]:
+    ) -> AsyncIterator[tuple[str, List[str]]]:
         """
-        Merge stdout and stderr async iterators to avoid deadlock.
+        Merge stdout and stderr into batches of lines without deadlocking.
         
-        This drains both streams concurrently so neither can fill its pipe buffer
-        and block the process.
+        One long-lived reader task per stream drains its pipe in blocks of
+        OUTPUT_READ_CHUNK_SIZE bytes, so neither pipe can fill up and block the
+        process. Each block is split into complete lines (a trailing partial
+        line is carried over to the next block) and pushed as one batch to a
+        shared bounded queue.
         
         Args:
-            stdout_iter: Async iterator for stdout lines
-            stderr_iter: Async iterator for stderr lines
+            stdout: Process stdout stream
+            stderr: Process stderr stream
             execution_id: Execution ID for tracking
             
         Yields:
-            Tuples of (stream_type, data) where stream_type is "stdout" or "stderr"
+            Tuples of (stream_type, lines) where stream_type is "stdout" or "stderr"
         """
-        # Create tasks for both streams
-        stdout_queue: asyncio.Queue = asyncio.Queue()
-        stderr_queue: asyncio.Queue = asyncio.Queue()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.OUTPUT_QUEUE_BATCHES)
         
-        async def read_stream(stream_iter: AsyncIterator[bytes], stream_type: str, queue: asyncio.Queue):
-            """Read from a stream and put lines into a queue."""
+        async def read_stream(stream: asyncio.StreamReader, stream_type: str):
+            """Read a stream in blocks and put batches of complete lines into the queue."""
+            carry = b""
             try:
-                async for line in stream_iter:
-                    await queue.put((stream_type, line))
+                while True:
+                    chunk = await stream.read(self.OUTPUT_READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    complete, newline, carry = (carry + chunk).rpartition(b"\n")
+                    if newline:
+                        text = complete.decode('utf-8', errors='replace')
+                        await queue.put((stream_type, [line.rstrip() for line in text.split("\n")]))
+                if carry:
+                    await queue.put((stream_type, [carry.decode('utf-8', errors='replace').rstrip()]))
             except Exception as e:
                 self.logger.exception(f"Error reading {stream_type} for execution {execution_id}: {e}")
                 # Put error marker in queue
-                await queue.put((stream_type, f"<Stream read error: {str(e)}>".encode()))
-            finally:
-                await queue.put((stream_type, None))  # Signal end of stream
+                await queue.put((stream_type, [f"<Stream read error: {str(e)}>"]))
+            # Signal end of stream (not on cancellation, when nobody is consuming)
+            await queue.put((stream_type, None))
         
         # Start reader tasks
-        stdout_task = asyncio.create_task(read_stream(stdout_iter, "stdout", stdout_queue))
-        stderr_task = asyncio.create_task(read_stream(stderr_iter, "stderr", stderr_queue))
+        readers = [
+            asyncio.create_task(read_stream(stdout, "stdout")),
+            asyncio.create_task(read_stream(stderr, "stderr"))
+        ]
         
         # Track which streams are still active
         active_streams = {"stdout", "stderr"}
         
         try:
             while active_streams:
-                # Wait for data from either queue
-                done, pending = await asyncio.wait(
-                    [
-                        asyncio.create_task(stdout_queue.get()) if "stdout" in active_streams else asyncio.sleep(float('inf')),
-                        asyncio.create_task(stderr_queue.get()) if "stderr" in active_streams else asyncio.sleep(float('inf'))
-                    ],
-                    return_when=asyncio.FIRST_COMPLETED
-                )
-                
-                for task in done:
-                    stream_type, data = await task
-                    if data is None:
-                        # Stream ended
-                        active_streams.discard(stream_type)
-                    else:
-                        yield (stream_type, data.decode('utf-8', errors='replace').rstrip())
-                
-                # Cancel pending tasks
-                for task in pending:
-                    task.cancel()
+                stream_type, lines = await queue.get()
+                if lines is None:
+                    # Stream ended
+                    active_streams.discard(stream_type)
+                else:
+                    yield (stream_type, lines)
         finally:
             # Ensure reader tasks are cleaned up
-            stdout_task.cancel()
-            stderr_task.cancel()
-            try:
-                await asyncio.gather(stdout_task, stderr_task, return_exceptions=True)
-            except asyncio.CancelledError:
-                pass
+            for task in readers:
+                task.cancel()
+            await asyncio.gather(*readers, return_exceptions=True)
     
     async def execute_command(
         self, 
@@ -584,51 +584,60 @@ class WebCommandExecutor:
             )
             
             # Stream output from both stdout and stderr concurrently to avoid deadlock
-            async for stream_type, line_data in self._merge_async_iters(
+            output_buffer = self.execution_states[execution_id]["output_buffer"]
+            async for stream_type, lines in self._merge_output_streams(
                 process.stdout, process.stderr, execution_id
             ):
-                if line_data:  # Skip empty lines
-                    line_count[stream_type] += 1
-                    total_lines = line_count["stdout"] + line_count["stderr"]
-                    
-                    # Filter sensitive data from output
-                    filtered_data = self._filter_sensitive_output(line_data)
-                    
-                    # Rich logging: Every 100 lines or for stderr
-                    if total_lines % 100 == 0 or stream_type == "stderr":
-                        elapsed_stream = time.time() - stream_start_time
-                        lines_per_sec = total_lines / elapsed_stream if elapsed_stream > 0 else 0
-                        self.logger.debug(
-                            f"[EXEC] Output line #{total_lines} for {execution_id} | "
-                            f"Type: {stream_type} | "
-                            f"Lines/sec: {lines_per_sec:.1f} | "
-                            f"Stdout: {line_count['stdout']} | Stderr: {line_count['stderr']}"
-                        )
-                    
-                    # Log stderr to Railway logs for debugging
-                    if stream_type == "stderr":
+                # Filter sensitive data from output, skipping empty lines
+                timestamp = datetime.now(timezone.utc).isoformat()
+                entries = [
+                    {"type": stream_type, "data": self._filter_sensitive_output(line), "timestamp": timestamp}
+                    for line in lines if line
+                ]
+                if not entries:
+                    continue
+                
+                previous_total = line_count["stdout"] + line_count["stderr"]
+                previous_count = line_count[stream_type]
+                line_count[stream_type] += len(entries)
+                total_lines = previous_total + len(entries)
+                
+                # Rich logging: Once per batch crossing a 100-line mark, or for stderr
+                if total_lines // 100 > previous_total // 100 or stream_type == "stderr":
+                    elapsed_stream = time.time() - stream_start_time
+                    lines_per_sec = total_lines / elapsed_stream if elapsed_stream > 0 else 0
+                    self.logger.debug(
+                        f"[EXEC] Output line #{total_lines} for {execution_id} | "
+                        f"Type: {stream_type} | "
+                        f"Batch: {len(entries)} lines | "
+                        f"Lines/sec: {lines_per_sec:.1f} | "
+                        f"Stdout: {line_count['stdout']} | Stderr: {line_count['stderr']}"
+                    )
+                
+                # Log stderr to Railway logs for debugging
+                if stream_type == "stderr":
+                    for offset, entry in enumerate(entries, start=1):
                         self.logger.warning(
-                            f"[EXEC] stderr line #{line_count['stderr']} for {execution_id}: {filtered_data[:200]}"
+                            f"[EXEC] stderr line #{previous_count + offset} for {execution_id}: {entry['data'][:200]}"
                         )
-                    
-                    # Buffer output with bounded deque (automatically drops oldest)
-                    self.execution_states[execution_id]["output_buffer"].append({
-                        "type": stream_type,
-                        "data": filtered_data,
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                    })
-                    
-                    # Yield with rich metadata
+                
+                # Buffer output with bounded deque (automatically drops oldest)
+                output_buffer.extend(entries)
+                
+                # Yield each line with rich metadata
+                stream_counts = dict(line_count)
+                for offset, entry in enumerate(entries, start=1):
+                    stream_counts[stream_type] = previous_count + offset
                     yield {
                         "type": stream_type,
-                        "data": filtered_data,
+                        "data": entry["data"],
                         "execution_id": execution_id,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": timestamp,
                         "_line_metadata": {
-                            "line_number": total_lines,
+                            "line_number": previous_total + offset,
                             "stream_type": stream_type,
-                            "stdout_count": line_count["stdout"],
-                            "stderr_count": line_count["stderr"]
+                            "stdout_count": stream_counts["stdout"],
+                            "stderr_count": stream_counts["stderr"]
                         }
                     }
             
@@ -23,6 +23,10 @@ Usage:
     
     # Agent reasoning:
     self.thinking_logger.log_reasoning(agent_name, decision, rationale)
+
+File output goes through the shared background LogSink, so agents never block
+on log file I/O. Structured events are also streamed to <log>.events.jsonl
+(PII-scrubbed on the writer thread).
 """
 
 import logging
@@ -35,6 +39,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
 
+from src.utils.log_sink import get_log_sink
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,6 +61,7 @@ class AgentThinkingLogger:
     _console = Console()
     _log_file = None
     _events = []  # Structured events for JSON export
+    _sink = None  # Background writer for log file output
     
     @classmethod
     def get_logger(cls):
@@ -71,6 +78,7 @@ class AgentThinkingLogger:
         cls._events = []  # Reset events list
         
         if output_file:
+            cls._sink = get_log_sink()
             # Create file and write header with PACIFIC TIME
             from src.utils.timezone_utils import get_pacific_time
             pacific_now = get_pacific_time()
@@ -88,8 +96,27 @@ class AgentThinkingLogger:
     @classmethod
     def disable(cls):
         """Disable agent thinking logging"""
+        cls.flush()
         cls._enabled = False
     
+    @classmethod
+    def flush(cls, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until queued log output has been written (call at stage boundaries and shutdown)"""
+        if cls._sink is None:
+            return True
+        return cls._sink.flush(timeout)
+    
+    def _write(self, text: str):
+        """Queue text for the log file"""
+        if self._log_file and self._sink:
+            self._sink.write_text(self._log_file, text)
+    
+    def _record_event(self, event: Dict[str, Any]):
+        """Keep an event for JSON export and stream it to the events JSONL file"""
+        self._events.append(event)
+        if self._log_file and self._sink:
+            self._sink.write_json(self._log_file.with_suffix('.events.jsonl'), event, scrub=True)
+    
     @classmethod
     def is_enabled(cls):
         """Check if full thinking logging is enabled"""
@@ -147,24 +174,19 @@ class AgentThinkingLogger:
         
         # File output
         if self._log_file:
-            with open(self._log_file, 'a') as f:
-                f.write(f"\n{'='*80}\n")
-                f.write(f"🤖 {agent_name}: PROMPT\n")
-                f.write(f"Time: {timestamp}\n")
-                f.write(f"{'='*80}\n\n")
-                if context:
-                    f.write("Context:\n")
-                    for key, value in context.items():
-                        f.write(f"  {key}: {value}\n")
-                    f.write("\n")
-                f.write(prompt)
-                f.write("\n\n")
+            lines = [f"\n{'='*80}\n", f"🤖 {agent_name}: PROMPT\n", f"Time: {timestamp}\n", f"{'='*80}\n\n"]
+            if context:
+                lines.append("Context:\n")
+                lines.extend(f"  {key}: {value}\n" for key, value in context.items())
+                lines.append("\n")
+            lines.append(f"{prompt}\n\n")
+            self._write("".join(lines))
         
         # Structured JSON event (for observability)
         if self._enabled:
             from src.utils.timezone_utils import get_pacific_time
             pacific_now = get_pacific_time()
-            self._events.append({
+            self._record_event({
                 'event_type': 'prompt',
                 'agent': agent_name,
                 'timestamp': pacific_now.isoformat(),
@@ -207,20 +229,18 @@ class AgentThinkingLogger:
         
         # File output
         if self._log_file:
-            with open(self._log_file, 'a') as f:
-                f.write(f"{'─'*80}\n")
-                f.write(f"🤖 {agent_name}: LLM RESPONSE\n")
-                if tokens_used:
-                    f.write(f"Tokens: {tokens_used} | Model: {model or 'unknown'}\n")
-                f.write(f"{'─'*80}\n\n")
-                f.write(response_text)
-                f.write("\n\n")
+            lines = [f"{'─'*80}\n", f"🤖 {agent_name}: LLM RESPONSE\n"]
+            if tokens_used:
+                lines.append(f"Tokens: {tokens_used} | Model: {model or 'unknown'}\n")
+            lines.append(f"{'─'*80}\n\n")
+            lines.append(f"{response_text}\n\n")
+            self._write("".join(lines))
         
         # Structured JSON event (for observability)
         if self._enabled:
             from src.utils.timezone_utils import get_pacific_time
             pacific_now = get_pacific_time()
-            self._events.append({
+            self._record_event({
                 'event_type': 'response',
                 'agent': agent_name,
                 'timestamp': pacific_now.isoformat(),
@@ -257,15 +277,12 @@ class AgentThinkingLogger:
         
         # File output
         if self._log_file:
-            with open(self._log_file, 'a') as f:
-                f.write(f"💭 {agent_name}: REASONING\n")
-                f.write(f"Decision: {decision}\n")
-                f.write(f"Rationale: {rationale}\n")
-                if data:
-                    f.write("\nSupporting Data:\n")
-                    for key, value in data.items():
-                        f.write(f"  {key}: {value}\n")
-                f.write("\n")
+            lines = [f"💭 {agent_name}: REASONING\n", f"Decision: {decision}\n", f"Rationale: {rationale}\n"]
+            if data:
+                lines.append("\nSupporting Data:\n")
+                lines.extend(f"  {key}: {value}\n" for key, value in data.items())
+            lines.append("\n")
+            self._write("".join(lines))
     
     def log_validation(
         self,
@@ -288,11 +305,7 @@ class AgentThinkingLogger:
         
         # File output
         if self._log_file:
-            with open(self._log_file, 'a') as f:
-                f.write(f"{status} {check_name}\n")
-                if details:
-                    f.write(f"  {details}\n")
-                f.write("\n")
+            self._write(f"{status} {check_name}\n" + (f"  {details}\n" if details else "") + "\n")
     
     def log_error(
         self,
@@ -314,7 +327,7 @@ class AgentThinkingLogger:
         
         # Structured JSON event (always tracked in metrics mode)
         if self._enabled or self._metrics_mode:
-            self._events.append({
+            self._record_event({
                 'event_type': 'error',
                 'agent': agent_name,
                 'timestamp': pacific_now.isoformat(),
@@ -341,7 +354,7 @@ class AgentThinkingLogger:
         from src.utils.timezone_utils import get_pacific_time
         pacific_now = get_pacific_time()
         
-        self._events.append({
+        self._record_event({
             'event_type': 'error',
             'agent': agent_name,
             'timestamp': pacific_now.isoformat(),
@@ -364,6 +377,8 @@ class AgentThinkingLogger:
             logger.debug("No events to export")
             return None
         
+        self.flush()
+        
         if output_file is None:
             # Auto-generate filename based on mode
             from src.utils.output_manager import get_output_file_path
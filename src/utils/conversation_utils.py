@@ -11,6 +11,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG = re.compile(r'<[^>]+>')
+_WHITESPACE_RUN = re.compile(r'\s+')
+
 
 def extract_conversation_text(conversation: Dict[str, Any], clean_html: bool = True) -> str:
     """
@@ -37,7 +40,7 @@ def extract_conversation_text(conversation: Dict[str, Any], clean_html: bool = T
             body = source.get('body', '')
             if body:
                 if clean_html:
-                    body = _clean_html(body)
+                    body = clean_html_text(body)
                 text_parts.append(body)
         
         # Extract from conversation parts (replies)
@@ -54,7 +57,7 @@ def extract_conversation_text(conversation: Dict[str, Any], clean_html: bool = T
                 body = part.get('body', '')
                 if body:
                     if clean_html:
-                        body = _clean_html(body)
+                        body = clean_html_text(body)
                     text_parts.append(body)
         
         # Optionally extract from notes
@@ -66,7 +69,7 @@ def extract_conversation_text(conversation: Dict[str, Any], clean_html: bool = T
                     body = note.get('body', '')
                     if body:
                         if clean_html:
-                            body = _clean_html(body)
+                            body = clean_html_text(body)
                         text_parts.append(body)
     
     except Exception as e:
@@ -99,7 +102,7 @@ def extract_customer_messages(conversation: Dict[str, Any], clean_html: bool = T
                 body = source.get('body', '').strip()
                 if body:
                     if clean_html:
-                        body = _clean_html(body)
+                        body = clean_html_text(body)
                     customer_msgs.append(body)
         
         # Extract from conversation parts
@@ -118,7 +121,7 @@ def extract_customer_messages(conversation: Dict[str, Any], clean_html: bool = T
                     body = part.get('body', '').strip()
                     if body:
                         if clean_html:
-                            body = _clean_html(body)
+                            body = clean_html_text(body)
                         customer_msgs.append(body)
     
     except Exception as e:
@@ -152,7 +155,7 @@ def extract_admin_messages(conversation: Dict[str, Any], clean_html: bool = True
                 body = source.get('body', '').strip()
                 if body:
                     if clean_html:
-                        body = _clean_html(body)
+                        body = clean_html_text(body)
                     admin_msgs.append(body)
         
         # Extract from conversation parts
@@ -171,7 +174,7 @@ def extract_admin_messages(conversation: Dict[str, Any], clean_html: bool = True
                     body = part.get('body', '').strip()
                     if body:
                         if clean_html:
-                            body = _clean_html(body)
+                            body = clean_html_text(body)
                         admin_msgs.append(body)
     
     except Exception as e:
@@ -180,7 +183,7 @@ def extract_admin_messages(conversation: Dict[str, Any], clean_html: bool = True
     return admin_msgs
 
 
-def _clean_html(text: str) -> str:
+def clean_html_text(text: str) -> str:
     """
     Remove HTML tags and clean up text content.
     
@@ -194,7 +197,7 @@ def _clean_html(text: str) -> str:
         return ''
     
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _HTML_TAG.sub('', text)
     
     # Decode common HTML entities
     text = text.replace('&nbsp;', ' ')
@@ -205,7 +208,7 @@ def _clean_html(text: str) -> str:
     text = text.replace('&#39;', "'")
     
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RUN.sub(' ', text)
     
     return text.strip()
 
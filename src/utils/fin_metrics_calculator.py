@@ -14,6 +14,12 @@ from typing import Dict, List, Any
 logger = logging.getLogger(__name__)
 
 
+ESCALATION_PHRASES = [
+    'speak to human', 'talk to agent', 'real person',
+    'human support', 'talk to someone', 'speak to someone'
+]
+
+
 def calculate_dual_metrics(conversations: List[Dict]) -> Dict[str, Any]:
     """
     Calculate both Intercom-compatible and quality-adjusted Fin metrics.
@@ -25,19 +31,43 @@ def calculate_dual_metrics(conversations: List[Dict]) -> Dict[str, Any]:
         Dict with both metric sets and comparison
     """
     if not conversations:
+        return summarize_dual_metrics(0, 0, 0)
+    
+    from src.services.fin_escalation_analyzer import is_fin_resolved
+    
+    deflected_count = sum(1 for conv in conversations if is_deflected(conv))
+    resolved_count = sum(1 for conv in conversations if is_fin_resolved(conv))
+    
+    return summarize_dual_metrics(len(conversations), deflected_count, resolved_count)
+
+
+def summarize_dual_metrics(total: int, deflected_count: int, resolved_count: int) -> Dict[str, Any]:
+    """
+    Build the dual metric sets from per-conversation counts.
+    
+    Callers that already evaluated is_deflected()/is_fin_resolved() for each
+    conversation use this instead of calculate_dual_metrics() to avoid a second pass.
+    
+    Args:
+        total: Number of Fin-involved conversations
+        deflected_count: Conversations passing is_deflected()
+        resolved_count: Conversations passing is_fin_resolved()
+        
+    Returns:
+        Dict with both metric sets and comparison
+    """
+    if total == 0:
         return {
             'intercom_compatible': _empty_metrics(),
             'quality_adjusted': _empty_metrics(),
             'comparison': {}
         }
     
-    total = len(conversations)
-    
     # Calculate Intercom-compatible metrics
-    intercom_metrics = _calculate_intercom_compatible(conversations)
+    intercom_metrics = _calculate_intercom_compatible(total, deflected_count)
     
     # Calculate quality-adjusted metrics (existing strict criteria)
-    quality_metrics = _calculate_quality_adjusted(conversations)
+    quality_metrics = _calculate_quality_adjusted(total, resolved_count)
     
     # Calculate the gap
     comparison = {
@@ -57,72 +87,69 @@ def calculate_dual_metrics(conversations: List[Dict]) -> Dict[str, Any]:
     }
 
 
-def _calculate_intercom_compatible(conversations: List[Dict]) -> Dict[str, Any]:
+def is_deflected(conv: Dict, text: str = None) -> bool:
     """
-    Calculate Intercom-compatible metrics (matches their native reporting).
+    Intercom-compatible deflection check for one conversation.
     
-    Deflection = Fin answered AND customer didn't escalate to human
-    (Liberal criteria - similar to Intercom's)
+    Deflected = No admin PARTICIPATED AND customer didn't request human
+    
+    Args:
+        conv: Conversation dict
+        text: Optional precomputed lowercased conversation text (clean_html=True)
     """
-    total = len(conversations)
-    deflected = []
-    
-    for conv in conversations:
-        # CRITICAL FIX: Check if admin actually PARTICIPATED (not just assigned)
-        # admin_assignee_id represents ASSIGNMENT (routing), not PARTICIPATION
-        # We need to check conversation_parts for actual admin messages
-        conversation_parts = conv.get('conversation_parts', {})
-        if isinstance(conversation_parts, dict):
-            parts_list = conversation_parts.get('conversation_parts', [])
-        elif isinstance(conversation_parts, list):
-            parts_list = conversation_parts
-        else:
-            parts_list = []
-        
-        # Check if any admin actually sent a message (PARTICIPATION, not assignment)
-        admin_participated = any(
-            part.get('author', {}).get('type') == 'admin'
-            for part in parts_list
-            if isinstance(part, dict)
-        )
-        
-        # Also check if customer explicitly requested human in text
+    # CRITICAL FIX: Check if admin actually PARTICIPATED (not just assigned)
+    # admin_assignee_id represents ASSIGNMENT (routing), not PARTICIPATION
+    # We need to check conversation_parts for actual admin messages
+    conversation_parts = conv.get('conversation_parts', {})
+    if isinstance(conversation_parts, dict):
+        parts_list = conversation_parts.get('conversation_parts', [])
+    elif isinstance(conversation_parts, list):
+        parts_list = conversation_parts
+    else:
+        parts_list = []
+    
+    # Check if any admin actually sent a message (PARTICIPATION, not assignment)
+    admin_participated = any(
+        part.get('author', {}).get('type') == 'admin'
+        for part in parts_list
+        if isinstance(part, dict)
+    )
+    if admin_participated:
+        return False
+    
+    # Also check if customer explicitly requested human in text
+    if text is None:
         from src.utils.conversation_utils import extract_conversation_text
         text = extract_conversation_text(conv, clean_html=True).lower()
-        
-        escalation_phrases = [
-            'speak to human', 'talk to agent', 'real person',
-            'human support', 'talk to someone', 'speak to someone'
-        ]
-        requested_human = any(phrase in text for phrase in escalation_phrases)
-        
-        # Deflected = No admin PARTICIPATED AND customer didn't request human
-        if not admin_participated and not requested_human:
-            deflected.append(conv)
     
+    return not any(phrase in text for phrase in ESCALATION_PHRASES)
+
+
+def _calculate_intercom_compatible(total: int, deflected_count: int) -> Dict[str, Any]:
+    """
+    Calculate Intercom-compatible metrics (matches their native reporting).
+    
+    Deflection = Fin answered AND customer didn't escalate to human
+    (Liberal criteria - similar to Intercom's)
+    """
     return {
-        'deflected_count': len(deflected),
-        'deflection_rate': round(len(deflected) / total * 100, 1) if total > 0 else 0,
+        'deflected_count': deflected_count,
+        'deflection_rate': round(deflected_count / total * 100, 1) if total > 0 else 0,
         'definition': 'Fin answered and customer did not escalate to human support',
         'methodology': 'Intercom-compatible (checks conversation_parts for actual admin participation)'
     }
 
 
-def _calculate_quality_adjusted(conversations: List[Dict]) -> Dict[str, Any]:
+def _calculate_quality_adjusted(total: int, resolved_count: int) -> Dict[str, Any]:
     """
     Calculate quality-adjusted metrics (stricter criteria for true helpfulness).
     
     Resolution = Fin actually solved the problem (not just deflected)
     (Strict criteria - honest assessment of quality)
     """
-    from src.services.fin_escalation_analyzer import is_fin_resolved
-    
-    total = len(conversations)
-    resolved = [conv for conv in conversations if is_fin_resolved(conv)]
-    
     return {
-        'resolved_count': len(resolved),
-        'resolution_rate': round(len(resolved) / total * 100, 1) if total > 0 else 0,
+        'resolved_count': resolved_count,
+        'resolution_rate': round(resolved_count / total * 100, 1) if total > 0 else 0,
         'definition': 'Fin truly resolved: closed OR low effort, no admin, no bad rating',
         'methodology': 'Quality-adjusted (strict criteria for true helpfulness)'
     }
@@ -0,0 +1,226 @@
+"""
+Background Log Sink
+
+Moves log file I/O off agent code paths. Callers enqueue records and return
+immediately; a daemon writer thread drains a bounded queue and appends records
+to their files in batches (one open/write per file per batch).
+
+Records are either raw text (human-readable logs) or JSON objects written as
+JSONL. JSON records can be scrubbed by the writer thread before serialization,
+so PII redaction does not run on the caller's thread.
+
+Overflow policy when the queue is full:
+- "block": wait for the writer to make room (no data loss)
+- "drop": discard the record and count it in stats['dropped']
+The shared sink takes its policy from settings.log_sink_overflow (LOG_SINK_OVERFLOW).
+
+Usage:
+    from src.utils.log_sink import get_log_sink
+
+    sink = get_log_sink()
+    sink.write_text(path, "line\\n")
+    sink.write_json(path, {'event': 'step'}, scrub=True)
+    sink.flush()  # wait until written, e.g. before reading the file
+    sink.request_flush()  # non-blocking: write what is queued now, e.g. at a stage boundary
+"""
+
+import atexit
+import json
+import logging
+import queue
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP = "drop"
+
+_STOP = object()
+
+
+class LogSink:
+    """Bounded-queue, batching log writer running on a daemon thread."""
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        overflow: str = OVERFLOW_BLOCK,
+        scrubber: Optional[Callable[[Any], Any]] = None
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            max_queue_size: Maximum queued records before the overflow policy applies
+            batch_size: Maximum records written per batch
+            flush_interval: Seconds the writer waits for more records before writing a partial batch
+            overflow: "block" or "drop" when the queue is full
+            scrubber: Function applied to JSON records enqueued with scrub=True
+        """
+        if overflow not in (OVERFLOW_BLOCK, OVERFLOW_DROP):
+            raise ValueError(f"overflow must be '{OVERFLOW_BLOCK}' or '{OVERFLOW_DROP}', got {overflow!r}")
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.scrubber = scrubber
+        self.stats = {'enqueued': 0, 'written': 0, 'dropped': 0, 'batches': 0, 'errors': 0}
+        self._stats_lock = threading.Lock()
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="log-sink-writer", daemon=True)
+        self._thread.start()
+
+    def write_text(self, path: Path, text: str) -> bool:
+        """Append raw text to path."""
+        return self._enqueue((Path(path), 'text', text, False))
+
+    def write_json(
+        self,
+        path: Path,
+        record: Dict[str, Any],
+        scrub: Union[bool, Callable[[Any], Any]] = False
+    ) -> bool:
+        """
+        Append a JSON object as one JSONL line, optionally scrubbed on the writer thread.
+        
+        scrub is True (use the sink's scrubber) or a function to apply to this record instead.
+        """
+        return self._enqueue((Path(path), 'json', record, scrub))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every record enqueued so far has been written.
+
+        Returns:
+            False if the timeout expired first
+        """
+        if self._closed:
+            return True
+        done = threading.Event()
+        if not self._put(done, block=True):
+            return False
+        return done.wait(timeout)
+
+    def request_flush(self) -> Optional[threading.Event]:
+        """
+        Ask the writer to write everything enqueued so far without waiting for it.
+
+        Returns:
+            Event set once those records are written, or None if the sink is
+            closed or the queue is full (the writer is then already busy draining it)
+        """
+        if self._closed:
+            return None
+        done = threading.Event()
+        return done if self._put(done, block=False) else None
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Write everything still queued and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['queued'] = self._queue.qsize()
+        stats['overflow'] = self.overflow
+        return stats
+
+    def _enqueue(self, record: Tuple[Path, str, Any, Any]) -> bool:
+        if self._closed:
+            return False
+        if not self._put(record, block=self.overflow == OVERFLOW_BLOCK):
+            self._count('dropped')
+            return False
+        self._count('enqueued')
+        return True
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        # Callers and the writer thread both update stats
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _put(self, item: Any, block: bool) -> bool:
+        try:
+            self._queue.put(item, block=block)
+            return True
+        except queue.Full:
+            return False
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            try:
+                # Gather a batch, but write immediately when a flush or stop is requested
+                while len(batch) < self.batch_size and isinstance(batch[-1], tuple):
+                    batch.append(self._queue.get(timeout=self.flush_interval))
+            except queue.Empty:
+                pass
+
+            stop = any(item is _STOP for item in batch)
+            self._write_batch([item for item in batch if isinstance(item, tuple)])
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if stop:
+                break
+
+    def _write_batch(self, records: List[Tuple[Path, str, Any, Any]]) -> None:
+        if not records:
+            return
+
+        chunks_by_path: Dict[Path, List[str]] = defaultdict(list)
+        for path, kind, payload, scrub in records:
+            if kind != 'json':
+                chunks_by_path[path].append(payload)
+                continue
+            try:
+                if callable(scrub):
+                    payload = scrub(payload)
+                elif scrub and self.scrubber:
+                    payload = self.scrubber(payload)
+                chunks_by_path[path].append(json.dumps(payload, default=str, ensure_ascii=False) + "\n")
+            except Exception as e:
+                self._count('errors')
+                logger.warning(f"Log sink could not serialize record for {path}: {e}")
+
+        for path, chunks in chunks_by_path.items():
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write("".join(chunks))
+                self._count('written', len(chunks))
+            except OSError as e:
+                self._count('errors')
+                logger.warning(f"Log sink failed to write {len(chunks)} records to {path}: {e}")
+        self._count('batches')
+
+
+_default_sink: Optional[LogSink] = None
+_default_sink_lock = threading.Lock()
+
+
+def get_log_sink() -> LogSink:
+    """Shared process-wide sink (queue size and overflow policy from settings); drained at interpreter exit."""
+    global _default_sink
+    with _default_sink_lock:
+        if _default_sink is None:
+            from src.config.settings import settings
+            from src.services.audit_trail import scrub_sensitive_data
+            _default_sink = LogSink(
+                max_queue_size=settings.log_sink_queue_size,
+                overflow=settings.log_sink_overflow,
+                scrubber=scrub_sensitive_data
+            )
+            atexit.register(_default_sink.close)
+        return _default_sink
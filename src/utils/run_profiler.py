@@ -0,0 +1,392 @@
+"""
+Run Profiler
+
+Per-stage performance profile for analysis runs (enabled with --profile).
+Only the topic-based voice-of-customer path (also used by 'complete') starts
+a profiler; other commands run unprofiled.
+
+Stages are opened with profile_stage() (or the @profiled decorator) and nest
+through a context variable, so concurrent asyncio tasks attribute their work to
+the stage that spawned them. Each stage records wall time, CPU time, the
+process peak RSS at the time it exited, LLM call count, tokens and prompt-cache
+hits. LLM usage is captured by wrapping the OpenAI and Anthropic SDK create()
+methods while profiling is active, so no call site has to report it.
+
+When no profiler is active, profile_stage() and @profiled cost one global
+lookup, so instrumentation can stay in place permanently.
+
+Usage:
+    from src.utils.run_profiler import start_profiling, stop_profiling, profile_stage
+
+    profiler = start_profiling("voice-of-customer")
+    with profile_stage("fetch"):
+        conversations = await fetcher.fetch_conversations_chunked(start, end)
+    stop_profiling()
+    profiler.save(get_output_file_path("profile_2024-W01.json"))
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FORMAT_VERSION = 1
+
+# Stage kinds used by the built-in instrumentation
+KIND_STAGE = "stage"
+KIND_AGENT = "agent"
+KIND_IO = "io"
+
+
+def _process_peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class StageProfile:
+    """Accumulated measurements for one stage path (e.g. 'orchestrator/TopicDetectionAgent')."""
+    path: str
+    name: str
+    kind: str = KIND_STAGE
+    parent: Optional[str] = None
+    calls: int = 0
+    errors: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    # Process-wide high-water mark (ru_maxrss) when the stage last exited, not the
+    # stage's own memory: a stage after a heavier one reports the earlier peak
+    process_peak_rss_mb: Optional[float] = None
+    llm_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    cache_hits: int = 0
+    llm_wait_seconds: float = 0.0
+
+    def add_llm_call(self, input_tokens: int, output_tokens: int, cached_tokens: int, wait_seconds: float):
+        self.llm_calls += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.cached_tokens += cached_tokens
+        self.llm_wait_seconds += wait_seconds
+        if cached_tokens:
+            self.cache_hits += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'name': self.name,
+            'kind': self.kind,
+            'parent': self.parent,
+            'calls': self.calls,
+            'errors': self.errors,
+            'wall_seconds': round(self.wall_seconds, 4),
+            'cpu_seconds': round(self.cpu_seconds, 4),
+            'process_peak_rss_mb': (
+                round(self.process_peak_rss_mb, 1) if self.process_peak_rss_mb is not None else None
+            ),
+            'llm_calls': self.llm_calls,
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'cached_tokens': self.cached_tokens,
+            'cache_hits': self.cache_hits,
+            'llm_wait_seconds': round(self.llm_wait_seconds, 4)
+        }
+
+
+# Stages enclosing the current task, outermost first
+_stage_stack: contextvars.ContextVar[Tuple[StageProfile, ...]] = contextvars.ContextVar(
+    'run_profiler_stage_stack', default=()
+)
+
+
+class RunProfiler:
+    """
+    Collects StageProfiles for one run.
+
+    Stages with the same path are aggregated (calls counts the entries). CPU
+    time is process-wide, so stages that overlap with concurrent work include
+    that work's CPU time too; the run totals are exact.
+    """
+
+    def __init__(self, run_name: str):
+        self.run_name = run_name
+        self.started_at = datetime.now()
+        self.completed_at: Optional[datetime] = None
+        self.metadata: Dict[str, Any] = {}
+        self.totals = StageProfile(path="", name=run_name, kind="run")
+        self._stages: Dict[str, StageProfile] = {}
+        self._lock = threading.Lock()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    @contextmanager
+    def stage(self, name: str, kind: str = KIND_STAGE) -> Iterator[StageProfile]:
+        """Measure the enclosed block as a child of the current stage."""
+        stack = _stage_stack.get()
+        parent = stack[-1].path if stack else None
+        path = f"{parent}/{name}" if parent else name
+        with self._lock:
+            profile = self._stages.get(path)
+            if profile is None:
+                profile = self._stages[path] = StageProfile(path=path, name=name, kind=kind, parent=parent)
+
+        token = _stage_stack.set(stack + (profile,))
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        failed = False
+        try:
+            yield profile
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            rss = _process_peak_rss_mb()
+            with self._lock:
+                profile.calls += 1
+                profile.errors += failed
+                profile.wall_seconds += wall
+                profile.cpu_seconds += cpu
+                if rss is not None:
+                    profile.process_peak_rss_mb = max(profile.process_peak_rss_mb or 0.0, rss)
+            _stage_stack.reset(token)
+
+    def record_llm_call(
+        self,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cached_tokens: int = 0,
+        wait_seconds: float = 0.0
+    ):
+        """Attribute one LLM call to the run and every enclosing stage."""
+        with self._lock:
+            self.totals.add_llm_call(input_tokens, output_tokens, cached_tokens, wait_seconds)
+            for profile in _stage_stack.get():
+                profile.add_llm_call(input_tokens, output_tokens, cached_tokens, wait_seconds)
+
+    def record_cache_hit(self, count: int = 1):
+        """Attribute a non-LLM cache hit (e.g. a tool result cache) to the current stages."""
+        with self._lock:
+            self.totals.cache_hits += count
+            for profile in _stage_stack.get():
+                profile.cache_hits += count
+
+    def finish(self):
+        """Freeze run-level wall/CPU/RSS totals."""
+        if self.completed_at is not None:
+            return
+        self.completed_at = datetime.now()
+        self.totals.calls = 1
+        self.totals.wall_seconds = time.perf_counter() - self._wall_start
+        self.totals.cpu_seconds = time.process_time() - self._cpu_start
+        self.totals.process_peak_rss_mb = _process_peak_rss_mb()
+
+    def get_stages(self) -> List[StageProfile]:
+        """Stages in the order they were first entered."""
+        with self._lock:
+            return list(self._stages.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        totals = self.totals.to_dict()
+        for key in ('path', 'name', 'kind', 'parent', 'calls', 'errors'):
+            totals.pop(key)
+        return {
+            'version': PROFILE_FORMAT_VERSION,
+            'run_name': self.run_name,
+            'started_at': self.started_at.isoformat(),
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'pid': os.getpid(),
+            'metadata': self.metadata,
+            'totals': totals,
+            'stages': [profile.to_dict() for profile in self.get_stages()]
+        }
+
+    def save(self, path: Path) -> Path:
+        """Write the profile as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+        return path
+
+
+# ---------------------------------------------------------------------------
+# LLM SDK instrumentation
+# ---------------------------------------------------------------------------
+
+def _openai_usage(response: Any) -> Tuple[int, int, int]:
+    usage = getattr(response, 'usage', None)
+    if usage is None:
+        return 0, 0, 0
+    details = getattr(usage, 'prompt_tokens_details', None)
+    return (
+        getattr(usage, 'prompt_tokens', 0) or 0,
+        getattr(usage, 'completion_tokens', 0) or 0,
+        getattr(details, 'cached_tokens', 0) or 0
+    )
+
+
+def _anthropic_usage(response: Any) -> Tuple[int, int, int]:
+    usage = getattr(response, 'usage', None)
+    if usage is None:
+        return 0, 0, 0
+    return (
+        getattr(usage, 'input_tokens', 0) or 0,
+        getattr(usage, 'output_tokens', 0) or 0,
+        getattr(usage, 'cache_read_input_tokens', 0) or 0
+    )
+
+
+def _wrap_create(original: Callable, read_usage: Callable[[Any], Tuple[int, int, int]]) -> Callable:
+    """Wrap an SDK create() so each call is recorded on the active profiler."""
+    if inspect.iscoroutinefunction(original):
+        @functools.wraps(original)
+        async def create(*args, **kwargs):
+            profiler = _active_profiler
+            if profiler is None:
+                return await original(*args, **kwargs)
+            start = time.perf_counter()
+            response = None
+            try:
+                response = await original(*args, **kwargs)
+                return response
+            finally:
+                profiler.record_llm_call(*read_usage(response), wait_seconds=time.perf_counter() - start)
+    else:
+        @functools.wraps(original)
+        def create(*args, **kwargs):
+            profiler = _active_profiler
+            if profiler is None:
+                return original(*args, **kwargs)
+            start = time.perf_counter()
+            response = None
+            try:
+                response = original(*args, **kwargs)
+                return response
+            finally:
+                profiler.record_llm_call(*read_usage(response), wait_seconds=time.perf_counter() - start)
+
+    create._run_profiler_original = original
+    return create
+
+
+def _llm_targets() -> List[Tuple[type, Callable[[Any], Tuple[int, int, int]]]]:
+    """SDK resource classes whose create() is instrumented (missing SDKs are skipped)."""
+    targets = []
+    try:
+        from openai.resources.chat.completions import AsyncCompletions, Completions
+        targets += [(AsyncCompletions, _openai_usage), (Completions, _openai_usage)]
+    except ImportError:
+        pass
+    try:
+        from anthropic.resources.messages import AsyncMessages, Messages
+        targets += [(AsyncMessages, _anthropic_usage), (Messages, _anthropic_usage)]
+    except ImportError:
+        pass
+    return targets
+
+
+def _instrument_llm_sdks():
+    for cls, read_usage in _llm_targets():
+        create = cls.__dict__.get('create')
+        if create is not None and not hasattr(create, '_run_profiler_original'):
+            cls.create = _wrap_create(create, read_usage)
+
+
+def _restore_llm_sdks():
+    for cls, _ in _llm_targets():
+        original = getattr(cls.__dict__.get('create'), '_run_profiler_original', None)
+        if original is not None:
+            cls.create = original
+
+
+# ---------------------------------------------------------------------------
+# Module-level API
+# ---------------------------------------------------------------------------
+
+_active_profiler: Optional[RunProfiler] = None
+
+
+def start_profiling(run_name: str) -> RunProfiler:
+    """Start profiling the current run and instrument the LLM SDKs."""
+    global _active_profiler
+    if _active_profiler is not None:
+        logger.warning(f"Replacing active profiler for run '{_active_profiler.run_name}'")
+    _active_profiler = RunProfiler(run_name)
+    _instrument_llm_sdks()
+    return _active_profiler
+
+
+def stop_profiling() -> Optional[RunProfiler]:
+    """Stop profiling, restore the LLM SDKs and return the finished profiler."""
+    global _active_profiler
+    profiler, _active_profiler = _active_profiler, None
+    _restore_llm_sdks()
+    if profiler is not None:
+        profiler.finish()
+    return profiler
+
+
+def get_profiler() -> Optional[RunProfiler]:
+    """The active profiler, or None when the run is not being profiled."""
+    return _active_profiler
+
+
+@contextmanager
+def profile_stage(name: str, kind: str = KIND_STAGE) -> Iterator[Optional[StageProfile]]:
+    """Measure the enclosed block on the active profiler (no-op when profiling is off)."""
+    profiler = _active_profiler
+    if profiler is None:
+        yield None
+        return
+    with profiler.stage(name, kind) as profile:
+        yield profile
+
+
+def profiled(name: str, kind: str = KIND_STAGE) -> Callable:
+    """Decorator form of profile_stage() for sync and async functions."""
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with profile_stage(name, kind):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_stage(name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_cache_hit(count: int = 1):
+    """Count a cache hit on the active profiler (no-op when profiling is off)."""
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler.record_cache_hit(count)
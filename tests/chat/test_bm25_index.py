@@ -0,0 +1,131 @@
+"""
+Tests for the BM25 inverted index behind the RAG engine.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.chat.engines.bm25_index import BM25Index, tokenize
+from src.chat.engines.rag_engine import RAGEngine, DocumentationEntry
+
+
+@pytest.fixture
+def index():
+    idx = BM25Index()
+    idx.add_document("billing", "billing refund invoice payment subscription billing")
+    idx.add_document("api", "api integration webhook errors api troubleshooting")
+    idx.add_document("voc", "voice of customer sentiment trends weekly report")
+    return idx
+
+
+class TestBM25Index:
+    def test_tokenize_drops_stop_words(self):
+        assert tokenize("Show me the Billing report for API-v2") == ["billing", "report", "api", "v2"]
+
+    def test_search_ranks_matching_documents(self, index):
+        results = index.search("refund for billing issue", top_k=2)
+
+        assert [doc_id for doc_id, _ in results] == ["billing"]
+        assert results[0][1] > 0
+
+    def test_early_termination_matches_exhaustive_scores(self, index):
+        for i in range(50):
+            index.add_document(f"filler-{i}", f"report number {i} weekly summary")
+
+        query = "api webhook weekly report"
+        exhaustive = sorted(
+            ((doc_id, index.score(query, doc_id)) for doc_id in index.doc_lengths),
+            key=lambda item: (item[1], item[0]),
+            reverse=True
+        )[:3]
+
+        assert index.search(query, top_k=3) == pytest.approx(exhaustive)
+
+    def test_incremental_update_and_removal(self, index):
+        assert index.add_document("billing", "billing refund invoice payment subscription billing") is False
+        assert index.add_document("billing", "pricing plans") is True
+        assert index.search("refund") == []
+
+        index.remove_document("billing")
+        assert "billing" not in index
+        assert "pricing" not in index.postings
+        assert index.total_length == sum(index.doc_lengths.values())
+
+    def test_save_and_load_round_trip(self, index, tmp_path):
+        path = tmp_path / "chat" / "index.json"
+        index.save(path)
+
+        loaded = BM25Index.load(path)
+
+        assert loaded.search("api errors") == index.search("api errors")
+        assert BM25Index.load(tmp_path / "missing.json") is None
+
+
+class TestRAGEngineIndex:
+    def test_added_documents_persist_across_sessions(self, tmp_path):
+        path = tmp_path / "rag_index.json"
+        engine = RAGEngine(index_path=str(path))
+        entry = DocumentationEntry(
+            title="Churn Report Summary",
+            content="Past churn report covering cancellation reasons and retention offers",
+            command="churn-report",
+            examples=["churn-report --time-period month"],
+            tags=["churn", "cancellation", "retention"]
+        )
+
+        assert engine.add_documents([entry]) == 1
+        assert engine.add_documents([entry]) == 0
+
+        reloaded = RAGEngine(index_path=str(path))
+        docs = reloaded._retrieve_relevant_docs("churn cancellation retention report")
+
+        assert docs[0].command == "churn-report"
+        assert 0.0 < docs[0].relevance_score <= 1.0
+
+    def test_rebuild_prunes_documents_not_re_added(self, tmp_path):
+        path = tmp_path / "rag_index.json"
+        engine = RAGEngine(index_path=str(path))
+        old, kept = (
+            DocumentationEntry(
+                title=f"{name} Summary", content=f"Past {name} report", command=f"{name}-report",
+                examples=[], tags=[name]
+            )
+            for name in ("churn", "billing")
+        )
+        engine.add_documents([old, kept])
+
+        reloaded = RAGEngine(index_path=str(path))
+
+        assert reloaded.rebuild([kept]) == 1
+        assert old.doc_id not in reloaded.index
+        assert old.doc_id not in {doc.doc_id for doc in reloaded.documentation}
+        assert old.doc_id not in RAGEngine(index_path=str(path)).index
+        assert kept.doc_id in RAGEngine(index_path=str(path)).index
+
+    def test_engine_without_index_path_stays_in_memory(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        engine = RAGEngine()
+
+        engine.add_documents([DocumentationEntry(
+            title="Churn Report Summary", content="Past churn report", command="churn-report",
+            examples=[], tags=["churn"]
+        )])
+
+        assert engine._retrieve_relevant_docs("churn report")[0].command == "churn-report"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_translator_keeps_index_next_to_chat_data(self, tmp_path):
+        from src.chat.hybrid_translator import HybridCommandTranslator
+
+        settings = Mock(output_directory=str(tmp_path))
+        with patch('src.chat.hybrid_translator.SemanticCache'), \
+             patch('src.chat.hybrid_translator.FunctionCallingEngine'), \
+             patch('src.chat.hybrid_translator.IntentClassifier'):
+            translator = HybridCommandTranslator(settings)
+
+        assert translator.rag_engine.index_path == tmp_path / "chat" / "rag_index.json"
+        translator.rag_engine.add_documents([DocumentationEntry(
+            title="Churn Report Summary", content="Past churn report", command="churn-report",
+            examples=[], tags=["churn"]
+        )])
+        assert (tmp_path / "chat" / "rag_index.json").exists()
@@ -104,8 +104,9 @@ class TestFunctionCallingEngine:
 class TestRAGEngine:
     """Test RAG engine."""
     
-    def setup_method(self):
-        self.engine = RAGEngine()
+    @pytest.fixture(autouse=True)
+    def setup_engine(self, tmp_path):
+        self.engine = RAGEngine(index_path=str(tmp_path / "rag_index.json"))
     
     def test_documentation_database(self):
         """Test documentation database structure."""
@@ -259,11 +260,11 @@ class TestIntentClassifier:
 class TestEngineIntegration:
     """Test integration between engines."""
     
-    def test_engine_compatibility(self):
+    def test_engine_compatibility(self, tmp_path):
         """Test that engines can work together."""
         # Create all engines
         function_engine = FunctionCallingEngine()
-        rag_engine = RAGEngine()
+        rag_engine = RAGEngine(index_path=str(tmp_path / "rag_index.json"))
         intent_classifier = IntentClassifier()
         
         # Test that they can all handle the same query
@@ -278,12 +279,12 @@ class TestEngineIntegration:
         assert rag_result.action in [ActionType.EXECUTE_COMMAND, ActionType.CLARIFY_REQUEST]
         assert intent_result.action in [ActionType.EXECUTE_COMMAND, ActionType.CLARIFY_REQUEST]
     
-    def test_confidence_comparison(self):
+    def test_confidence_comparison(self, tmp_path):
         """Test confidence levels across engines."""
         query = "Give me last week's voice of customer report with gamma presentation"
         
         function_engine = FunctionCallingEngine()
-        rag_engine = RAGEngine()
+        rag_engine = RAGEngine(index_path=str(tmp_path / "rag_index.json"))
         intent_classifier = IntentClassifier()
         
         func_result = function_engine.translate(query)
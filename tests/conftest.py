@@ -330,9 +330,19 @@ def mock_duckdb_storage():
     mock.get_analysis_snapshot = Mock(return_value=None)
     mock.get_snapshots_by_type = Mock(return_value=[])
     mock.store_comparative_analysis = Mock(return_value=True)
+    mock.get_comparative_analysis = Mock(return_value=None)
     mock.store_metrics_timeseries = Mock(return_value=True)
     mock.mark_snapshot_reviewed = Mock(return_value=True)
     mock.get_snapshots_by_date_range = Mock(return_value=[])
+    mock.get_recent_snapshots = Mock(return_value=[])
+    mock.get_snapshot_metadata = Mock(return_value=[])
+    mock.get_snapshot_stats = Mock(return_value={
+        'count': 0, 'earliest_period_start': None, 'latest_period_start': None
+    })
+    mock.replace_snapshot_metrics = Mock(return_value=True)
+    mock.get_metric_series = Mock(return_value=[])
+    mock.get_metric_series_by_category = Mock(return_value=[])
+    mock.get_snapshot_ids_without_metrics = Mock(return_value=[])
     mock.ensure_schema = Mock()
     
     return mock
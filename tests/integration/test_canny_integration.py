@@ -194,9 +194,13 @@ class TestCannyIntegration:
     async def test_topic_orchestrator_with_canny(
         self,
         sample_canny_api_response,
-        sample_intercom_conversations
+        sample_intercom_conversations,
+        tmp_path,
+        monkeypatch
     ):
         """Test TopicOrchestrator with Canny integration."""
+        # The Canny agent gets the orchestrator's default DuckDB file; keep it out of the repo
+        monkeypatch.chdir(tmp_path)
         mock_ai_factory = MagicMock(spec=AIModelFactory)
         mock_ai_factory.analyze_sentiment = AsyncMock(return_value={
             'sentiment': 'positive',
@@ -2,6 +2,7 @@
 Tests for AdminProfileCache service.
 """
 
+import asyncio
 import pytest
 import logging
 from datetime import datetime, timedelta
@@ -440,3 +441,87 @@ class TestAdminProfileCache:
         assert profile.vendor == 'boldr'
         # Check that success was logged
         assert any('Derived vendor' in record.message and 'boldr' in record.message for record in caplog.records)
+
+
+class TestAdminProfileWarmUp:
+    """Bulk directory prefetch, batched DuckDB access and single-flight lookups"""
+    
+    @pytest.fixture
+    def directory(self):
+        return {
+            'type': 'admin.list',
+            'admins': [
+                {'id': '1', 'name': 'Maria', 'email': 'maria@hirehoratio.co', 'away_mode_enabled': False},
+                {'id': '2', 'name': 'Sam', 'email': 'sam@boldr.co', 'away_mode_enabled': True},
+                {'id': '3', 'name': 'No Email'}
+            ]
+        }
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_loads_directory_with_one_call(self, mock_intercom_service, directory):
+        cache = AdminProfileCache(mock_intercom_service, None)
+        mock_intercom_service.client.admins.list = AsyncMock(return_value=directory)
+        mock_intercom_service.client.admins.find = AsyncMock()
+        
+        await cache.warm_up(['1', '2'])
+        await cache.warm_up(['1', '2', '4'])
+        profile = await cache.get_admin_profile('2')
+        
+        assert mock_intercom_service.client.admins.list.await_count == 1
+        assert mock_intercom_service.client.admins.find.await_count == 0
+        assert profile.vendor == 'boldr'
+        assert profile.active is False
+        # Admins without a work email are built on lookup, with the caller's public_email
+        assert '3' not in cache.session_cache
+    
+    @pytest.mark.asyncio
+    async def test_directory_profiles_match_per_admin_lookups(self, mock_intercom_service, directory):
+        directory['admins'].append({'id': '4', 'name': 'Pat', 'email': 'pat@gmail.com'})
+        lookups = [('1', None), ('3', 'agent3@boldr.co'), ('4', 'pat@hirehoratio.co')]
+        
+        per_admin = AdminProfileCache(mock_intercom_service, None)
+        payloads = {admin['id']: admin for admin in directory['admins']}
+        mock_intercom_service.client.admins.find = AsyncMock(side_effect=lambda admin_id: payloads[admin_id])
+        expected = [await per_admin.get_admin_profile(a, public_email=e) for a, e in lookups]
+        
+        cache = AdminProfileCache(mock_intercom_service, None)
+        mock_intercom_service.client.admins.list = AsyncMock(return_value=directory)
+        mock_intercom_service.client.admins.find.reset_mock()
+        await cache.warm_up()
+        profiles = [await cache.get_admin_profile(a, public_email=e) for a, e in lookups]
+        
+        assert mock_intercom_service.client.admins.find.await_count == 0
+        # Public-email fallback applies to directory entries too
+        assert [p.vendor for p in profiles] == ['horatio', 'boldr', 'horatio']
+        assert [p.model_dump(exclude={'cached_at'}) for p in profiles] == \
+            [p.model_dump(exclude={'cached_at'}) for p in expected]
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self, mock_intercom_service, sample_admin_api_response):
+        cache = AdminProfileCache(mock_intercom_service, None)
+        
+        async def slow_find(admin_id):
+            await asyncio.sleep(0.01)
+            return sample_admin_api_response
+        
+        mock_intercom_service.client.admins.find = AsyncMock(side_effect=slow_find)
+        
+        profiles = await asyncio.gather(*[cache.get_admin_profile('12345') for _ in range(5)])
+        
+        assert mock_intercom_service.client.admins.find.await_count == 1
+        assert all(p is profiles[0] for p in profiles)
+        assert cache.get_cache_stats()['merged_lookups'] == 4
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_reads_and_writes_db_in_batches(self, mock_intercom_service, directory, duckdb_storage):
+        mock_intercom_service.client.admins.list = AsyncMock(return_value=directory)
+        await AdminProfileCache(mock_intercom_service, duckdb_storage).warm_up()
+        
+        # A fresh session is served from DuckDB without touching the API
+        cache = AdminProfileCache(mock_intercom_service, duckdb_storage)
+        mock_intercom_service.client.admins.list.reset_mock()
+        await cache.warm_up(['1', '2'])
+        
+        assert mock_intercom_service.client.admins.list.await_count == 0
+        assert cache.session_cache['1'].email == 'maria@hirehoratio.co'
+        assert cache.get_cache_stats()['db_hits'] == 2
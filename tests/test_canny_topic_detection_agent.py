@@ -0,0 +1,106 @@
+"""
+Unit tests for CannyTopicDetectionAgent: concurrent batch classification and
+DuckDB-backed classification cache.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.agents.canny_topic_detection_agent import CannyTopicDetectionAgent
+
+
+def _classification_response(prompt: str, **kwargs) -> str:
+    """Classify every post in the prompt batch as Billing."""
+    count = prompt.split('POSTS:')[1].count('Title:')
+    return json.dumps([
+        {'post_index': i, 'category': 'Billing', 'confidence': 0.9}
+        for i in range(count)
+    ])
+
+
+@pytest.fixture
+def ai_factory():
+    factory = Mock()
+    factory.generate_response = AsyncMock(side_effect=_classification_response)
+    return factory
+
+
+@pytest.fixture
+def canny_posts():
+    return [
+        {'id': f'post_{i}', 'title': f'Refund request {i}', 'details': 'Charged twice', 'score': i}
+        for i in range(25)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_classified(ai_factory, canny_posts):
+    agent = CannyTopicDetectionAgent(ai_factory)
+
+    topic_groups = await agent.detect_topics(canny_posts)
+
+    assert ai_factory.generate_response.await_count == 3
+    assert topic_groups['Billing']['count'] == 25
+    assert agent.cache_stats['cache_misses'] == 25
+    assert agent.cache_stats['llm_batches'] == 3
+
+
+@pytest.mark.asyncio
+async def test_batches_respect_provider_semaphore(monkeypatch, ai_factory, canny_posts):
+    import src.agents.canny_topic_detection_agent as canny_module
+    clients = []
+    monkeypatch.setattr(
+        canny_module, 'get_recommended_semaphore',
+        lambda client: clients.append(client) or asyncio.Semaphore(1)
+    )
+    in_flight = [0]
+    peak = [0]
+
+    async def respond(prompt, **kwargs):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0)
+        in_flight[0] -= 1
+        return _classification_response(prompt)
+
+    ai_factory.generate_response = AsyncMock(side_effect=respond)
+    agent = CannyTopicDetectionAgent(ai_factory)
+
+    await agent.detect_topics(canny_posts)
+
+    assert clients == [ai_factory.get_client.return_value]
+    assert peak[0] == 1
+    assert ai_factory.generate_response.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_unchanged_posts_served_from_cache(ai_factory, canny_posts, duckdb_storage):
+    agent = CannyTopicDetectionAgent(ai_factory, duckdb_storage=duckdb_storage)
+    await agent.detect_topics(canny_posts)
+    assert agent.cache_stats['cached_writes'] == 25
+
+    ai_factory.generate_response.reset_mock()
+    fresh_posts = [dict(post) for post in canny_posts]
+    fresh_posts[0]['details'] = 'Edited details'
+
+    topic_groups = await agent.detect_topics(fresh_posts)
+
+    assert ai_factory.generate_response.await_count == 1
+    assert agent.cache_stats['cache_hits'] == 24
+    assert agent.cache_stats['cache_misses'] == 1
+    assert topic_groups['Billing']['count'] == 25
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_and_is_not_cached(canny_posts, duckdb_storage):
+    factory = Mock()
+    factory.generate_response = AsyncMock(side_effect=RuntimeError("LLM down"))
+    agent = CannyTopicDetectionAgent(factory, duckdb_storage=duckdb_storage)
+
+    topic_groups = await agent.detect_topics(canny_posts)
+
+    assert sum(group['count'] for group in topic_groups.values()) == 25
+    assert agent.cache_stats['cached_writes'] == 0
+    assert duckdb_storage.get_canny_topic_classifications(['post_0']) == {}
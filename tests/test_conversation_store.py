@@ -0,0 +1,89 @@
+"""
+Tests for the shared conversation store used by AgentContext.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.agents.base_agent import AgentContext
+from src.agents.conversation_store import ConversationStore, ConversationView
+
+
+@pytest.fixture
+def conversations():
+    return [{'id': str(i), 'tier': 'paid' if i % 2 else 'free'} for i in range(6)]
+
+
+def _context(conversations):
+    return AgentContext(
+        analysis_id="test",
+        analysis_type="weekly_voc",
+        start_date=datetime(2025, 11, 1),
+        end_date=datetime(2025, 11, 7),
+        conversations=conversations
+    )
+
+
+def test_context_wraps_list_without_copying(conversations):
+    context = _context(conversations)
+
+    assert isinstance(context.conversations, ConversationView)
+    assert context.conversations == conversations
+    assert context.conversations[0] is conversations[0]
+    assert len(context.conversation_store) == 6
+
+
+def test_views_are_read_only_and_share_dicts(conversations):
+    view = ConversationStore(conversations).view()
+
+    paid = view.filter(lambda c: c['tier'] == 'paid')
+    first_two = paid[:2]
+
+    assert paid.ids == ['1', '3', '5']
+    assert first_two == [conversations[1], conversations[3]]
+    assert first_two[0] is conversations[1]
+    assert view.subset(['5', '0', 'missing']).ids == ['5', '0']
+    with pytest.raises(TypeError):
+        view[0] = {}
+
+
+def test_with_conversations_reuses_store(conversations):
+    context = _context(conversations)
+    paid = [c for c in conversations if c['tier'] == 'paid']
+
+    stage_context = context.with_conversations(paid, metadata={'stage': 'subtopics'})
+
+    assert stage_context.conversation_store is context.conversation_store
+    assert stage_context.conversations.ids == ['1', '3', '5']
+    assert stage_context.metadata == {'stage': 'subtopics'}
+    assert context.conversations.ids == [str(i) for i in range(6)]
+
+
+def test_foreign_list_gets_its_own_store(conversations):
+    context = _context(conversations)
+    other = [{'id': '0', 'tier': 'paid'}]
+
+    stage_context = context.with_conversations(other)
+
+    assert stage_context.conversation_store is not context.conversation_store
+    assert stage_context.conversations[0] is other[0]
+
+
+def test_context_serializes_conversations(conversations):
+    context = _context(conversations)
+
+    dumped = json.loads(context.model_dump_json())
+
+    assert dumped['conversations'] == conversations
+    assert context.model_dump()['conversations'] == conversations
+
+
+def test_category_prompt_includes_sample_conversations(conversations):
+    from src.agents.category_agent import CategoryAgent
+
+    prompt = CategoryAgent().format_context_data(_context(conversations))
+
+    assert "ConversationView" not in prompt
+    assert json.dumps(conversations[:3], indent=2, default=str) in prompt
@@ -351,7 +351,51 @@ class TestDataExporter:
         assert non_existent_dir.exists()
 
 
-
-
-
-
+class TestStreamingExport:
+    """Chunked exports must match single-chunk exports."""
+    
+    @staticmethod
+    def _conversations(sample_conversations, copies=3):
+        conversations = []
+        for i in range(copies):
+            for conv in sample_conversations:
+                conv = dict(conv, id=f"{conv['id']}_{i}", created_at=conv['created_at'] + i * 86400)
+                conversations.append(conv)
+        return conversations
+    
+    def test_chunked_csv_matches_single_chunk(self, temp_dir, sample_conversations):
+        """CSV files appended across chunks equal a single-chunk export."""
+        conversations = self._conversations(sample_conversations)
+        
+        whole = DataExporter(str(temp_dir / "whole")).export_conversations_to_csv(conversations, "vo")
+        chunked_exporter = DataExporter(str(temp_dir / "chunked"))
+        chunked_exporter.EXPORT_CHUNK_SIZE = 4
+        chunked = chunked_exporter.export_conversations_to_csv(iter(conversations), "vo")
+        
+        assert [Path(path).name for path in chunked] == [Path(path).name for path in whole]
+        for whole_path, chunked_path in zip(whole, chunked):
+            pd.testing.assert_frame_equal(pd.read_csv(chunked_path), pd.read_csv(whole_path))
+        
+        metrics = pd.read_csv(chunked[1]).set_index('metric')['value']
+        assert metrics['Total Conversations'] == len(conversations)
+    
+    def test_parquet_round_trips_across_chunks(self, temp_dir, sample_conversations):
+        """Parquet row groups written per chunk read back as one table."""
+        conversations = self._conversations(sample_conversations)
+        exporter = DataExporter(str(temp_dir))
+        exporter.EXPORT_CHUNK_SIZE = 4
+        
+        df = pd.read_parquet(exporter.export_to_parquet(conversations, "vo"))
+        
+        assert list(df['conversation_id']) == [conv['id'] for conv in conversations]
+        assert list(df.columns) == list(exporter._prepare_conversations_dataframe(conversations).columns)
+    
+    def test_technical_export_streams_header_once(self, temp_dir, technical_troubleshooting_conversations):
+        """Technical troubleshooting CSV has one header regardless of chunking."""
+        exporter = DataExporter(str(temp_dir))
+        exporter.EXPORT_CHUNK_SIZE = 1
+        
+        df = pd.read_csv(exporter.export_technical_troubleshooting_analysis(technical_troubleshooting_conversations, "tech"))
+        
+        assert len(df) == len(technical_troubleshooting_conversations)
+        assert 'cache_clear_mentioned' in df.columns
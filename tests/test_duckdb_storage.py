@@ -1058,6 +1058,44 @@ class TestHistoricalSnapshotHelpers:
         """Test retrieving non-existent snapshot returns None."""
         retrieved = duckdb_storage.get_analysis_snapshot('nonexistent_id')
         assert retrieved is None
+    
+    def test_replace_snapshot_metrics_is_atomic(self, duckdb_storage, sample_analysis_snapshot):
+        """A failed metric insert leaves the previous rollup in place."""
+        duckdb_storage.store_analysis_snapshot(sample_analysis_snapshot)
+        snapshot_id = sample_analysis_snapshot['snapshot_id']
+        
+        def metric(name, value):
+            return {
+                'metric_id': f'{snapshot_id}:{name}', 'snapshot_id': snapshot_id,
+                'metric_name': name, 'metric_value': value,
+                'metric_unit': 'count', 'category': 'volume'
+            }
+        
+        assert duckdb_storage.replace_snapshot_metrics(snapshot_id, [metric('a', 1), metric('b', 2)])
+        assert not duckdb_storage.replace_snapshot_metrics(snapshot_id, [metric('a', 5), metric('b', 'not a number')])
+        
+        rows = duckdb_storage.conn.execute(
+            "SELECT metric_name, metric_value FROM metrics_timeseries WHERE snapshot_id = ? ORDER BY metric_name",
+            [snapshot_id]
+        ).fetchall()
+        assert rows == [('a', 1.0), ('b', 2.0)]
+    
+    def test_nested_transaction_joins_outer(self, duckdb_storage, sample_analysis_snapshot):
+        """Methods that open a transaction can run inside a caller's transaction."""
+        snapshot_id = sample_analysis_snapshot['snapshot_id']
+        metric = {
+            'metric_id': f'{snapshot_id}:a', 'snapshot_id': snapshot_id, 'metric_name': 'a',
+            'metric_value': 1, 'metric_unit': 'count', 'category': 'volume'
+        }
+        
+        with pytest.raises(RuntimeError):
+            with duckdb_storage.transaction():
+                assert duckdb_storage.store_analysis_snapshot(sample_analysis_snapshot)
+                assert duckdb_storage.replace_snapshot_metrics(snapshot_id, [metric])
+                raise RuntimeError("abort")
+        
+        assert duckdb_storage.get_analysis_snapshot(snapshot_id) is None
+        assert duckdb_storage.query("SELECT * FROM metrics_timeseries").empty
 
 
 
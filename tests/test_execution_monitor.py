@@ -0,0 +1,144 @@
+"""
+Tests for execution monitor persistence: batched ExecutionStore writes,
+coalesced ExecutionStateManager files, and non-blocking broadcast.
+"""
+
+import asyncio
+import json
+import sqlite3
+import pytest
+
+from src.services.execution_monitor import (
+    AgentStatus,
+    ExecutionMonitor,
+    ExecutionStatus,
+    ExecutionStore,
+)
+from src.services.execution_state_manager import (
+    ExecutionStateManager,
+    ExecutionStatus as JobStatus,
+)
+
+
+@pytest.fixture
+def store(temp_dir, monkeypatch):
+    monkeypatch.delenv('EXECUTION_DB_PATH', raising=False)
+    store = ExecutionStore(db_path=str(temp_dir / "executions.db"), flush_interval=0.05)
+    yield store
+    store.close()
+
+
+def test_store_uses_wal_journal(store):
+    with sqlite3.connect(store.db_path) as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+@pytest.mark.asyncio
+async def test_status_updates_are_coalesced(store):
+    monitor = ExecutionMonitor(store=store)
+    run_id = await monitor.start_execution("voice-of-customer", ["--days", "7"])
+
+    writes = []
+    original_write = store._write_runs
+    store._write_runs = lambda rows: (writes.append(len(rows)), original_write(rows))
+
+    for agent in monitor.default_agent_order[:4]:
+        await monitor.update_agent_status(agent, AgentStatus.RUNNING)
+        await monitor.update_agent_status(agent, AgentStatus.COMPLETED, cost=0.01)
+    await monitor.update_phase("Analyzing", ExecutionStatus.ANALYZING)
+
+    assert writes == []
+    await asyncio.sleep(0.1)
+
+    assert writes == [1]
+    run = store.get_run(run_id)
+    assert run['current_phase'] == "Analyzing"
+    assert run['total_cost'] == pytest.approx(0.04)
+
+
+@pytest.mark.asyncio
+async def test_agent_rows_are_replaced_not_appended(store):
+    monitor = ExecutionMonitor(store=store)
+    run_id = await monitor.start_execution("voice-of-customer", [])
+    await monitor.update_agent_status("SegmentationAgent", AgentStatus.RUNNING)
+    await monitor.complete_execution()
+
+    agents = store.get_run_agents(run_id)
+
+    assert len(agents) == len(monitor.default_agent_order)
+    assert agents[0]['status'] == "running"
+    assert store.get_stats()['completed'] == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_wait_on_full_queue(store):
+    monitor = ExecutionMonitor(store=store)
+    slow = asyncio.Queue(maxsize=1)
+    fast = asyncio.Queue()
+    monitor.listeners = [slow, fast]
+
+    await asyncio.wait_for(monitor.broadcast({"n": 1}), timeout=0.1)
+    await asyncio.wait_for(monitor.broadcast({"n": 2}), timeout=0.1)
+
+    assert slow.get_nowait() == {"n": 2}
+    assert fast.qsize() == 2
+    assert monitor.dropped_messages == 1
+    assert slow in monitor.listeners
+
+
+@pytest.mark.asyncio
+async def test_shutdown_persists_queued_updates(temp_dir):
+    db_path = str(temp_dir / "executions.db")
+    store = ExecutionStore(db_path=db_path, flush_interval=60)
+    monitor = ExecutionMonitor(store=store)
+    run_id = await monitor.start_execution("voice-of-customer", [])
+    await monitor.update_phase("Reporting", ExecutionStatus.GENERATING_REPORT)
+
+    await monitor.shutdown()
+
+    reopened = ExecutionStore(db_path=db_path)
+    try:
+        assert reopened.get_run(run_id)['current_phase'] == "Reporting"
+    finally:
+        reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_monitor_reads_run_off_event_loop(store):
+    monitor = ExecutionMonitor(store=store)
+    run_id = await monitor.start_execution("voice-of-customer", [])
+    await store.flush()
+
+    # Hold the connection lock: the loop must stay responsive while the read waits
+    store._conn_lock.acquire()
+    read = asyncio.create_task(monitor.get_run(run_id))
+    await asyncio.sleep(0.05)
+    assert not read.done()
+    store._conn_lock.release()
+
+    assert (await read)['id'] == run_id
+    assert [r['id'] for r in await monitor.get_recent_runs()] == [run_id]
+
+
+@pytest.mark.asyncio
+async def test_state_manager_coalesces_disk_writes(temp_dir):
+    manager = ExecutionStateManager(persistence_dir=str(temp_dir / "jobs"), flush_interval=0.05)
+    writes = []
+    original_write = manager._write_state_files
+    manager._write_state_files = lambda states: (writes.append(len(states)), original_write(states))
+
+    await manager.create_execution("exec_1", "voice-of-customer", [])
+    await manager.start_execution("exec_1")
+    await manager.update_execution_status("exec_1", JobStatus.RUNNING)
+    await manager.add_output_file("exec_1", "/app/outputs/report.md")
+    await manager.update_execution_status("exec_1", JobStatus.COMPLETED, return_code=0)
+    await manager.flush_to_disk()
+
+    assert writes == [1]
+    data = json.loads((temp_dir / "jobs" / "exec_1.json").read_text())
+    assert data['status'] == "completed"
+    assert data['output_files'] == ["report.md"]
+
+    reloaded = ExecutionStateManager(persistence_dir=str(temp_dir / "jobs"))
+    assert (await reloaded.get_execution("exec_1")).return_code == 0
@@ -15,7 +15,7 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock
 from typing import Dict, Any, List
 
-from src.agents.fin_performance_agent import FinPerformanceAgent
+from src.agents.fin_performance_agent import FinPerformanceAgent, SubtopicIndex
 from src.agents.base_agent import AgentContext, AgentResult, ConfidenceLevel
 
 
@@ -439,4 +439,36 @@ class TestFinPerformanceAgent:
         assert 'resolution_rate_delta' in comparison
         assert 'knowledge_gap_delta' in comparison
         assert 'resolution_rate_interpretation' in comparison
-        assert 'knowledge_gap_interpretation' in comparison
\ No newline at end of file
+        assert 'knowledge_gap_interpretation' in comparison
+
+    def test_subtopic_index_matches_pairwise_matching(self, agent, sample_fin_conversations_with_subtopics, mock_subtopic_detection_result):
+        """The inverted sub-topic index returns exactly the conversations _match_conversation_to_subtopic accepts."""
+        conversations = sample_fin_conversations_with_subtopics + [
+            {
+                'id': 'overlap',
+                'detected_topics': ['Billing Issues'],
+                'source': {'body': '<p>Waiting on a REFUND DELAY update</p>'},
+                'tags': {'tags': [{'name': 'refund'}]},
+                'custom_attributes': {'plan': 'Annual'},
+                'conversation_topics': ['Subscription'],
+            }
+        ]
+        subtopics_data = dict(mock_subtopic_detection_result['data']['subtopics_by_tier1_topic'])
+        subtopics_data['Billing Issues'] = {
+            'tier2': dict(subtopics_data['Billing Issues']['tier2'], annual={}),
+            'tier3': dict(
+                subtopics_data['Billing Issues']['tier3'],
+                **{'Refund words': {'keywords': ['refund delay', 'Refund', 'fund']}, 'Catch all': {'keywords': ['']}}
+            ),
+        }
+        records = [agent._build_conversation_record(c) for c in conversations]
+        index = SubtopicIndex(records, subtopics_data)
+
+        for tier1_topic, subtopics in subtopics_data.items():
+            in_topic = [i for i, c in enumerate(conversations) if tier1_topic in c.get('detected_topics', [])]
+            for tier_level in ('tier2', 'tier3'):
+                for name, data in subtopics[tier_level].items():
+                    expected = [i for i in in_topic if agent._match_conversation_to_subtopic(conversations[i], name, tier_level, data)]
+                    assert index.match(tier1_topic, tier_level, name, data) == expected, (tier1_topic, name)
+
+        assert len(conversations) - 1 in index.match('Billing Issues', 'tier3', 'Refund words', subtopics_data['Billing Issues']['tier3']['Refund words'])
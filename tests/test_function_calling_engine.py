@@ -4,10 +4,34 @@ Tests for FunctionCallingEngine command argument building.
 Verifies that natural language queries map to expected CLI commands with correct flags.
 """
 
+import re
+
 import pytest
 from src.chat.engines.function_calling import FunctionCallingEngine
 
 
+def _pairwise_match(engine, query):
+    """Reference implementation: score every example and pattern of every function in turn."""
+    query_lower = query.lower()
+    best_match, best_score = None, 0.0
+    for func_name, func_def in engine.functions.items():
+        score = 0.0
+        query_words = set(query_lower.split())
+        for example in func_def.examples:
+            example_words = set(example.lower().split())
+            overlap = len(query_words & example_words)
+            score = max(score, overlap / max(len(query_words), len(example_words)))
+        patterns = engine.patterns.get(func_name, [])
+        if patterns:
+            score = max(score, sum(1 for p in patterns if re.search(p, query_lower)) / len(patterns))
+        keywords, floor = engine._define_keyword_boosts().get(func_name, ([], 0.0))
+        if any(word in query_lower for word in keywords):
+            score = max(score, floor)
+        if score > best_score:
+            best_match, best_score = func_name, score
+    return best_match, best_score
+
+
 class TestFunctionCallingEngine:
     """Test suite for FunctionCallingEngine"""
     
@@ -173,3 +197,49 @@ class TestFunctionCallingEngine:
         assert "boldr" in args
         assert "--individual-breakdown" in args
 
+
+QUERIES = [
+    "Give me last week's voice of customer report",
+    "complete analysis of everything",
+    "Run comprehensive analysis with Gamma presentation",
+    "billing invoice insights",
+    "tech api errors report",
+    "product feature requests analysis",
+    "Show me sites account management insights",
+    "coaching report for Boldr agents struggling",
+    "individual agent performance breakdown by taxonomy",
+    "what's the weather",
+    "VOC",
+    "",
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_intent_matcher_matches_pairwise_scoring(query):
+    engine = FunctionCallingEngine()
+
+    assert engine._match_function(query) == _pairwise_match(engine, query)
+
+
+def test_intent_matcher_picks_up_new_examples_after_rebuild():
+    engine = FunctionCallingEngine()
+    engine.functions["billing_analysis"].examples.append("dunning retries overview")
+    engine.matcher = engine._build_matcher()
+
+    assert engine._match_function("dunning retries overview") == ("billing_analysis", 1.0)
+
+
+def test_intent_matcher_falls_back_to_regex_for_non_literal_patterns():
+    from src.chat.engines.intent_matcher import IntentMatcher, literal_alternatives
+
+    assert literal_alternatives(r"(?:billing|account management)") == ["billing", "account management"]
+    assert literal_alternatives(r"q[1-4] (?:report|review)") is None
+
+    matcher = IntentMatcher(
+        examples={"quarterly": [], "billing": []},
+        patterns={"quarterly": [r"q[1-4]\b", r"(?:report|review)"], "billing": [r"(?:billing|invoice)"]},
+    )
+
+    assert matcher.best_match("Q3 review") == ("quarterly", 1.0)
+    assert matcher.best_match("q5 billing report") == ("billing", 1.0)
+    assert matcher.best_match("nothing relevant") == (None, 0.0)
@@ -7,7 +7,7 @@ from unittest.mock import Mock, patch, AsyncMock
 import httpx
 import asyncio
 
-from src.services.gamma_client import GammaClient, GammaAPIError
+from src.services.gamma_client import GammaClient, GammaAPIError, GammaPollScheduler
 
 
 class TestGammaClient:
@@ -299,6 +299,103 @@ class TestGammaClient:
                 await gamma_client.poll_generation("test_generation_id", max_polls=1)
 
 
-
-
-
+class TestGammaPollScheduler:
+    """Test cases for the shared GammaPollScheduler."""
+    
+    @pytest.fixture
+    def gamma_client(self):
+        """GammaClient with no jitter so backoff is deterministic."""
+        return GammaClient(jitter=False, poll_interval=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_polls_all_outstanding_generations_together(self, gamma_client):
+        """Concurrent waiters share one polling loop."""
+        responses = {
+            'gen_a': [{'status': 'processing'}, {'status': 'completed', 'gammaUrl': 'https://gamma.app/a'}],
+            'gen_b': [{'status': 'completed', 'gammaUrl': 'https://gamma.app/b'}],
+        }
+        
+        async def fake_status(generation_id):
+            return responses[generation_id].pop(0)
+        
+        scheduler = GammaPollScheduler(gamma_client)
+        with patch.object(gamma_client, 'get_generation_status', side_effect=fake_status):
+            result_a, result_b = await asyncio.gather(
+                scheduler.wait_for('gen_a'),
+                scheduler.wait_for('gen_b')
+            )
+        
+        assert result_a['gammaUrl'] == 'https://gamma.app/a'
+        assert result_b['gammaUrl'] == 'https://gamma.app/b'
+        assert scheduler.status_checks == 3
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_backs_off_and_retries(self, gamma_client):
+        """A 429 pauses the scheduler without counting as a poll attempt."""
+        mock_status = AsyncMock(side_effect=[
+            GammaAPIError("Status check failed 429: Too Many Requests"),
+            {'status': 'completed', 'gammaUrl': 'https://gamma.app/a'}
+        ])
+        
+        scheduler = GammaPollScheduler(gamma_client, max_polls=1)
+        with patch.object(gamma_client, 'get_generation_status', mock_status), \
+             patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = await scheduler.wait_for('gen_a')
+        
+        assert result['status'] == 'completed'
+        assert scheduler.rate_limit_count == 1
+        mock_sleep.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_failed_generation_raises(self, gamma_client):
+        """A failed generation only fails its own waiter."""
+        async def fake_status(generation_id):
+            if generation_id == 'gen_bad':
+                return {'status': 'failed', 'error': 'Bad input'}
+            return {'status': 'completed', 'gammaUrl': 'https://gamma.app/ok'}
+        
+        scheduler = GammaPollScheduler(gamma_client)
+        with patch.object(gamma_client, 'get_generation_status', side_effect=fake_status):
+            results = await asyncio.gather(
+                scheduler.wait_for('gen_bad'),
+                scheduler.wait_for('gen_ok'),
+                return_exceptions=True
+            )
+        
+        assert isinstance(results[0], GammaAPIError)
+        assert "Bad input" in str(results[0])
+        assert results[1]['gammaUrl'] == 'https://gamma.app/ok'
+    
+    @pytest.mark.asyncio
+    async def test_max_polls_exceeded(self, gamma_client):
+        """Generations stuck in processing fail after max_polls."""
+        scheduler = GammaPollScheduler(gamma_client, max_polls=2)
+        with patch.object(gamma_client, 'get_generation_status',
+                          AsyncMock(return_value={'status': 'processing'})):
+            with pytest.raises(GammaAPIError, match="exceeded 2 attempts"):
+                await scheduler.wait_for('gen_a')
+    
+    @pytest.mark.asyncio
+    async def test_poll_generation_uses_scheduler_loop(self, gamma_client):
+        """poll_generation shares the scheduler's 429 handling and backoff."""
+        mock_status = AsyncMock(side_effect=[
+            {'status': 'processing'},
+            GammaAPIError("Status check failed 429: Too Many Requests"),
+            {'status': 'completed', 'gammaUrl': 'https://gamma.app/a'}
+        ])
+        
+        with patch.object(gamma_client, 'get_generation_status', mock_status), \
+             patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = await gamma_client.poll_generation('gen_a', max_polls=2)
+        
+        assert result['gammaUrl'] == 'https://gamma.app/a'
+        assert mock_status.await_count == 3
+        assert mock_sleep.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_poll_generation_max_polls_exceeded(self, gamma_client):
+        """poll_generation fails once max_polls non-final statuses are seen."""
+        with patch.object(gamma_client, 'get_generation_status',
+                          AsyncMock(return_value={'status': 'processing'})):
+            with pytest.raises(GammaAPIError, match="exceeded 2 attempts"):
+                await gamma_client.poll_generation('gen_a', max_polls=2)
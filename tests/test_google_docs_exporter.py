@@ -8,7 +8,7 @@ from pathlib import Path
 import tempfile
 import os
 
-from src.services.google_docs_exporter import GoogleDocsExporter
+from src.services.google_docs_exporter import DOC_STYLES, GoogleDocsExporter
 
 
 class TestGoogleDocsExporter:
@@ -518,3 +518,63 @@ class TestGoogleDocsExporter:
 
 
 
+    
+    def test_export_styles_writes_every_style_from_one_model(self, docs_exporter, sample_analysis_results):
+        """Test that exporting all styles extracts each conversation's quote once."""
+        extracted = []
+        extract = docs_exporter._extract_quote_from_conversation
+        
+        def counting_extract(conversation):
+            extracted.append(conversation['id'])
+            return extract(conversation)
+        
+        docs_exporter._extract_quote_from_conversation = counting_extract
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_paths = {style: Path(temp_dir) / f"{style}.md" for style in DOC_STYLES}
+            
+            result_paths = docs_exporter.export_styles(sample_analysis_results, output_paths)
+            
+            assert result_paths == output_paths
+            assert "John Doe" in output_paths['executive'].read_text(encoding='utf-8')
+            assert "The API is not working properly" in output_paths['training'].read_text(encoding='utf-8')
+            assert "### Quote 2" in output_paths['detailed'].read_text(encoding='utf-8')
+        
+        assert extracted == ['conv_1', 'conv_2']
+    
+    def test_export_model_matches_per_style_extraction(self, docs_exporter, sample_analysis_results):
+        """Test that the shared model returns the same quotes and categories as direct extraction."""
+        conversations = sample_analysis_results['conversations'] * 3
+        sample_analysis_results['conversations'] = conversations
+        category_results = sample_analysis_results['category_results']
+        
+        model = docs_exporter.build_export_model(sample_analysis_results)
+        
+        for limit in (3, 5, 1, 4, 0):
+            assert model.customer_quotes(limit) == docs_exporter._extract_customer_quotes(conversations, limit)
+            assert model.top_categories(limit) == docs_exporter._get_top_categories(category_results, limit)
+    
+    def test_export_model_is_rebuilt_for_new_results(self, docs_exporter, sample_analysis_results):
+        """Test that the cached model is reused only for the same results content."""
+        model = docs_exporter.build_export_model(sample_analysis_results)
+        
+        assert docs_exporter.build_export_model(sample_analysis_results) is model
+        
+        other_results = dict(sample_analysis_results, conversations=[])
+        other_model = docs_exporter.build_export_model(other_results)
+        
+        assert other_model is not model
+        assert other_model.customer_quotes(3) == []
+    
+    def test_export_model_is_rebuilt_after_in_place_change(self, docs_exporter, sample_analysis_results):
+        """Test that mutating the same results object invalidates the cached model."""
+        model = docs_exporter.build_export_model(sample_analysis_results)
+        model.customer_quotes(3)
+        
+        sample_analysis_results['conversations'] = []
+        rebuilt = docs_exporter.build_export_model(sample_analysis_results)
+        
+        assert rebuilt is not model
+        assert rebuilt.customer_quotes(3) == []
+        # An equal copy of the current content reuses the model
+        assert docs_exporter.build_export_model(dict(sample_analysis_results)) is rebuilt
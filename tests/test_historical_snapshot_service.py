@@ -199,8 +199,6 @@ def test_calculate_comparison_identifies_declining_patterns(historical_snapshot_
 
 def test_get_historical_context_no_data(historical_snapshot_service, mock_duckdb_storage):
     """Test historical context with no data"""
-    mock_duckdb_storage.get_snapshots_by_type.return_value = []
-    
     context = historical_snapshot_service.get_historical_context()
     
     assert context['has_baseline'] is False
@@ -209,10 +207,11 @@ def test_get_historical_context_no_data(historical_snapshot_service, mock_duckdb
     assert context['can_do_seasonality'] is False
 
 
-def test_get_historical_context_4_weeks(historical_snapshot_service, mock_duckdb_storage, sample_snapshot_data):
+def test_get_historical_context_4_weeks(historical_snapshot_service, mock_duckdb_storage):
     """Test historical context with 4 weeks of data"""
-    snapshots = [sample_snapshot_data.copy() for _ in range(4)]
-    mock_duckdb_storage.get_snapshots_by_type.return_value = snapshots
+    mock_duckdb_storage.get_snapshot_stats.return_value = {
+        'count': 4, 'earliest_period_start': date(2025, 10, 6), 'latest_period_start': date(2025, 10, 27)
+    }
     
     context = historical_snapshot_service.get_historical_context()
     
@@ -220,12 +219,15 @@ def test_get_historical_context_4_weeks(historical_snapshot_service, mock_duckdb
     assert context['weeks_available'] == 4
     assert context['can_do_trends'] is True
     assert context['can_do_seasonality'] is False
+    assert context['baseline_date'] == date(2025, 10, 6)
+    mock_duckdb_storage.get_snapshots_by_type.assert_not_called()
 
 
-def test_get_historical_context_12_weeks(historical_snapshot_service, mock_duckdb_storage, sample_snapshot_data):
+def test_get_historical_context_12_weeks(historical_snapshot_service, mock_duckdb_storage):
     """Test historical context with 12 weeks (seasonality threshold)"""
-    snapshots = [sample_snapshot_data.copy() for _ in range(12)]
-    mock_duckdb_storage.get_snapshots_by_type.return_value = snapshots
+    mock_duckdb_storage.get_snapshot_stats.return_value = {
+        'count': 12, 'earliest_period_start': date(2025, 8, 4), 'latest_period_start': date(2025, 10, 20)
+    }
     
     context = historical_snapshot_service.get_historical_context()
     
@@ -240,27 +242,18 @@ def test_get_historical_context_12_weeks(historical_snapshot_service, mock_duckd
 # =============================================================================
 
 def test_list_snapshots_all_types(historical_snapshot_service, mock_duckdb_storage, sample_snapshot_data):
-    """Test listing snapshots of all types"""
+    """Test listing snapshots of all types uses a single merged query"""
     weekly_snap = sample_snapshot_data.copy()
     weekly_snap['analysis_type'] = 'weekly'
     monthly_snap = sample_snapshot_data.copy()
     monthly_snap['analysis_type'] = 'monthly'
-    
-    # Mock returns different results for different types
-    def mock_get_by_type(type_, limit):
-        if type_ == 'weekly':
-            return [weekly_snap]
-        elif type_ == 'monthly':
-            return [monthly_snap]
-        return []
-    
-    mock_duckdb_storage.get_snapshots_by_type.side_effect = mock_get_by_type
+    mock_duckdb_storage.get_recent_snapshots.return_value = [weekly_snap, monthly_snap]
     
     snapshots = historical_snapshot_service.list_snapshots(None, 10)
     
-    assert len(snapshots) >= 2
-    types = {s['analysis_type'] for s in snapshots}
-    assert 'weekly' in types or 'monthly' in types
+    mock_duckdb_storage.get_recent_snapshots.assert_called_once_with(10)
+    mock_duckdb_storage.get_snapshots_by_type.assert_not_called()
+    assert {s['analysis_type'] for s in snapshots} == {'weekly', 'monthly'}
 
 
 def test_list_snapshots_filter_by_type(historical_snapshot_service, mock_duckdb_storage, sample_snapshot_data):
@@ -934,3 +927,153 @@ def test_helper_methods_declining_patterns(historical_snapshot_service, sample_s
     assert 'OldTopic' in declining_topics
     assert 'TinyTopic' not in declining_topics  # Filtered as noise
 
+
+
+# =============================================================================
+# Test metadata queries and metrics_timeseries rollup (integration)
+# =============================================================================
+
+def _save_weeks(service, weeks):
+    """Save consecutive weekly snapshots with growing Billing volume."""
+    start = date(2025, 10, 6)
+    for i in range(weeks):
+        period_start = start + timedelta(days=7 * i)
+        service.save_snapshot({
+            'period_start': period_start,
+            'period_end': period_start + timedelta(days=6),
+            'summary': {'total_conversations': 100 + i},
+            'agent_results': {
+                'TopicDetectionAgent': {'data': {'topic_distribution': {'Billing': 10 + i, 'API': 5}}},
+                'TopicProcessingAgent': {'data': {'topic_sentiments': {'Billing': {'positive': 0.5, 'negative': 0.3}}}}
+            }
+        }, 'weekly')
+
+
+def test_historical_context_from_metadata_integration(duckdb_storage):
+    """Count and baseline date come from one aggregate query"""
+    service = HistoricalSnapshotService(duckdb_storage)
+    _save_weeks(service, 5)
+    
+    context = service.get_historical_context()
+    
+    assert context['weeks_available'] == 5
+    assert context['baseline_date'] == date(2025, 10, 6)
+    
+    metadata = service.list_snapshot_metadata('weekly', 2)
+    assert [m['snapshot_id'] for m in metadata] == ['weekly_20251103', 'weekly_20251027']
+    assert 'topic_volumes' not in metadata[0]
+
+
+def test_save_snapshot_populates_metric_rollup(duckdb_storage):
+    """Saved snapshots are flattened into long-format metric rows"""
+    service = HistoricalSnapshotService(duckdb_storage)
+    _save_weeks(service, 4)
+    
+    series = service.get_metric_series(['total_conversations', 'topic_volume.Billing'], 'weekly', periods=3)
+    
+    assert [p['value'] for p in series['total_conversations']] == [101.0, 102.0, 103.0]
+    assert [p['value'] for p in series['topic_volume.Billing']] == [11.0, 12.0, 13.0]
+    
+    sentiments = service.get_category_series('topic_sentiment', 'weekly', periods=1)
+    assert sentiments['topic_sentiment.Billing.positive'][0]['value'] == 0.5
+
+
+def test_resaving_snapshot_rebuilds_metric_rollup(duckdb_storage):
+    """Re-saving a period replaces its snapshot and metric rows"""
+    service = HistoricalSnapshotService(duckdb_storage)
+    _save_weeks(service, 1)
+    service.save_snapshot({
+        'period_start': date(2025, 10, 6),
+        'period_end': date(2025, 10, 12),
+        'summary': {'total_conversations': 250},
+        'agent_results': {}
+    }, 'weekly')
+    
+    series = service.get_category_series('topic_volume', 'weekly', periods=4)
+    totals = service.get_metric_series(['total_conversations'], 'weekly', periods=4)
+    
+    assert series == {}
+    assert [p['value'] for p in totals['total_conversations']] == [250.0]
+
+
+def test_resaving_compared_snapshot_updates_it(duckdb_storage):
+    """Re-saving a snapshot that comparisons reference updates it in place"""
+    service = HistoricalSnapshotService(duckdb_storage)
+    _save_weeks(service, 3)
+    service.save_snapshot({
+        'period_start': date(2025, 10, 13),
+        'period_end': date(2025, 10, 19),
+        'summary': {'total_conversations': 300},
+        'agent_results': {'TopicDetectionAgent': {'data': {'topic_distribution': {'Billing': 40}}}}
+    }, 'weekly')
+    
+    snapshot = duckdb_storage.get_analysis_snapshot('weekly_20251013')
+    totals = service.get_metric_series(['total_conversations'], 'weekly', periods=3)
+    following = duckdb_storage.get_comparative_analysis('comp_weekly_20251020_weekly_20251013')
+    
+    assert snapshot['total_conversations'] == 300
+    assert [p['value'] for p in totals['total_conversations']] == [100.0, 300.0, 102.0]
+    assert following['volume_changes']['Billing']['prior'] == 40
+
+
+def test_backfill_metrics_timeseries(duckdb_storage, sample_snapshot_data):
+    """Snapshots stored without a rollup get one on backfill"""
+    duckdb_storage.store_analysis_snapshot(sample_snapshot_data)
+    service = HistoricalSnapshotService(duckdb_storage)
+    
+    assert service.backfill_metrics_timeseries() == 1
+    assert service.backfill_metrics_timeseries() == 0
+
+
+def test_save_snapshot_precomputes_period_comparison(duckdb_storage):
+    """Saving a snapshot stores its comparison with the prior period"""
+    service = HistoricalSnapshotService(duckdb_storage)
+    _save_weeks(service, 3)
+    
+    stored = duckdb_storage.get_comparative_analysis('comp_weekly_20251020_weekly_20251013')
+    
+    assert stored is not None
+    assert stored['volume_changes']['Billing'] == {'change': 1, 'pct': 0.0909, 'current': 12, 'prior': 11}
+    assert stored['current_total_conversations'] == 102
+    assert duckdb_storage.get_comparative_analysis('comp_weekly_20251006_weekly_20250929') is None
+
+
+def test_get_period_comparison_uses_stored_row(duckdb_storage):
+    """Report lookups read the stored comparison instead of loading snapshots"""
+    service = HistoricalSnapshotService(duckdb_storage)
+    _save_weeks(service, 2)
+    
+    with patch.object(duckdb_storage, 'get_analysis_snapshot', side_effect=AssertionError('snapshot loaded')):
+        comparison = service.get_period_comparison('weekly_20251013', 'weekly')
+    
+    assert comparison['prior_snapshot_id'] == 'weekly_20251006'
+    assert comparison['comparison_type'] == 'week_over_week'
+
+
+def test_backfilled_snapshot_refreshes_following_comparison(duckdb_storage):
+    """Saving an earlier period also compares the already-saved following period"""
+    service = HistoricalSnapshotService(duckdb_storage)
+    service.save_snapshot({
+        'period_start': date(2025, 10, 13),
+        'period_end': date(2025, 10, 19),
+        'summary': {'total_conversations': 80},
+        'agent_results': {'TopicDetectionAgent': {'data': {'topic_distribution': {'Billing': 20}}}}
+    }, 'weekly')
+    _save_weeks(service, 1)
+    
+    comparison = service.get_comparison('weekly_20251013', 'weekly_20251006')
+    
+    assert comparison['volume_changes']['Billing']['change'] == 10
+    assert comparison['prior_period_label'] == ''
+
+
+def test_get_comparison_computes_missing_pair_once(duckdb_storage, sample_snapshot_data):
+    """Pairs stored without a precomputed comparison are calculated and stored on first lookup"""
+    prior = dict(sample_snapshot_data, snapshot_id='weekly_20251031')
+    duckdb_storage.store_analysis_snapshot(prior)
+    duckdb_storage.store_analysis_snapshot(sample_snapshot_data)
+    service = HistoricalSnapshotService(duckdb_storage)
+    
+    assert service.get_comparison('weekly_20251107', 'weekly_20251031') is not None
+    assert duckdb_storage.get_comparative_analysis('comp_weekly_20251107_weekly_20251031') is not None
+    assert service.get_comparison('weekly_20251107', 'weekly_20251114') is None
@@ -331,3 +331,52 @@ class TestIndividualAgentAnalyzer:
         assert isinstance(strong, list)
         assert isinstance(weak, list)
 
+
+
+class TestSinglePassMetrics:
+    """Feature rows are derived once per conversation and shared by all metrics"""
+    
+    @pytest.mark.asyncio
+    async def test_text_extracted_once_per_conversation(self, mock_admin_cache, sample_conversations, admin_details_map):
+        analyzer = IndividualAgentAnalyzer('horatio', mock_admin_cache, None)
+        
+        with patch(
+            'src.services.individual_agent_analyzer.extract_conversation_text',
+            side_effect=lambda conv, clean_html=True: conv.get('full_text', '')
+        ) as extract:
+            agent_metrics = await analyzer.analyze_agents(sample_conversations, admin_details_map)
+        
+        assert extract.call_count == len(sample_conversations)
+        john = next(a for a in agent_metrics if a.agent_id == 'agent2')
+        assert john.reopen_rate == 1.0
+        assert john.needs_coaching_example_url.endswith('conv_2')
+    
+    def test_taxonomy_breakdown_groups_categories_and_subcategories(self, mock_admin_cache):
+        analyzer = IndividualAgentAnalyzer('horatio', mock_admin_cache, None)
+        analyzer.taxonomy = None  # Tag mapping only
+        convs = [
+            {
+                'id': f'conv_{i}',
+                'state': 'closed',
+                'count_reopens': 1 if i == 0 else 0,
+                'created_at': 1699000000,
+                'updated_at': 1699000000 + 3600 * (i + 1),
+                'tags': {'tags': [{'name': 'Refund'}]},
+                'full_text': 'Escalating to Hilary' if i == 1 else 'Resolved'
+            }
+            for i in range(3)
+        ]
+        
+        with patch(
+            'src.services.individual_agent_analyzer.extract_conversation_text',
+            side_effect=lambda conv, clean_html=True: conv.get('full_text', '')
+        ):
+            features = analyzer._build_features(convs)
+        by_category, by_subcategory = analyzer._analyze_taxonomy_performance(features)
+        
+        billing = by_category['Billing']
+        assert billing.volume == 3
+        assert billing.fcr_rate == pytest.approx(2 / 3)
+        assert billing.escalation_rate == pytest.approx(1 / 3)
+        assert billing.median_resolution_hours == 2.0
+        assert by_subcategory['Billing>Refund'].volume == 3
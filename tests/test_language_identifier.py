@@ -0,0 +1,77 @@
+"""
+Tests for the offline trigram language identifier.
+"""
+
+import pytest
+
+from src.services.data_preprocessor import DataPreprocessor
+from src.utils.language_identifier import LanguageIdentifier
+
+
+@pytest.fixture(scope="module")
+def identifier():
+    return LanguageIdentifier()
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("I can't export my presentation to PDF, it keeps failing with an error", 'en'),
+    ("No puedo exportar mi presentación, me sale un error cada vez", 'es'),
+    ("Je n'arrive pas à exporter ma présentation, il y a une erreur", 'fr'),
+    ("Ich kann meine Präsentation nicht exportieren, es kommt immer ein Fehler", 'de'),
+    ("Não consigo exportar minha apresentação, sempre dá erro", 'pt'),
+    ("Non riesco a esportare la mia presentazione, mi dà sempre un errore", 'it'),
+    ("Ik kan mijn presentatie niet exporteren, ik krijg steeds een foutmelding", 'nl'),
+])
+def test_identifies_support_messages(identifier, text, expected):
+    language, confidence = identifier.identify(text)
+
+    assert language == expected
+    assert confidence > 0.8
+
+
+def test_batch_matches_single_and_rejects_short_text(identifier):
+    texts = [
+        "Why was I charged twice when I cancelled my plan last week?",
+        "hello",
+        "",
+        "Hola, necesito un reembolso de mi suscripción por favor",
+    ]
+
+    results = identifier.identify_batch(texts)
+
+    assert results == [identifier.identify(text) for text in texts]
+    assert results[1] == (None, 0.0)
+    assert results[2] == (None, 0.0)
+    assert [language for language, _ in results] == ['en', None, None, 'es']
+
+
+def test_batch_is_scored_in_chunks(identifier):
+    texts = [
+        'My account was charged twice for the subscription this month, please help',
+        'Mi cuenta fue cobrada dos veces este mes, necesito ayuda por favor',
+        'ok',
+        None,
+        'Mon compte a été débité deux fois ce mois-ci, pouvez-vous m\'aider',
+    ]
+
+    chunked = LanguageIdentifier(chunk_size=2)
+
+    assert chunked.identify_batch(texts) == identifier.identify_batch(texts)
+    assert chunked.identify_batch([]) == []
+
+
+def test_preprocessor_infers_language_per_conversation():
+    preprocessor = DataPreprocessor()
+    conversations = [
+        {'id': '1', 'source': {'body': 'My account was charged twice for the subscription this month, please help'}},
+        {'id': '2', 'source': {'body': 'Mi cuenta fue cobrada dos veces este mes, necesito ayuda por favor'}},
+        {'id': '3', 'source': {'body': 'ok'}},
+    ]
+    stats = {}
+
+    preprocessor._infer_missing_data(conversations, stats)
+
+    assert conversations[0]['inferred_language'] == 'en'
+    assert conversations[1]['inferred_language'] == 'es'
+    assert 'inferred_language' not in conversations[2]
+    assert stats['inferred_data']['languages_inferred'] == 2
@@ -0,0 +1,143 @@
+"""
+Tests for the background log sink used by AuditTrail and AgentThinkingLogger.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from src.services.audit_trail import AuditTrail, scrub_sensitive_data
+from src.utils.log_sink import LogSink
+
+
+@pytest.fixture
+def sink():
+    log_sink = LogSink(flush_interval=0.05, scrubber=scrub_sensitive_data)
+    yield log_sink
+    log_sink.close()
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_batches_text_and_jsonl_records(sink, tmp_path):
+    text_path = tmp_path / "thinking.log"
+    jsonl_path = tmp_path / "events.jsonl"
+
+    for i in range(3):
+        sink.write_text(text_path, f"line {i}\n")
+        sink.write_json(jsonl_path, {'i': i})
+    assert sink.flush(timeout=5)
+
+    assert text_path.read_text(encoding='utf-8') == "line 0\nline 1\nline 2\n"
+    assert [record['i'] for record in _read_jsonl(jsonl_path)] == [0, 1, 2]
+    assert sink.get_stats()['written'] == 6
+
+
+def test_scrubs_on_writer_thread(sink, tmp_path):
+    path = tmp_path / "events.jsonl"
+
+    sink.write_json(path, {'email': 'agent@horatio.ai'}, scrub=True)
+    sink.write_json(path, {'email': 'agent@horatio.ai'}, scrub=False)
+    sink.flush(timeout=5)
+
+    scrubbed, raw = _read_jsonl(path)
+    assert scrubbed['email'] == '[EMAIL_REDACTED]'
+    assert raw['email'] == 'agent@horatio.ai'
+
+
+def test_drop_policy_counts_overflow(tmp_path):
+    release = threading.Event()
+    drop_sink = LogSink(max_queue_size=2, batch_size=1, overflow="drop", scrubber=lambda record: release.wait(5) and record)
+    path = tmp_path / "events.jsonl"
+    try:
+        # The writer stalls on the first record, so the two-slot queue overflows
+        results = [drop_sink.write_json(path, {'i': i}, scrub=True) for i in range(6)]
+        release.set()
+        drop_sink.flush(timeout=5)
+
+        assert results[:2] == [True, True]
+        assert drop_sink.get_stats()['dropped'] == results.count(False) > 0
+        assert len(_read_jsonl(path)) == results.count(True)
+    finally:
+        release.set()
+        drop_sink.close()
+
+
+def test_rejects_unknown_overflow_policy():
+    with pytest.raises(ValueError):
+        LogSink(overflow="spill")
+
+
+def test_audit_trail_streams_scrubbed_events(tmp_path):
+    event_log = tmp_path / "audit_events.jsonl"
+    audit = AuditTrail(output_dir=str(tmp_path), scrub_pii=True, event_log=event_log)
+
+    audit.step("Data Fetching", "Fetched conversations", {'contact': 'user@example.com'})
+    audit.decision("Filter?", "Yes", "Too many rows")
+    audit.step("Analysis", "Started analysis")
+    audit.flush()
+
+    events = _read_jsonl(event_log)
+    assert [e['event_type'] for e in events] == ['step', 'decision', 'step']
+    assert events[0]['details']['contact'] == '[EMAIL_REDACTED]'
+    # In-memory records are untouched; scrubbing happened on the writer thread
+    assert audit.steps[0]['details']['contact'] == 'user@example.com'
+
+
+def test_phase_boundary_signals_writer_without_blocking(tmp_path, monkeypatch):
+    event_log = tmp_path / "audit_events.jsonl"
+    audit = AuditTrail(output_dir=str(tmp_path), scrub_pii=True, event_log=event_log)
+    # Writer would otherwise hold the first event for a long batching window
+    slow_sink = LogSink(flush_interval=30, scrubber=scrub_sensitive_data)
+    monkeypatch.setattr(audit, '_sink', slow_sink)
+    waits = []
+    monkeypatch.setattr(slow_sink, 'flush', lambda timeout=None: waits.append(timeout) or True)
+
+    try:
+        audit.step("Data Fetching", "Fetched conversations")
+        audit.step("Analysis", "Started analysis")
+        assert waits == []
+
+        deadline = time.monotonic() + 5
+        while not event_log.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _read_jsonl(event_log)[0]['phase'] == "Data Fetching"
+    finally:
+        slow_sink.close()
+
+
+def test_audit_tool_calls_are_snapshotted_and_scrubbed_when_recorded(tmp_path):
+    event_log = tmp_path / "audit_events.jsonl"
+    audit = AuditTrail(output_dir=str(tmp_path), scrub_pii=True, event_log=event_log)
+    arguments = {'email': 'agent@horatio.ai'}
+    result = {'vendor': 'horatio', 'members': ['lead@horatio.ai']}
+
+    audit.tool_call('lookup_admin_profile', arguments, result, True, 12.0)
+    # Caller reuses its objects before the writer thread gets to the event
+    arguments['email'] = 'other@horatio.ai'
+    result['members'].append('new@horatio.ai')
+    audit.flush()
+
+    event = _read_jsonl(event_log)[0]
+    assert event['tool_name'] == 'lookup_admin_profile'
+    assert event['arguments'] == {'email': '[EMAIL_REDACTED]'}
+    assert event['result']['members'] == ['[EMAIL_REDACTED]']
+    assert audit.tool_calls[0]['arguments'] == {'email': '[EMAIL_REDACTED]'}
+    assert audit.tool_calls[0]['result']['members'] == ['[EMAIL_REDACTED]']
+
+
+def test_shared_sink_overflow_policy_comes_from_settings(monkeypatch):
+    from src.config.settings import settings
+    from src.utils import log_sink
+
+    monkeypatch.setattr(settings, 'log_sink_overflow', 'drop')
+    monkeypatch.setattr(log_sink, '_default_sink', None)
+    shared = log_sink.get_log_sink()
+    try:
+        assert shared.overflow == 'drop'
+    finally:
+        shared.close()
@@ -1912,3 +1912,32 @@ async def test_execute_without_analytical_insights():
     assert '## Pattern Intelligence' not in formatted_output
     assert '## Risk & Opportunity Signals' not in formatted_output
 
+
+@pytest.mark.asyncio
+async def test_topic_card_highlights_ranked_by_conversation_rating(agent):
+    """Highlights are ordered by the rating of the conversation behind each example"""
+    examples = [
+        {'conversation_id': f'conv_{i}', 'preview': f'Example {i}', 'intercom_url': f'https://example.com/{i}'}
+        for i in range(6)
+    ]
+    conversations = [{'id': f'conv_{i}', 'conversation_rating': 5 if i == 5 else 3} for i in range(6)]
+    context = AgentContext(
+        analysis_id="test-highlights",
+        analysis_type="weekly",
+        conversations=conversations,
+        start_date=datetime(2024, 5, 1, tzinfo=timezone.utc),
+        end_date=datetime(2024, 5, 8, tzinfo=timezone.utc),
+        metadata={'week_id': '2024-W18'},
+        previous_results={
+            'SegmentationAgent': {'data': {'segmentation_summary': {'paid_count': 6, 'free_count': 0}}},
+            'TopicDetectionAgent': {
+                'data': {'topic_distribution': {'Billing': {'volume': 6, 'percentage': 100.0, 'detection_method': 'attribute'}}}
+            },
+            'TopicExamples': {'Billing': {'data': {'examples': examples}}}
+        }
+    )
+    
+    result = await agent.execute(context)
+    
+    highlights = result.data['formatted_output'].split('**Highlights**')[1].split('**Lowlights**')[0]
+    assert highlights.startswith(' (Best Experiences) ✅:\n\n1. "Example 5"')
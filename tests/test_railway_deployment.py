@@ -502,4 +502,34 @@ class TestDebugVersionEndpoint:
         assert data['commit'] in ['unknown', os.getenv('GIT_COMMIT', 'unknown')]
 
 
+
+class TestShutdownHook:
+    """Tests for state persisted when the server shuts down."""
+    
+    def test_shutdown_writes_pending_job_states(self, tmp_path):
+        """Test job states still waiting for the delayed flush are written."""
+        if not HAS_FASTAPI:
+            pytest.skip("FastAPI not available")
+        
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+        from deploy import railway_web
+        from src.services.execution_state_manager import ExecutionStateManager
+        
+        async def run():
+            manager = ExecutionStateManager(persistence_dir=str(tmp_path), flush_interval=60)
+            await manager.create_execution("exec_1", "voice-of-customer", ["--days", "7"])
+            assert not (tmp_path / "exec_1.json").exists()
+            
+            with patch.object(railway_web, 'state_manager', manager), \
+                 patch('src.services.execution_monitor.shutdown_execution_monitor', AsyncMock()) as monitor_shutdown:
+                await railway_web.flush_execution_history()
+            
+            monitor_shutdown.assert_awaited_once()
+            manager._flush_task.cancel()
+        
+        asyncio.run(run())
+        
+        assert (tmp_path / "exec_1.json").exists()
+
 # Run tests with: pytest tests/test_railway_deployment.py -v
\ No newline at end of file
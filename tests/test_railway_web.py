@@ -6,7 +6,7 @@ Tests all new FastAPI routes and ensures proper integration with HistoricalSnaps
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from datetime import date, datetime
 
 # Import the app
@@ -328,32 +328,31 @@ def test_analysis_view_not_found(client):
 
 
 def test_analysis_compare_route(client):
-    """Test comparison view."""
+    """Test comparison view renders the stored comparison row."""
     with patch('railway_web.duckdb_storage') as mock_db, \
          patch('railway_web.historical_service') as mock_service:
         
-        mock_db.get_analysis_snapshot = MagicMock(side_effect=[
-            {
-                'snapshot_id': 'weekly_20251114',
-                'date_range_label': 'Nov 8-14, 2025',
-                'total_conversations': 175
+        mock_service.get_comparison_async = AsyncMock(return_value={
+            'current_snapshot_id': 'weekly_20251114',
+            'prior_snapshot_id': 'weekly_20251107',
+            'current_period_label': 'Nov 8-14, 2025',
+            'prior_period_label': 'Nov 1-7, 2025',
+            'volume_changes': {
+                'Billing': {'change': 7, 'pct': 0.155, 'current': 52, 'prior': 45},
+                'API': {'change': 16, 'pct': 0.8889, 'current': 34, 'prior': 18}
             },
-            {
-                'snapshot_id': 'weekly_20251107',
-                'date_range_label': 'Nov 1-7, 2025',
-                'total_conversations': 150
-            }
-        ])
-        
-        mock_service.calculate_comparison = MagicMock(return_value={
-            'volume_changes': [('Billing', 15.5, 7)],
-            'significant_changes': ['API volume increased by 89%']
+            'significant_changes': [
+                {'topic': 'API', 'change': 16, 'pct': 0.8889, 'direction': 'increasing', 'alert': '⚠️'}
+            ]
         })
         
         response = client.get("/analysis/compare/weekly_20251114/weekly_20251107")
         
         assert response.status_code == 200
+        mock_service.get_comparison_async.assert_awaited_once_with('weekly_20251114', 'weekly_20251107')
+        mock_db.get_analysis_snapshot.assert_not_called()
         assert 'Nov 8-14, 2025' in response.text
+        assert 'API: +88.9% (+16 conversations)' in response.text
         assert 'Nov 1-7, 2025' in response.text
 
 
@@ -0,0 +1,161 @@
+"""
+Tests for the per-stage run profiler used by --profile.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.execution_monitor import ExecutionMonitor, ExecutionStore
+from src.utils import run_profiler
+from src.utils.run_profiler import (
+    KIND_AGENT,
+    _anthropic_usage,
+    _openai_usage,
+    _wrap_create,
+    get_profiler,
+    profile_stage,
+    profiled,
+    record_cache_hit,
+    start_profiling,
+    stop_profiling,
+)
+
+
+@pytest.fixture
+def profiler():
+    profiler = start_profiling("test-run")
+    yield profiler
+    stop_profiling()
+
+
+def test_profile_stage_is_noop_without_profiler():
+    assert get_profiler() is None
+
+    with profile_stage("fetch") as stage:
+        record_cache_hit()
+
+    assert stage is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_attribute_llm_calls_to_their_own_stage(profiler):
+    @profiled("agent", KIND_AGENT)
+    async def agent(tokens):
+        await asyncio.sleep(0.01)
+        profiler.record_llm_call(input_tokens=tokens, output_tokens=1, cached_tokens=tokens // 2)
+
+    async def topic(name, tokens):
+        with profile_stage(name):
+            await agent(tokens)
+
+    with profile_stage("orchestrator"):
+        await asyncio.gather(topic("billing", 100), topic("export", 10), topic("export", 20))
+        record_cache_hit()
+
+    stages = {stage.path: stage for stage in profiler.get_stages()}
+
+    assert list(stages) == [
+        "orchestrator", "orchestrator/billing", "orchestrator/billing/agent",
+        "orchestrator/export", "orchestrator/export/agent"
+    ]
+    assert stages["orchestrator/export"].calls == 2
+    assert stages["orchestrator/export/agent"].input_tokens == 30
+    assert stages["orchestrator/billing/agent"].kind == KIND_AGENT
+    assert stages["orchestrator"].llm_calls == 3
+    assert stages["orchestrator"].input_tokens == 130
+    assert stages["orchestrator"].cache_hits == 4
+    assert stages["orchestrator"].wall_seconds >= 0.01
+    assert profiler.totals.llm_calls == 3
+
+
+def test_failed_stage_counts_error(profiler):
+    with pytest.raises(ValueError):
+        with profile_stage("report_write"):
+            raise ValueError("disk full")
+
+    stage = profiler.get_stages()[0]
+    assert (stage.calls, stage.errors) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_wrapped_sdk_create_records_usage(profiler):
+    async def create(**kwargs):
+        usage = SimpleNamespace(
+            prompt_tokens=120, completion_tokens=30,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=64)
+        )
+        return SimpleNamespace(usage=usage)
+
+    wrapped = _wrap_create(create, _openai_usage)
+    with profile_stage("llm"):
+        await wrapped(model="gpt-4o-mini")
+
+    stage = profiler.get_stages()[0]
+    assert (stage.llm_calls, stage.input_tokens, stage.output_tokens) == (1, 120, 30)
+    assert (stage.cached_tokens, stage.cache_hits) == (64, 1)
+    assert stage.llm_wait_seconds > 0
+
+
+def test_usage_readers_tolerate_missing_usage():
+    anthropic_response = SimpleNamespace(
+        usage=SimpleNamespace(input_tokens=10, output_tokens=5, cache_read_input_tokens=None)
+    )
+
+    assert _anthropic_usage(anthropic_response) == (10, 5, 0)
+    assert _openai_usage(SimpleNamespace()) == (0, 0, 0)
+
+
+def test_sdks_are_instrumented_only_while_profiling():
+    from openai.resources.chat.completions import AsyncCompletions
+
+    original = AsyncCompletions.create
+    start_profiling("test-run")
+    try:
+        assert AsyncCompletions.create._run_profiler_original is original
+    finally:
+        stop_profiling()
+
+    assert AsyncCompletions.create is original
+    assert run_profiler._active_profiler is None
+
+
+def test_save_writes_json_profile(profiler, temp_dir):
+    with profile_stage("fetch"):
+        pass
+    stop_profiling()
+
+    path = profiler.save(temp_dir / "profile.json")
+    data = json.loads(path.read_text())
+
+    assert data['run_name'] == "test-run"
+    assert data['totals']['wall_seconds'] >= 0
+    assert [stage['path'] for stage in data['stages']] == ["fetch"]
+    # RSS is the process high-water mark, never below what the stage saw on exit
+    if data['stages'][0]['process_peak_rss_mb'] is not None:
+        assert data['totals']['process_peak_rss_mb'] >= data['stages'][0]['process_peak_rss_mb']
+
+
+@pytest.mark.asyncio
+async def test_monitor_records_profile_in_store(profiler, temp_dir, monkeypatch):
+    monkeypatch.delenv('EXECUTION_DB_PATH', raising=False)
+    store = ExecutionStore(db_path=str(temp_dir / "executions.db"), flush_interval=0.05)
+    monitor = ExecutionMonitor(store=store)
+    run_id = await monitor.start_execution("voice-of-customer", ["--profile"])
+
+    with profile_stage("orchestrator"):
+        with profile_stage("SegmentationAgent", KIND_AGENT):
+            profiler.record_llm_call(input_tokens=50, output_tokens=5)
+    stop_profiling()
+
+    await monitor.record_profile(profiler.to_dict())
+    await store.flush()
+
+    rows = store.get_run_profile(run_id)
+    assert [(row['path'], row['llm_calls']) for row in rows] == [
+        ("orchestrator", 1), ("orchestrator/SegmentationAgent", 1)
+    ]
+    assert json.loads(store.get_run(run_id)['data'])['profile']['totals']['input_tokens'] == 50
+    store.close()
@@ -1324,4 +1324,92 @@ class TestSegmentationAgent:
         
         assert segment == 'paid', f"Expected 'paid' segment, got '{segment}'"
         # Should recognize it was escalated
-        assert agent_type == 'unknown', f"Expected 'unknown' (escalated to human), got '{agent_type}'"
\ No newline at end of file
+        assert agent_type == 'unknown', f"Expected 'unknown' (escalated to human), got '{agent_type}'"    
+
+    # =============================================================================
+    # Single-walk escalation scan
+    # =============================================================================
+
+    @staticmethod
+    def _paid_conversation(parts, **fields):
+        conv = {
+            'id': 'scan_conv',
+            'conversation_parts': {'conversation_parts': parts},
+            'source': {'type': 'chat', 'body': 'Question'},
+            'contacts': {'contacts': [{'custom_attributes': {'tier': 'Pro'}}]}
+        }
+        conv.update(fields)
+        return conv
+    
+    def test_senior_staff_name_spanning_two_parts(self):
+        """A senior staff name split across consecutive bodies matches as in the joined text."""
+        agent = SegmentationAgent(track_escalations=True)
+        conv = self._paid_conversation(
+            [
+                {'author': {'type': 'user'}, 'body': '<p>Please ask Max</p>'},
+                {'author': {'type': 'user'}, 'body': 'Jackson to call me'}
+            ],
+            ai_agent_participated=False
+        )
+        
+        assert agent._classify_conversation(conv) == ('paid', 'escalated')
+    
+    def test_scan_stops_once_chain_is_settled(self):
+        """Parts after the deciding signal are not walked; an unsettled chain walks every part."""
+        agent = SegmentationAgent(track_escalations=True)
+        parts = [
+            {'author': {'type': 'admin', 'name': 'Agent', 'email': 'hilary@example.com'}, 'body': 'On it'},
+            {'author': {'type': 'user'}, 'body': 'Thanks'},
+            {'author': {'type': 'user'}, 'body': 'Still broken'}
+        ]
+        conv = self._paid_conversation(parts)
+        
+        settled = agent._scan_escalation_chain(conv, fin_involved=False)
+        assert settled.has_senior_staff and settled.user_parts == 0
+        
+        # With Fin involved a vendor could still follow, so the walk continues
+        unsettled = agent._scan_escalation_chain(conv, fin_involved=True)
+        assert unsettled.has_senior_staff and unsettled.user_parts == 2
+        assert agent._classify_conversation(dict(conv, ai_agent_participated=True)) == ('paid', 'fin_to_senior_direct')
+    
+    def test_debug_messages_formatted_lazily(self, monkeypatch):
+        """Per-conversation debug logging defers formatting to the logging module."""
+        agent = SegmentationAgent(track_escalations=True)
+        conv = self._paid_conversation(
+            [{'author': {'type': 'bot', 'name': 'Fin'}, 'body': 'Here is the answer'}],
+            ai_agent_participated=True,
+            state='closed'
+        )
+        calls = []
+        monkeypatch.setattr(agent.logger, 'debug', lambda message, *args, **kwargs: calls.append((message, args)))
+        
+        assert agent._classify_conversation(conv) == ('paid', 'fin_only')
+        assert calls
+        assert any(args for _, args in calls)
+        for message, args in calls:
+            assert message.count('%s') == len(args)
+    
+    @pytest.mark.asyncio
+    async def test_execute_extracts_tier_once_per_conversation(self, monkeypatch):
+        """Tier extraction is shared between classification and the tier distribution."""
+        agent = SegmentationAgent(track_escalations=True)
+        conversations = [
+            self._paid_conversation([{'author': {'type': 'user'}, 'body': f'Message {i}'}], id=f'c{i}')
+            for i in range(5)
+        ]
+        extract = agent._extract_customer_tier
+        calls = []
+        monkeypatch.setattr(agent, '_extract_customer_tier', lambda conv: calls.append(conv['id']) or extract(conv))
+        context = AgentContext(
+            analysis_id='tier_once',
+            analysis_type='weekly',
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 8, tzinfo=timezone.utc),
+            conversations=conversations
+        )
+        
+        result = await agent.execute(context)
+        
+        assert result.success
+        assert calls == [f'c{i}' for i in range(5)]
+        assert result.data['segmentation_summary']['tier_distribution']['pro'] == 5
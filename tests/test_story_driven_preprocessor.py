@@ -0,0 +1,138 @@
+"""
+Unit tests for StoryDrivenPreprocessor: bounded concurrent story summaries,
+content-hash summary cache and the no-story prefilter.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.story_driven_preprocessor import (
+    NO_STORY_SUMMARY,
+    SUMMARY_FAILED,
+    StoryDrivenPreprocessor,
+)
+
+
+class FakeLLM:
+    """Records concurrency of generate_analysis calls."""
+
+    def __init__(self, delay: float = 0.02, hang_on: str = None):
+        self.delay = delay
+        self.hang_on = hang_on
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def generate_analysis(self, prompt: str) -> str:
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(60 if self.hang_on and self.hang_on in prompt else self.delay)
+            return f"summary {self.calls}"
+        finally:
+            self.active -= 1
+
+
+def _conversation(conv_id, body):
+    return {
+        'id': conv_id,
+        'created_at': 1699123456,
+        'source': {'body': body},
+        'conversation_parts': {'conversation_parts': []},
+    }
+
+
+@pytest.fixture
+def preprocessor():
+    preprocessor = StoryDrivenPreprocessor()
+    preprocessor.summary_semaphore = asyncio.Semaphore(3)
+    preprocessor.openai_client = FakeLLM()
+    return preprocessor
+
+
+@pytest.mark.asyncio
+async def test_summaries_run_concurrently_within_limit_and_keep_order(preprocessor):
+    conversations = [
+        _conversation(f"conv_{i}", f"I am trying to export deck {i} but the export is broken")
+        for i in range(12)
+    ]
+
+    stories = await preprocessor._extract_conversation_stories(conversations, {})
+
+    assert [story['conversation_id'] for story in stories] == [conv['id'] for conv in conversations]
+    assert preprocessor.openai_client.calls == 12
+    assert preprocessor.openai_client.max_active == 3
+
+
+@pytest.mark.asyncio
+async def test_identical_content_reuses_cached_summary(preprocessor):
+    body = "I need to cancel because the editor is not working"
+    conversations = [_conversation(f"conv_{i}", body) for i in range(5)]
+
+    stories = await preprocessor._extract_conversation_stories(conversations, {})
+    await preprocessor._extract_conversation_stories(conversations[:1], {})
+
+    assert len({story['story_summary'] for story in stories}) == 1
+    assert preprocessor.openai_client.calls < 5
+    assert preprocessor.summary_stats['cache_hits'] == 6 - preprocessor.openai_client.calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_share_one_in_flight_summary(preprocessor):
+    # Enough slots that every duplicate would otherwise start its own request
+    preprocessor.summary_semaphore = asyncio.Semaphore(10)
+    body = "I need to cancel because the editor is not working"
+    conversations = [_conversation(f"conv_{i}", body) for i in range(5)]
+
+    stories = await preprocessor._extract_conversation_stories(conversations, {})
+
+    assert preprocessor.openai_client.calls == 1
+    assert {story['story_summary'] for story in stories} == {"summary 1"}
+    assert preprocessor.summary_stats['cache_hits'] == 4
+    assert preprocessor._summary_inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_conversations_without_story_elements_skip_llm(preprocessor):
+    conversations = [_conversation("conv_plain", "Hello there, quick note about my account settings")]
+
+    stories = await preprocessor._extract_conversation_stories(conversations, {})
+
+    assert stories[0]['story_summary'] == NO_STORY_SUMMARY
+    assert preprocessor.openai_client.calls == 0
+    assert preprocessor.summary_stats['prefiltered'] == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_out_summary_falls_back_without_blocking_others(preprocessor):
+    preprocessor.openai_client = FakeLLM(hang_on="deck 1 ")
+    preprocessor.summary_timeout = 0.2
+    conversations = [
+        _conversation(f"conv_{i}", f"I want to share deck {i} but the link is broken")
+        for i in range(3)
+    ]
+
+    stories = await preprocessor._extract_conversation_stories(conversations, {})
+
+    assert [story['story_summary'] == SUMMARY_FAILED for story in stories] == [False, True, False]
+    assert preprocessor.summary_stats['timeouts'] == 1
+    assert preprocessor._content_hash('conversation', stories[1]['conversation_text']) not in preprocessor._summary_cache
+
+
+@pytest.mark.asyncio
+async def test_conversation_and_canny_stories_share_the_limit(preprocessor, monkeypatch):
+    async def no_llm(*args, **kwargs):
+        return {}
+    for step in ('_identify_recurring_themes', '_generate_story_insights', '_create_narrative_synthesis', '_log_chatgpt_analysis'):
+        monkeypatch.setattr(preprocessor, step, no_llm)
+
+    conversations = [_conversation(f"conv_{i}", f"Trying to fix issue {i} with my slides") for i in range(3)]
+    canny_posts = [{'id': f"post_{i}", 'title': f"Add feature {i}", 'details': 'Need it'} for i in range(3)]
+
+    results = await preprocessor.preprocess_for_story_analysis(conversations, canny_posts, "this week")
+
+    assert len(results['conversation_stories']) == len(results['canny_stories']) == 3
+    assert preprocessor.openai_client.max_active == 3
+    assert results['analysis_metadata']['story_summary_stats']['llm_calls'] == 6
@@ -0,0 +1,70 @@
+"""
+Tests for the streaming stratified sampler used by DataPreprocessor.
+"""
+
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.services.data_preprocessor import DataPreprocessor
+from src.services.stratified_sampler import StratifiedSampler, stratified_sample
+
+
+@pytest.fixture
+def conversations():
+    start = datetime(2025, 11, 1, tzinfo=timezone.utc)
+    categories = ['Billing'] * 6 + ['Bug'] * 3 + ['API']
+    return [
+        {
+            'id': f'conv_{i}',
+            'inferred_category': categories[i % len(categories)],
+            'tier': 'paid' if i % 4 == 0 else 'free',
+            'created_at': start + timedelta(days=i % 2)
+        }
+        for i in range(1000)
+    ]
+
+
+def test_sample_is_proportional_across_strata(conversations):
+    sample = stratified_sample(conversations, 100, seed=7)
+
+    assert len(sample) == 100
+    assert len({c['id'] for c in sample}) == 100
+    by_category = Counter(c['inferred_category'] for c in sample)
+    assert by_category == {'Billing': 60, 'Bug': 30, 'API': 10}
+
+
+def test_sample_is_reproducible_and_order_independent(conversations):
+    first = stratified_sample(conversations, 50, seed=7)
+    shuffled = conversations[:]
+    random.Random(1).shuffle(shuffled)
+    second = stratified_sample(shuffled, 50, seed=7)
+    other_seed = stratified_sample(conversations, 50, seed=8)
+
+    assert {c['id'] for c in first} == {c['id'] for c in second}
+    assert {c['id'] for c in first} != {c['id'] for c in other_seed}
+
+
+def test_reservoirs_are_bounded_per_stratum(conversations):
+    sampler = StratifiedSampler(5, seed=1)
+    sampler.extend(conversations)
+
+    assert all(len(reservoir) <= 5 for reservoir in sampler._reservoirs.values())
+    assert len(sampler.result()) == 5
+
+
+@pytest.mark.asyncio
+async def test_stream_matches_in_memory_sampling(conversations):
+    preprocessor = DataPreprocessor()
+
+    async def chunks():
+        for i in range(0, len(conversations), 137):
+            yield conversations[i:i + 137]
+
+    streamed, stream_stats = await preprocessor.sample_conversation_stream(chunks(), 80, seed=3)
+    in_memory = preprocessor._statistical_sampling(conversations, 80, {}, seed=3)
+
+    assert [c['id'] for c in streamed] == [c['id'] for c in in_memory]
+    assert stream_stats['seen'] == 1000
@@ -0,0 +1,140 @@
+"""
+Unit tests for SynthesisEngine's cross-category index: overlaps, correlations
+and patterns answered from one pass over the category results.
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from src.services.synthesis_engine import CategoryIndex, SynthesisEngine
+
+
+def _category_results(seed: int, categories: int = 8, items: int = 12):
+    rng = random.Random(seed)
+    results = {}
+    for number in range(categories):
+        results[f"category_{number}"] = {
+            'data_summary': {
+                'filtered_conversations': rng.randint(0, 300),
+                'top_topics': [
+                    {'topic': f"topic_{rng.randrange(items)}", 'count': rng.randint(1, 20)}
+                    for _ in range(rng.randint(0, 8))
+                ],
+                'top_tags': [
+                    {'tag': f"tag_{rng.randrange(items)}", 'count': rng.randint(1, 20)}
+                    for _ in range(rng.randint(0, 8))
+                ]
+            },
+            'analysis_results': {
+                'common_issues': [f"issue_{rng.randrange(5)}" for _ in range(rng.randint(0, 3))],
+                'escalation_analysis': {'escalation_rate': rng.uniform(0, 80)}
+            }
+        }
+    return results
+
+
+def _pairwise_overlaps(category_results, item_type):
+    """Reference: rescan every category's list for every item."""
+    item_field = item_type[:-1]
+    totals = {}
+    for results in category_results.values():
+        for item_data in results['data_summary'][f'top_{item_type}']:
+            totals[item_data[item_field]] = totals.get(item_data[item_field], 0) + item_data['count']
+
+    overlapping = {}
+    for item, total_count in totals.items():
+        categories = [
+            category for category, results in category_results.items()
+            if any(entry[item_field] == item for entry in results['data_summary'][f'top_{item_type}'])
+        ]
+        if total_count > 1 and len(categories) > 1:
+            overlapping[item] = {'total_count': total_count, 'categories': categories, 'category_count': len(categories)}
+    return overlapping
+
+
+def _pairwise_correlations(category_results):
+    """Reference: Jaccard similarity of top topics and tags for every category pair."""
+    def jaccard(first, second):
+        union = first | second
+        return len(first & second) / len(union) if union else 0
+
+    correlations = {}
+    categories = list(category_results)
+    for i, cat1 in enumerate(categories):
+        for cat2 in categories[i + 1:]:
+            data1 = category_results[cat1]['data_summary']
+            data2 = category_results[cat2]['data_summary']
+            score = (
+                jaccard({t['topic'] for t in data1['top_topics']}, {t['topic'] for t in data2['top_topics']})
+                + jaccard({t['tag'] for t in data1['top_tags']}, {t['tag'] for t in data2['top_tags']})
+            ) / 2
+            if score > 0.3:
+                correlations[f"{cat1}-{cat2}"] = {
+                    'correlation_score': score,
+                    'strength': 'strong' if score > 0.7 else 'medium'
+                }
+    return correlations
+
+
+@pytest.fixture
+def engine():
+    return SynthesisEngine()
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_index_matches_pairwise_overlaps_and_correlations(engine, seed):
+    category_results = _category_results(seed, items=random.Random(seed).choice([3, 6, 12]))
+    index = CategoryIndex.build(category_results)
+
+    assert index.overlapping_items('topics') == _pairwise_overlaps(category_results, 'topics')
+    assert index.overlapping_items('tags') == _pairwise_overlaps(category_results, 'tags')
+
+    correlations = engine._calculate_category_correlations(index)
+    assert correlations == _pairwise_correlations(category_results)
+    assert list(correlations) == list(_pairwise_correlations(category_results))
+
+
+def test_index_aggregates_patterns_and_rates():
+    category_results = {
+        'billing': {
+            'data_summary': {'filtered_conversations': 10, 'top_topics': [{'topic': 'refund', 'count': 4}]},
+            'analysis_results': {
+                'common_issues': ['refund delay'],
+                'escalation_analysis': {'escalation_rate': 40, 'statistics': {'angry': 2}}
+            }
+        },
+        'product': {
+            'data_summary': {'filtered_conversations': 5},
+            'analysis_results': {
+                'common_issues': ['refund delay', 'export'],
+                'escalation_analysis': {'statistics': {'angry': 3}},
+                'success_analysis': {'success_rate': 75}
+            }
+        }
+    }
+
+    index = CategoryIndex.build(category_results)
+
+    assert dict(index.issue_counts) == {'refund delay': 2, 'export': 1}
+    assert dict(index.escalation_triggers) == {'angry': 5}
+    assert index.categories['billing'].success_rate is None
+    assert index.categories['product'].escalation_rate == 0
+    assert index.categories['billing'].priority_score == pytest.approx(10 * 0.4 + 40 * 0.3)
+
+
+@pytest.mark.asyncio
+async def test_synthesis_reports_overlaps_from_index(engine):
+    category_results = _category_results(3)
+
+    synthesis = await engine.synthesize_category_results(
+        category_results, datetime(2024, 1, 1), datetime(2024, 1, 8)
+    )
+
+    metrics = synthesis['cross_category_metrics']
+    assert metrics['topic_overlap'] == _pairwise_overlaps(category_results, 'topics')
+    assert synthesis['trend_analysis']['category_correlation'] == _pairwise_correlations(category_results)
+    assert synthesis['synthesis_metadata']['filtered_conversations'] == sum(
+        results['data_summary']['filtered_conversations'] for results in category_results.values()
+    )
@@ -0,0 +1,165 @@
+"""
+Tests for ToolResultCache and ToolRegistry caching behaviour.
+"""
+
+import json
+import pytest
+
+from src.agents.tools import BaseTool, ToolDefinition, ToolRegistry, ToolResult, ToolResultCache
+from src.services.duckdb_storage import DuckDBStorage
+
+
+class CountingTool(BaseTool):
+    """Returns a fresh row list on each call and counts executions."""
+
+    def __init__(self):
+        super().__init__(name="count_rows", description="Test tool")
+        self.calls = 0
+
+    def get_definition(self) -> ToolDefinition:
+        return ToolDefinition(name=self.name, description=self.description, parameters=[])
+
+    async def execute(self, **kwargs) -> ToolResult:
+        self.calls += 1
+        return ToolResult(success=True, data={'rows': [{'id': i} for i in range(kwargs.get('limit', 3))]})
+
+
+def _registry(cache=None):
+    registry = ToolRegistry(cache=cache)
+    tool = CountingTool()
+    registry.register(tool)
+    return registry, tool
+
+
+@pytest.mark.asyncio
+async def test_hits_return_shared_frozen_result():
+    registry, tool = _registry()
+
+    first = await registry.execute_tool("count_rows", limit=2)
+    second = await registry.execute_tool("count_rows", limit=2)
+
+    assert tool.calls == 1
+    assert second is first
+    assert json.loads(json.dumps(second.data)) == {'rows': [{'id': 0}, {'id': 1}]}
+    with pytest.raises(TypeError):
+        second.data['rows'][0]['id'] = 99
+    with pytest.raises(Exception):
+        second.success = False
+
+
+@pytest.mark.asyncio
+async def test_cache_is_shared_between_registries():
+    shared = ToolResultCache()
+    registry_a, tool_a = _registry(shared)
+    registry_b, tool_b = _registry(shared)
+
+    await registry_a.execute_tool("count_rows", limit=2)
+    await registry_b.execute_tool("count_rows", limit=2)
+
+    assert tool_a.calls == 1
+    assert tool_b.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_invalidates_cached_results():
+    registry, tool = _registry()
+    await registry.execute_tool("count_rows")
+
+    DuckDBStorage._mark_ingested()
+    await registry.execute_tool("count_rows")
+
+    assert tool.calls == 2
+    assert registry.cache.stats['invalidations'] == 1
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ToolResultCache(max_entries=2, max_bytes=10_000)
+    for key in ("a", "b"):
+        cache.put(key, ToolResult(success=True, data=[key]))
+    cache.get("a")
+    cache.put("c", ToolResult(success=True, data=["c"]))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    cache.put("big", ToolResult(success=True, data="x" * 20_000))
+    assert "big" not in cache
+    assert cache.total_bytes <= cache.max_bytes
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    import src.agents.tools.result_cache as result_cache
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+    cache = ToolResultCache(ttl_seconds=60)
+    cache.put("k", ToolResult(success=True, data=1))
+
+    now[0] += 61
+
+    assert cache.get("k") is None
+    assert cache.stats['expirations'] == 1
+    assert cache.total_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_agents_in_one_run_share_tool_hits(monkeypatch, tmp_path):
+    from src.agents.agent_performance_agent import AgentPerformanceAgent
+    from src.agents.tools import AdminProfileLookupTool
+
+    lookups = []
+
+    async def lookup(self, **kwargs):
+        lookups.append(kwargs['admin_id'])
+        return ToolResult(success=True, data={'admin_id': kwargs['admin_id']})
+
+    monkeypatch.setattr(AdminProfileLookupTool, 'execute', lookup)
+    monkeypatch.chdir(tmp_path)
+    run_cache = ToolResultCache()
+    team = AgentPerformanceAgent(agent_filter='horatio', tool_cache=run_cache)
+    coaching = AgentPerformanceAgent(agent_filter='boldr', tool_cache=run_cache)
+
+    first = await team.tool_registry.execute_tool('lookup_admin_profile', admin_id='42', public_email=None)
+    second = await coaching.tool_registry.execute_tool('lookup_admin_profile', admin_id='42', public_email=None)
+
+    assert lookups == ['42']
+    assert second is first
+    assert run_cache.stats['hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_cache_is_invalidated_by_ingest_mid_run(monkeypatch, tmp_path):
+    from datetime import datetime
+    from src.agents.agent_performance_agent import AgentPerformanceAgent
+    from src.agents.base_agent import AgentResult, ConfidenceLevel
+    from src.agents.tools import AdminProfileLookupTool
+    from src.cli.runners import run_agent_performance_analysis
+    import src.services.chunked_fetcher as chunked_fetcher
+
+    class Fetcher:
+        async def fetch_conversations_chunked(self, **kwargs):
+            return [{'id': 'c1', 'admin_assignee': {'email': 'agent@hirehoratio.co'}}]
+
+    lookups = []
+
+    async def lookup(self, **kwargs):
+        lookups.append(kwargs['admin_id'])
+        return ToolResult(success=True, data={'admin_id': kwargs['admin_id']})
+
+    async def execute(self, context, **kwargs):
+        await self.tool_registry.execute_tool('lookup_admin_profile', admin_id='42', public_email=None)
+        DuckDBStorage._mark_ingested()
+        await self.tool_registry.execute_tool('lookup_admin_profile', admin_id='42', public_email=None)
+        return AgentResult(
+            agent_name=self.name, success=False, data={}, confidence=0.0,
+            confidence_level=ConfidenceLevel.LOW, error_message='stop'
+        )
+
+    monkeypatch.setattr(chunked_fetcher, 'ChunkedFetcher', Fetcher)
+    monkeypatch.setattr(AdminProfileLookupTool, 'execute', lookup)
+    monkeypatch.setattr(AgentPerformanceAgent, 'execute', execute)
+    monkeypatch.chdir(tmp_path)
+
+    result = await run_agent_performance_analysis('horatio', datetime(2024, 1, 1), datetime(2024, 1, 8))
+
+    assert result['error'] == 'stop'
+    assert lookups == ['42', '42']
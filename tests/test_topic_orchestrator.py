@@ -13,6 +13,12 @@ from src.agents.topic_orchestrator import TopicOrchestrator
 from src.agents.base_agent import AgentContext, AgentResult, ConfidenceLevel
 
 
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run in tmp_path so the orchestrator's default DuckDB file and outputs stay out of the repo."""
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.fixture
 def orchestrator():
     """Return TopicOrchestrator instance."""
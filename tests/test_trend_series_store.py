@@ -0,0 +1,139 @@
+"""
+Unit tests for TrendSeriesStore and TrendAgent's use of it: rolling window,
+week replacement, persistence and one-time migration of legacy week files.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.agents.trend_agent import TrendAgent
+from src.services.trend_series_store import TrendSeriesStore
+
+
+def _results(week: int, topics=('Billing', 'Bug', 'Account')):
+    return {
+        'topic_distribution': {
+            topic: {'volume': week * 10 + offset, 'percentage': 12.5}
+            for offset, topic in enumerate(topics)
+        },
+        'topic_sentiments': {
+            topic: {'positive': 0.1 * offset, 'label': 'mixed'}
+            for offset, topic in enumerate(topics)
+        }
+    }
+
+
+def _legacy_history(directory):
+    """Reference: every legacy week file, read in filename order."""
+    history = []
+    for file in sorted(directory.glob("week_*.json")):
+        with open(file) as f:
+            history.append(json.load(f))
+    return history
+
+
+@pytest.fixture
+def agent(tmp_path):
+    with patch('src.agents.trend_agent.get_ai_client'):
+        yield TrendAgent(historical_data_dir=tmp_path)
+
+
+def test_store_keeps_only_the_newest_points(tmp_path):
+    store = TrendSeriesStore(tmp_path / "series.json", max_points=3)
+    store.append_week('2024-W01', _results(1, topics=('Retired',)))
+    for week in range(2, 6):
+        store.append_week(f'2024-W0{week}', _results(week))
+
+    history = store.history()
+
+    assert [entry['week_id'] for entry in history] == ['2024-W03', '2024-W04', '2024-W05']
+    assert store.weeks_recorded == 5
+    assert 'Retired' not in store.volume
+    assert history[-1]['results']['topic_distribution']['Bug'] == {'volume': 51}
+    assert history[-1]['results']['topic_sentiments']['Bug'] == {'positive': 0.1}
+    assert [entry['week_id'] for entry in store.history(2)] == ['2024-W04', '2024-W05']
+
+
+def test_rerun_of_a_week_replaces_its_points(tmp_path):
+    store = TrendSeriesStore(tmp_path / "series.json")
+    store.append_week('2024-W01', _results(1))
+    store.append_week('2024-W02', _results(2))
+    store.append_week('2024-W02', _results(7, topics=('Billing',)))
+
+    history = store.history()
+
+    assert [entry['week_id'] for entry in history] == ['2024-W01', '2024-W02']
+    assert history[-1]['results']['topic_distribution'] == {'Billing': {'volume': 70}}
+    assert store.weeks_recorded == 2
+
+
+def test_backfilled_week_keeps_week_order(tmp_path):
+    store = TrendSeriesStore(tmp_path / "series.json", max_points=3)
+    for week in ('2024-W10', '2024-W12'):
+        store.append_week(week, _results(1))
+    store.append_week('2024-W11', _results(2))
+
+    assert [entry['week_id'] for entry in store.history()] == ['2024-W10', '2024-W11', '2024-W12']
+
+    store.append_week('2024-W05', _results(3))
+
+    history = store.history()
+    assert [entry['week_id'] for entry in history] == ['2024-W10', '2024-W11', '2024-W12']
+    assert history[-1]['results']['topic_distribution']['Billing'] == {'volume': 10}
+    assert store.weeks_recorded == 3
+
+    store.append_week('2024-W13', _results(4))
+    assert [entry['week_id'] for entry in store.history()] == ['2024-W11', '2024-W12', '2024-W13']
+
+
+def test_store_round_trips_through_disk(tmp_path):
+    path = tmp_path / "series.json"
+    store = TrendSeriesStore(path, max_points=4)
+    for week in range(1, 4):
+        store.append_week(f'2024-W0{week}', _results(week), timestamp=f'2024-01-0{week}T00:00:00')
+    store.save()
+
+    reloaded = TrendSeriesStore(path, max_points=2)
+
+    assert reloaded.history() == store.history(2)
+    assert not path.with_suffix('.json.tmp').exists()
+
+
+def test_store_rejects_empty_window(tmp_path):
+    with pytest.raises(ValueError):
+        TrendSeriesStore(tmp_path / "series.json", max_points=0)
+
+
+def test_agent_migrates_legacy_week_files_once(agent, tmp_path):
+    for week in range(1, 4):
+        with open(tmp_path / f"week_2024-W0{week}.json", 'w') as f:
+            json.dump({'week_id': f'2024-W0{week}', 'timestamp': f'2024-01-0{week}', 'results': _results(week)}, f)
+    expected = _legacy_history(tmp_path)
+    for entry in expected:
+        for topic_stats in entry['results']['topic_distribution'].values():
+            topic_stats.pop('percentage')
+        for scores in entry['results']['topic_sentiments'].values():
+            scores.pop('label')
+
+    history = agent._load_historical_data()
+
+    assert history == expected
+    assert (tmp_path / "trend_series.json").exists()
+
+    # Later legacy files are no longer scanned once the store exists
+    (tmp_path / "week_2024-W09.json").write_text("{not json")
+    assert agent._load_historical_data() == expected
+
+
+def test_agent_trends_match_legacy_file_history(agent, tmp_path):
+    for week in range(1, 15):
+        agent._save_week_data(f'2024-W{week:02d}', _results(week))
+    current = _results(15, topics=('Billing', 'Bug', 'New'))
+
+    history = agent._load_historical_data()
+
+    assert len(history) == TrendAgent.HISTORY_WEEKS
+    assert history[-1]['week_id'] == '2024-W14'
+    assert agent._calculate_trends(current, history) == agent._calculate_trends(current, _legacy_history(tmp_path))